@@ -0,0 +1,6 @@
+"""Benchmark suite for the Parslet runtime.
+
+Run ``python -m benchmarks --help`` from the repository root. The
+"Runtime benchmarks" section of ``docs/source/testing.rst`` describes what is
+measured and how to compare results across commits.
+"""
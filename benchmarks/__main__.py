@@ -0,0 +1,97 @@
+"""Command line entry point: ``python -m benchmarks``."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+
+from . import bench_runtime  # noqa: F401 - registers the benchmarks
+from .harness import BENCHMARKS, compare, environment, format_result, iter_results
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the suite, print a summary and optionally save or compare results."""
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Measure Parslet's runtime overhead.",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument(
+        "names",
+        nargs="*",
+        help="Benchmarks or prefixes to run (e.g. 'dag' or 'cache.io'); "
+        "all by default",
+    )
+    parser.add_argument(
+        "--quick", action="store_true", help="Use small sizes for a fast smoke run"
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="Timed repetitions per case"
+    )
+    parser.add_argument(
+        "--max-size", type=int, help="Skip sizes larger than this (e.g. 100000)"
+    )
+    parser.add_argument("--out", metavar="PATH", help="Write the JSON report to PATH")
+    parser.add_argument(
+        "--compare",
+        metavar="BASELINE",
+        help="Compare against a JSON report and exit with 1 on regressions",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="Relative slowdown counted as a regression with --compare",
+    )
+    parser.add_argument(
+        "--list", action="store_true", help="List the benchmarks and exit"
+    )
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for bench in BENCHMARKS.values():
+            print(f"{bench.name:<22} {bench.description}")
+        return 0
+
+    unknown = [
+        n
+        for n in args.names
+        if not any(b == n or b.startswith(n + ".") for b in BENCHMARKS)
+    ]
+    if unknown:
+        parser.error(f"unknown benchmark(s): {', '.join(unknown)}")
+
+    results = []
+    for result in iter_results(args.names, args.quick, args.repeat, args.max_size):
+        print(format_result(result), flush=True)
+        results.append(result)
+    report = {
+        "meta": environment(quick=args.quick, repeat=args.repeat),
+        "results": results,
+    }
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as fh:
+            json.dump(report, fh, indent=2)
+        print(f"Results written to {args.out}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as fh:
+            baseline = json.load(fh)
+        rows = compare(report, baseline, args.threshold)
+        regressions = [r for r in rows if r["regression"]]
+        print(
+            f"\nCompared {len(rows)} case(s) with {args.compare} "
+            f"(commit {baseline.get('meta', {}).get('commit')}):"
+        )
+        for row in sorted(rows, key=lambda r: -r["ratio"]):
+            params = " ".join(f"{k}={v}" for k, v in row["params"].items())
+            mark = "  REGRESSION" if row["regression"] else ""
+            print(f"  {row['name']:<22} {params:<34} x{row['ratio']:.2f}{mark}")
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
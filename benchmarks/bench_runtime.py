@@ -0,0 +1,242 @@
+"""Benchmarks of Parslet's own runtime overhead.
+
+Task bodies are trivial so that the figures measure the engine - DAG
+construction, scheduling, dispatch, caching and checkpointing - rather than
+user code.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import shutil
+import tempfile
+from collections.abc import Callable, Iterator
+
+from parslet.core import DAG, DAGRunner, parslet_task
+from parslet.core.cache import compute_cache_key, load_from_cache, save_to_cache
+from parslet.core.task import ParsletFuture
+from parslet.utils.checkpointing import CheckpointManager
+
+from .harness import Case, benchmark
+
+# Per-task INFO logging would dominate the dispatch figures.
+_QUIET = logging.getLogger("parslet.benchmarks")
+_QUIET.setLevel(logging.WARNING)
+_QUIET.addHandler(logging.NullHandler())
+_QUIET.propagate = False
+
+
+@parslet_task
+def bench_noop() -> None:
+    return None
+
+
+@parslet_task
+def bench_step(*deps: object) -> int:
+    return len(deps)
+
+
+def _runner(workers: int) -> DAGRunner:
+    return DAGRunner(max_workers=workers, runner_logger=_QUIET, check_network=False)
+
+
+def _tree(n: int) -> list[ParsletFuture]:
+    """``n`` tasks where task ``i`` depends on tasks ``i - 1`` and ``i // 2``."""
+    futures: list[ParsletFuture] = [bench_step()]
+    for i in range(1, n):
+        parents = {i - 1, i // 2}
+        futures.append(bench_step(*(futures[p] for p in sorted(parents))))
+    return futures
+
+
+def _wide(n: int) -> list[ParsletFuture]:
+    return [bench_noop() for _ in range(n)]
+
+
+def _deep(n: int) -> list[ParsletFuture]:
+    futures: list[ParsletFuture] = [bench_step()]
+    for _ in range(n - 1):
+        futures.append(bench_step(futures[-1]))
+    return futures[-1:]
+
+
+def _diamond(n: int, width: int = 16) -> list[ParsletFuture]:
+    """Repeated fan-out/fan-in stages of ``width`` tasks, ``n`` tasks in all."""
+    join = bench_step()
+    made = 1
+    while made + width + 1 <= n:
+        fan = [bench_step(join) for _ in range(width)]
+        join = bench_step(*fan)
+        made += width + 1
+    return [join]
+
+
+def _dag_for(futures: list[ParsletFuture]) -> DAG:
+    dag = DAG()
+    dag.build_dag(futures)
+    return dag
+
+
+@benchmark("dispatch.overhead", sizes=[1_000, 10_000], quick_sizes=[200])
+def dispatch_overhead(sizes: list[int]) -> Iterator[Case]:
+    """Per-task cost of running independent no-op tasks through the runner."""
+    for n in sizes:
+        for workers in (1, 4):
+            state: dict[str, object] = {}
+
+            def setup(
+                n: int = n, workers: int = workers, state: dict[str, object] = state
+            ) -> None:
+                # Runner construction probes the host; keep it out of the
+                # per-task figure.
+                state["runner"] = _runner(workers)
+                state["dag"] = _dag_for(_wide(n))
+
+            def run(state: dict[str, object] = state) -> None:
+                state["runner"].run(state["dag"])  # type: ignore[attr-defined]
+
+            yield Case({"tasks": n, "workers": workers}, n, run, setup)
+
+
+@benchmark("dag.build", sizes=[1_000, 100_000, 1_000_000], quick_sizes=[1_000, 10_000])
+def dag_build(sizes: list[int]) -> Iterator[Case]:
+    """Building the graph from already created futures."""
+    for n in sizes:
+        futures = _tree(n)
+
+        def run(futures: list[ParsletFuture] = futures) -> None:
+            DAG().build_dag(futures)
+
+        yield Case({"nodes": n, "shape": "tree"}, n, run, repeat=_repeat_for(n))
+
+
+@benchmark(
+    "dag.validate", sizes=[1_000, 100_000, 1_000_000], quick_sizes=[1_000, 10_000]
+)
+def dag_validate(sizes: list[int]) -> Iterator[Case]:
+    """Cycle and dependency checks of a built graph."""
+    for n in sizes:
+        dag = _dag_for(_tree(n))
+        yield Case(
+            {"nodes": n, "shape": "tree"}, n, dag.validate_dag, repeat=_repeat_for(n)
+        )
+
+
+@benchmark(
+    "dag.toposort", sizes=[1_000, 100_000, 1_000_000], quick_sizes=[1_000, 10_000]
+)
+def dag_toposort(sizes: list[int]) -> Iterator[Case]:
+    """Computing the execution order of a built graph."""
+    for n in sizes:
+        dag = _dag_for(_tree(n))
+
+        def run(dag: DAG = dag) -> None:
+            dag.get_execution_order()
+
+        yield Case({"nodes": n, "shape": "tree"}, n, run, repeat=_repeat_for(n))
+
+
+def _repeat_for(n: int) -> int | None:
+    """Fewer repetitions for the largest graphs."""
+    return 1 if n >= 1_000_000 else (3 if n >= 100_000 else None)
+
+
+@benchmark("cache.key", sizes=[10_000], quick_sizes=[1_000])
+def cache_key(sizes: list[int]) -> Iterator[Case]:
+    """Hashing task invocations into cache keys."""
+    args = (1, "two", [3.0, 4.0], {"five": 6})
+    kwargs = {"flag": True}
+    for n in sizes:
+
+        def run(n: int = n) -> None:
+            for i in range(n):
+                compute_cache_key("bench_step", args, kwargs, str(i))
+
+        yield Case({"calls": n}, n, run)
+
+
+@benchmark("cache.io", sizes=[1_000], quick_sizes=[100])
+def cache_io(sizes: list[int]) -> Iterator[Case]:
+    """Saving and loading 1 KiB results to and from the on-disk cache."""
+    payload = os.urandom(1024)
+    for n in sizes:
+        for op in ("save", "load"):
+            cache_dir = tempfile.mkdtemp(prefix="parslet-bench-cache-")
+            previous = os.environ.get("PARSLET_CACHE_DIR")
+            keys = [compute_cache_key("bench_io", (i,), {}) for i in range(n)]
+
+            def setup(cache_dir: str = cache_dir, keys: list[str] = keys) -> None:
+                os.environ["PARSLET_CACHE_DIR"] = cache_dir
+                for key in keys:
+                    save_to_cache(key, payload)
+
+            def teardown(
+                cache_dir: str = cache_dir, previous: str | None = previous
+            ) -> None:
+                if previous is None:
+                    os.environ.pop("PARSLET_CACHE_DIR", None)
+                else:
+                    os.environ["PARSLET_CACHE_DIR"] = previous
+                shutil.rmtree(cache_dir, ignore_errors=True)
+
+            if op == "save":
+
+                def run(keys: list[str] = keys) -> None:
+                    for key in keys:
+                        save_to_cache(key, payload)
+
+            else:
+
+                def run(keys: list[str] = keys) -> None:
+                    for key in keys:
+                        load_from_cache(key)
+
+            yield Case({"op": op, "entries": n}, n, run, setup, teardown)
+
+
+@benchmark("checkpoint.write", sizes=[1_000, 5_000], quick_sizes=[200])
+def checkpoint_write(sizes: list[int]) -> Iterator[Case]:
+    """Recording completed tasks in a checkpoint file."""
+    for n in sizes:
+        workdir = tempfile.mkdtemp(prefix="parslet-bench-ckpt-")
+        path = os.path.join(workdir, "checkpoint.json")
+        ids = [f"task_{i}" for i in range(n)]
+
+        def setup(path: str = path) -> None:
+            if os.path.exists(path):
+                os.remove(path)
+
+        def run(path: str = path, ids: list[str] = ids) -> None:
+            manager = CheckpointManager(path)
+            for task_id in ids:
+                manager.mark_complete(task_id, "SUCCESS")
+
+        def teardown(workdir: str = workdir) -> None:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+        # Each mark rewrites the whole file, so large cases are slow.
+        yield Case({"tasks": n}, n, run, setup, teardown, repeat=3)
+
+
+@benchmark("e2e.throughput", sizes=[1_000, 10_000], quick_sizes=[200])
+def e2e_throughput(sizes: list[int]) -> Iterator[Case]:
+    """Build, schedule and run wide, deep and diamond shaped workflows."""
+    shapes = {"wide": _wide, "deep": _deep, "diamond": _diamond}
+    for n in sizes:
+        for shape, make in shapes.items():
+            state: dict[str, object] = {}
+
+            def setup(state: dict[str, object] = state) -> None:
+                # As in dispatch.overhead, runner construction is not timed.
+                state["runner"] = _runner(4)
+
+            def run(
+                n: int = n,
+                make: Callable[[int], list[ParsletFuture]] = make,
+                state: dict[str, object] = state,
+            ) -> None:
+                runner = state["runner"]
+                runner.run(_dag_for(make(n)))  # type: ignore[attr-defined]
+
+            yield Case({"shape": shape, "tasks": n, "workers": 4}, n, run, setup)
@@ -0,0 +1,269 @@
+"""Timing, result format and comparison for the Parslet benchmark suite.
+
+Benchmarks register themselves with :func:`benchmark` and are run by
+:func:`run_benchmarks`, which returns a JSON-serialisable report::
+
+    {
+      "meta": {"commit": ..., "python": ..., "platform": ..., ...},
+      "results": [
+        {"name": "dag.build", "params": {"nodes": 1000, "shape": "tree"},
+         "seconds": 0.0123, "min_seconds": 0.0119, "repeat": 5,
+         "items": 1000, "per_item_us": 12.3, "items_per_s": 81300.8},
+        ...
+      ]
+    }
+
+``seconds`` is the median over ``repeat`` runs. Reports from two commits
+are compared with :func:`compare`, which matches results by name and
+parameters.
+"""
+
+from __future__ import annotations
+
+import datetime as _dt
+import gc
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+#: Registered benchmarks, in registration order.
+BENCHMARKS: dict[str, Benchmark] = {}
+
+
+@dataclass
+class Case:
+    """
+    One parametrised measurement of a benchmark.
+
+    Attributes:
+        params (dict): Parameters recorded with the result.
+        items (int): Units of work per run, used for per-item figures.
+        run (Callable[[], None]): The timed code.
+        setup (Optional[Callable[[], None]]): Untimed code run before each
+            repetition, e.g. to rebuild inputs that ``run`` consumes.
+        teardown (Optional[Callable[[], None]]): Untimed clean-up after all
+            repetitions.
+        repeat (Optional[int]): Overrides the suite's repeat count, for
+            cases that are too slow to repeat often.
+    """
+
+    params: dict[str, Any]
+    items: int
+    run: Callable[[], None]
+    setup: Callable[[], None] | None = None
+    teardown: Callable[[], None] | None = None
+    repeat: int | None = None
+
+
+@dataclass
+class Benchmark:
+    """A named benchmark producing :class:`Case` objects for given sizes."""
+
+    name: str
+    cases: Callable[[list[int]], Iterable[Case]]
+    sizes: list[int]
+    quick_sizes: list[int]
+    description: str
+
+
+def benchmark(
+    name: str, sizes: list[int], quick_sizes: list[int]
+) -> Callable[[Callable[[list[int]], Iterable[Case]]], Callable[..., Any]]:
+    """
+    Register a benchmark.
+
+    The decorated function receives the list of sizes to measure and yields
+    one :class:`Case` per measurement.
+
+    Args:
+        name (str): Dotted name, e.g. ``"dag.build"``.
+        sizes (list[int]): Sizes measured by a full run.
+        quick_sizes (list[int]): Sizes measured with ``--quick``.
+    """
+
+    def decorator(
+        func: Callable[[list[int]], Iterable[Case]],
+    ) -> Callable[[list[int]], Iterable[Case]]:
+        if name in BENCHMARKS:
+            raise ValueError(f"Benchmark {name!r} registered twice")
+        BENCHMARKS[name] = Benchmark(
+            name, func, sizes, quick_sizes, (func.__doc__ or "").strip()
+        )
+        return func
+
+    return decorator
+
+
+def _time_case(case: Case, repeat: int) -> list[float]:
+    timings: list[float] = []
+    gc_was_enabled = gc.isenabled()
+    try:
+        for _ in range(case.repeat or repeat):
+            if case.setup is not None:
+                case.setup()
+            gc.collect()
+            gc.disable()
+            start = time.perf_counter()
+            case.run()
+            timings.append(time.perf_counter() - start)
+            if gc_was_enabled:
+                gc.enable()
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+        if case.teardown is not None:
+            case.teardown()
+    return timings
+
+
+def _result(name: str, case: Case, timings: list[float]) -> dict[str, Any]:
+    median = statistics.median(timings)
+    result: dict[str, Any] = {
+        "name": name,
+        "params": case.params,
+        "seconds": median,
+        "min_seconds": min(timings),
+        "repeat": len(timings),
+        "items": case.items,
+    }
+    if case.items:
+        result["per_item_us"] = median / case.items * 1e6
+        result["items_per_s"] = case.items / median if median else None
+    return result
+
+
+def iter_results(
+    names: Iterable[str] | None = None,
+    quick: bool = False,
+    repeat: int = 5,
+    max_size: int | None = None,
+) -> Iterator[dict[str, Any]]:
+    """
+    Run the selected benchmarks and yield one result per case.
+
+    Args:
+        names (Optional[Iterable[str]]): Benchmark names or name prefixes
+            (``"dag"`` selects ``dag.build``, ``dag.validate``, ...). All
+            benchmarks run if None.
+        quick (bool): Use each benchmark's small ``quick_sizes``.
+        repeat (int): Timed repetitions per case.
+        max_size (Optional[int]): Skip sizes larger than this.
+    """
+    selected = list(BENCHMARKS.values())
+    if names:
+        prefixes = list(names)
+        selected = [
+            b
+            for b in selected
+            if any(b.name == p or b.name.startswith(p + ".") for p in prefixes)
+        ]
+    for bench in selected:
+        sizes = bench.quick_sizes if quick else bench.sizes
+        if max_size is not None:
+            sizes = [s for s in sizes if s <= max_size]
+        for case in bench.cases(sizes):
+            yield _result(bench.name, case, _time_case(case, repeat))
+
+
+def run_benchmarks(
+    names: Iterable[str] | None = None,
+    quick: bool = False,
+    repeat: int = 5,
+    max_size: int | None = None,
+) -> dict[str, Any]:
+    """Run benchmarks like :func:`iter_results` and return the full report."""
+    results = list(iter_results(names, quick, repeat, max_size))
+    return {"meta": environment(quick=quick, repeat=repeat), "results": results}
+
+
+def environment(**extra: object) -> dict[str, Any]:
+    """Describe the machine and checkout the benchmarks ran on."""
+    try:
+        from parslet import __version__
+    except Exception:  # pragma: no cover - partial checkout
+        __version__ = "unknown"
+    meta: dict[str, Any] = {
+        "parslet_version": __version__,
+        "commit": _git_commit(),
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "timestamp": _dt.datetime.now(_dt.UTC).isoformat(timespec="seconds"),
+    }
+    meta.update(extra)
+    return meta
+
+
+def _git_commit() -> str | None:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).resolve().parent,
+            timeout=5,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def _key(result: dict[str, Any]) -> tuple[str, tuple[tuple[str, str], ...]]:
+    params = tuple(sorted((k, str(v)) for k, v in result["params"].items()))
+    return result["name"], params
+
+
+def compare(
+    current: dict[str, Any], baseline: dict[str, Any], threshold: float = 0.1
+) -> list[dict[str, Any]]:
+    """
+    Compare two reports case by case.
+
+    Args:
+        current (dict): Report of the checkout under test.
+        baseline (dict): Report to compare against.
+        threshold (float): Relative slowdown above which a case counts as a
+            regression (0.1 = 10 % slower).
+
+    Returns:
+        list[dict]: One entry per case present in both reports with
+        ``name``, ``params``, ``baseline_s``, ``current_s``, ``ratio``
+        (current / baseline) and ``regression``.
+    """
+    base = {_key(r): r for r in baseline.get("results", [])}
+    rows: list[dict[str, Any]] = []
+    for result in current.get("results", []):
+        old = base.get(_key(result))
+        if old is None or not old["seconds"]:
+            continue
+        ratio = result["seconds"] / old["seconds"]
+        rows.append(
+            {
+                "name": result["name"],
+                "params": result["params"],
+                "baseline_s": old["seconds"],
+                "current_s": result["seconds"],
+                "ratio": ratio,
+                "regression": ratio > 1 + threshold,
+            }
+        )
+    return rows
+
+
+def format_result(result: dict[str, Any]) -> str:
+    """Return a one-line human readable summary of ``result``."""
+    params = " ".join(f"{k}={v}" for k, v in result["params"].items())
+    line = f"{result['name']:<22} {params:<34} {result['seconds'] * 1e3:>10.2f} ms"
+    if "per_item_us" in result:
+        line += f"  {result['per_item_us']:>9.2f} us/item"
+    return line
@@ -3,7 +3,7 @@ from __future__ import annotations
 """Extract frames from a video with Parslet."""
 
 from pathlib import Path
-from typing import List
+from typing import Iterable, Iterator, List
 
 from parslet.core import parslet_task, ParsletFuture, DAG, DAGRunner
 
@@ -16,31 +16,35 @@ else:
     IMPORT_ERROR = None
 
 
-@parslet_task
-def extract_frames(video_path: str, out_dir: str = "frames") -> List[Path]:
-    """Save all frames from ``video_path`` to ``out_dir``."""
+@parslet_task(stream=True, stream_buffer=8)
+def extract_frames(video_path: str, out_dir: str = "frames") -> Iterator[Path]:
+    """Save frames from ``video_path`` to ``out_dir``, yielding each path.
+
+    Frames are handed to downstream tasks as soon as they are written; at
+    most ``stream_buffer`` of them wait for a consumer at any time.
+    """
     if cv2 is None:
         raise ImportError("opencv-python is required") from IMPORT_ERROR
     cap = cv2.VideoCapture(video_path)
     out = Path(out_dir)
     out.mkdir(parents=True, exist_ok=True)
-    frames = []
     idx = 0
-    while True:
-        ret, frame = cap.read()
-        if not ret:
-            break
-        fname = out / f"frame_{idx:03d}.png"
-        cv2.imwrite(str(fname), frame)
-        frames.append(fname)
-        idx += 1
-    cap.release()
-    return frames
+    try:
+        while True:
+            ret, frame = cap.read()
+            if not ret:
+                break
+            fname = out / f"frame_{idx:03d}.png"
+            cv2.imwrite(str(fname), frame)
+            yield fname
+            idx += 1
+    finally:
+        cap.release()
 
 
 @parslet_task
-def count_frames(frames: List[Path]) -> int:
-    return len(frames)
+def count_frames(frames: Iterable[Path]) -> int:
+    return sum(1 for _ in frames)
 
 
 def main(video_path: str) -> List[ParsletFuture]:
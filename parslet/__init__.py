@@ -3,27 +3,75 @@
 Only a small set of names is re-exported here to keep the package's public
 interface compact and easy to learn.  Everything else remains available under
 ``parslet.core`` or other subpackages.
+
+Names are resolved lazily (PEP 562) so that ``import parslet`` stays cheap;
+``networkx``, ``rich`` and the runtime modules are only imported once one of
+the names below is first used.
 """
 
-from .core import (
-    DAG,
-    DAGRunner,
-    EnergyAwarePolicy,
-    ParsletFuture,
-    parslet_task,
-    task_variant,
-)
-from .utils.power import PowerState, get_power_state, watch
-
-try:
-    from importlib.metadata import version as _pkg_version
-except Exception:  # pragma: no cover
-    from importlib_metadata import version as _pkg_version  # type: ignore
-
-try:
-    __version__ = _pkg_version("parslet")
-except Exception:
-    __version__ = "0.0.0"
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover - imported for type hints only
+    from .core import (
+        DAG,
+        DAGRunner,
+        EnergyAwarePolicy,
+        ParsletFuture,
+        parslet_task,
+        task_variant,
+    )
+    from .utils.power import (
+        PowerState,
+        PowerWatcher,
+        get_power_state,
+        shared_watcher,
+        watch,
+    )
+
+# Public name -> module that defines it.
+_LAZY_ATTRS = {
+    "parslet_task": ".core",
+    "ParsletFuture": ".core",
+    "DAG": ".core",
+    "DAGRunner": ".core",
+    "task_variant": ".core",
+    "EnergyAwarePolicy": ".core",
+    "PowerState": ".utils.power",
+    "PowerWatcher": ".utils.power",
+    "get_power_state": ".utils.power",
+    "shared_watcher": ".utils.power",
+    "watch": ".utils.power",
+}
+
+
+def _package_version() -> str:
+    try:
+        from importlib.metadata import version as _pkg_version
+    except Exception:  # pragma: no cover
+        from importlib_metadata import version as _pkg_version  # type: ignore
+
+    try:
+        return _pkg_version("parslet")
+    except Exception:
+        return "0.0.0"
+
+
+def __getattr__(name: str) -> object:
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is not None:
+        value = getattr(import_module(module_name, __name__), name)
+    elif name == "__version__":
+        value = _package_version()
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRS) | {"__version__"})
+
 
 __all__ = [
     "parslet_task",
@@ -33,6 +81,8 @@ __all__ = [
     "task_variant",
     "EnergyAwarePolicy",
     "PowerState",
+    "PowerWatcher",
     "get_power_state",
+    "shared_watcher",
     "watch",
 ]
@@ -1,3 +1,6 @@
+import getpass
+import hashlib
+import os
 import re
 import sys
 import tempfile
@@ -7,6 +10,62 @@ from pathlib import Path
 from types import ModuleType
 
 
+def get_compiled_workflow_dir() -> Path:
+    """Return the directory holding translated Parsl workflows.
+
+    Defaults to ``~/.parslet/compiled`` and can be overridden with the
+    ``PARSLET_COMPILE_CACHE_DIR`` environment variable. If the directory
+    cannot be created, a per-user folder in the system temp directory is
+    used instead.
+    """
+    base = os.environ.get(
+        "PARSLET_COMPILE_CACHE_DIR", os.path.expanduser("~/.parslet/compiled")
+    )
+    path = Path(base)
+    try:
+        path.mkdir(parents=True, exist_ok=True)
+    except OSError:
+        path = Path(tempfile.gettempdir()) / f"parslet-compiled-{getpass.getuser()}"
+        path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def _translated_parsl_workflow(wf_path: Path, code: str) -> Path:
+    """Return a Parslet translation of ``wf_path``, reusing a cached one.
+
+    Translations are stored as ``<stem>_<path hash>_<source hash>_parslet.py``
+    where the source hash also covers the translator version. A stable file
+    name lets Python keep the compiled bytecode in ``__pycache__`` between
+    runs. Older translations of the same workflow are removed.
+    """
+    from .compat.parsl_adapter import TRANSLATOR_VERSION, import_parsl_script
+
+    cache_dir = get_compiled_workflow_dir()
+    path_key = hashlib.sha256(str(wf_path).encode("utf-8")).hexdigest()[:8]
+    source_key = hashlib.sha256(
+        f"{TRANSLATOR_VERSION}\0{code}".encode("utf-8")
+    ).hexdigest()[:16]
+    prefix = f"{wf_path.stem}_{path_key}_"
+    target = cache_dir / f"{prefix}{source_key}_parslet.py"
+    if target.exists():
+        return target
+
+    tmp = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+    try:
+        import_parsl_script(str(wf_path), str(tmp))
+        os.replace(tmp, target)
+    finally:
+        tmp.unlink(missing_ok=True)
+
+    for stale in cache_dir.glob(f"{prefix}*_parslet.py"):
+        if stale != target:
+            stale.unlink(missing_ok=True)
+    for stale in (cache_dir / "__pycache__").glob(f"{prefix}*_parslet.*.pyc"):
+        if not stale.name.startswith(target.stem + "."):
+            stale.unlink(missing_ok=True)
+    return target
+
+
 def load_workflow_module(path: str) -> ModuleType:
     """Load a workflow script or module reference.
 
@@ -43,15 +102,13 @@ def load_workflow_module(path: str) -> ModuleType:
 
     code = wf_path.read_text(encoding="utf-8")
     if re.search(r"@\s*(python_app|bash_app)", code):
-        from .compat.parsl_adapter import import_parsl_script
-
-        tmp = tempfile.NamedTemporaryFile(suffix="_parslet.py", delete=False)
-        tmp.close()
-        import_parsl_script(str(wf_path), tmp.name)
-        spec = spec_from_file_location(Path(tmp.name).stem, tmp.name)
+        # Translations are cached per source hash, so unchanged Parsl
+        # scripts skip the AST rewrite and reuse their bytecode.
+        translated = _translated_parsl_workflow(wf_path, code)
+        spec = spec_from_file_location(translated.stem, translated)
         if spec and spec.loader:
             module = module_from_spec(spec)
-            sys.modules[Path(tmp.name).stem] = module
+            sys.modules[translated.stem] = module
             spec.loader.exec_module(module)
             module.__converted_from_parsl__ = True
             module.__original_parsl_path__ = str(wf_path)
@@ -23,6 +23,11 @@ from textwrap import dedent
 from ..core.dag import DAG
 from ..core.task import ParsletFuture, parslet_task
 
+# Bump whenever ``import_parsl_script`` produces different output for the
+# same input; it is part of the key of cached translations (see
+# ``parslet.cli.load_workflow_module``).
+TRANSLATOR_VERSION = 1
+
 
 class ParslToParsletTranslator(ast.NodeTransformer):
     """Replace Parsl decorators and APIs with Parslet equivalents."""
@@ -317,6 +322,7 @@ __all__ = [
     "convert_parslet_to_parsl",
     "import_parsl_script",
     "export_parsl_dag",
+    "TRANSLATOR_VERSION",
     "python_app",
     "bash_app",
     "DataFlowKernel",
@@ -1,27 +1,96 @@
 """Public exports for Parslet core primitives.
 
 This module defines the long-term stable API surface of ``parslet.core``.
+
+Exports are loaded lazily (PEP 562): each name imports its defining
+submodule on first access, so ``from parslet.core import parslet_task``
+does not pull in ``networkx``, the runner or the Parsl/Dask bridges.
 """
 
-from importlib import metadata
-
-from .dag import DAG, DAGCycleError  # noqa: F401
-from .dag_io import export_dag_to_json, import_dag_from_json  # noqa: F401
-from .ir import infer_edges_from_params  # noqa: F401
-from .ir import IRGraph, IRTask, normalize_names, toposort
-from .parsl_bridge import convert_task_to_parsl  # noqa: F401
-from .parsl_bridge import execute_with_parsl, parsl_python
-from .policy import AdaptivePolicy, EnergyAwarePolicy  # noqa: F401
-from .runner import DAGRunner  # noqa: F401
-from .runner import BatteryLevelLowError, UpstreamTaskFailedError
-from .scheduler import AdaptiveScheduler  # noqa: F401
-from .task import parslet_task  # noqa: F401
-from .task import ParsletFuture, set_allow_redefine, task_variant
-
-try:
-    __version__ = metadata.version("parslet")
-except metadata.PackageNotFoundError:  # pragma: no cover
-    __version__ = "0.0.0"
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover - imported for type hints only
+    from .dag import DAG, DAGCycleError  # noqa: F401
+    from .dag_io import export_dag_to_json, import_dag_from_json  # noqa: F401
+    from .dag_io import export_dag_to_binary, import_dag_from_binary  # noqa: F401
+    from .history import RunHistory
+    from .ir import infer_edges_from_params  # noqa: F401
+    from .ir import IRGraph, IRTask, normalize_names, toposort
+    from .ir import dag_from_ir, ir_from_dag
+    from .parsl_bridge import convert_task_to_parsl  # noqa: F401
+    from .parsl_bridge import execute_with_parsl, parsl_python
+    from .policy import AdaptivePolicy, EnergyAwarePolicy  # noqa: F401
+    from .policy import ThermalPolicy
+    from .runner import DAGRunner  # noqa: F401
+    from .runner import BatteryLevelLowError, UpstreamTaskFailedError
+    from .scheduler import AdaptiveScheduler  # noqa: F401
+    from .stats import TaskStatsStore
+    from .streaming import TaskStream
+    from .sweep import SweepResult, WorkflowTemplate, run_sweep
+    from .task import parslet_task  # noqa: F401
+    from .task import ParsletFuture, set_allow_redefine, task_variant
+    from .task import set_task_id_mode
+
+# Public name -> submodule that defines it.
+_LAZY_ATTRS = {
+    "DAG": ".dag",
+    "DAGCycleError": ".dag",
+    "export_dag_to_binary": ".dag_io",
+    "export_dag_to_json": ".dag_io",
+    "import_dag_from_binary": ".dag_io",
+    "import_dag_from_json": ".dag_io",
+    "RunHistory": ".history",
+    "IRGraph": ".ir",
+    "IRTask": ".ir",
+    "dag_from_ir": ".ir",
+    "infer_edges_from_params": ".ir",
+    "ir_from_dag": ".ir",
+    "normalize_names": ".ir",
+    "toposort": ".ir",
+    "convert_task_to_parsl": ".parsl_bridge",
+    "execute_with_parsl": ".parsl_bridge",
+    "parsl_python": ".parsl_bridge",
+    "AdaptivePolicy": ".policy",
+    "EnergyAwarePolicy": ".policy",
+    "ThermalPolicy": ".policy",
+    "BatteryLevelLowError": ".runner",
+    "DAGRunner": ".runner",
+    "UpstreamTaskFailedError": ".runner",
+    "AdaptiveScheduler": ".scheduler",
+    "TaskStatsStore": ".stats",
+    "TaskStream": ".streaming",
+    "SweepResult": ".sweep",
+    "WorkflowTemplate": ".sweep",
+    "run_sweep": ".sweep",
+    "ParsletFuture": ".task",
+    "parslet_task": ".task",
+    "set_allow_redefine": ".task",
+    "set_task_id_mode": ".task",
+    "task_variant": ".task",
+}
+
+
+def __getattr__(name: str) -> object:
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is not None:
+        value = getattr(import_module(module_name, __name__), name)
+    elif name == "__version__":
+        from importlib import metadata
+
+        try:
+            value = metadata.version("parslet")
+        except metadata.PackageNotFoundError:  # pragma: no cover
+            value = "0.0.0"
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRS) | {"__version__"})
+
 
 __all__ = [
     "parslet_task",
@@ -32,8 +101,16 @@ __all__ = [
     "UpstreamTaskFailedError",
     "AdaptivePolicy",
     "EnergyAwarePolicy",
+    "ThermalPolicy",
     "AdaptiveScheduler",
+    "TaskStatsStore",
+    "RunHistory",
+    "TaskStream",
+    "run_sweep",
+    "WorkflowTemplate",
+    "SweepResult",
     "set_allow_redefine",
+    "set_task_id_mode",
     "task_variant",
     "convert_task_to_parsl",
     "execute_with_parsl",
@@ -43,4 +120,6 @@ __all__ = [
     "infer_edges_from_params",
     "toposort",
     "normalize_names",
+    "ir_from_dag",
+    "dag_from_ir",
 ]
@@ -4,8 +4,9 @@ Public API: :class:`DAG` for representing task graphs and
 ``DAGCycleError`` when a cycle is detected.
 """
 
+import heapq
 import networkx as nx
-from typing import List, Dict, Set
+from typing import Any, List, Dict, Mapping, Set, Tuple
 from pathlib import Path
 from collections import deque
 import logging
@@ -43,7 +44,8 @@ class DAG:
     This class is responsible for constructing the task graph based on
     declared dependencies between `ParsletFuture` objects. Dependencies are
     established when one `ParsletFuture` is passed as an argument to the
-    function call that generates another `ParsletFuture`.
+    function call that generates another `ParsletFuture`, either directly or
+    inside a list, tuple, set or dict.
 
     The DAG can be validated to check for structural issues, primarily cycles,
     and can provide a topological sort of tasks for execution by the
@@ -56,6 +58,13 @@ class DAG:
         tasks (Dict[str, ParsletFuture]): A mapping from task IDs to their
                                          corresponding `ParsletFuture`
                                          objects.
+        aliases (Dict[str, str]): Task IDs removed by
+                                  `eliminate_common_subexpressions`, mapped
+                                  to the task ID that now computes their
+                                  result.
+        fused_chains (List[List[str]]): Chains selected by
+                                        `fuse_linear_chains`, each executed
+                                        by the runner as one job.
     """
 
     def __init__(self) -> None:
@@ -68,6 +77,10 @@ class DAG:
         self.graph: nx.DiGraph = nx.DiGraph()
         # Maps task_id (str) to ParsletFuture instances.
         self.tasks: Dict[str, ParsletFuture] = {}
+        # Maps merged duplicate task IDs to their canonical task ID.
+        self.aliases: Dict[str, str] = {}
+        # Linear chains of task IDs the runner executes as a single job.
+        self.fused_chains: List[List[str]] = []
 
     def add_task(self, future: ParsletFuture) -> None:
         """
@@ -102,15 +115,11 @@ class DAG:
         self.tasks[future.task_id] = future
 
         # Collect all ParsletFuture instances from the task's arguments and
-        # keyword arguments. These represent the direct dependencies of the
-        # current task.
-        dependencies_found: List[ParsletFuture] = []
-        for arg in future.args:
-            if isinstance(arg, ParsletFuture):
-                dependencies_found.append(arg)
-        for kwarg_value in future.kwargs.values():
-            if isinstance(kwarg_value, ParsletFuture):
-                dependencies_found.append(kwarg_value)
+        # keyword arguments, including those nested in containers. These
+        # represent the direct dependencies of the current task.
+        dependencies_found: List[ParsletFuture] = (
+            future.argument_template().dependencies
+        )
 
         # For each dependency found, ensure it's in the graph and then add
         # an edge.
@@ -124,7 +133,11 @@ class DAG:
             # This signifies that `dep_future` must complete before `future`.
             self.graph.add_edge(dep_future.task_id, future.task_id)
 
-    def build_dag(self, entry_futures: List[ParsletFuture]) -> None:
+    def build_dag(
+        self,
+        entry_futures: List[ParsletFuture],
+        eliminate_duplicates: bool = False,
+    ) -> None:
         """
         Builds the DAG from a list of "entry" ParsletFuture objects.
 
@@ -139,53 +152,226 @@ class DAG:
             entry_futures (List[ParsletFuture]): A list of ParsletFuture
             objects that are part of the workflow. These often
             represent the final outputs or key checkpoints of the DAG.
+            eliminate_duplicates (bool): If True, run
+            `eliminate_common_subexpressions` once the graph is built so
+            identical invocations of pure or cached tasks execute once.
+        """
+        self.extend(entry_futures)
+
+        if eliminate_duplicates:
+            self.eliminate_common_subexpressions()
+
+    def extend(self, futures: List[ParsletFuture]) -> List[str]:
+        """
+        Add ``futures`` and any dependencies not yet in the DAG.
+
+        This is the incremental form of `build_dag`: the traversal stops at
+        tasks that are already part of the graph, so growing a large DAG by a
+        handful of tasks only costs work proportional to the new tasks and
+        their edges. The runner uses it to splice in tasks spawned by
+        ``dynamic`` tasks while the workflow is executing.
+
+        Args:
+            futures (List[ParsletFuture]): Futures to add to the graph.
+
+        Returns:
+            List[str]: IDs of the newly added tasks in topological order.
+
+        Raises:
+            DAGCycleError: If the new tasks form a cycle.
         """
         # Queue for BFS-like traversal of futures and their dependencies.
-        queue = deque(entry_futures)
-        # Set to keep track of futures whose dependencies have been processed
-        # or added to queue.
-        visited_futures_for_processing: Set[str] = set()
+        queue = deque(f for f in futures if f.task_id not in self.tasks)
+        new_ids: List[str] = []
 
         while queue:
             current_future = queue.popleft()
 
-            if current_future.task_id in visited_futures_for_processing:
+            if current_future.task_id in self.tasks:
                 continue  # Already processed or in queue
 
-            visited_futures_for_processing.add(current_future.task_id)
-
-            # Ensure the current future is registered as a task
-            # and a graph node.
-            if current_future.task_id not in self.tasks:
-                self.graph.add_node(current_future.task_id, future_obj=current_future)
-                self.tasks[current_future.task_id] = current_future
-
-            # Discover dependencies from args and kwargs.
-            # If a dependency is a ParsletFuture, ensure it's added to the
-            # graph and to the processing queue if not already visited.
-            # Then, add an edge from the dependency to the current_future.
-
-            dependencies_to_explore: List[ParsletFuture] = []
-            for arg in current_future.args:
-                if isinstance(arg, ParsletFuture):
-                    dependencies_to_explore.append(arg)
-            for kwarg_value in current_future.kwargs.values():
-                if isinstance(kwarg_value, ParsletFuture):
-                    dependencies_to_explore.append(kwarg_value)
-
-            for dep_future in dependencies_to_explore:
-                # Add dependency as a task and graph node if it's new.
+            # Register the current future as a task and graph node.
+            self.graph.add_node(current_future.task_id, future_obj=current_future)
+            self.tasks[current_future.task_id] = current_future
+            new_ids.append(current_future.task_id)
+
+            # Discover dependencies from args and kwargs, including futures
+            # nested inside lists, tuples, sets and dicts. The argument
+            # template is cached on the future so the runner can later
+            # resolve arguments without rescanning literal containers.
+            # Each dependency not yet in the graph is queued; an edge is
+            # added from the dependency to the current_future either way.
+            # Nodes are added when dequeued, so an edge may briefly point
+            # at a node that networkx created implicitly.
+            for dep_future in current_future.argument_template().dependencies:
+                self.graph.add_edge(dep_future.task_id, current_future.task_id)
                 if dep_future.task_id not in self.tasks:
-                    self.graph.add_node(dep_future.task_id, future_obj=dep_future)
-                    self.tasks[dep_future.task_id] = dep_future
+                    queue.append(dep_future)
 
-                # Add an edge from the dependency to the current task.
-                self.graph.add_edge(dep_future.task_id, current_future.task_id)
+        if not new_ids:
+            return []
+        subgraph = self.graph.subgraph(new_ids)
+        try:
+            return list(nx.topological_sort(subgraph))
+        except nx.NetworkXUnfeasible:
+            raise DAGCycleError(
+                "Task dependency graph is invalid. Newly added tasks form a cycle."
+            ) from None
 
-                # If this dependency hasn't been processed, add it to the
-                # queue.
-                if dep_future.task_id not in visited_futures_for_processing:
-                    queue.append(dep_future)
+    @staticmethod
+    def _invocation_key(obj: Any, canonical: Dict[str, str]) -> Any:
+        """
+        Return a hashable key describing an argument for duplicate detection.
+
+        Futures are keyed by their canonical task ID, primitives by value and
+        built-in containers recursively. Any other object is keyed by its
+        identity, so two calls only match when they receive the very same
+        object; this keeps the pass conservative for values whose equality
+        is expensive or ill-defined.
+        """
+        if isinstance(obj, ParsletFuture):
+            return ("future", canonical.get(obj.task_id, obj.task_id))
+        if obj is None or isinstance(obj, str | int | float | bool | bytes):
+            return (type(obj).__name__, obj)
+        kind = type(obj)
+        if kind is list or kind is tuple:
+            return (
+                kind.__name__,
+                tuple(DAG._invocation_key(i, canonical) for i in obj),
+            )
+        if kind is set or kind is frozenset:
+            return (
+                kind.__name__,
+                frozenset(DAG._invocation_key(i, canonical) for i in obj),
+            )
+        if kind is dict:
+            return (
+                "dict",
+                frozenset(
+                    (
+                        DAG._invocation_key(k, canonical),
+                        DAG._invocation_key(v, canonical),
+                    )
+                    for k, v in obj.items()
+                ),
+            )
+        return ("id", id(obj))
+
+    def eliminate_common_subexpressions(self) -> int:
+        """
+        Merge identical invocations of pure tasks into a single node.
+
+        A task qualifies when it was declared with ``pure=True`` or
+        ``cache=True``. Two qualifying tasks are identical when they call the
+        same function with equal arguments, where upstream futures compare
+        equal once they have themselves been merged. Tasks are visited in
+        topological order so chains of duplicates collapse completely.
+
+        The duplicate node is removed from the graph, its dependents are
+        rewired to the canonical node and its `ParsletFuture` forwards
+        `result()` to the canonical future, so callers holding either future
+        see the same outcome. Removed IDs are recorded in `aliases`.
+
+        Returns:
+            int: The number of task nodes removed. Returns 0 without changes
+            if the graph contains a cycle (left for `validate_dag` to report).
+        """
+        try:
+            order = list(nx.topological_sort(self.graph))
+        except nx.NetworkXUnfeasible:
+            return 0
+
+        seen: Dict[Any, str] = {}
+        removed = 0
+        for task_id in order:
+            future = self.tasks[task_id]
+            if not (future.pure or getattr(future.func, "_parslet_cache", False)):
+                continue
+            try:
+                key = (
+                    id(future.func),
+                    self._invocation_key(future.args, self.aliases),
+                    self._invocation_key(future.kwargs, self.aliases),
+                )
+                hash(key)
+            except TypeError:  # pragma: no cover - defensive
+                continue
+            canonical_id = seen.get(key)
+            if canonical_id is None:
+                seen[key] = task_id
+                continue
+
+            for dependent in list(self.graph.successors(task_id)):
+                self.graph.add_edge(canonical_id, dependent)
+            self.graph.remove_node(task_id)
+            del self.tasks[task_id]
+            future._alias_of = self.tasks[canonical_id]
+            self.aliases[task_id] = canonical_id
+            removed += 1
+
+        if removed:
+            logger.info("Merged %d duplicate task invocation(s).", removed)
+        return removed
+
+    def fuse_linear_chains(self) -> List[List[str]]:
+        """
+        Select single-producer/single-consumer chains for fused execution.
+
+        A task ``v`` joins the chain of its predecessor ``u`` when ``u`` has
+        exactly one dependent (``v``) and ``v`` has exactly one dependency
+        (``u``). Such stages can never run concurrently, so the `DAGRunner`
+        executes each chain back to back in a single worker instead of
+        submitting every stage separately. This saves an executor hop,
+        callback and thread handoff per stage while the runner still records
+        statuses, timings and failures per task.
+
+        Tasks declared with ``dynamic=True`` only ever end a chain: their
+        successors have to wait for the tasks they spawn, which must not
+        happen inside the worker running the chain. Streaming tasks run in
+        their own thread and are never fused.
+
+        The graph itself is not modified. Call this again after changing
+        the graph; the previous selection is replaced.
+
+        Returns:
+            List[List[str]]: Chains of two or more task IDs in execution
+            order. Empty if the graph contains a cycle.
+        """
+        try:
+            order = list(nx.topological_sort(self.graph))
+        except nx.NetworkXUnfeasible:
+            self.fused_chains = []
+            return []
+
+        def _links(u: str, v: str) -> bool:
+            # ``u`` -> ``v`` is the only edge out of ``u`` and into ``v``.
+            first, second = self.tasks[u], self.tasks[v]
+            return (
+                self.graph.out_degree(u) == 1
+                and self.graph.in_degree(v) == 1
+                and not first.dynamic
+                and not first.stream
+                and not second.stream
+            )
+
+        chains: List[List[str]] = []
+        for node in order:
+            preds = list(self.graph.predecessors(node))
+            if len(preds) == 1 and _links(preds[0], node):
+                # Part of the chain started by an earlier node.
+                continue
+            chain = [node]
+            current = node
+            while self.graph.out_degree(current) == 1:
+                successor = next(iter(self.graph.successors(current)))
+                if not _links(current, successor):
+                    break
+                chain.append(successor)
+                current = successor
+            if len(chain) > 1:
+                chains.append(chain)
+        self.fused_chains = chains
+        return chains
 
     def validate_dag(self) -> None:
         """
@@ -243,7 +429,9 @@ class DAG:
 
             raise DAGCycleError(f"Task dependency graph is invalid. {cycle_info}")
 
-    def get_execution_order(self) -> List[str]:
+    def get_execution_order(
+        self, priorities: Mapping[str, float] | None = None
+    ) -> List[str]:
         """
         Performs a topological sort on the DAG to get a valid execution
         order of task IDs.
@@ -252,6 +440,13 @@ class DAG:
         respects all defined dependencies, meaning a task will only appear
         after all its prerequisite tasks have appeared.
 
+        Args:
+            priorities (Optional[Mapping[str, float]]): Optional priority per
+                task ID. Among tasks that are ready at the same point, higher
+                priorities come first (ties keep insertion order). Missing
+                task IDs default to ``0``. See `bottom_levels` for a
+                longest-path-first priority.
+
         Returns:
             List[str]: A list of task IDs (strings) in a valid execution order.
                        Returns an empty list if the DAG is empty.
@@ -265,6 +460,9 @@ class DAG:
         if not self.graph.nodes:
             return []  # No tasks to order in an empty graph.
 
+        if priorities is not None:
+            return self._prioritized_order(priorities)
+
         try:
             # nx.topological_sort returns a generator, so convert it to a list.
             return list(nx.topological_sort(self.graph))
@@ -281,6 +479,97 @@ class DAG:
                 "state that passed cycle validation."
             )
 
+    def _prioritized_order(self, priorities: Mapping[str, float]) -> List[str]:
+        """Kahn's algorithm picking the highest-priority ready task first."""
+        index = {node: i for i, node in enumerate(self.graph.nodes)}
+        remaining = {node: deg for node, deg in self.graph.in_degree()}
+        ready = [
+            (-priorities.get(node, 0.0), index[node], node)
+            for node, deg in remaining.items()
+            if deg == 0
+        ]
+        heapq.heapify(ready)
+        order: List[str] = []
+        while ready:
+            _, _, node = heapq.heappop(ready)
+            order.append(node)
+            for succ in self.graph.successors(node):
+                remaining[succ] -= 1
+                if remaining[succ] == 0:
+                    heapq.heappush(
+                        ready, (-priorities.get(succ, 0.0), index[succ], succ)
+                    )
+        if len(order) != len(index):
+            self.validate_dag()
+        return order
+
+    def bottom_levels(
+        self, durations: Mapping[str, float] | None = None
+    ) -> Dict[str, float]:
+        """
+        Compute each task's longest remaining path to the end of the DAG.
+
+        The bottom level of a task is its own duration plus the largest
+        bottom level among its dependents. Running tasks with the largest
+        bottom level first (longest-path-first) keeps the critical path busy.
+
+        Args:
+            durations (Optional[Mapping[str, float]]): Expected duration per
+                task ID in seconds. Missing entries count as ``1.0``, so with
+                no durations the result is measured in task hops.
+
+        Returns:
+            Dict[str, float]: Bottom level per task ID.
+
+        Raises:
+            DAGCycleError: If the graph contains a cycle.
+        """
+        durations = durations or {}
+        levels: Dict[str, float] = {}
+        for node in reversed(self.get_execution_order()):
+            below = max(
+                (levels[succ] for succ in self.graph.successors(node)), default=0.0
+            )
+            levels[node] = durations.get(node, 1.0) + below
+        return levels
+
+    def critical_path(
+        self, durations: Mapping[str, float] | None = None
+    ) -> Tuple[List[str], float]:
+        """
+        Return the longest path through the DAG and its total duration.
+
+        The critical path bounds the makespan of a run: no amount of extra
+        workers can finish the workflow faster than the sum of the durations
+        along it.
+
+        Args:
+            durations (Optional[Mapping[str, float]]): Expected duration per
+                task ID in seconds, e.g. from
+                :meth:`parslet.core.stats.TaskStatsStore.estimate_dag`.
+                Missing entries count as ``1.0``.
+
+        Returns:
+            Tuple[List[str], float]: The task IDs on the critical path in
+            execution order, and the path's total duration. An empty DAG
+            yields ``([], 0.0)``.
+        """
+        if not self.graph.nodes:
+            return [], 0.0
+        levels = self.bottom_levels(durations)
+        node = max(
+            (n for n in self.graph.nodes if self.graph.in_degree(n) == 0),
+            key=lambda n: levels[n],
+        )
+        path = [node]
+        while True:
+            successors = list(self.graph.successors(node))
+            if not successors:
+                break
+            node = max(successors, key=lambda n: levels[n])
+            path.append(node)
+        return path, levels[path[0]]
+
     def get_task_future(self, task_id: str) -> ParsletFuture:
         """
         Retrieves the `ParsletFuture` object for a given task ID.
@@ -435,12 +724,7 @@ class DAG:
                 return False  # Found an unknown future
 
             # Add its ParsletFuture dependencies to the queue for checking.
-            for arg in current_future.args:
-                if isinstance(arg, ParsletFuture):
-                    if arg.task_id not in visited_ids:
-                        queue.append(arg)
-        for kwarg_value in current_future.kwargs.values():
-            if isinstance(kwarg_value, ParsletFuture):
-                if kwarg_value.task_id not in visited_ids:
-                    queue.append(kwarg_value)
+            for dep_future in current_future.argument_template().dependencies:
+                if dep_future.task_id not in visited_ids:
+                    queue.append(dep_future)
         return True  # All reachable futures are known
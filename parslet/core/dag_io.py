@@ -1,22 +1,42 @@
-"""JSON serialization helpers for Parslet DAGs.
+"""Serialization helpers for Parslet DAGs.
 
-Public API: :func:`export_dag_to_json` and :func:`import_dag_from_json`.
+Public API: :func:`export_dag_to_json`, :func:`import_dag_from_json`,
+:func:`export_dag_to_binary` and :func:`import_dag_from_binary`.
+
+The JSON format is easy to read and edit. The binary format is meant for
+very large graphs: it is written in a single streaming pass, stores module
+and function names once in a string table, encodes edges as varints and is
+decoded straight from a memory-mapped file.
 """
 
 import json
 import importlib
-from typing import Any, Dict, List
+import mmap
+import struct
+from types import ModuleType
+from typing import Any, Callable, Dict, Iterator, List, Tuple
 
 from .dag import DAG
 from .task import ParsletFuture
 
 
-__all__ = ["export_dag_to_json", "import_dag_from_json"]
+__all__ = [
+    "export_dag_to_json",
+    "import_dag_from_json",
+    "export_dag_to_binary",
+    "import_dag_from_binary",
+]
 
 
 def _serialize_arg(arg: Any) -> Any:
     if isinstance(arg, ParsletFuture):
         return {"__future__": arg.task_id}
+    if isinstance(arg, tuple):
+        return {"__tuple__": [_serialize_arg(a) for a in arg]}
+    if isinstance(arg, list):
+        return [_serialize_arg(a) for a in arg]
+    if isinstance(arg, dict):
+        return {k: _serialize_arg(v) for k, v in arg.items()}
     return arg
 
 
@@ -47,20 +67,45 @@ def export_dag_to_json(dag: DAG, path: str) -> None:
 def _deserialize_arg(val: Any, task_map: Dict[str, ParsletFuture]) -> Any:
     if isinstance(val, dict) and "__future__" in val:
         return task_map[val["__future__"]]
+    if isinstance(val, dict) and "__tuple__" in val:
+        return tuple(_deserialize_arg(v, task_map) for v in val["__tuple__"])
+    if isinstance(val, list):
+        return [_deserialize_arg(v, task_map) for v in val]
+    if isinstance(val, dict):
+        return {k: _deserialize_arg(v, task_map) for k, v in val.items()}
     return val
 
 
+def _function_resolver() -> Callable[[str, str], Callable[..., Any]]:
+    """Return a lookup that imports each module and resolves each function once."""
+    modules: Dict[str, ModuleType] = {}
+    funcs: Dict[Tuple[str, str], Callable[..., Any]] = {}
+
+    def resolve(module_name: str, func_name: str) -> Callable[..., Any]:
+        key = (module_name, func_name)
+        func = funcs.get(key)
+        if func is None:
+            module = modules.get(module_name)
+            if module is None:
+                module = modules[module_name] = importlib.import_module(module_name)
+            func = getattr(module, func_name)
+            if hasattr(func, "_parslet_original_func"):
+                func = getattr(func, "_parslet_original_func")
+            funcs[key] = func
+        return func
+
+    return resolve
+
+
 def import_dag_from_json(path: str) -> DAG:
     with open(path, "r", encoding="utf-8") as f:
         data = json.load(f)
     tasks_data = data.get("tasks", [])
     task_map: Dict[str, ParsletFuture] = {}
+    resolve = _function_resolver()
     # First pass: create futures without args
     for t in tasks_data:
-        module = importlib.import_module(t["module"])
-        func = getattr(module, t["func_name"])
-        if hasattr(func, "_parslet_original_func"):
-            func = getattr(func, "_parslet_original_func")
+        func = resolve(t["module"], t["func_name"])
         future = ParsletFuture(task_id=t["task_id"], func=func, args=(), kwargs={})
         task_map[t["task_id"]] = future
     # Second pass: assign args
@@ -73,7 +118,244 @@ def import_dag_from_json(path: str) -> DAG:
     dag = DAG()
     dag.graph.add_nodes_from((tid, {"future_obj": f}) for tid, f in task_map.items())
     dag.tasks = task_map
-    for t in tasks_data:
-        for dep in t.get("dependencies", []):
-            dag.graph.add_edge(dep, t["task_id"])
+    dag.graph.add_edges_from(
+        (dep, t["task_id"]) for t in tasks_data for dep in t.get("dependencies", [])
+    )
+    return dag
+
+
+# --- Binary format -----------------------------------------------------------
+#
+# File layout (all integers are unsigned LEB128 varints unless noted):
+#
+#   b"PDAG" version:u8
+#   records, each starting with a tag byte:
+#     _TAG_STRING  len bytes                 -> appended to the string table
+#     _TAG_FUNC    module_sid name_sid       -> appended to the function table
+#     _TAG_TASK    func_ref len task_id len payload
+#                  payload is compact JSON ``[args, kwargs]``, empty when the
+#                  task takes no arguments
+#     _TAG_END
+#   edge section, one entry per task in record order:
+#     n_deps zigzag(task_index - dep_index) ...
+#   footer: edge_offset:u64 n_tasks:u64 n_edges:u64 b"PDAG" (little endian)
+#
+# Strings and functions are defined just before their first use, so the file
+# is written in one pass without holding the whole graph in memory.
+
+_BINARY_MAGIC = b"PDAG"
+_BINARY_VERSION = 1
+_FOOTER = struct.Struct("<QQQ4s")
+_TAG_END = 0
+_TAG_STRING = 1
+_TAG_FUNC = 2
+_TAG_TASK = 3
+_FLUSH_BYTES = 1 << 20
+
+
+def _put_varint(buf: bytearray, value: int) -> None:
+    while value > 0x7F:
+        buf.append((value & 0x7F) | 0x80)
+        value >>= 7
+    buf.append(value)
+
+
+def _put_bytes(buf: bytearray, data: bytes) -> None:
+    _put_varint(buf, len(data))
+    buf += data
+
+
+def _get_varint(data: Any, pos: int) -> Tuple[int, int]:
+    value = 0
+    shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+
+def export_dag_to_binary(dag: DAG, path: str) -> None:
+    """
+    Write ``dag`` to ``path`` in Parslet's binary DAG format.
+
+    Tasks are streamed to disk in chunks, so memory use stays small even
+    for graphs with millions of tasks. Task arguments must be JSON
+    serializable, as for :func:`export_dag_to_json`.
+
+    Args:
+        dag (DAG): The DAG to save.
+        path (str): Destination file.
+    """
+    nodes = list(dag.graph.nodes)
+    index = {task_id: i for i, task_id in enumerate(nodes)}
+    strings: Dict[str, int] = {}
+    funcs: Dict[Tuple[str, str], int] = {}
+    buf = bytearray(_BINARY_MAGIC)
+    buf.append(_BINARY_VERSION)
+    encode = json.JSONEncoder(separators=(",", ":")).encode
+
+    def intern(text: str) -> int:
+        sid = strings.get(text)
+        if sid is None:
+            sid = strings[text] = len(strings)
+            buf.append(_TAG_STRING)
+            _put_bytes(buf, text.encode("utf-8"))
+        return sid
+
+    with open(path, "wb") as f:
+        for task_id in nodes:
+            future = dag.tasks[task_id]
+            key = (future.func.__module__, future.func.__name__)
+            func_ref = funcs.get(key)
+            if func_ref is None:
+                module_sid = intern(key[0])
+                name_sid = intern(key[1])
+                func_ref = funcs[key] = len(funcs)
+                buf.append(_TAG_FUNC)
+                _put_varint(buf, module_sid)
+                _put_varint(buf, name_sid)
+            buf.append(_TAG_TASK)
+            _put_varint(buf, func_ref)
+            _put_bytes(buf, task_id.encode("utf-8"))
+            if future.args or future.kwargs:
+                payload = [
+                    [_serialize_arg(a) for a in future.args],
+                    {k: _serialize_arg(v) for k, v in future.kwargs.items()},
+                ]
+                _put_bytes(buf, encode(payload).encode("utf-8"))
+            else:
+                buf.append(0)
+            if len(buf) >= _FLUSH_BYTES:
+                f.write(buf)
+                buf.clear()
+        buf.append(_TAG_END)
+        f.write(buf)
+        buf.clear()
+
+        edge_offset = f.tell()
+        n_edges = 0
+        predecessors = dag.graph.pred
+        for i, task_id in enumerate(nodes):
+            deps = predecessors[task_id]
+            _put_varint(buf, len(deps))
+            for dep in deps:
+                delta = i - index[dep]
+                # Zigzag keeps small negative deltas small.
+                _put_varint(buf, (delta << 1) if delta >= 0 else ((-delta << 1) - 1))
+            n_edges += len(deps)
+            if len(buf) >= _FLUSH_BYTES:
+                f.write(buf)
+                buf.clear()
+        f.write(buf)
+        f.write(_FOOTER.pack(edge_offset, len(nodes), n_edges, _BINARY_MAGIC))
+
+
+def _iter_binary_edges(
+    data: Any, pos: int, n_tasks: int, task_ids: List[str]
+) -> Iterator[Tuple[str, str]]:
+    for i in range(n_tasks):
+        count, pos = _get_varint(data, pos)
+        target = task_ids[i]
+        for _ in range(count):
+            zz, pos = _get_varint(data, pos)
+            delta = (zz >> 1) if not zz & 1 else -((zz + 1) >> 1)
+            yield task_ids[i - delta], target
+
+
+def import_dag_from_binary(path: str) -> DAG:
+    """
+    Load a DAG written by :func:`export_dag_to_binary`.
+
+    The file is memory-mapped and decoded in place, and every module is
+    imported only once no matter how many of its tasks the graph contains.
+
+    Args:
+        path (str): File to read.
+
+    Returns:
+        DAG: The reconstructed DAG. Futures are fresh and not yet executed.
+
+    Raises:
+        ValueError: If the file is not a Parslet binary DAG or was written
+            by an unsupported format version.
+    """
+    with (
+        open(path, "rb") as f,
+        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data,
+    ):
+        if (
+            len(data) < len(_BINARY_MAGIC) + 1 + _FOOTER.size
+            or data[: len(_BINARY_MAGIC)] != _BINARY_MAGIC
+        ):
+            raise ValueError(f"{path} is not a Parslet binary DAG file.")
+        version = data[len(_BINARY_MAGIC)]
+        if version != _BINARY_VERSION:
+            raise ValueError(
+                f"Unsupported binary DAG version {version} in {path}; "
+                f"expected {_BINARY_VERSION}."
+            )
+        edge_offset, n_tasks, _n_edges, magic = _FOOTER.unpack_from(
+            data, len(data) - _FOOTER.size
+        )
+        if magic != _BINARY_MAGIC:
+            raise ValueError(f"{path} is truncated or corrupt.")
+
+        resolve = _function_resolver()
+        strings: List[str] = []
+        funcs: List[Callable[..., Any]] = []
+        task_ids: List[str] = []
+        task_map: Dict[str, ParsletFuture] = {}
+        payloads: List[Tuple[ParsletFuture, bytes]] = []
+        pos = len(_BINARY_MAGIC) + 1
+        while True:
+            tag = data[pos]
+            pos += 1
+            if tag == _TAG_TASK:
+                func_ref, pos = _get_varint(data, pos)
+                size, pos = _get_varint(data, pos)
+                task_id = data[pos : pos + size].decode("utf-8")
+                pos += size
+                size, pos = _get_varint(data, pos)
+                future = ParsletFuture(
+                    task_id=task_id, func=funcs[func_ref], args=(), kwargs={}
+                )
+                if size:
+                    payloads.append((future, data[pos : pos + size]))
+                    pos += size
+                task_ids.append(task_id)
+                task_map[task_id] = future
+            elif tag == _TAG_STRING:
+                size, pos = _get_varint(data, pos)
+                strings.append(data[pos : pos + size].decode("utf-8"))
+                pos += size
+            elif tag == _TAG_FUNC:
+                module_sid, pos = _get_varint(data, pos)
+                name_sid, pos = _get_varint(data, pos)
+                funcs.append(resolve(strings[module_sid], strings[name_sid]))
+            elif tag == _TAG_END:
+                break
+            else:
+                raise ValueError(f"Unknown record tag {tag} in {path}.")
+
+        # Arguments may reference any task, so they are decoded once all
+        # futures exist.
+        decode = json.JSONDecoder().decode
+        for future, payload in payloads:
+            args, kwargs = decode(payload.decode("utf-8"))
+            future.args = tuple(_deserialize_arg(a, task_map) for a in args)
+            future.kwargs = {
+                k: _deserialize_arg(v, task_map) for k, v in kwargs.items()
+            }
+
+        dag = DAG()
+        dag.graph.add_nodes_from(
+            (tid, {"future_obj": f}) for tid, f in task_map.items()
+        )
+        dag.tasks = task_map
+        dag.graph.add_edges_from(
+            _iter_binary_edges(data, edge_offset, n_tasks, task_ids)
+        )
     return dag
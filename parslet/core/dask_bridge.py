@@ -5,15 +5,32 @@ Public API: :func:`execute_with_dask` to run a workflow via Dask.
 
 from __future__ import annotations
 
-from typing import List, Dict, Any, Optional, Union
+from typing import List, Dict, Any, Optional, Tuple, Union
 
 from .dag import DAG
 from .task import ParsletFuture
+from .task_call import ResultRef, TaskCall
 
 
 __all__ = ["execute_with_dask"]
 
 
+def _build_dask_graph(dag: DAG) -> Dict[str, Tuple[Any, ...]]:
+    """Translate ``dag`` into a raw Dask task graph keyed by task ID.
+
+    Each node becomes ``(call, *dependency_keys)``.  No ``delayed`` objects
+    are created, so building the graph costs one small tuple per task and
+    no per-node tokenization.
+    """
+    graph: Dict[str, Tuple[Any, ...]] = {}
+    for task_id, pf in dag.tasks.items():
+        template = pf.argument_template()
+        dep_keys = tuple(dep.task_id for dep in template.dependencies)
+        args, kwargs = template.resolve(lambda dep: ResultRef(dep.task_id))
+        graph[task_id] = (TaskCall(pf.func, args, kwargs, dep_keys),) + dep_keys
+    return graph
+
+
 def execute_with_dask(
     entry_futures: List[ParsletFuture],
     scheduler: Optional[Union[str, Any]] = None,
@@ -42,7 +59,7 @@ def execute_with_dask(
     [2]
     """
     try:
-        from dask import delayed, compute
+        from dask.base import get_scheduler
 
         try:
             from dask.distributed import Client
@@ -57,33 +74,15 @@ def execute_with_dask(
     dag.build_dag(entry_futures)
     dag.validate_dag()
 
-    order = dag.get_execution_order()
-    dask_futures: Dict[str, Any] = {}
-
-    for task_id in order:
-        pf = dag.get_task_future(task_id)
-        dask_task = delayed(pf.func)
-
-        resolved_args = [
-            dask_futures[a.task_id] if isinstance(a, ParsletFuture) else a
-            for a in pf.args
-        ]
-        resolved_kwargs = {
-            k: dask_futures[v.task_id] if isinstance(v, ParsletFuture) else v
-            for k, v in pf.kwargs.items()
-        }
-
-        dask_futures[task_id] = dask_task(*resolved_args, **resolved_kwargs)
-
-    entry_tasks = [dask_futures[f.task_id] for f in entry_futures]
+    graph = _build_dask_graph(dag)
+    keys = [f.task_id for f in entry_futures]
 
     if scheduler is None:
         scheduler = "threads"
 
-    if "Client" in locals() and Client is not None and isinstance(scheduler, Client):
-        futures = [scheduler.compute(t) for t in entry_tasks]
-        results = scheduler.gather(futures)
+    if Client is not None and isinstance(scheduler, Client):
+        results = scheduler.get(graph, keys)
     else:
-        results = compute(*entry_tasks, scheduler=scheduler)
+        results = get_scheduler(scheduler=scheduler)(graph, keys)
 
     return list(results)
@@ -0,0 +1,273 @@
+"""Per-task energy accounting from power telemetry.
+
+:class:`EnergyMeter` samples the power state through the shared
+:class:`~parslet.utils.power.PowerWatcher` while a run is in progress and
+listens to the runner's task events. Each pair of consecutive samples spans
+a window in which the battery drained by some amount - in joules when the
+platform reports the remaining energy or the discharge rate, in battery
+percent otherwise. That drain is split between the tasks that ran during the
+window in proportion to how long each of them ran inside it, and the shares
+are summed per task name.
+
+The figures are estimates: the battery also powers the screen, radios and
+other processes, and drain measured while nothing ran is reported as idle.
+They are most useful for comparing tasks with one another, e.g. to let
+:class:`~parslet.core.policy.EnergyAwarePolicy` order tasks by measured
+cost rather than by their ``energy_cost`` labels.
+"""
+
+from __future__ import annotations
+
+import bisect
+import logging
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+
+from ..utils.power import PowerState, shared_watcher
+from .events import Event, EventSink, EventType
+
+__all__ = ["EnergyMeter"]
+
+logger = logging.getLogger(__name__)
+
+
+def _window_drain(
+    before: PowerState, after: PowerState
+) -> tuple[float | None, float | None]:
+    """Return the joules and battery percent drained between two samples."""
+    if before.source != "battery" or after.source != "battery" or after.is_charging:
+        return None, None
+    joules: float | None = None
+    if before.energy_wh is not None and after.energy_wh is not None:
+        joules = max(0.0, (before.energy_wh - after.energy_wh) * 3600)
+    else:
+        rates = [p for p in (before.power_w, after.power_w) if p is not None]
+        if rates:
+            joules = sum(rates) / len(rates) * max(0.0, after.ts - before.ts)
+    percent: float | None = None
+    if before.percent is not None and after.percent is not None:
+        percent = float(max(0, before.percent - after.percent))
+    return joules, percent
+
+
+class EnergyMeter(EventSink):
+    """
+    Attribute battery drain to tasks by overlapping runtime.
+
+    Subscribe the meter to a runner's event bus and bracket the run with
+    :meth:`start` and :meth:`stop`; ``DAGRunner(energy=True)`` does both.
+
+    Attributes:
+        interval_s (float): Seconds between power samples.
+    """
+
+    def __init__(
+        self,
+        interval_s: float = 5.0,
+        sample: Callable[[], PowerState] | None = None,
+    ) -> None:
+        """
+        Args:
+            interval_s (float): Seconds between power samples. Reading the
+                battery may start a subprocess on Android, so keep this at a
+                few seconds.
+            sample (Optional[Callable[[], PowerState]]): Source of power
+                readings. Defaults to the shared power watcher, which then
+                samples every ``interval_s`` for the meter and any other
+                consumer.
+        """
+        self.interval_s = interval_s
+        self._sample = sample or self._shared_sample
+        self._lock = threading.Lock()
+        self._samples: list[PowerState] = []
+        # (task name, wall-clock start, wall-clock end) of finished tasks.
+        self._intervals: list[tuple[str, float, float]] = []
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def handle(self, event: Event) -> None:
+        kind = event.type
+        if (
+            kind is EventType.TASK_SUCCEEDED or kind is EventType.TASK_FAILED
+        ) and event.duration_s is not None:
+            with self._lock:
+                self._intervals.append(
+                    (event.task_name or "?", event.time - event.duration_s, event.time)
+                )
+
+    def _shared_sample(self) -> PowerState:
+        # The watcher's thread samples every interval_s; allow for the two
+        # threads being out of phase and for the time a poll takes.
+        return shared_watcher().latest(max_age_s=self.interval_s * 1.5)
+
+    def sample_now(self) -> PowerState:
+        """Take one power sample and add it to the record."""
+        state = self._sample()
+        if not state.ts:
+            state.ts = time.time()
+        with self._lock:
+            self._samples.append(state)
+        return state
+
+    def start(self) -> None:
+        """Forget earlier runs, take the first sample and keep sampling."""
+        if self._thread is not None:
+            return
+        with self._lock:
+            self._samples = []
+            self._intervals = []
+        if self._sample == self._shared_sample:
+            shared_watcher().start(self.interval_s)
+        self.sample_now()
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._sample_loop, name="parslet-energy", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop sampling and take the final sample."""
+        thread = self._thread
+        if thread is None:
+            return
+        self._stop.set()
+        thread.join()
+        self._thread = None
+        self.sample_now()
+        if self._sample == self._shared_sample:
+            shared_watcher().stop(self.interval_s)
+
+    def _sample_loop(self) -> None:
+        while not self._stop.wait(self.interval_s):
+            try:
+                self.sample_now()
+            except Exception as e:  # pragma: no cover - provider bug
+                logger.warning(f"Power sampling failed: {e}")
+
+    def report(self) -> dict[str, Any]:
+        """
+        Return the energy attributed to each task name.
+
+        Returns:
+            Dict[str, Any]: ``tasks`` maps each task name to ``calls``,
+            ``seconds`` (summed runtime), ``joules`` and ``battery_pct``
+            (None when the platform did not report that unit),
+            ``joules_per_call`` and ``max_temperature_c``. ``idle_joules``
+            and ``idle_battery_pct`` hold the drain of windows in which no
+            task ran, ``samples`` the number of power readings.
+        """
+        with self._lock:
+            samples = sorted(self._samples, key=lambda s: s.ts)
+            intervals = list(self._intervals)
+        tasks: dict[str, dict[str, Any]] = {}
+        for name, start, end in intervals:
+            entry = tasks.setdefault(
+                name,
+                {
+                    "calls": 0,
+                    "seconds": 0.0,
+                    "joules": None,
+                    "battery_pct": None,
+                    "max_temperature_c": None,
+                },
+            )
+            entry["calls"] += 1
+            entry["seconds"] += end - start
+
+        windows = [
+            (before.ts, after.ts, *_window_drain(before, after), before, after)
+            for before, after in zip(samples, samples[1:], strict=False)
+            if after.ts > before.ts
+        ]
+        starts = [w[0] for w in windows]
+        # Task-seconds inside each window, then each task's share of them.
+        busy = [0.0] * len(windows)
+        overlaps: list[tuple[str, int, float]] = []
+        for name, start, end in intervals:
+            index = max(0, bisect.bisect_right(starts, start) - 1)
+            while index < len(windows) and windows[index][0] < end:
+                w_start, w_end = windows[index][0], windows[index][1]
+                overlap = min(end, w_end) - max(start, w_start)
+                if overlap > 0:
+                    busy[index] += overlap
+                    overlaps.append((name, index, overlap))
+                index += 1
+
+        for name, index, overlap in overlaps:
+            _, _, joules, percent, before, after = windows[index]
+            share = overlap / busy[index]
+            entry = tasks[name]
+            if joules is not None:
+                entry["joules"] = (entry["joules"] or 0.0) + joules * share
+            if percent is not None:
+                entry["battery_pct"] = (entry["battery_pct"] or 0.0) + percent * share
+            temps = [
+                t for t in (before.temperature_c, after.temperature_c) if t is not None
+            ]
+            if temps:
+                entry["max_temperature_c"] = max(
+                    [*temps, entry["max_temperature_c"] or float("-inf")]
+                )
+
+        idle_joules: float | None = None
+        idle_pct: float | None = None
+        for index, (_, _, joules, percent, _, _) in enumerate(windows):
+            if busy[index]:
+                continue
+            if joules is not None:
+                idle_joules = (idle_joules or 0.0) + joules
+            if percent is not None:
+                idle_pct = (idle_pct or 0.0) + percent
+        for entry in tasks.values():
+            joules = entry["joules"]
+            entry["joules_per_call"] = (
+                joules / entry["calls"] if joules is not None else None
+            )
+        return {
+            "tasks": tasks,
+            "idle_joules": idle_joules,
+            "idle_battery_pct": idle_pct,
+            "samples": len(samples),
+        }
+
+    def joules_per_call(self) -> dict[str, float]:
+        """Return the mean measured energy of one call, by task name."""
+        return {
+            name: entry["joules_per_call"]
+            for name, entry in self.report()["tasks"].items()
+            if entry["joules_per_call"] is not None
+        }
+
+    def format_report(self) -> str:
+        """Return :meth:`report` as human readable text."""
+        data = self.report()
+        lines = [
+            f"{'Task':<30} {'Calls':>6} {'Runtime':>10} {'Energy':>10} "
+            f"{'Per call':>10} {'Battery':>8}"
+        ]
+
+        def joules(value: float | None) -> str:
+            return f"{value:.2f} J" if value is not None else "-"
+
+        def percent(value: float | None) -> str:
+            return f"{value:.2f}%" if value is not None else "-"
+
+        rows = sorted(
+            data["tasks"].items(),
+            key=lambda kv: -(kv[1]["joules"] or kv[1]["battery_pct"] or 0.0),
+        )
+        for name, entry in rows:
+            lines.append(
+                f"{name:<30} {entry['calls']:>6} {entry['seconds']:>9.2f}s "
+                f"{joules(entry['joules']):>10} "
+                f"{joules(entry['joules_per_call']):>10} "
+                f"{percent(entry['battery_pct']):>8}"
+            )
+        lines.append(
+            f"Idle drain: {joules(data['idle_joules'])}, "
+            f"{percent(data['idle_battery_pct'])} "
+            f"({data['samples']} power sample(s))"
+        )
+        return "\n".join(lines)
@@ -0,0 +1,350 @@
+"""Structured runner events and the sinks that consume them.
+
+:class:`DAGRunner` reports what happens to each task - submission, cache
+hits, completion, failure - as typed :class:`Event` tuples on an
+:class:`EventBus` instead of formatting log messages in the worker and
+scheduling threads. The bus keeps the most recent events in a ring buffer
+and hands every event to its sinks on a background dispatcher thread, so
+the cost on the hot path is one tuple and two appends. Text is only ever
+produced by a sink:
+
+* :class:`LogSink` writes readable (or JSON) messages to a logger, which the
+  CLI renders with ``rich``;
+* :class:`JsonLinesSink` writes one JSON object per event to a file;
+* :class:`MetricsSink` feeds :class:`~parslet.core.metrics.RunnerMetrics`.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import queue
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from enum import StrEnum
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any, NamedTuple
+
+if TYPE_CHECKING:  # pragma: no cover - imported for type hints only
+    from .metrics import RunnerMetrics
+
+__all__ = [
+    "Event",
+    "EventBus",
+    "EventSink",
+    "EventType",
+    "JsonLinesSink",
+    "LogSink",
+    "MetricsSink",
+]
+
+logger = logging.getLogger(__name__)
+
+
+class EventType(StrEnum):
+    """Kinds of events emitted by the runner."""
+
+    RUN_STARTED = "run_started"
+    RUN_FINISHED = "run_finished"
+    TASK_SUBMITTED = "task_submitted"
+    CHAIN_SUBMITTED = "chain_submitted"
+    TASK_STARTED = "task_started"
+    TASK_SUCCEEDED = "task_succeeded"
+    TASK_FAILED = "task_failed"
+    TASK_SKIPPED = "task_skipped"
+    CACHE_HIT = "cache_hit"
+    CACHE_MISS = "cache_miss"
+    POOL_RESIZED = "pool_resized"
+
+
+class Event(NamedTuple):
+    """
+    One runner event.
+
+    Attributes:
+        type (EventType): What happened.
+        time (float): Wall-clock time (``time.time()``) of the event.
+        task_id (Optional[str]): Task the event concerns, if any.
+        task_name (Optional[str]): Registered name of that task.
+        duration_s (Optional[float]): Execution time for finished tasks.
+        detail (Optional[dict]): Event specific values, e.g. the error of a
+            failed task or the old and new size of a resized pool.
+    """
+
+    type: EventType
+    time: float
+    task_id: str | None = None
+    task_name: str | None = None
+    duration_s: float | None = None
+    detail: dict[str, Any] | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the event as a flat JSON-serialisable dictionary."""
+        data: dict[str, Any] = {"event": str(self.type), "time": self.time}
+        if self.task_id is not None:
+            data["task_id"] = self.task_id
+        if self.task_name is not None:
+            data["task"] = self.task_name
+        if self.duration_s is not None:
+            data["duration_s"] = self.duration_s
+        if self.detail:
+            data.update(self.detail)
+        return data
+
+
+class EventSink:
+    """
+    Consumer of runner events.
+
+    :meth:`handle` is only ever called from the bus's dispatcher thread (or
+    the thread stopping the bus), one event at a time.
+    """
+
+    def handle(self, event: Event) -> None:
+        """Process one event."""
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Release resources; called when the sink is unsubscribed."""
+
+
+# Placed on the queue to stop the dispatcher thread.
+_STOP = object()
+
+_now = time.time
+
+
+class EventBus:
+    """
+    Fan-out of runner events to sinks.
+
+    :meth:`emit` may be called from any thread. Events are appended to a
+    ring buffer of the last ``capacity`` events and, if any sink is
+    subscribed, queued for the dispatcher thread started by :meth:`start`.
+    Events emitted while no dispatcher runs are delivered by the next
+    :meth:`flush` or :meth:`stop`.
+    """
+
+    def __init__(self, capacity: int = 4096) -> None:
+        """
+        Args:
+            capacity (int): Number of recent events kept by :meth:`recent`.
+        """
+        # Plain tuples; :class:`Event` objects are only built when read.
+        self._history: deque[tuple[Any, ...]] = deque(maxlen=capacity)
+        self._sinks: list[EventSink] = []
+        self._queue: queue.SimpleQueue[object] = queue.SimpleQueue()
+        self._thread: threading.Thread | None = None
+        # Serialises delivery when the caller drains the queue itself.
+        self._deliver_lock = threading.Lock()
+
+    @property
+    def sinks(self) -> list[EventSink]:
+        """The subscribed sinks."""
+        return list(self._sinks)
+
+    def subscribe(self, sink: EventSink) -> None:
+        """Deliver all following events to ``sink``."""
+        self._sinks = [*self._sinks, sink]
+
+    def unsubscribe(self, sink: EventSink) -> None:
+        """Stop delivering events to ``sink`` and close it."""
+        self.flush()
+        self._sinks = [s for s in self._sinks if s is not sink]
+        sink.close()
+
+    def emit(
+        self,
+        type: EventType,
+        task_id: str | None = None,
+        task_name: str | None = None,
+        duration_s: float | None = None,
+        detail: dict[str, Any] | None = None,
+    ) -> None:
+        """Record an event; never formats text or blocks."""
+        record = (type, _now(), task_id, task_name, duration_s, detail)
+        self._history.append(record)
+        if self._sinks:
+            self._queue.put(record)
+
+    def recent(self, limit: int | None = None) -> list[Event]:
+        """Return up to ``limit`` of the most recent events, oldest first."""
+        records = list(self._history)
+        if limit is not None:
+            records = records[-limit:] if limit > 0 else []
+        return [Event._make(r) for r in records]
+
+    def start(self) -> None:
+        """Start the dispatcher thread if it is not running."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._thread = threading.Thread(
+            target=self._dispatch_loop, name="parslet-events", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Deliver all queued events and stop the dispatcher thread."""
+        thread = self._thread
+        if thread is not None:
+            self._queue.put(_STOP)
+            thread.join()
+            self._thread = None
+        self._drain()
+
+    def flush(self, timeout: float | None = None) -> None:
+        """Block until every event emitted so far has been delivered."""
+        thread = self._thread
+        if thread is None or not thread.is_alive():
+            self._drain()
+            return
+        if thread is threading.current_thread():
+            return  # A sink cannot wait for itself.
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait(timeout)
+
+    def close(self) -> None:
+        """Stop the bus and close all sinks."""
+        self.stop()
+        for sink in self._sinks:
+            sink.close()
+        self._sinks = []
+
+    def _dispatch_loop(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                return
+            self._deliver(item)
+
+    def _drain(self) -> None:
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                return
+            if item is not _STOP:
+                self._deliver(item)
+
+    def _deliver(self, item: object) -> None:
+        if isinstance(item, threading.Event):
+            item.set()
+            return
+        event = Event._make(item)  # type: ignore[arg-type]
+        with self._deliver_lock:
+            for sink in self._sinks:
+                try:
+                    sink.handle(event)
+                except Exception as e:  # pragma: no cover - defensive
+                    logger.warning(f"Event sink {type(sink).__name__} failed: {e}")
+
+
+class LogSink(EventSink):
+    """
+    Write events to a logger as readable messages, or as JSON objects.
+
+    Task failures are not repeated here; the runner logs them itself with
+    their traceback.
+    """
+
+    def __init__(
+        self,
+        target_logger: logging.Logger,
+        json_format: bool = False,
+        level: int = logging.INFO,
+    ) -> None:
+        self.logger = target_logger
+        self.json_format = json_format
+        self.level = level
+
+    def handle(self, event: Event) -> None:
+        if not self.logger.isEnabledFor(self.level):
+            return
+        if self.json_format:
+            self.logger.log(self.level, json.dumps(event.to_dict(), default=repr))
+            return
+        message = _MESSAGES.get(event.type)
+        text = message(event) if message is not None else None
+        if text is not None:
+            self.logger.log(self.level, text)
+
+
+def _detail(event: Event, key: str) -> object:
+    return (event.detail or {}).get(key)
+
+
+_MESSAGES: dict[EventType, Callable[[Event], str | None]] = {
+    EventType.RUN_STARTED: lambda e: (
+        f"DAGRunner starting execution with {_detail(e, 'workers')} worker "
+        "thread(s)."
+    ),
+    EventType.RUN_FINISHED: lambda e: "DAGRunner finished processing all tasks.",
+    EventType.TASK_SUBMITTED: lambda e: (
+        f"Submitting task '{e.task_id}' ({e.task_name}) to executor."
+    ),
+    EventType.CHAIN_SUBMITTED: lambda e: (
+        f"Submitting fused chain of {_detail(e, 'length')} task(s) starting at "
+        f"'{e.task_id}' to executor."
+    ),
+    EventType.TASK_SUCCEEDED: lambda e: (
+        f"Task '{e.task_id}' ({e.task_name}) completed successfully"
+        + (f" in {e.duration_s:.4f}s." if e.duration_s is not None else ".")
+    ),
+    # Other skips are logged as warnings or errors by the runner itself.
+    EventType.TASK_SKIPPED: lambda e: (
+        f"Skipping task '{e.task_id}' as it was already completed in a " "previous run."
+        if _detail(e, "reason") == "checkpoint"
+        else None
+    ),
+    EventType.CACHE_HIT: lambda e: f"Cache hit for task '{e.task_id}' ({e.task_name}).",
+    EventType.POOL_RESIZED: lambda e: (
+        f"Resized worker pool from {_detail(e, 'old')} to {_detail(e, 'new')}"
+    ),
+}
+
+
+class JsonLinesSink(EventSink):
+    """Append every event as one JSON object per line to a file or stream."""
+
+    def __init__(self, target: str | Path | IO[str]) -> None:
+        """
+        Args:
+            target (str | Path | IO[str]): Path of the file to write, which
+                is truncated, or an open text stream, which is left open.
+        """
+        if isinstance(target, (str, Path)):
+            self._fh: IO[str] = open(target, "w", encoding="utf-8")
+            self._owned = True
+        else:
+            self._fh = target
+            self._owned = False
+
+    def handle(self, event: Event) -> None:
+        self._fh.write(json.dumps(event.to_dict(), default=repr) + "\n")
+
+    def close(self) -> None:
+        if self._owned:
+            self._fh.close()
+        else:
+            self._fh.flush()
+
+
+class MetricsSink(EventSink):
+    """Feed task completions and cache lookups into :class:`RunnerMetrics`."""
+
+    def __init__(self, metrics: RunnerMetrics) -> None:
+        self.metrics = metrics
+
+    def handle(self, event: Event) -> None:
+        kind = event.type
+        if kind is EventType.TASK_SUCCEEDED or kind is EventType.TASK_FAILED:
+            if event.duration_s is not None:
+                status = "SUCCESS" if kind is EventType.TASK_SUCCEEDED else "FAILED"
+                self.metrics.task_finished(
+                    event.task_name or "", status, event.duration_s
+                )
+        elif kind is EventType.CACHE_HIT or kind is EventType.CACHE_MISS:
+            self.metrics.cache_lookup(hit=kind is EventType.CACHE_HIT)
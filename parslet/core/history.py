@@ -0,0 +1,433 @@
+"""SQLite store of past runs for cross-run performance analysis.
+
+Every ``parslet run`` appends one row to ``runs`` - workflow, a hash of its
+source, host, Parslet and Python versions, elapsed time and resource
+snapshots taken before and after the run - and one row per task to
+``task_runs`` with its registered name, status, duration and whether the
+result came from the cache. Only the newest runs are kept (see
+:func:`get_history_keep`). Unlike the per-run ``--export-stats`` files,
+tasks are keyed by name, so runs can be compared: :meth:`RunHistory.percentiles`,
+:meth:`RunHistory.trends` and :meth:`RunHistory.slowest` back the
+``parslet stats`` command.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import platform
+import socket
+import sqlite3
+import statistics
+from collections.abc import Iterator
+from contextlib import closing, contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:  # pragma: no cover - imported for type hints only
+    from .dag import DAG
+    from .runner import DAGRunner
+
+__all__ = ["RunHistory", "get_history_keep", "get_history_path", "resource_snapshot"]
+
+logger = logging.getLogger(__name__)
+
+# Runs kept when PARSLET_HISTORY_KEEP is not set.
+DEFAULT_KEEP_RUNS = 100
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    started_at REAL NOT NULL,
+    elapsed_s REAL,
+    workflow TEXT NOT NULL,
+    workflow_hash TEXT,
+    parslet_version TEXT,
+    python TEXT,
+    host TEXT,
+    platform TEXT,
+    cpu_count INTEGER,
+    workers INTEGER,
+    tasks INTEGER,
+    succeeded INTEGER,
+    failed INTEGER,
+    cache_hits INTEGER,
+    ram_start_mb REAL,
+    ram_end_mb REAL,
+    battery_start REAL,
+    battery_end REAL,
+    load_avg REAL,
+    peak_rss_mb REAL
+);
+CREATE TABLE IF NOT EXISTS task_runs (
+    run_id INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+    task_id TEXT NOT NULL,
+    task_name TEXT NOT NULL,
+    status TEXT NOT NULL,
+    duration_s REAL,
+    cached INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS task_runs_name ON task_runs (task_name, run_id);
+CREATE INDEX IF NOT EXISTS task_runs_run ON task_runs (run_id);
+CREATE INDEX IF NOT EXISTS runs_workflow ON runs (workflow, id);
+"""
+
+
+def get_history_path() -> Path:
+    """Return the SQLite file used for the run history."""
+    base = os.environ.get(
+        "PARSLET_HISTORY_DB", os.path.expanduser("~/.parslet/history.db")
+    )
+    return Path(base)
+
+
+def get_history_keep() -> int:
+    """
+    Return how many runs the history retains.
+
+    Read from ``PARSLET_HISTORY_KEEP``; :data:`DEFAULT_KEEP_RUNS` if it is
+    unset or invalid. Zero or a negative value keeps every run.
+    """
+    value = os.environ.get("PARSLET_HISTORY_KEEP")
+    if not value:
+        return DEFAULT_KEEP_RUNS
+    try:
+        return int(value)
+    except ValueError:
+        logger.warning(
+            f"Ignoring invalid PARSLET_HISTORY_KEEP '{value}'; keeping "
+            f"{DEFAULT_KEEP_RUNS} runs."
+        )
+        return DEFAULT_KEEP_RUNS
+
+
+def resource_snapshot() -> dict[str, float | None]:
+    """
+    Return the host's current resource state.
+
+    The result holds ``ram_mb`` (available RAM), ``battery`` (percent),
+    ``load_avg`` (one-minute load average) and ``peak_rss_mb`` of this
+    process; values that cannot be read are None.
+    """
+    from ..utils.resource_utils import (
+        get_available_ram_mb,
+        get_battery_level,
+        get_peak_rss_bytes,
+    )
+
+    try:
+        load: float | None = os.getloadavg()[0]
+    except (AttributeError, OSError):  # pragma: no cover - Windows
+        load = None
+    peak = get_peak_rss_bytes()
+    battery = get_battery_level()
+    return {
+        "ram_mb": get_available_ram_mb(),
+        "battery": float(battery) if battery is not None else None,
+        "load_avg": load,
+        "peak_rss_mb": peak / (1024 * 1024) if peak is not None else None,
+    }
+
+
+def _source_hash(path: str | Path | None) -> str | None:
+    if path is None:
+        return None
+    try:
+        return hashlib.sha256(Path(path).read_bytes()).hexdigest()[:12]
+    except OSError:
+        return None
+
+
+def _percentile(values: list[float], q: float) -> float:
+    """Linearly interpolated ``q``-th percentile (0-100) of sorted ``values``."""
+    if len(values) == 1:
+        return values[0]
+    pos = (len(values) - 1) * q / 100
+    low = int(pos)
+    high = min(low + 1, len(values) - 1)
+    return values[low] + (values[high] - values[low]) * (pos - low)
+
+
+class RunHistory:
+    """
+    Run-history database.
+
+    A short-lived connection is opened per call, so one instance may be
+    shared between threads and several processes may write to the same
+    file.
+
+    Attributes:
+        path (Path): The SQLite file.
+        keep (int): Runs retained after each :meth:`record_run`; zero or
+            less keeps every run.
+    """
+
+    def __init__(self, path: str | Path | None = None, keep: int | None = None) -> None:
+        self.path = Path(path) if path is not None else get_history_path()
+        self.keep = keep if keep is not None else get_history_keep()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        with closing(sqlite3.connect(self.path, timeout=30)) as conn:
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA foreign_keys = ON")
+            with conn:
+                yield conn
+
+    def record_run(
+        self,
+        runner: DAGRunner,
+        dag: DAG,
+        workflow: str,
+        started_at: float,
+        elapsed_s: float,
+        source: str | Path | None = None,
+        resources_before: dict[str, float | None] | None = None,
+    ) -> int:
+        """
+        Store a finished run and the outcome of each of its tasks, then
+        drop runs beyond the newest ``keep``.
+
+        Args:
+            runner (DAGRunner): The runner that executed ``dag``.
+            dag (DAG): The executed graph, including dynamically spawned
+                tasks.
+            workflow (str): Name the run is filed under, usually the
+                workflow file path.
+            started_at (float): Wall-clock start time (``time.time()``).
+            elapsed_s (float): Duration of the run.
+            source (Optional[str | Path]): Workflow source file; its hash
+                tells workflow versions apart.
+            resources_before (Optional[dict]): :func:`resource_snapshot`
+                taken before the run.
+
+        Returns:
+            int: ID of the new run.
+        """
+        from .. import __version__
+
+        before = resources_before or {}
+        after = resource_snapshot()
+        rows: list[tuple[str, str, str, float | None, int]] = []
+        for task_id, future in dag.tasks.items():
+            func = future.func
+            name = getattr(func, "_parslet_task_name", func.__name__)
+            rows.append(
+                (
+                    task_id,
+                    name,
+                    runner.task_statuses.get(task_id, "PENDING"),
+                    runner.task_execution_times.get(task_id),
+                    int(task_id in runner.cache_hits),
+                )
+            )
+        succeeded = sum(1 for row in rows if row[2] == "SUCCESS")
+        failed = sum(1 for row in rows if row[2] == "FAILED")
+        with self._connect() as conn:
+            cursor = conn.execute(
+                """
+                INSERT INTO runs (
+                    started_at, elapsed_s, workflow, workflow_hash,
+                    parslet_version, python, host, platform, cpu_count,
+                    workers, tasks, succeeded, failed, cache_hits,
+                    ram_start_mb, ram_end_mb, battery_start, battery_end,
+                    load_avg, peak_rss_mb
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    started_at,
+                    elapsed_s,
+                    workflow,
+                    _source_hash(source),
+                    __version__,
+                    platform.python_version(),
+                    socket.gethostname(),
+                    platform.platform(),
+                    os.cpu_count(),
+                    runner.max_workers,
+                    len(rows),
+                    succeeded,
+                    failed,
+                    len(runner.cache_hits),
+                    before.get("ram_mb"),
+                    after["ram_mb"],
+                    before.get("battery"),
+                    after["battery"],
+                    after["load_avg"],
+                    after["peak_rss_mb"],
+                ),
+            )
+            run_id = int(cursor.lastrowid or 0)
+            conn.executemany(
+                "INSERT INTO task_runs (run_id, task_id, task_name, status, "
+                "duration_s, cached) VALUES (?, ?, ?, ?, ?, ?)",
+                [(run_id, *row) for row in rows],
+            )
+        if self.keep > 0:
+            self.prune(self.keep)
+        return run_id
+
+    @staticmethod
+    def _run_filter(
+        workflow: str | None, last_runs: int | None
+    ) -> tuple[str, list[object]]:
+        """SQL selecting the IDs of the matching runs, and its parameters."""
+        sql = "SELECT id FROM runs"
+        params: list[object] = []
+        if workflow is not None:
+            # A bare file name matches the workflow recorded by full path.
+            suffix = f"{os.sep}{workflow}"
+            sql += " WHERE workflow = ? OR substr(workflow, -?) = ?"
+            params += [workflow, len(suffix), suffix]
+        sql += " ORDER BY id DESC"
+        if last_runs is not None:
+            sql += " LIMIT ?"
+            params.append(last_runs)
+        return sql, params
+
+    def runs(
+        self, workflow: str | None = None, limit: int | None = 20
+    ) -> list[dict[str, Any]]:
+        """Return the most recent runs, newest first, as dictionaries."""
+        ids, params = self._run_filter(workflow, limit)
+        with self._connect() as conn:
+            rows = conn.execute(
+                f"SELECT * FROM runs WHERE id IN ({ids}) ORDER BY id DESC", params
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def durations(
+        self, workflow: str | None = None, last_runs: int | None = None
+    ) -> dict[str, list[tuple[int, float]]]:
+        """
+        Return ``(run_id, seconds)`` of every executed task, by task name.
+
+        Only successful tasks that actually ran count; cache hits and
+        failures would distort the timings.
+        """
+        ids, params = self._run_filter(workflow, last_runs)
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT task_name, run_id, duration_s FROM task_runs "
+                f"WHERE run_id IN ({ids}) AND status = 'SUCCESS' AND cached = 0 "
+                "AND duration_s IS NOT NULL ORDER BY run_id",
+                params,
+            ).fetchall()
+        result: dict[str, list[tuple[int, float]]] = {}
+        for name, run_id, duration in rows:
+            result.setdefault(name, []).append((run_id, duration))
+        return result
+
+    def percentiles(
+        self, workflow: str | None = None, last_runs: int | None = None
+    ) -> dict[str, dict[str, float]]:
+        """
+        Return duration statistics per task name.
+
+        Returns:
+            Dict[str, Dict[str, float]]: Per task name ``count``, ``mean_s``,
+            ``p50_s``, ``p90_s``, ``p99_s`` and ``max_s``.
+        """
+        result: dict[str, dict[str, float]] = {}
+        for name, samples in self.durations(workflow, last_runs).items():
+            values = sorted(d for _, d in samples)
+            result[name] = {
+                "count": len(values),
+                "mean_s": statistics.fmean(values),
+                "p50_s": _percentile(values, 50),
+                "p90_s": _percentile(values, 90),
+                "p99_s": _percentile(values, 99),
+                "max_s": values[-1],
+            }
+        return result
+
+    def trends(
+        self,
+        workflow: str | None = None,
+        recent: int = 3,
+        threshold: float = 0.2,
+        last_runs: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Compare each task's latest runs against its earlier runs.
+
+        For every task name the ``recent`` newest runs that executed it are
+        compared with all earlier ones by median duration. Tasks without
+        earlier runs are left out.
+
+        Args:
+            workflow (Optional[str]): Only consider runs of this workflow.
+            recent (int): Number of newest runs forming the recent window.
+            threshold (float): Relative slowdown above which a task counts
+                as a regression (0.2 = 20 % slower).
+            last_runs (Optional[int]): Only consider this many newest runs.
+
+        Returns:
+            List[Dict[str, Any]]: ``task``, ``baseline_s``, ``recent_s``,
+            ``ratio`` (recent / baseline), ``baseline_runs``,
+            ``recent_runs`` and ``regression``, slowest ratio first.
+        """
+        rows: list[dict[str, Any]] = []
+        for name, samples in self.durations(workflow, last_runs).items():
+            run_ids = sorted({run_id for run_id, _ in samples})
+            if len(run_ids) <= recent:
+                continue
+            cutoff = run_ids[-recent]
+            baseline = [d for run_id, d in samples if run_id < cutoff]
+            latest = [d for run_id, d in samples if run_id >= cutoff]
+            base_s = statistics.median(baseline)
+            recent_s = statistics.median(latest)
+            ratio = recent_s / base_s if base_s else float("inf")
+            rows.append(
+                {
+                    "task": name,
+                    "baseline_s": base_s,
+                    "recent_s": recent_s,
+                    "ratio": ratio,
+                    "baseline_runs": len(run_ids) - recent,
+                    "recent_runs": recent,
+                    "regression": ratio > 1 + threshold,
+                }
+            )
+        rows.sort(key=lambda row: -row["ratio"])
+        return rows
+
+    def slowest(
+        self,
+        workflow: str | None = None,
+        limit: int = 10,
+        last_runs: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """Return the ``limit`` longest task executions, slowest first."""
+        ids, params = self._run_filter(workflow, last_runs)
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT t.task_name, t.task_id, t.duration_s, t.run_id, "
+                "r.started_at, r.workflow_hash FROM task_runs t "
+                "JOIN runs r ON r.id = t.run_id "
+                f"WHERE t.run_id IN ({ids}) AND t.cached = 0 "
+                "AND t.duration_s IS NOT NULL "
+                "ORDER BY t.duration_s DESC LIMIT ?",
+                [*params, limit],
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def prune(self, keep: int) -> int:
+        """
+        Delete all but the ``keep`` newest runs; return how many went.
+
+        As for :func:`get_history_keep`, zero or less keeps every run.
+        """
+        if keep <= 0:
+            return 0
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "DELETE FROM runs WHERE id NOT IN "
+                "(SELECT id FROM runs ORDER BY id DESC LIMIT ?)",
+                (keep,),
+            )
+            return cursor.rowcount
@@ -11,8 +11,12 @@ full DAG classes used by Parslet itself.
 """
 from __future__ import annotations
 
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Any, Dict, Iterable, List, Tuple, Set
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Tuple, Set
+
+if TYPE_CHECKING:  # pragma: no cover - imported for type hints only
+    from .dag import DAG
 
 
 @dataclass
@@ -44,40 +48,57 @@ def infer_edges_from_params(tasks: Dict[str, IRTask]) -> List[Tuple[str, str]]:
 
     The helper assumes that if a parameter name matches another task name the
     latter is a dependency of the former.  It is purposely conservative –
-    callers can override the result with explicit edges if necessary.
+    callers can override the result with explicit edges if necessary.  A
+    parameter listed twice yields a single edge.
     """
 
     edges: List[Tuple[str, str]] = []
     for task in tasks.values():
-        for param in task.params:
+        name = task.name
+        for param in dict.fromkeys(task.params):
             if param in tasks:
-                edges.append((param, task.name))
+                edges.append((param, name))
     return edges
 
 
+def _successors(
+    tasks: Dict[str, IRTask], edges: Iterable[Tuple[str, str]]
+) -> Tuple[Dict[str, List[str]], Dict[str, int]]:
+    """Build successor lists and in-degree counters in a single edge pass."""
+
+    successors: Dict[str, List[str]] = {name: [] for name in tasks}
+    in_degree: Dict[str, int] = dict.fromkeys(tasks, 0)
+    for dep, node in edges:
+        if dep not in successors or node not in in_degree:
+            missing = dep if dep not in successors else node
+            raise ValueError(
+                f"Edge ({dep!r}, {node!r}) references unknown task {missing!r}"
+            )
+        successors[dep].append(node)
+        in_degree[node] += 1
+    return successors, in_degree
+
+
 def toposort(tasks: Dict[str, IRTask], edges: Iterable[Tuple[str, str]]) -> List[str]:
     """Topologically sort ``tasks`` given an iterable of ``edges``.
 
-    A ``ValueError`` is raised if a cycle is detected.  The algorithm is a
-    tiny implementation of Kahn's method and is sufficient for the unit tests
-    shipped with this repository.
+    A ``ValueError`` is raised if a cycle is detected or an edge names an
+    unknown task.  This is Kahn's method over successor lists and in-degree
+    counters, so it runs in ``O(V + E)``.  Tasks that become ready at the
+    same time keep the order in which they appear in ``tasks``.
     """
 
-    graph: Dict[str, Set[str]] = {name: set() for name in tasks}
-    for dep, node in edges:
-        graph[node].add(dep)
-
+    successors, in_degree = _successors(tasks, edges)
+    ready = deque(name for name, degree in in_degree.items() if not degree)
     result: List[str] = []
-    ready = [name for name, deps in graph.items() if not deps]
 
     while ready:
-        node = ready.pop()
+        node = ready.popleft()
         result.append(node)
-        for other, deps in graph.items():
-            if node in deps:
-                deps.remove(node)
-                if not deps:
-                    ready.append(other)
+        for other in successors[node]:
+            in_degree[other] -= 1
+            if not in_degree[other]:
+                ready.append(other)
 
     if len(result) != len(tasks):
         raise ValueError("Cycle detected in IRGraph")
@@ -109,10 +130,106 @@ def normalize_names(tasks: Dict[str, IRTask]) -> Dict[str, IRTask]:
     return new_tasks
 
 
+def ir_from_dag(dag: DAG) -> IRGraph:
+    """Describe a Parslet :class:`~parslet.core.dag.DAG` as an ``IRGraph``.
+
+    Each task is keyed by its task ID.  ``params`` lists the IDs of its
+    dependencies, ``body_ref`` points at the task function as
+    ``"module:qualname"`` and ``metadata`` keeps the task name together with
+    the arguments (dependencies encoded as ``{"__future__": task_id}``) so
+    that :func:`dag_from_ir` can rebuild the same DAG.  Edges are read
+    straight from the DAG's adjacency without any graph algorithms.
+    """
+
+    from .dag_io import _serialize_arg
+
+    predecessors = dag.graph.pred
+    tasks: Dict[str, IRTask] = {}
+    edges: List[Tuple[str, str]] = []
+    for task_id, future in dag.tasks.items():
+        deps = list(predecessors[task_id])
+        func = future.func
+        tasks[task_id] = IRTask(
+            name=task_id,
+            params=deps,
+            body_ref=f"{func.__module__}:{func.__qualname__}",
+            cache_key=getattr(future, "_cache_key", None),
+            metadata={
+                "task_name": getattr(func, "_parslet_task_name", func.__name__),
+                "args": [_serialize_arg(a) for a in future.args],
+                "kwargs": {k: _serialize_arg(v) for k, v in future.kwargs.items()},
+            },
+        )
+        edges.extend((dep, task_id) for dep in deps)
+    return IRGraph(tasks=tasks, edges=edges)
+
+
+def dag_from_ir(graph: IRGraph) -> DAG:
+    """Build a Parslet :class:`~parslet.core.dag.DAG` from an ``IRGraph``.
+
+    Every task needs a ``body_ref`` of the form ``"module:qualname"``.
+    Arguments come from ``metadata["args"]``/``metadata["kwargs"]`` when
+    present (as written by :func:`ir_from_dag`); otherwise the task is called
+    with the results of the tasks named in ``params``, in order.  Edges are
+    checked with :func:`toposort` and inserted in bulk; the DAG is not
+    rebuilt by traversing futures.
+
+    Raises:
+        ValueError: If a task has no ``body_ref``, the edges form a cycle or
+            reference unknown tasks.
+    """
+
+    import importlib
+
+    from .dag import DAG
+    from .dag_io import _deserialize_arg
+    from .task import ParsletFuture
+
+    edges = graph.edges or infer_edges_from_params(graph.tasks)
+    toposort(graph.tasks, edges)
+
+    modules: Dict[str, Any] = {}
+    futures: Dict[str, ParsletFuture] = {}
+    for key, task in graph.tasks.items():
+        if not task.body_ref or ":" not in task.body_ref:
+            raise ValueError(f"IR task {key!r} has no 'module:qualname' body_ref")
+        module_name, qualname = task.body_ref.split(":", 1)
+        module = modules.get(module_name)
+        if module is None:
+            module = modules[module_name] = importlib.import_module(module_name)
+        func: Any = module
+        for part in qualname.split("."):
+            func = getattr(func, part)
+        func = getattr(func, "_parslet_original_func", func)
+        futures[key] = ParsletFuture(task_id=key, func=func, args=(), kwargs={})
+
+    for key, task in graph.tasks.items():
+        future = futures[key]
+        metadata = task.metadata or {}
+        if "args" in metadata or "kwargs" in metadata:
+            future.args = tuple(
+                _deserialize_arg(a, futures) for a in metadata.get("args", [])
+            )
+            future.kwargs = {
+                k: _deserialize_arg(v, futures)
+                for k, v in metadata.get("kwargs", {}).items()
+            }
+        else:
+            future.args = tuple(futures[p] for p in task.params if p in futures)
+
+    dag = DAG()
+    dag.graph.add_nodes_from((tid, {"future_obj": f}) for tid, f in futures.items())
+    dag.tasks = futures
+    dag.graph.add_edges_from(edges)
+    return dag
+
+
 __all__ = [
     "IRTask",
     "IRGraph",
     "infer_edges_from_params",
     "toposort",
     "normalize_names",
+    "ir_from_dag",
+    "dag_from_ir",
 ]
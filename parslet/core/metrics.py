@@ -0,0 +1,293 @@
+"""Prometheus metrics for a running :class:`~parslet.core.runner.DAGRunner`.
+
+:class:`RunnerMetrics` collects task completions and cache lookups from the
+runner's callbacks and renders them, together with a snapshot of the
+runner's state and the host's resources, in the Prometheus text exposition
+format. :class:`MetricsServer` serves that text over HTTP so long-running
+workflows can be scraped while they execute.
+
+Recording must never slow down or block the worker threads, so events are
+appended to a :class:`collections.deque` (atomic under the GIL) and only
+folded into counters and histograms when a scrape happens.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from collections import deque
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover - imported for type hints only
+    from .runner import DAGRunner
+
+__all__ = ["MetricsServer", "RunnerMetrics"]
+
+logger = logging.getLogger(__name__)
+
+#: Upper bounds (seconds) of the task latency histogram buckets.
+LATENCY_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+    300.0,
+)
+
+# Pending events after which a recording thread folds them in itself, so
+# memory stays bounded when nobody scrapes.
+_DRAIN_THRESHOLD = 4096
+
+# Stands in for the task name of cache lookup events; task names are
+# never empty.
+_CACHE_EVENT = ""
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class RunnerMetrics:
+    """
+    Aggregated task metrics of one runner.
+
+    :meth:`task_finished` and :meth:`cache_lookup` may be called from any
+    thread without taking a lock; :meth:`render` produces the exposition
+    text.
+    """
+
+    def __init__(self) -> None:
+        self._events: deque[tuple[str, str, float]] = deque()
+        self._fold_lock = threading.Lock()
+        # Task name -> (per-bucket counts, sum of seconds, count).
+        self._latency: dict[str, tuple[list[int], float, int]] = {}
+        self._finished: dict[str, int] = {}
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def task_finished(self, task_name: str, status: str, duration_s: float) -> None:
+        """Record that ``task_name`` ended with ``status`` after ``duration_s``."""
+        self._events.append((task_name, status, duration_s))
+        if len(self._events) > _DRAIN_THRESHOLD:
+            self._fold(blocking=False)
+
+    def cache_lookup(self, hit: bool) -> None:
+        """Record one result-cache lookup."""
+        self._events.append((_CACHE_EVENT, "hit" if hit else "miss", 0.0))
+
+    def _fold(self, blocking: bool = True) -> None:
+        """Fold pending events into the aggregates."""
+        if not self._fold_lock.acquire(blocking=blocking):
+            return
+        try:
+            while True:
+                try:
+                    name, status, seconds = self._events.popleft()
+                except IndexError:
+                    break
+                if name == _CACHE_EVENT:
+                    if status == "hit":
+                        self.cache_hits += 1
+                    else:
+                        self.cache_misses += 1
+                    continue
+                self._finished[status] = self._finished.get(status, 0) + 1
+                buckets, total, count = self._latency.get(
+                    name, ([0] * len(LATENCY_BUCKETS), 0.0, 0)
+                )
+                for i, bound in enumerate(LATENCY_BUCKETS):
+                    if seconds <= bound:
+                        buckets[i] += 1
+                        break
+                self._latency[name] = (buckets, total + seconds, count + 1)
+        finally:
+            self._fold_lock.release()
+
+    def render(self, runner: DAGRunner | None = None) -> str:
+        """
+        Return all metrics in the Prometheus text format.
+
+        Args:
+            runner (Optional[DAGRunner]): When given, task counts by status,
+                queue depth, active workers and pool size are read from it.
+        """
+        self._fold()
+        lines: list[str] = []
+
+        def metric(name: str, kind: str, help_text: str) -> None:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+
+        if runner is not None:
+            statuses = list(runner.task_statuses.copy().values())
+            counts = {s: statuses.count(s) for s in set(statuses)}
+            if runner._dag is not None:
+                counts["PENDING"] = max(0, len(runner._dag.tasks) - len(statuses))
+            metric("parslet_tasks", "gauge", "Tasks of the current run by status.")
+            for status in sorted(counts):
+                lines.append(f'parslet_tasks{{status="{status}"}} {counts[status]}')
+
+            executor = getattr(runner, "executor", None)
+            queue = getattr(executor, "_work_queue", None)
+            queued = queue.qsize() if queue is not None else 0
+            running = counts.get("RUNNING", 0)
+            metric("parslet_queue_depth", "gauge", "Tasks waiting for a worker.")
+            lines.append(f"parslet_queue_depth {queued}")
+            metric("parslet_active_workers", "gauge", "Workers executing a task.")
+            lines.append(f"parslet_active_workers {max(0, running - queued)}")
+            metric("parslet_pool_size", "gauge", "Size of the worker pool.")
+            pool_size = getattr(runner, "_pool_size", runner.max_workers)
+            lines.append(f"parslet_pool_size {pool_size}")
+
+        metric(
+            "parslet_tasks_finished_total",
+            "counter",
+            "Executed tasks by final status.",
+        )
+        for status in sorted(self._finished):
+            lines.append(
+                f'parslet_tasks_finished_total{{status="{status}"}} '
+                f"{self._finished[status]}"
+            )
+
+        metric(
+            "parslet_task_duration_seconds",
+            "histogram",
+            "Task execution time by task name.",
+        )
+        for name in sorted(self._latency):
+            buckets, total, count = self._latency[name]
+            label = _escape(name)
+            cumulative = 0
+            for bound, n in zip(LATENCY_BUCKETS, buckets, strict=True):
+                cumulative += n
+                lines.append(
+                    f'parslet_task_duration_seconds_bucket{{task="{label}",'
+                    f'le="{bound}"}} {cumulative}'
+                )
+            lines.append(
+                f'parslet_task_duration_seconds_bucket{{task="{label}",'
+                f'le="+Inf"}} {count}'
+            )
+            lines.append(f'parslet_task_duration_seconds_sum{{task="{label}"}} {total}')
+            lines.append(
+                f'parslet_task_duration_seconds_count{{task="{label}"}} {count}'
+            )
+
+        lookups = self.cache_hits + self.cache_misses
+        metric("parslet_cache_hits_total", "counter", "Result cache hits.")
+        lines.append(f"parslet_cache_hits_total {self.cache_hits}")
+        metric("parslet_cache_misses_total", "counter", "Result cache misses.")
+        lines.append(f"parslet_cache_misses_total {self.cache_misses}")
+        metric("parslet_cache_hit_ratio", "gauge", "Share of cache lookups that hit.")
+        lines.append(
+            f"parslet_cache_hit_ratio {self.cache_hits / lookups if lookups else 0.0}"
+        )
+
+        lines.extend(_host_metrics())
+        return "\n".join(lines) + "\n"
+
+
+def _host_metrics() -> list[str]:
+    """Resident memory, battery and thermal state of the host."""
+    from ..utils.power import shared_watcher
+
+    lines: list[str] = []
+    try:
+        import psutil
+
+        rss = psutil.Process(os.getpid()).memory_info().rss
+    except Exception:  # pragma: no cover - psutil missing or restricted
+        rss = None
+    if rss is not None:
+        lines.append("# HELP parslet_process_resident_memory_bytes Resident memory.")
+        lines.append("# TYPE parslet_process_resident_memory_bytes gauge")
+        lines.append(f"parslet_process_resident_memory_bytes {rss}")
+
+    state = shared_watcher().latest(max_age_s=5.0)
+    lines.append("# HELP parslet_on_battery 1 if the host runs on battery power.")
+    lines.append("# TYPE parslet_on_battery gauge")
+    lines.append(f"parslet_on_battery {int(state.source == 'battery')}")
+    if state.percent is not None:
+        lines.append("# HELP parslet_battery_percent Battery charge level.")
+        lines.append("# TYPE parslet_battery_percent gauge")
+        lines.append(f"parslet_battery_percent {state.percent}")
+    if state.temperature_c is not None:
+        lines.append("# HELP parslet_temperature_celsius Device temperature.")
+        lines.append("# TYPE parslet_temperature_celsius gauge")
+        lines.append(f"parslet_temperature_celsius {state.temperature_c}")
+    lines.append("# HELP parslet_thermal_throttle 1 if the CPU is throttled.")
+    lines.append("# TYPE parslet_thermal_throttle gauge")
+    lines.append(f"parslet_thermal_throttle {int(state.thermal_throttle)}")
+    return lines
+
+
+class MetricsServer:
+    """
+    Background HTTP server exposing metrics text on ``/metrics``.
+
+    Attributes:
+        port (int): Port the server is bound to.
+    """
+
+    def __init__(
+        self, render: Callable[[], str], port: int, host: str = "127.0.0.1"
+    ) -> None:
+        """
+        Args:
+            render (Callable[[], str]): Produces the exposition text for each
+                scrape.
+            port (int): Port to listen on; 0 picks a free one.
+            host (str): Interface to bind.
+        """
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        class _Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:  # noqa: N802 - http.server API
+                if self.path.split("?", 1)[0] not in ("/", "/metrics"):
+                    self.send_error(404)
+                    return
+                try:
+                    body = render().encode("utf-8")
+                except Exception as e:  # pragma: no cover - defensive
+                    logger.warning(f"Rendering metrics failed: {e}")
+                    self.send_error(500)
+                    return
+                self.send_response(200)
+                self.send_header(
+                    "Content-Type", "text/plain; version=0.0.4; charset=utf-8"
+                )
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: object) -> None:
+                pass  # Scrapes are too frequent to log.
+
+        self._server = ThreadingHTTPServer((host, port), _Handler)
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="parslet-metrics", daemon=True
+        )
+
+    def start(self) -> None:
+        """Start serving in a daemon thread."""
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop serving and release the port."""
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
@@ -0,0 +1,337 @@
+"""Aggregated live view of a running workflow for ``parslet run --monitor``.
+
+:class:`RunMonitor` subscribes to the runner's
+:class:`~parslet.core.events.EventBus` and keeps running totals - tasks per
+status and per task name, recent completions for throughput and ETA, and the
+set of tasks currently executing. :meth:`RunMonitor.render` turns that state
+into a fixed-size ``rich`` renderable, so refreshing the view costs the same
+for ten tasks as for a hundred thousand and never walks the runner's status
+dictionary.
+"""
+
+from __future__ import annotations
+
+import heapq
+import os
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from typing import TYPE_CHECKING, TypedDict
+
+from ..utils.power import PowerState, shared_watcher
+from .events import Event, EventSink, EventType
+
+if TYPE_CHECKING:  # pragma: no cover - imported for type hints only
+    import psutil
+    from rich.console import RenderableType
+
+__all__ = ["MonitorSnapshot", "NameSummary", "RunMonitor"]
+
+_SPARK = "▁▂▃▄▅▆▇█"
+
+# Completions younger than this many seconds count towards the throughput.
+_RATE_WINDOW_S = 30.0
+
+
+class _NameStats:
+    __slots__ = ("running", "succeeded", "failed", "skipped", "cached", "total_s")
+
+    def __init__(self) -> None:
+        self.running = 0
+        self.succeeded = 0
+        self.failed = 0
+        self.skipped = 0
+        self.cached = 0
+        self.total_s = 0.0
+
+
+class NameSummary(TypedDict):
+    """Counts and mean execution time of the tasks sharing one name."""
+
+    running: int
+    succeeded: int
+    failed: int
+    skipped: int
+    cached: int
+    mean_s: float | None
+
+
+class MonitorSnapshot(TypedDict):
+    """Aggregated state returned by :meth:`RunMonitor.snapshot`."""
+
+    total: int
+    running: int
+    pending: int
+    succeeded: int
+    failed: int
+    skipped: int
+    cached: int
+    elapsed_s: float
+    throughput: float
+    eta_s: float | None
+    by_name: dict[str, NameSummary]
+    slowest: list[tuple[str, str, float]]
+
+
+class RunMonitor(EventSink):
+    """
+    Incrementally aggregated progress of one run.
+
+    Attributes:
+        top (int): Number of task names and running tasks listed.
+    """
+
+    def __init__(
+        self,
+        total: Callable[[], int] | None = None,
+        top: int = 5,
+        history: int = 40,
+    ) -> None:
+        """
+        Args:
+            total (Optional[Callable[[], int]]): Returns the number of tasks
+                in the run, e.g. ``lambda: len(dag.tasks)``; called on each
+                render so tasks spawned at run time are included.
+            top (int): Number of task names and running tasks listed.
+            history (int): Number of resource samples in the sparklines.
+        """
+        self.top = top
+        self._total = total
+        self._lock = threading.Lock()
+        self._started = time.monotonic()
+        # Task ID -> (start time, task name) of the tasks executing now.
+        self._running: dict[str, tuple[float, str]] = {}
+        self._names: dict[str, _NameStats] = {}
+        self.succeeded = 0
+        self.failed = 0
+        self.skipped = 0
+        self.cached = 0
+        self._finish_times: deque[float] = deque()
+        self._cpu: deque[float] = deque(maxlen=history)
+        self._rss: deque[float] = deque(maxlen=history)
+        self._process: psutil.Process | None = None
+        self._power: PowerState | None = None
+
+    def _name(self, name: str | None) -> _NameStats:
+        key = name or "?"
+        stats = self._names.get(key)
+        if stats is None:
+            stats = self._names[key] = _NameStats()
+        return stats
+
+    def handle(self, event: Event) -> None:
+        kind = event.type
+        now = time.monotonic()
+        with self._lock:
+            if (
+                kind is EventType.TASK_SUBMITTED
+                or kind is EventType.CHAIN_SUBMITTED
+                or kind is EventType.TASK_STARTED
+            ) and event.task_id is not None:
+                self._running[event.task_id] = (now, event.task_name or "?")
+                self._name(event.task_name).running += 1
+            elif kind is EventType.TASK_SUCCEEDED or kind is EventType.TASK_FAILED:
+                stats = self._name(event.task_name)
+                if self._running.pop(event.task_id or "", None) is not None:
+                    stats.running -= 1
+                if kind is EventType.TASK_SUCCEEDED:
+                    self.succeeded += 1
+                    stats.succeeded += 1
+                else:
+                    self.failed += 1
+                    stats.failed += 1
+                stats.total_s += event.duration_s or 0.0
+                self._finish_times.append(now)
+            elif kind is EventType.CACHE_HIT:
+                self.cached += 1
+                self._name(event.task_name).cached += 1
+                self._finish_times.append(now)
+            elif kind is EventType.TASK_SKIPPED:
+                self.skipped += 1
+                self._name(event.task_name).skipped += 1
+
+    @property
+    def finished(self) -> int:
+        """Tasks that reached a final state."""
+        return self.succeeded + self.failed + self.skipped + self.cached
+
+    def throughput(self, now: float | None = None) -> float:
+        """Completed tasks per second over the last 30 seconds."""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            times = self._finish_times
+            while times and now - times[0] > _RATE_WINDOW_S:
+                times.popleft()
+            count = len(times)
+        window = min(_RATE_WINDOW_S, now - self._started)
+        return count / window if window > 0 else 0.0
+
+    def sample_resources(self) -> None:
+        """Record the process CPU load and resident memory for the sparklines,
+        and the battery and temperature reading of the shared power watcher."""
+        self._power = shared_watcher().latest(max_age_s=5.0)
+        try:
+            import psutil
+
+            if self._process is None:
+                self._process = psutil.Process(os.getpid())
+                self._process.cpu_percent(None)
+            cpu = self._process.cpu_percent(None)
+            rss = self._process.memory_info().rss
+        except Exception:  # pragma: no cover - psutil missing or restricted
+            return
+        self._cpu.append(cpu)
+        self._rss.append(rss / (1024 * 1024))
+
+    def snapshot(self) -> MonitorSnapshot:
+        """
+        Return the aggregated state as plain data.
+
+        The result holds the totals by status (``pending`` is derived from
+        ``total``), ``throughput`` in tasks per second, ``eta_s`` (None while
+        unknown), ``by_name`` with the ``top`` busiest task names and
+        ``slowest`` with the ``top`` longest running tasks as
+        ``(task_id, task_name, seconds)``.
+        """
+        now = time.monotonic()
+        rate = self.throughput(now)
+        with self._lock:
+            running = len(self._running)
+            finished = self.finished
+            slowest = heapq.nsmallest(
+                self.top, self._running.items(), key=lambda kv: kv[1][0]
+            )
+            names = heapq.nlargest(
+                self.top,
+                self._names.items(),
+                key=lambda kv: kv[1].running
+                + kv[1].succeeded
+                + kv[1].failed
+                + kv[1].skipped
+                + kv[1].cached,
+            )
+            by_name = {
+                name: NameSummary(
+                    running=s.running,
+                    succeeded=s.succeeded,
+                    failed=s.failed,
+                    skipped=s.skipped,
+                    cached=s.cached,
+                    mean_s=(
+                        s.total_s / (s.succeeded + s.failed)
+                        if s.succeeded + s.failed
+                        else None
+                    ),
+                )
+                for name, s in names
+            }
+            succeeded, failed = self.succeeded, self.failed
+            skipped, cached = self.skipped, self.cached
+        total = self._total() if self._total is not None else finished + running
+        remaining = max(0, total - finished)
+        return MonitorSnapshot(
+            total=total,
+            running=running,
+            pending=max(0, remaining - running),
+            succeeded=succeeded,
+            failed=failed,
+            skipped=skipped,
+            cached=cached,
+            elapsed_s=now - self._started,
+            throughput=rate,
+            eta_s=remaining / rate if rate > 0 else None,
+            by_name=by_name,
+            slowest=[(tid, name, now - start) for tid, (start, name) in slowest],
+        )
+
+    def render(self) -> RenderableType:
+        """Return the current view as a ``rich`` renderable."""
+        from rich.console import Group
+        from rich.table import Table
+        from rich.text import Text
+
+        self.sample_resources()
+        snap = self.snapshot()
+        total = snap["total"]
+        finished = self.finished
+        eta = snap["eta_s"]
+        header = Text.assemble(
+            (f"{finished}/{total} done", "bold"),
+            f"  running {snap['running']}  pending {snap['pending']}  ",
+            (f"ok {snap['succeeded']}", "green"),
+            "  ",
+            (f"cached {snap['cached']}", "cyan"),
+            "  ",
+            (f"failed {snap['failed']}", "red"),
+            "  ",
+            (f"skipped {snap['skipped']}", "yellow"),
+            f"\n{snap['throughput']:.1f} tasks/s  elapsed "
+            f"{_duration(snap['elapsed_s'])}  ETA "
+            f"{_duration(eta) if eta is not None else '?'}",
+        )
+
+        names = Table(title="Tasks by name", expand=False)
+        for column in ("Task", "Running", "OK", "Cached", "Failed", "Skipped", "Mean"):
+            names.add_column(column, justify="left" if column == "Task" else "right")
+        for name, row in snap["by_name"].items():
+            mean = row["mean_s"]
+            names.add_row(
+                name,
+                str(row["running"]),
+                str(row["succeeded"]),
+                str(row["cached"]),
+                str(row["failed"]),
+                str(row["skipped"]),
+                f"{mean:.3f}s" if mean is not None else "-",
+            )
+        hidden = len(self._names) - len(snap["by_name"])
+        if hidden > 0:
+            names.caption = f"{hidden} more task name(s)"
+
+        slow = Table(title="Longest running", expand=False)
+        slow.add_column("Task ID")
+        slow.add_column("Task")
+        slow.add_column("Running for", justify="right")
+        for task_id, name, seconds in snap["slowest"]:
+            slow.add_row(task_id, name, _duration(seconds))
+
+        resources = Text.assemble(
+            "CPU ",
+            (_sparkline(self._cpu), "magenta"),
+            f" {self._cpu[-1]:.0f}%" if self._cpu else "",
+            "   RSS ",
+            (_sparkline(self._rss), "blue"),
+            f" {self._rss[-1]:.0f} MiB" if self._rss else "",
+        )
+        power = self._power
+        if power is not None and power.percent is not None:
+            resources.append(f"   Battery {power.percent}%")
+            if power.is_charging:
+                resources.append(" (charging)")
+        if power is not None and power.temperature_c is not None:
+            resources.append(
+                f"   {power.temperature_c:.0f}°C",
+                "red" if power.thermal_throttle else None,
+            )
+        return Group(header, names, slow, resources)
+
+
+def _sparkline(values: deque[float]) -> str:
+    if not values:
+        return ""
+    low, high = min(values), max(values)
+    span = high - low or 1.0
+    last = len(_SPARK) - 1
+    return "".join(_SPARK[round((v - low) / span * last)] for v in values)
+
+
+def _duration(seconds: float) -> str:
+    seconds = int(seconds)
+    if seconds < 60:
+        return f"{seconds}s"
+    minutes, seconds = divmod(seconds, 60)
+    if minutes < 60:
+        return f"{minutes}m{seconds:02d}s"
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}h{minutes:02d}m"
@@ -11,6 +11,7 @@ import tempfile
 
 from .dag import DAG
 from .task import ParsletFuture, parslet_task
+from .task_call import ResultRef, TaskCall
 
 
 __all__ = ["convert_task_to_parsl", "execute_with_parsl", "parsl_python"]
@@ -21,6 +22,15 @@ __all__ = ["convert_task_to_parsl", "execute_with_parsl", "parsl_python"]
 # decorator is used many times within a single process.
 _DFK_CACHE: Dict[str, Any] = {}
 
+# Attribute under which ``convert_task_to_parsl`` stores the app built for a
+# function, so a DAG with many nodes but few distinct functions creates one
+# ``python_app`` per function.  The entry remembers the ``python_app``
+# decorator it was built with and is rebuilt if Parsl has been re-imported.
+# Keeping it on the function rather than in a module-level mapping lets the
+# app hold the function strongly, as process-based executors pickle it,
+# while the pair is still freed together once the function is unused.
+_APP_ATTR = "_parslet_parsl_app"
+
 
 def _ensure_parsl_loaded(config: Any | None, executor: str | None) -> None:
     """Lazily load Parsl with a small thread pool configuration."""
@@ -52,7 +62,8 @@ def convert_task_to_parsl(parslet_func):
 
     This requires the ``parsl`` package to be installed. The returned
     function behaves like the original Parslet task but executes under
-    Parsl's DataFlowKernel when called.
+    Parsl's DataFlowKernel when called.  Conversions are memoized per
+    function, so repeated calls return the same app.
     """
     try:
         from parsl import python_app
@@ -62,13 +73,25 @@ def convert_task_to_parsl(parslet_func):
             "Install it via `pip install parsl`."
         ) from exc
 
+    cached = getattr(parslet_func, _APP_ATTR, None)
+    if cached is not None and cached[0] is python_app:
+        return cached[1]
+
     @python_app
     def parsl_task(*args, **kwargs):
         return parslet_func(*args, **kwargs)
 
+    try:
+        setattr(parslet_func, _APP_ATTR, (python_app, parsl_task))
+    except (AttributeError, TypeError):  # e.g. bound methods; convert each time
+        pass
     return parsl_task
 
 
+def _run_call(call: TaskCall, *dep_values: Any) -> Any:
+    return call(*dep_values)
+
+
 def execute_with_parsl(
     entry_futures: List[ParsletFuture],
     parsl_config: Optional[Any] = None,
@@ -129,17 +152,23 @@ def execute_with_parsl(
 
     for task_id in order:
         pf = dag.get_task_future(task_id)
-        parsl_app = convert_task_to_parsl(pf.func)
-
-        resolved_args = [
-            parsl_futures[a.task_id] if isinstance(a, ParsletFuture) else a
-            for a in pf.args
-        ]
-        resolved_kwargs = {
-            k: parsl_futures[v.task_id] if isinstance(v, ParsletFuture) else v
-            for k, v in pf.kwargs.items()
-        }
+        template = pf.argument_template()
+        if template.nested:
+            # Parsl only waits for futures passed directly as arguments, so
+            # futures inside containers are passed as extra positional
+            # arguments and put back in place inside the app.
+            dep_keys = tuple(dep.task_id for dep in template.dependencies)
+            args, kwargs = template.resolve(lambda dep: ResultRef(dep.task_id))
+            parsl_futures[task_id] = convert_task_to_parsl(_run_call)(
+                TaskCall(pf.func, args, kwargs, dep_keys),
+                *(parsl_futures[key] for key in dep_keys),
+            )
+            continue
 
+        parsl_app = convert_task_to_parsl(pf.func)
+        resolved_args, resolved_kwargs = template.resolve(
+            lambda dep: parsl_futures[dep.task_id]
+        )
         parsl_futures[task_id] = parsl_app(*resolved_args, **resolved_kwargs)
 
     results = [parsl_futures[f.task_id].result() for f in entry_futures]
@@ -1,9 +1,11 @@
 """Resource-aware worker pool policy."""
 
+import statistics
 from dataclasses import dataclass
 
 from ..utils.power import PowerState
 from ..utils.resource_utils import ResourceSnapshot
+from .stats import TaskStatsStore
 from .task import ParsletFuture
 
 
@@ -34,19 +36,45 @@ class AdaptivePolicy:
 
 @dataclass
 class EnergyAwarePolicy:
-    """Hybrid policy that considers task metadata and power state."""
+    """Hybrid policy that considers task metadata and power state.
+
+    Tasks are ranked by their ``energy_cost`` label unless
+    ``measured_costs`` holds the energy one call of the task took in earlier
+    runs (see :meth:`from_stats`). Tasks without a measurement are then
+    placed at the lowest, median or highest measured cost for the labels
+    ``"low"``, ``"med"`` and ``"high"``.
+    """
 
     low_battery_threshold: int = 40
+    measured_costs: dict[str, float] | None = None
+
+    @classmethod
+    def from_stats(
+        cls, store: TaskStatsStore, low_battery_threshold: int = 40
+    ) -> "EnergyAwarePolicy":
+        """Create a policy using the energy recorded in ``store``."""
+        return cls(low_battery_threshold, store.energy_costs() or None)
 
     def _energy_rank(self, cost: str) -> int:
         return {"low": 0, "med": 1, "high": 2}.get(cost, 1)
 
+    def _energy_key(self, fut: ParsletFuture) -> float:
+        rank = self._energy_rank(fut.energy_cost)
+        if not self.measured_costs:
+            return rank
+        name = getattr(fut.func, "_parslet_task_name", fut.func.__name__)
+        measured = self.measured_costs.get(name)
+        if measured is not None:
+            return measured
+        known = sorted(self.measured_costs.values())
+        return (known[0], statistics.median(known), known[-1])[rank]
+
     def _qos_rank(self, qos: str) -> int:
         return {"high": 0, "standard": 1, "best_effort": 2}.get(qos, 1)
 
     def task_priority(self, fut: ParsletFuture, power: PowerState) -> tuple:
         deadline = fut.deadline_s if fut.deadline_s is not None else float("inf")
-        energy = self._energy_rank(fut.energy_cost)
+        energy = self._energy_key(fut)
         qos = self._qos_rank(fut.qos)
         if (
             power.source == "battery"
@@ -70,3 +98,47 @@ class EnergyAwarePolicy:
             if power.percent < self.low_battery_threshold:
                 return max(1, current // 2)
         return current
+
+
+@dataclass
+class ThermalPolicy:
+    """Back off before the SoC reaches its throttling temperature.
+
+    Within ``margin_c`` degrees of the throttle point the worker limit
+    shrinks linearly towards one and tasks declared with
+    ``energy_cost="high"`` are held back; at the throttle point only one
+    task runs. Passively cooled devices keep a higher sustained clock this
+    way than when they run flat out into the throttle.
+    """
+
+    margin_c: float = 8.0
+    throttle_temp_c: float = 80.0
+    max_defer_s: float = 60.0
+
+    def heat(self, power: PowerState) -> float | None:
+        """Return how far into the margin the SoC is, from 0.0 to 1.0.
+
+        The platform's passive trip point is used when known, otherwise
+        ``throttle_temp_c``. Returns None without a temperature reading.
+        """
+
+        if power.thermal_throttle:
+            return 1.0
+        if power.temperature_c is None:
+            return None
+        limit = power.throttle_temp_c or self.throttle_temp_c
+        fraction = (power.temperature_c - (limit - self.margin_c)) / self.margin_c
+        return min(1.0, max(0.0, fraction))
+
+    def decide_max_workers(self, power: PowerState, current: int) -> int:
+        """Return how many tasks may run at once at the current temperature."""
+
+        heat = self.heat(power)
+        if not heat:
+            return current
+        return max(1, round(current * (1.0 - heat)))
+
+    def should_defer(self, fut: ParsletFuture, power: PowerState) -> bool:
+        """Return True if ``fut`` should wait for the SoC to cool down."""
+
+        return fut.energy_cost == "high" and bool(self.heat(power))
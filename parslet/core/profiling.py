@@ -0,0 +1,315 @@
+"""Per-task CPU and memory profiling for :class:`~parslet.core.runner.DAGRunner`.
+
+:class:`TaskProfiler` runs selected task functions under :mod:`cProfile` or
+:mod:`tracemalloc` and aggregates the results by task name: CPU profiles are
+merged into :class:`pstats.Stats` objects, memory profiles into the peak
+traced memory, the growth of the process's peak RSS and the source lines
+that allocated the most. Tasks are profiled when the runner was started
+with ``profile="cpu"`` or ``profile="mem"`` (``parslet run --profile``) or
+when they are declared with ``@parslet_task(profile=...)``.
+
+Up to Python 3.11, cProfile only sees the thread it runs in, so CPU
+profiles are exact per task. From Python 3.12 it is built on the
+process-wide :mod:`sys.monitoring`: only one profiler may be active at a
+time and it records every thread. CPU-profiled tasks therefore run one at a
+time there, and a task that runs unprofiled alongside one (possible when
+only some tasks are declared with ``profile="cpu"``) shows up in its
+profile. tracemalloc traces the whole process; when several profiled tasks
+run at the same time their allocations are attributed to each other, so run
+with ``--max-workers 1`` for exact memory attribution.
+"""
+
+from __future__ import annotations
+
+import io
+import logging
+import re
+import sys
+import threading
+from collections.abc import Callable
+from contextlib import AbstractContextManager, nullcontext
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from ..utils.resource_utils import get_peak_rss_bytes
+
+if TYPE_CHECKING:  # pragma: no cover - imported for type hints only
+    import pstats
+
+__all__ = ["PROFILE_MODES", "TaskProfiler"]
+
+logger = logging.getLogger(__name__)
+
+#: Supported profiling modes.
+PROFILE_MODES = ("cpu", "mem")
+
+# cProfile uses the process-wide sys.monitoring from Python 3.12 on.
+_PROCESS_WIDE_CPU_PROFILER = sys.version_info >= (3, 12)
+
+
+class _MemoryProfile:
+    """Memory figures of all profiled calls of one task."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.peak_bytes = 0
+        self.rss_growth_bytes = 0
+        # "file:line" -> bytes allocated and not freed by the task.
+        self.allocations: dict[str, int] = {}
+
+
+class TaskProfiler:
+    """
+    Profile task executions and aggregate the results per task name.
+
+    Attributes:
+        mode (Optional[str]): Mode applied to every task, or None to
+            profile only tasks declared with ``profile=...``.
+        top (int): Number of entries listed per task in the reports.
+    """
+
+    def __init__(self, mode: str | None = None, top: int = 10) -> None:
+        if mode is not None and mode not in PROFILE_MODES:
+            raise ValueError(
+                f"Unknown profile mode {mode!r}; expected one of "
+                f"{', '.join(PROFILE_MODES)}."
+            )
+        self.mode = mode
+        self.top = top
+        self._lock = threading.Lock()
+        # Held by the running CPU-profiled call where cProfile is
+        # process-wide, so that such calls run one at a time.
+        self._cpu_serial: AbstractContextManager[object] = (
+            threading.Lock() if _PROCESS_WIDE_CPU_PROFILER else nullcontext()
+        )
+        self._cpu: dict[str, pstats.Stats] = {}
+        self._memory: dict[str, _MemoryProfile] = {}
+        # Running memory-profiled calls; tracemalloc runs while any do.
+        self._tracing = 0
+        self._started_tracemalloc = False
+
+    def mode_for(self, func: Callable[..., Any]) -> str | None:
+        """Return the profiling mode that applies to task function ``func``."""
+        if self.mode is not None:
+            return self.mode
+        return getattr(func, "_parslet_profile", None)
+
+    def execute(
+        self,
+        func: Callable[..., Any],
+        args: list[object],
+        kwargs: dict[str, object],
+    ) -> object:
+        """Call ``func(*args, **kwargs)``, profiling it if it is selected."""
+        mode = self.mode_for(func)
+        if mode is None:
+            return func(*args, **kwargs)
+        name = getattr(func, "_parslet_task_name", func.__name__)
+        if mode == "cpu":
+            return self._execute_cpu(name, func, args, kwargs)
+        return self._execute_mem(name, func, args, kwargs)
+
+    def _execute_cpu(
+        self,
+        name: str,
+        func: Callable[..., Any],
+        args: list[object],
+        kwargs: dict[str, object],
+    ) -> object:
+        import cProfile
+        import pstats
+
+        with self._cpu_serial:
+            profile = cProfile.Profile()
+            try:
+                profile.enable()
+            except ValueError as e:
+                # A profiler outside Parslet is active (only one is allowed
+                # per process from Python 3.12); run the task unprofiled.
+                logger.warning(f"Cannot profile task '{name}': {e}")
+                return func(*args, **kwargs)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                profile.disable()
+                with self._lock:
+                    stats = self._cpu.get(name)
+                    if stats is None:
+                        self._cpu[name] = pstats.Stats(profile)
+                    else:
+                        stats.add(profile)
+
+    def _execute_mem(
+        self,
+        name: str,
+        func: Callable[..., Any],
+        args: list[object],
+        kwargs: dict[str, object],
+    ) -> object:
+        import tracemalloc
+
+        with self._lock:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracemalloc = True
+            self._tracing += 1
+        rss_before = get_peak_rss_bytes()
+        before = tracemalloc.take_snapshot()
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _, peak = tracemalloc.get_traced_memory()
+            after = tracemalloc.take_snapshot()
+            rss_after = get_peak_rss_bytes()
+            ignore = (
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, __file__),
+            )
+            diffs = after.filter_traces(ignore).compare_to(
+                before.filter_traces(ignore), "lineno"
+            )
+            with self._lock:
+                entry = self._memory.setdefault(name, _MemoryProfile())
+                entry.calls += 1
+                entry.peak_bytes = max(entry.peak_bytes, peak - current)
+                if rss_before is not None and rss_after is not None:
+                    entry.rss_growth_bytes = max(
+                        entry.rss_growth_bytes, rss_after - rss_before
+                    )
+                for diff in diffs:
+                    if diff.size_diff <= 0:
+                        continue
+                    frame = diff.traceback[0]
+                    where = f"{frame.filename}:{frame.lineno}"
+                    entry.allocations[where] = (
+                        entry.allocations.get(where, 0) + diff.size_diff
+                    )
+                self._tracing -= 1
+                if not self._tracing and self._started_tracemalloc:
+                    tracemalloc.stop()
+                    self._started_tracemalloc = False
+
+    @property
+    def has_results(self) -> bool:
+        """True once at least one task has been profiled."""
+        return bool(self._cpu or self._memory)
+
+    def cpu_stats(self, task_name: str | None = None) -> pstats.Stats | None:
+        """
+        Return the merged CPU profile of ``task_name``, or of all tasks.
+
+        Returns None if no matching task was CPU-profiled.
+        """
+        import pstats
+
+        with self._lock:
+            if task_name is not None:
+                return self._cpu.get(task_name)
+            if not self._cpu:
+                return None
+            merged = pstats.Stats()
+            for stats in self._cpu.values():
+                merged.add(stats)
+            return merged
+
+    def memory_summary(self) -> dict[str, dict[str, Any]]:
+        """
+        Return the memory profile of each task name.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Per task name, ``calls``,
+            ``peak_bytes`` (largest traced memory growth during one call),
+            ``rss_growth_bytes`` (largest growth of the process's peak RSS
+            during one call) and ``top_allocations``, the ``top`` source
+            lines with the most memory allocated and still held, as
+            ``(location, bytes)`` pairs.
+        """
+        with self._lock:
+            return {
+                name: {
+                    "calls": entry.calls,
+                    "peak_bytes": entry.peak_bytes,
+                    "rss_growth_bytes": entry.rss_growth_bytes,
+                    "top_allocations": sorted(
+                        entry.allocations.items(), key=lambda kv: -kv[1]
+                    )[: self.top],
+                }
+                for name, entry in self._memory.items()
+            }
+
+    def cpu_report(self) -> str:
+        """Return the ``top`` functions by cumulative time for each task."""
+        out = io.StringIO()
+        with self._lock:
+            items = sorted(self._cpu.items())
+        for name, stats in items:
+            out.write(f"=== {name} ===\n")
+            stats.stream = out  # type: ignore[attr-defined]
+            stats.sort_stats("cumulative").print_stats(self.top)
+        return out.getvalue()
+
+    def memory_report(self) -> str:
+        """Return the memory summary as human readable text."""
+        lines: list[str] = []
+        summary = self.memory_summary()
+        for name in sorted(summary, key=lambda n: -summary[n]["peak_bytes"]):
+            entry = summary[name]
+            lines.append(f"=== {name} ===")
+            lines.append(
+                f"calls: {entry['calls']}  "
+                f"peak traced: {_format_bytes(entry['peak_bytes'])}  "
+                f"peak RSS growth: {_format_bytes(entry['rss_growth_bytes'])}"
+            )
+            for where, size in entry["top_allocations"]:
+                lines.append(f"  {_format_bytes(size):>10}  {where}")
+            lines.append("")
+        return "\n".join(lines)
+
+    def save(self, directory: str | Path) -> list[Path]:
+        """
+        Write the collected profiles to ``directory``.
+
+        CPU profiles are written as ``cpu.pstats`` (all tasks merged, for
+        ``python -m pstats`` or snakeviz), one ``cpu-<task>.pstats`` per task
+        name and ``cpu.txt``; memory profiles as ``memory.txt``.
+
+        Returns:
+            List[Path]: The files written.
+        """
+        out_dir = Path(directory)
+        out_dir.mkdir(parents=True, exist_ok=True)
+        written: list[Path] = []
+        merged = self.cpu_stats()
+        if merged is not None:
+            path = out_dir / "cpu.pstats"
+            merged.dump_stats(path)
+            written.append(path)
+            with self._lock:
+                items = list(self._cpu.items())
+            for name, stats in items:
+                path = out_dir / f"cpu-{_safe_name(name)}.pstats"
+                stats.dump_stats(path)
+                written.append(path)
+            path = out_dir / "cpu.txt"
+            path.write_text(self.cpu_report(), encoding="utf-8")
+            written.append(path)
+        if self._memory:
+            path = out_dir / "memory.txt"
+            path.write_text(self.memory_report(), encoding="utf-8")
+            written.append(path)
+        return written
+
+
+def _safe_name(name: str) -> str:
+    return re.sub(r"[^A-Za-z0-9_.-]", "_", name)
+
+
+def _format_bytes(size: int) -> str:
+    value = float(size)
+    for unit in ("B", "KiB", "MiB"):
+        if abs(value) < 1024:
+            return f"{value:.1f} {unit}"
+        value /= 1024
+    return f"{value:.1f} GiB"
@@ -6,13 +6,15 @@ Public API: ``DAGRunner``, ``UpstreamTaskFailedError``,
 """
 
 import hashlib
-import json
 import logging
 import os
 import socket
+import threading
 import time
+from collections.abc import Callable
 from concurrent.futures import Future as ExecutorFuture
 from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from pathlib import Path
 from typing import Any
 
@@ -24,6 +26,7 @@ from parslet.security.defcon import Defcon
 from ..utils.checkpointing import CheckpointManager
 from ..utils.diagnostics import find_free_port
 from ..utils.network_utils import is_network_available, is_vpn_active
+from ..utils.power import shared_watcher
 from ..utils.resource_utils import (
     get_available_ram_mb,
     get_battery_level,
@@ -31,9 +34,17 @@ from ..utils.resource_utils import (
 )
 from .cache import compute_cache_key, load_from_cache, save_to_cache
 from .dag import DAG, DAGCycleError
-from .policy import AdaptivePolicy
+from .energy import EnergyMeter
+from .events import EventBus, EventSink, EventType, LogSink, MetricsSink
+from .metrics import MetricsServer, RunnerMetrics
+from .policy import AdaptivePolicy, ThermalPolicy
+from .profiling import TaskProfiler
 from .scheduler import AdaptiveScheduler
-from .task import ParsletFuture
+from .stats import TaskStatsStore
+from .streaming import StreamChannel, TaskStream
+from .task import ArgumentTemplate, ParsletFuture
+from .thermal import ThermalGuard
+from .trace import TraceRecorder
 
 __all__ = [
     "DAGRunner",
@@ -100,6 +111,11 @@ class ResourceLimitError(RuntimeError):
     """Task failed due to system resource exhaustion (e.g., memory)."""
 
 
+def _task_name(future: ParsletFuture) -> str:
+    """Registered task name of ``future``, as used in events and stats."""
+    return getattr(future.func, "_parslet_task_name", future.func.__name__)
+
+
 class DAGRunner:
     """
     Executes tasks defined in a Parslet DAG in the correct topological order.
@@ -126,6 +142,14 @@ class DAGRunner:
         signature_file: str | None = None,
         watch_files: list[str] | None = None,
         disable_cache: bool = False,
+        stats_store: TaskStatsStore | None = None,
+        check_network: bool = True,
+        serve_metrics: bool = False,
+        record_trace: bool = False,
+        profile: str | None = None,
+        event_sinks: list[EventSink] | None = None,
+        energy: bool = False,
+        thermal_policy: ThermalPolicy | None = None,
     ) -> None:
         """
         Initializes the DAGRunner.
@@ -154,6 +178,38 @@ class DAGRunner:
             disable_cache (bool): If True, disables task caching even for tasks
                 that request it. Can also be set via the ``PARSLET_NO_CACHE``
                 environment variable.
+            stats_store (Optional[TaskStatsStore]): Historical runtime store.
+                When given, ready tasks are ordered longest-path-first using
+                the recorded durations, and the durations of successfully
+                executed tasks are saved back to it after the run.
+            check_network (bool): If True, each run starts by probing for an
+                internet connection and warns when none is found. Long-lived
+                callers such as ``parslet serve`` probe once themselves and
+                pass False to keep runs fast.
+            serve_metrics (bool): If True, each run serves Prometheus
+                metrics over HTTP on ``monitor_port`` at ``/metrics``. The
+                server binds to ``127.0.0.1`` unless ``PARSLET_METRICS_HOST``
+                names another interface.
+            record_trace (bool): If True, argument resolution, cache
+                lookups, queue waits and task executions are recorded in
+                ``self.trace`` and can be saved as a Chrome trace.
+            profile (Optional[str]): ``"cpu"`` or ``"mem"`` to profile every
+                executed task with cProfile or tracemalloc. Tasks declared
+                with ``@parslet_task(profile=...)`` are profiled regardless.
+                Results are aggregated per task name in ``self.profiler``.
+            event_sinks (Optional[list[EventSink]]): Consumers of the
+                runner's task events (see :mod:`parslet.core.events`). If
+                None, events are written to the runner's logger when it has
+                INFO enabled, as JSON objects if ``json_logs`` is set.
+            energy (bool): If True, battery drain is sampled during each run
+                and attributed to tasks by runtime in ``self.energy``. With
+                ``stats_store``, the mean energy per call is saved for
+                :class:`~parslet.core.policy.EnergyAwarePolicy`.
+            thermal_policy (Optional[ThermalPolicy]): If given, tasks run
+                only when ``self.thermal`` admits them: near the SoC's
+                throttle temperature fewer tasks run at once and
+                ``energy_cost="high"`` tasks are held back from the pool
+                until it cools down. Streaming producers are exempt.
         """
         if runner_logger:
             self.logger = runner_logger
@@ -189,6 +245,8 @@ class DAGRunner:
         )
 
         self.disable_cache = disable_cache or bool(os.getenv("PARSLET_NO_CACHE"))
+        self.stats_store = stats_store
+        self.check_network = check_network
 
         if policy is not None:
             if user_specified_max_workers is not None:
@@ -228,9 +286,54 @@ class DAGRunner:
         # Stores the final status of each task: "SUCCESS", "FAILED",
         # "SKIPPED", or "RUNNING" (transient).
         self.task_statuses: dict[str, str] = {}
+        # Task IDs whose result was served from the cache.
+        self.cache_hits: set[str] = set()
+
+        # Task, cache and latency metrics, collected only when served.
+        self.metrics: RunnerMetrics | None = RunnerMetrics() if serve_metrics else None
+        # Timeline of the run for Perfetto / chrome://tracing, if requested.
+        self.trace: TraceRecorder | None = TraceRecorder() if record_trace else None
+        # Per-task cProfile / tracemalloc results.
+        self.profiler = TaskProfiler(profile)
+
+        # Task lifecycle events. Messages are only formatted by the sinks,
+        # on the bus's dispatcher thread, never on the hot path.
+        self.events = EventBus()
+        if event_sinks is None:
+            if self.logger.isEnabledFor(logging.INFO):
+                self.events.subscribe(LogSink(self.logger, json_format=json_logs))
+        else:
+            for sink in event_sinks:
+                self.events.subscribe(sink)
+        if self.metrics is not None:
+            self.events.subscribe(MetricsSink(self.metrics))
+        # Battery drain per task, measured only when requested.
+        self.energy: EnergyMeter | None = EnergyMeter() if energy else None
+        if self.energy is not None:
+            self.events.subscribe(self.energy)
+        # Temperature-dependent admission of tasks, if requested.
+        self.thermal: ThermalGuard | None = (
+            ThermalGuard(thermal_policy) if thermal_policy is not None else None
+        )
 
         # Reference to the DAG being executed, used for richer error messages
         self._dag: DAG | None = None
+        # Serialises DAG growth from tasks declared with ``dynamic=True``.
+        self._dag_lock = threading.Lock()
+        # IDs of dynamic tasks that may still spawn work; ``run`` keeps the
+        # executor open until this set drains.
+        self._dynamic_outstanding: set[str] = set()
+        self._dynamic_cond = threading.Condition()
+        # Executor jobs of the current run whose completion callbacks have
+        # not finished yet. ``run`` waits for them so that a pool passed in
+        # by the caller, which is not shut down, behaves like our own.
+        self._jobs_pending = 0
+        self._jobs_cond = threading.Condition()
+        # Channels feeding the consumers of ``stream=True`` tasks, keyed by
+        # (producer task ID, consumer task ID), and the producer threads.
+        self._streams: dict[tuple[str, str], tuple[ParsletFuture, StreamChannel]] = {}
+        self._streams_lock = threading.Lock()
+        self._stream_threads: list[threading.Thread] = []
 
     def get_task_benchmarks(self) -> dict[str, dict[str, Any]]:
         """
@@ -278,11 +381,12 @@ class DAGRunner:
         Resolves the arguments for a given ParsletFuture by obtaining results
         from its dependency ParsletFutures.
 
-        This method iterates through the `args` and `kwargs` of the
-        `parslet_future_to_resolve`. If an argument is another `ParsletFuture`
-        (a dependency), its `result()` method is called. This call will block
-        until the dependency's result is available or an exception is set on
-        it.
+        This method walks the precomputed argument template of
+        `parslet_future_to_resolve`. Wherever a `ParsletFuture` (a
+        dependency) appears, either directly or nested inside a container,
+        its `result()` method is called. This call will block until the
+        dependency's result is available or an exception is set on it.
+        Containers without futures are passed through without being copied.
 
         Args:
             dag (DAG): The DAG object, used to potentially retrieve future
@@ -302,39 +406,37 @@ class DAGRunner:
                   encountered from a failed dependency. If all dependencies
                   succeed, this is None.
         """
-        resolved_args: list[object] = []
         first_exception: Exception | None = None
-
-        for arg in parslet_future_to_resolve.args:
-            if isinstance(arg, ParsletFuture):
-                try:
-                    # This call blocks until the dependency's result is
-                    # available or an exception is raised.
-                    dependency_result = arg.result()
-                    resolved_args.append(dependency_result)
-                except Exception as e:
-                    if first_exception is None:  # Capture the first failure
-                        first_exception = e
-                    resolved_args.append(
-                        None
-                    )  # Append a placeholder; task won't run if
-                    # first_exception is set
-            else:
-                resolved_args.append(arg)
-
-        resolved_kwargs: dict[str, object] = {}
-        for key, kwarg_val in parslet_future_to_resolve.kwargs.items():
-            if isinstance(kwarg_val, ParsletFuture):
-                try:
-                    dependency_result = kwarg_val.result()
-                    resolved_kwargs[key] = dependency_result
-                except Exception as e:
-                    if first_exception is None:  # Capture the first failure
-                        first_exception = e
-                    resolved_kwargs[key] = None  # Placeholder
-            else:
-                resolved_kwargs[key] = kwarg_val
-
+        channels: list[StreamChannel] = []
+
+        def _lookup(dep: ParsletFuture) -> object:
+            nonlocal first_exception
+            while dep._alias_of is not None:
+                dep = dep._alias_of
+            if dep.stream and not (dep.done() and dep._exception is not None):
+                # Streaming dependencies hand over their items as they are
+                # produced instead of blocking until the producer finishes.
+                channel = self._stream_channel(
+                    dep, parslet_future_to_resolve, bounded=False
+                )
+                channels.append(channel)
+                return TaskStream(channel, dep.task_id)
+            try:
+                # This call blocks until the dependency's result is
+                # available or an exception is raised.
+                return dep.result()
+            except Exception as e:
+                if first_exception is None:  # Capture the first failure
+                    first_exception = e
+                # Placeholder; the task won't run if first_exception is set.
+                return None
+
+        template = parslet_future_to_resolve.argument_template()
+        resolved_args, resolved_kwargs = template.resolve(_lookup)
+        # Only now can the consumer start reading, so only now may a full
+        # channel hold its producer back.
+        for channel in channels:
+            channel.bound()
         return resolved_args, resolved_kwargs, first_exception
 
     @staticmethod
@@ -342,15 +444,83 @@ class DAGRunner:
         parslet_future: ParsletFuture,
         args: list[object],
         kwargs: dict[str, object],
+        profiler: TaskProfiler | None = None,
     ) -> object:
-        """Execute a task function and translate resource errors."""
+        """
+        Execute a task function and translate resource errors.
+
+        When a ``profiler`` is given, the call is profiled if the runner's
+        profile mode or the task's ``profile`` flag asks for it.
+        """
         allow_shell = getattr(parslet_future.func, "_parslet_allow_shell", False)
         try:
             with shell_guard(allow_shell):
+                if profiler is not None:
+                    return profiler.execute(parslet_future.func, args, kwargs)
                 return parslet_future.func(*args, **kwargs)
         except (MemoryError, OSError) as e:
             raise ResourceLimitError(str(e)) from e
 
+    def _traced_task_execution(
+        self,
+        parslet_future: ParsletFuture,
+        args: list[object],
+        kwargs: dict[str, object],
+        queued_at: float | None,
+    ) -> object:
+        """
+        Execute a task like ``_wrapped_task_execution`` and record its span.
+
+        ``queued_at`` is the trace timestamp at which the task was handed to
+        the executor; the time until a worker picked it up is recorded as
+        its queue wait.
+        """
+        trace = self.trace
+        assert trace is not None
+        task_id = parslet_future.task_id
+        start = trace.now()
+        details: dict[str, Any] = {"task_id": task_id, "pid": os.getpid()}
+        if queued_at is not None:
+            trace.async_span("queued", "queue", task_id, queued_at, start)
+            details["queue_wait_ms"] = (start - queued_at) / 1000
+        status = "FAILED"
+        try:
+            result = self._wrapped_task_execution(
+                parslet_future, args, kwargs, self.profiler
+            )
+            status = "SUCCESS"
+            return result
+        finally:
+            details["status"] = status
+            trace.complete(
+                _task_name(parslet_future),
+                "task",
+                start,
+                args=details,
+            )
+
+    def _guarded_task_execution(
+        self,
+        parslet_future: ParsletFuture,
+        args: list[object],
+        kwargs: dict[str, object],
+        queued_at: float | None,
+    ) -> object:
+        """Execute a task once the thermal guard admits it."""
+        guard = self.thermal
+        assert guard is not None
+        with guard.slot(parslet_future, self._pool_size) as waited:
+            if waited:
+                # Time spent cooling down is not part of the task's runtime.
+                self.task_start_times[parslet_future.task_id] = time.monotonic()
+            if self.trace is not None:
+                return self._traced_task_execution(
+                    parslet_future, args, kwargs, queued_at
+                )
+            return self._wrapped_task_execution(
+                parslet_future, args, kwargs, self.profiler
+            )
+
     def _maybe_resize_pool(self) -> None:
         """Adjust executor worker count based on current policy."""
 
@@ -362,14 +532,9 @@ class DAGRunner:
         if new_size != old_size:
             self.executor._max_workers = new_size
             self._pool_size = new_size
-            if self.json_logs:
-                self.logger.info(
-                    json.dumps(
-                        {"event": "pool_resize", "old": old_size, "new": new_size}
-                    )
-                )
-            else:
-                self.logger.info(f"Resized worker pool from {old_size} to {new_size}")
+            self.events.emit(
+                EventType.POOL_RESIZED, detail={"old": old_size, "new": new_size}
+            )
 
     def _remediation_hint(self, exc: Exception) -> str:
         """Provide a simple one-line remediation hint based on the exception."""
@@ -398,12 +563,11 @@ class DAGRunner:
         task_id = parslet_future.task_id
         try:
             result = executor_future.result()
+            if parslet_future.dynamic and self._expand_dynamic(parslet_future, result):
+                # Completed later, once the spawned tasks have finished.
+                return
             parslet_future.set_result(result)
             self.task_statuses[task_id] = "SUCCESS"
-            self.logger.info(
-                f"Task '{task_id}' ({parslet_future.func.__name__}) "
-                "completed successfully."
-            )
             if (
                 getattr(parslet_future.func, "_parslet_cache", False)
                 and not self.disable_cache
@@ -460,10 +624,7 @@ class DAGRunner:
                 end_time = time.monotonic()
                 duration = end_time - self.task_start_times[task_id]
                 self.task_execution_times[task_id] = duration
-                self.logger.debug(
-                    f"Task '{task_id}' finished. Duration: {duration:.4f}s. "
-                    f"Status: {self.task_statuses.get(task_id)}"
-                )
+                self._emit_finished(parslet_future, duration)
             self._maybe_resize_pool()
 
     def _run_task_serially(
@@ -483,9 +644,17 @@ class DAGRunner:
             f"Running task '{task_id}' ({parslet_future.func.__name__}) in "
             "failsafe executor."
         )
+        trace = self.trace
+        trace_start = trace.now() if trace is not None else 0.0
         start = time.monotonic()
+        guard = self.thermal
         try:
-            result = parslet_future.func(*args, **kwargs)
+            with (
+                guard.slot(parslet_future, self._pool_size)
+                if guard is not None
+                else nullcontext(False)
+            ):
+                result = parslet_future.func(*args, **kwargs)
             parslet_future.set_result(result)
             self.task_statuses[task_id] = "SUCCESS"
             if (
@@ -513,13 +682,770 @@ class DAGRunner:
         finally:
             duration = time.monotonic() - start
             self.task_execution_times[task_id] = duration
-            self.logger.debug(
-                f"Task '{task_id}' finished in failsafe executor. "
-                f"Duration: {duration:.4f}s. "
-                f"Status: {self.task_statuses.get(task_id)}"
+            self._emit_finished(parslet_future, duration)
+            if trace is not None:
+                trace.complete(
+                    _task_name(parslet_future),
+                    "task",
+                    trace_start,
+                    args={
+                        "task_id": task_id,
+                        "pid": os.getpid(),
+                        "status": self.task_statuses.get(task_id),
+                        "failsafe": True,
+                    },
+                )
+
+    def _emit_finished(self, parslet_future: ParsletFuture, duration: float) -> None:
+        """Emit the success or failure event of an executed task."""
+        status = self.task_statuses.get(parslet_future.task_id)
+        if status == "SUCCESS":
+            kind = EventType.TASK_SUCCEEDED
+        elif status == "FAILED":
+            kind = EventType.TASK_FAILED
+        else:
+            return
+        detail = None
+        exc = parslet_future._exception
+        if kind is EventType.TASK_FAILED and exc is not None:
+            detail = {"error": f"{type(exc).__name__}: {exc}"}
+        self.events.emit(
+            kind, parslet_future.task_id, _task_name(parslet_future), duration, detail
+        )
+
+    def _prepare_task(
+        self, dag: DAG, task_id: str, current_parslet_future: ParsletFuture
+    ) -> tuple[list[object], dict[str, object]] | None:
+        """
+        Run the pre-execution checks for a task and resolve its arguments.
+
+        Handles checkpoint resumption, upstream failures, cache hits and the
+        low-battery guard. In each of those cases the task's status and
+        future are updated here and ``None`` is returned. Otherwise the
+        resolved positional and keyword arguments are returned and the task
+        should be executed.
+        """
+        if (
+            self.checkpoint
+            and task_id in self.checkpoint.completed
+            and not self._stream_needed_again(dag, current_parslet_future)
+        ):
+            self.task_statuses[task_id] = "SKIPPED"
+            self.events.emit(
+                EventType.TASK_SKIPPED,
+                task_id,
+                _task_name(current_parslet_future),
+                detail={"reason": "checkpoint"},
+            )
+            current_parslet_future.set_result(None)
+            return None
+
+        # Resolve arguments by getting results from dependency
+        # ParsletFutures. This implicitly waits for dependencies to
+        # complete before proceeding.
+        trace = self.trace
+        if trace is not None:
+            resolve_start = trace.now()
+        (
+            resolved_args,
+            resolved_kwargs,
+            dependency_exception,
+        ) = self._resolve_task_arguments(dag, current_parslet_future)
+        if trace is not None:
+            trace.complete(
+                "resolve_args", "dispatch", resolve_start, args={"task_id": task_id}
             )
 
-    def run(self, dag: DAG) -> None:
+        if dependency_exception is not None:
+            # An upstream dependency failed. Mark this task as SKIPPED
+            # and set its exception.
+            original_failing_task_id: str | None = None
+            true_original_exception = dependency_exception
+            if isinstance(dependency_exception, UpstreamTaskFailedError):
+                # If the dependency itself was skipped, trace back to
+                # the root cause.
+                true_original_exception = dependency_exception.original_exception
+                original_failing_task_id = dependency_exception.original_failure_task_id
+            else:
+                # The failure happened in a direct dependency; name it.
+                for dep in current_parslet_future.argument_template().dependencies:
+                    while dep._alias_of is not None:
+                        dep = dep._alias_of
+                    if dep._exception is dependency_exception:
+                        original_failing_task_id = dep.task_id
+                        break
+
+            err_msg_for_log = (
+                f"Task '{task_id}' "
+                f"({current_parslet_future.func.__name__}) skipped "
+                "due to upstream failure in task "
+                f"'{original_failing_task_id or 'unknown'}'. "
+                f"Root error: {type(true_original_exception).__name__}"
+                f": {true_original_exception}"
+            )
+            self.logger.error(err_msg_for_log)
+            self.task_statuses[task_id] = "SKIPPED"
+            self.events.emit(
+                EventType.TASK_SKIPPED,
+                task_id,
+                _task_name(current_parslet_future),
+                detail={
+                    "reason": "upstream_failure",
+                    "failed_task_id": original_failing_task_id,
+                },
+            )
+
+            current_parslet_future.set_exception(
+                UpstreamTaskFailedError(
+                    skipped_task_id=task_id,
+                    skipped_task_name=(current_parslet_future.func.__name__),
+                    original_failure_task_id=original_failing_task_id,
+                    original_exception=true_original_exception,
+                )
+            )
+            return None
+
+        cache_enabled = (
+            getattr(current_parslet_future.func, "_parslet_cache", False)
+            and not self.disable_cache
+            and not current_parslet_future.stream
+            # A stream's cache key only names its producer, not its items.
+            and not any(
+                isinstance(value, TaskStream)
+                for value in (*resolved_args, *resolved_kwargs.values())
+            )
+        )
+        if cache_enabled:
+            version = getattr(
+                current_parslet_future.func, "_parslet_cache_version", "1"
+            )
+            task_name = _task_name(current_parslet_future)
+            cache_key = compute_cache_key(
+                task_name, tuple(resolved_args), resolved_kwargs, version
+            )
+            if trace is not None:
+                lookup_start = trace.now()
+            try:
+                cached = load_from_cache(cache_key)
+            except FileNotFoundError:
+                current_parslet_future._cache_key = cache_key  # type: ignore[attr-defined]
+                self.events.emit(EventType.CACHE_MISS, task_id, task_name)
+                if trace is not None:
+                    trace.complete(
+                        "cache_lookup",
+                        "cache",
+                        lookup_start,
+                        args={"task_id": task_id, "hit": False},
+                    )
+            else:
+                self.events.emit(EventType.CACHE_HIT, task_id, task_name)
+                if trace is not None:
+                    trace.complete(
+                        "cache_lookup",
+                        "cache",
+                        lookup_start,
+                        args={"task_id": task_id, "hit": True},
+                    )
+                current_parslet_future.set_result(cached)
+                self.task_statuses[task_id] = "SUCCESS"
+                self.task_execution_times[task_id] = 0.0
+                self.cache_hits.add(task_id)
+                if self.checkpoint:
+                    self.checkpoint.mark_complete(task_id, "SUCCESS")
+                return None
+
+        # Check battery level for battery-sensitive tasks.
+        batt_level = (
+            get_battery_level()
+            if getattr(
+                current_parslet_future.func,
+                "_parslet_battery_sensitive",
+                False,
+            )
+            and not self.ignore_battery
+            else None
+        )
+        if batt_level is not None and batt_level < 20:
+            self.logger.warning(
+                f"Skipping battery-sensitive task '{task_id}' due to "
+                f"low battery ({batt_level}%)."
+                " Use --ignore-battery to override."
+            )
+            self.task_statuses[task_id] = "SKIPPED"
+            self.events.emit(
+                EventType.TASK_SKIPPED,
+                task_id,
+                _task_name(current_parslet_future),
+                detail={"reason": "low_battery", "battery_percent": batt_level},
+            )
+            current_parslet_future.set_exception(
+                BatteryLevelLowError(
+                    task_id,
+                    current_parslet_future.func.__name__,
+                    batt_level,
+                )
+            )
+            if self.checkpoint:
+                self.checkpoint.mark_complete(task_id, "SKIPPED")
+            return None
+
+        return resolved_args, resolved_kwargs
+
+    def _submit_fused_chain(
+        self,
+        executor: ThreadPoolExecutor,
+        dag: DAG,
+        chain: list[str],
+        first_args: tuple[list[object], dict[str, object]] | None,
+    ) -> None:
+        """Submit a fused linear chain of tasks as a single executor job."""
+        stages = [dag.get_task_future(tid) for tid in chain]
+        if first_args is None:
+            # The first task was settled without running (checkpoint, cache,
+            # upstream failure or battery guard); the rest still need work.
+            stages = stages[1:]
+        self.events.emit(
+            EventType.CHAIN_SUBMITTED,
+            stages[0].task_id,
+            _task_name(stages[0]),
+            detail={"length": len(stages)},
+        )
+        queued_at = self.trace.now() if self.trace is not None else None
+        try:
+            self._track_job(
+                executor.submit(
+                    self._run_fused_chain, dag, stages, first_args, queued_at
+                )
+            )
+        except Exception as e:
+            self.logger.warning(
+                f"Executor rejected fused chain starting at "
+                f"'{stages[0].task_id}': {e}. Running it inline."
+            )
+            self._run_fused_chain(dag, stages, first_args)
+
+    def _run_fused_chain(
+        self,
+        dag: DAG,
+        stages: list[ParsletFuture],
+        first_args: tuple[list[object], dict[str, object]] | None,
+        queued_at: float | None = None,
+    ) -> None:
+        """
+        Execute the stages of a fused chain back to back in one worker.
+
+        Each stage goes through the same preparation and completion handling
+        as an individually submitted task, so statuses, execution times,
+        cache writes, checkpoints and failure attribution stay per stage.
+        A failed stage causes the following stages to be skipped with an
+        ``UpstreamTaskFailedError`` naming it. ``queued_at`` is the trace
+        timestamp at which the chain was submitted, if tracing.
+        """
+        for index, stage in enumerate(stages):
+            task_id = stage.task_id
+            if index == 0 and first_args is not None:
+                prepared: tuple[list[object], dict[str, object]] | None = first_args
+            else:
+                prepared = self._prepare_task(dag, task_id, stage)
+            if prepared is None:
+                continue
+            args, kwargs = prepared
+            self.task_start_times[task_id] = time.monotonic()
+            self.task_statuses[task_id] = "RUNNING"
+            if index > 0:
+                # The chain's submission only covered its first stage.
+                self.events.emit(EventType.TASK_STARTED, task_id, _task_name(stage))
+            stage._resolved_args = args  # type: ignore[attr-defined]
+            stage._resolved_kwargs = kwargs  # type: ignore[attr-defined]
+            outcome: ExecutorFuture[Any] = ExecutorFuture()
+            try:
+                if self.thermal is not None:
+                    outcome.set_result(
+                        self._guarded_task_execution(stage, args, kwargs, queued_at)
+                    )
+                    queued_at = None
+                elif self.trace is not None:
+                    # Only the first stage waited in the executor queue.
+                    outcome.set_result(
+                        self._traced_task_execution(stage, args, kwargs, queued_at)
+                    )
+                    queued_at = None
+                else:
+                    outcome.set_result(
+                        self._wrapped_task_execution(stage, args, kwargs, self.profiler)
+                    )
+            except Exception as e:
+                outcome.set_exception(e)
+            self._task_done_callback(stage, outcome)
+
+    def _dispatch_task(
+        self,
+        executor: ThreadPoolExecutor,
+        dag: DAG,
+        task_id: str,
+        chain: list[str] | None = None,
+    ) -> None:
+        """
+        Prepare one task and hand it to the executor.
+
+        Args:
+            executor (ThreadPoolExecutor): Pool the task is submitted to.
+            dag (DAG): The DAG containing the task.
+            task_id (str): ID of the task to dispatch.
+            chain (Optional[list[str]]): Fused chain headed by this task, if
+                any; the whole chain is then submitted as one job.
+        """
+        current_parslet_future = dag.get_task_future(task_id)
+        prepared = self._prepare_task(dag, task_id, current_parslet_future)
+        if chain is not None:
+            self._submit_when_cool(
+                # Without ``prepared`` the first task has already settled.
+                [dag.get_task_future(tid) for tid in chain[prepared is None :]],
+                lambda: self._submit_fused_chain(executor, dag, chain, prepared),
+            )
+            return
+        if prepared is None:
+            return
+        resolved_args, resolved_kwargs = prepared
+        if current_parslet_future.stream:
+            self._start_stream_producer(
+                dag, current_parslet_future, resolved_args, resolved_kwargs
+            )
+            return
+        self._submit_when_cool(
+            [current_parslet_future],
+            lambda: self._submit_task(
+                executor, current_parslet_future, resolved_args, resolved_kwargs
+            ),
+        )
+
+    def _submit_when_cool(
+        self, futures: list[ParsletFuture], submit: Callable[[], None]
+    ) -> None:
+        """
+        Call ``submit`` now, or once the thermal guard lets ``futures`` run.
+
+        High-energy tasks are held back here, before they reach the pool,
+        so waiting for the SoC to cool never ties up a worker thread. Held
+        work counts as a pending job, so the run waits for it.
+        """
+        guard = self.thermal
+        if guard is None:
+            submit()
+            return
+        with self._jobs_cond:
+            self._jobs_pending += 1
+
+        def release() -> None:
+            try:
+                submit()
+            finally:
+                self._job_finished()
+
+        if not guard.hold(futures, release):
+            release()
+
+    def _submit_task(
+        self,
+        executor: ThreadPoolExecutor,
+        current_parslet_future: ParsletFuture,
+        resolved_args: list[object],
+        resolved_kwargs: dict[str, object],
+    ) -> None:
+        """Hand a task whose arguments are resolved to the executor."""
+        task_id = current_parslet_future.task_id
+        # All dependencies resolved successfully, submit the task to
+        # the executor.
+        try:
+            self.events.emit(
+                EventType.TASK_SUBMITTED, task_id, _task_name(current_parslet_future)
+            )
+            self.task_start_times[task_id] = time.monotonic()
+            self.task_statuses[task_id] = "RUNNING"
+
+            # store resolved args for potential failsafe re-run
+            current_parslet_future._resolved_args = resolved_args  # type: ignore[attr-defined]
+            current_parslet_future._resolved_kwargs = resolved_kwargs  # type: ignore[attr-defined]
+
+            if self.thermal is not None:
+                exec_future = executor.submit(
+                    self._guarded_task_execution,
+                    current_parslet_future,
+                    resolved_args,
+                    resolved_kwargs,
+                    self.trace.now() if self.trace is not None else None,
+                )
+            elif self.trace is not None:
+                exec_future = executor.submit(
+                    self._traced_task_execution,
+                    current_parslet_future,
+                    resolved_args,
+                    resolved_kwargs,
+                    self.trace.now(),
+                )
+            else:
+                exec_future = executor.submit(
+                    self._wrapped_task_execution,
+                    current_parslet_future,
+                    resolved_args,
+                    resolved_kwargs,
+                    self.profiler,
+                )
+
+            # Add a callback to handle task completion/failure and
+            # update ParsletFuture.
+            def _cb(
+                executor_fut: ExecutorFuture[Any],
+                parslet_fut: ParsletFuture = current_parslet_future,
+            ) -> None:
+                self._task_done_callback(parslet_fut, executor_fut)
+
+            exec_future.add_done_callback(_cb)
+            self._track_job(exec_future)
+        except (MemoryError, OSError) as e:
+            if self.failsafe_mode:
+                self.logger.warning(
+                    f"Executor rejected task '{task_id}' due to "
+                    f"resource limits: {e}. Running serially."
+                )
+                self._run_task_serially(
+                    current_parslet_future,
+                    resolved_args,
+                    resolved_kwargs,
+                )
+            else:
+                err_msg = "Failed to submit task " f"'{task_id}' to executor: {e}"
+                self.logger.critical(err_msg, exc_info=True)
+                current_parslet_future.set_exception(RuntimeError(err_msg))
+                self.task_statuses[task_id] = "FAILED"
+                if task_id in self.task_start_times:
+                    end_time = time.monotonic()
+                    duration = end_time - self.task_start_times[task_id]
+                    self.task_execution_times[task_id] = duration
+        except Exception as e:
+            err_msg = f"Failed to submit task '{task_id}' to executor: {e}"
+            self.logger.critical(err_msg, exc_info=True)
+            current_parslet_future.set_exception(RuntimeError(err_msg))
+            self.task_statuses[task_id] = "FAILED"
+            if task_id in self.task_start_times:
+                end_time = time.monotonic()
+                duration = end_time - self.task_start_times[task_id]
+                self.task_execution_times[task_id] = duration
+
+    def _stream_needed_again(self, dag: DAG, future: ParsletFuture) -> bool:
+        """
+        Return True if a checkpointed streaming task has to run again.
+
+        Stream items are not checkpointed, so a producer is only skipped
+        once every consumer has completed as well.
+        """
+        if not future.stream or self.checkpoint is None:
+            return False
+        with self._dag_lock:
+            consumers = list(dag.get_dependents(future.task_id))
+        pending = [tid for tid in consumers if tid not in self.checkpoint.completed]
+        if pending:
+            self.logger.info(
+                f"Re-running streaming task '{future.task_id}': its items are "
+                f"not checkpointed and {len(pending)} consumer(s) still need them."
+            )
+        return bool(pending)
+
+    def _stream_channel(
+        self, producer: ParsletFuture, consumer: ParsletFuture, bounded: bool
+    ) -> StreamChannel:
+        """
+        Return the channel from ``producer`` to ``consumer``, creating it.
+
+        ``bounded`` only applies to a new channel; see
+        :class:`~parslet.core.streaming.StreamChannel`.
+        """
+        key = (producer.task_id, consumer.task_id)
+        with self._streams_lock:
+            entry = self._streams.get(key)
+            if entry is not None:
+                return entry[1]
+            channel = StreamChannel(producer.stream_buffer, bounded=bounded)
+            self._streams[key] = (consumer, channel)
+        # A consumer that finishes early must not leave the producer blocked.
+        consumer.add_done_callback(lambda _f: channel.close())
+        if producer.done():
+            # The producer finished before this consumer asked for its
+            # items; they are gone, so fail rather than hand over nothing.
+            channel.finish(
+                RuntimeError(
+                    f"Streaming task '{producer.task_id}' already finished; its "
+                    f"items are no longer available to '{consumer.task_id}'."
+                )
+            )
+        return channel
+
+    def _start_stream_producer(
+        self,
+        dag: DAG,
+        future: ParsletFuture,
+        args: list[object],
+        kwargs: dict[str, object],
+    ) -> None:
+        """
+        Run a ``stream=True`` task in its own thread.
+
+        Producers sit outside the worker pool so that a pool fully occupied
+        by consumers waiting for items can never starve them. Channels of
+        consumers that still wait for other tasks start unbounded, since
+        blocking on them could stall the very tasks they wait for.
+        """
+        task_id = future.task_id
+        with self._dag_lock:
+            consumers = [
+                dag.get_task_future(tid) for tid in dag.get_dependents(task_id)
+            ]
+        outlets = [
+            (
+                consumer,
+                self._stream_channel(
+                    future,
+                    consumer,
+                    bounded=all(
+                        dep.done() or dep.stream
+                        for dep in consumer.argument_template().dependencies
+                    ),
+                ),
+            )
+            for consumer in consumers
+        ]
+        self.logger.info(
+            f"Starting streaming task '{task_id}' ({future.func.__name__}) "
+            f"with {len(outlets)} consumer(s)."
+        )
+        self.task_start_times[task_id] = time.monotonic()
+        self.task_statuses[task_id] = "RUNNING"
+        thread = threading.Thread(
+            target=self._run_stream_producer,
+            args=(future, args, kwargs, outlets),
+            name=f"parslet-stream-{task_id}",
+            daemon=True,
+        )
+        self._stream_threads.append(thread)
+        thread.start()
+
+    def _run_stream_producer(
+        self,
+        future: ParsletFuture,
+        args: list[object],
+        kwargs: dict[str, object],
+        outlets: list[tuple[ParsletFuture, StreamChannel]],
+    ) -> None:
+        """
+        Iterate a streaming task and fan its items out to its consumers.
+
+        Each ``put`` waits while that consumer's buffer is full, which is
+        what bounds the producer's memory. Iteration stops early once every
+        consumer has closed its channel. The task completes with the number
+        of items produced, or with the exception raised by the generator,
+        which is also delivered to the consumers.
+        """
+        task_id = future.task_id
+        allow_shell = getattr(future.func, "_parslet_allow_shell", False)
+        outcome: ExecutorFuture[Any] = ExecutorFuture()
+        channels = [channel for _, channel in outlets]
+        produced = 0
+        trace = self.trace
+        trace_start = trace.now() if trace is not None else 0.0
+        try:
+            # The generator body runs during iteration, so the shell guard
+            # has to stay active for the whole loop.
+            with shell_guard(allow_shell):
+                items = iter(future.func(*args, **kwargs))
+                try:
+                    for item in items:
+                        produced += 1
+                        delivered = [channel.put(item) for channel in channels]
+                        if channels and not any(delivered):
+                            self.logger.info(
+                                f"All consumers of streaming task '{task_id}' "
+                                f"stopped reading after {produced} item(s)."
+                            )
+                            break
+                finally:
+                    close = getattr(items, "close", None)
+                    if close is not None:
+                        close()
+        except Exception as e:
+            outcome.set_exception(e)
+            for consumer, channel in outlets:
+                channel.finish(
+                    UpstreamTaskFailedError(
+                        consumer.task_id, consumer.func.__name__, task_id, e
+                    )
+                )
+        else:
+            outcome.set_result(produced)
+            for channel in channels:
+                channel.finish()
+        if trace is not None:
+            trace.complete(
+                _task_name(future),
+                "task",
+                trace_start,
+                args={
+                    "task_id": task_id,
+                    "status": "FAILED" if outcome.exception() else "SUCCESS",
+                    "items": produced,
+                },
+            )
+        self._task_done_callback(future, outcome)
+
+    def _track_job(self, exec_future: ExecutorFuture[Any]) -> None:
+        """Count ``exec_future`` as pending until its callbacks have run."""
+        with self._jobs_cond:
+            self._jobs_pending += 1
+
+        # Registered after the task's own callback, so any work that
+        # callback dispatched is already counted.
+        exec_future.add_done_callback(lambda _fut: self._job_finished())
+
+    def _job_finished(self) -> None:
+        with self._jobs_cond:
+            self._jobs_pending -= 1
+            if not self._jobs_pending:
+                self._jobs_cond.notify_all()
+
+    def _wait_for_jobs(self) -> None:
+        """Block until every job submitted during this run has finished."""
+        with self._jobs_cond:
+            self._jobs_cond.wait_for(lambda: not self._jobs_pending)
+
+    def _track_dynamic(self, future: ParsletFuture) -> None:
+        """Keep the run open until the dynamic ``future`` has settled."""
+        with self._dynamic_cond:
+            self._dynamic_outstanding.add(future.task_id)
+        future.add_done_callback(self._dynamic_settled)
+
+    def _dynamic_settled(self, future: ParsletFuture) -> None:
+        with self._dynamic_cond:
+            self._dynamic_outstanding.discard(future.task_id)
+            if not self._dynamic_outstanding:
+                self._dynamic_cond.notify_all()
+
+    def _wait_for_dynamic_tasks(self) -> None:
+        with self._dynamic_cond:
+            while self._dynamic_outstanding:
+                self._dynamic_cond.wait()
+
+    def _dispatch_when_ready(self, dag: DAG, future: ParsletFuture) -> None:
+        """
+        Dispatch ``future`` once all of its dependencies have completed.
+
+        Tasks spawned at run time are dispatched from completion callbacks
+        instead of the main scheduling loop, so nothing waits on a dependency
+        while holding a worker thread or the main loop.
+        """
+        # Streaming dependencies deliver items while running, so waiting
+        # for them to finish would stall their bounded channels.
+        pending = [
+            dep
+            for dep in future.argument_template().dependencies
+            if not dep.done() and not dep.stream
+        ]
+        if not pending:
+            self._dispatch_task(self.executor, dag, future.task_id)
+            return
+        remaining = [len(pending)]
+        lock = threading.Lock()
+
+        def _dep_done(_dep: ParsletFuture) -> None:
+            with lock:
+                remaining[0] -= 1
+                ready = remaining[0] == 0
+            if ready:
+                self._dispatch_task(self.executor, dag, future.task_id)
+
+        for dep in pending:
+            dep.add_done_callback(_dep_done)
+
+    def _expand_dynamic(self, parent: ParsletFuture, value: object) -> bool:
+        """
+        Splice the tasks returned by a dynamic task into the running DAG.
+
+        Every ``ParsletFuture`` found in ``value`` (and any of its not yet
+        known dependencies) is added to the DAG and dispatched as soon as its
+        inputs are ready. Once they have all completed, ``parent`` is
+        completed with ``value`` in which the futures are replaced by their
+        results; if one of them failed, ``parent`` fails with an
+        ``UpstreamTaskFailedError``.
+
+        Args:
+            parent (ParsletFuture): The dynamic task that produced ``value``.
+            value (object): The raw return value of ``parent``.
+
+        Returns:
+            bool: True if tasks were spawned and ``parent`` will be completed
+            later, False if ``value`` contains no futures.
+        """
+        template = ArgumentTemplate((value,), {})
+        spawned = template.dependencies
+        if not spawned:
+            return False
+        dag = self._dag
+        if dag is None:  # pragma: no cover - only called during ``run``
+            return False
+
+        task_id = parent.task_id
+        # The parent's own execution ends here; waiting for its children is
+        # not attributed to it.
+        start = self.task_start_times.pop(task_id, None)
+        if start is not None:
+            self.task_execution_times[task_id] = time.monotonic() - start
+        with self._dag_lock:
+            new_ids = dag.extend(spawned)
+        self.logger.info(
+            f"Dynamic task '{task_id}' spawned {len(new_ids)} new task(s)."
+        )
+        new_futures = [dag.get_task_future(tid) for tid in new_ids]
+        for future in new_futures:
+            if future.dynamic:
+                self._track_dynamic(future)
+
+        remaining = [len(spawned)]
+        lock = threading.Lock()
+
+        def _child_done(_child: ParsletFuture) -> None:
+            with lock:
+                remaining[0] -= 1
+                finished = remaining[0] == 0
+            if not finished:
+                return
+            failure: list[tuple[ParsletFuture, Exception]] = []
+
+            def _lookup(dep: ParsletFuture) -> object:
+                try:
+                    return dep.result()
+                except Exception as e:
+                    if not failure:
+                        failure.append((dep, e))
+                    return None
+
+            (resolved,), _ = template.resolve(_lookup)
+            outcome: ExecutorFuture[Any] = ExecutorFuture()
+            if failure:
+                failed, exc = failure[0]
+                outcome.set_exception(
+                    UpstreamTaskFailedError(
+                        task_id, parent.func.__name__, failed.task_id, exc
+                    )
+                )
+            else:
+                outcome.set_result(resolved)
+            self._task_done_callback(parent, outcome)
+
+        for future in new_futures:
+            self._dispatch_when_ready(dag, future)
+        for child in spawned:
+            child.add_done_callback(_child_done)
+        return True
+
+    def run(self, dag: DAG, executor: ThreadPoolExecutor | None = None) -> None:
         """
         Executes all tasks in the provided DAG according to their dependencies.
 
@@ -530,13 +1456,64 @@ class DAGRunner:
 
         Args:
             dag (DAG): The Parslet DAG object containing tasks to be executed.
+            executor (Optional[ThreadPoolExecutor]): Pool to run the tasks on.
+                It is left running afterwards so it can be reused across
+                runs. If None, a pool of ``max_workers`` threads is created
+                for this run and shut down when it finishes.
         """
-        self._dag = dag
-        self.logger.info(
-            f"DAGRunner starting execution with {self.max_workers} worker " "thread(s)."
+        server = self._start_metrics_server() if self.metrics is not None else None
+        run_start = self.trace.now() if self.trace is not None else 0.0
+        # Energy metering and the thermal guard read the shared power
+        # watcher; keep it sampling in the background at the rate they need.
+        watch_s = min(
+            (c.interval_s for c in (self.energy, self.thermal) if c is not None),
+            default=None,
         )
+        if watch_s is not None:
+            shared_watcher().start(watch_s)
+        self.events.start()
+        if self.energy is not None:
+            self.energy.start()
+        try:
+            self._run(dag, executor)
+        finally:
+            # Deliver the remaining events before the run is reported done.
+            self.events.stop()
+            if self.energy is not None:
+                self.energy.stop()
+            if watch_s is not None:
+                shared_watcher().stop(watch_s)
+            if server is not None:
+                server.stop()
+            if self.trace is not None:
+                self.trace.complete("run", "runner", run_start)
+
+    def _render_metrics(self) -> str:
+        assert self.metrics is not None
+        # Completions still queued on the event bus belong in the scrape.
+        self.events.flush(timeout=1.0)
+        return self.metrics.render(self)
+
+    def _start_metrics_server(self) -> MetricsServer | None:
+        """Serve ``self.metrics`` on ``monitor_port``, or another free port."""
+        host = os.getenv("PARSLET_METRICS_HOST", "127.0.0.1")
+        for port in (self.monitor_port, 0):
+            try:
+                server = MetricsServer(self._render_metrics, port, host)
+            except OSError as e:
+                self.logger.warning(f"Cannot serve metrics on port {port}: {e}")
+                continue
+            server.start()
+            self.monitor_port = server.port
+            self.logger.info(f"Serving metrics on http://{host}:{server.port}/metrics")
+            return server
+        return None
+
+    def _run(self, dag: DAG, executor: ThreadPoolExecutor | None) -> None:
+        self._dag = dag
+        self.events.emit(EventType.RUN_STARTED, detail={"workers": self.max_workers})
 
-        if not is_network_available():
+        if self.check_network and not is_network_available():
             self.logger.warning(
                 "No internet connection detected. Tasks that require the "
                 "network may fail."
@@ -560,7 +1537,8 @@ class DAGRunner:
         try:
             # Ensure DAG is valid (e.g., no cycles) before starting.
             dag.validate_dag()
-            execution_order = dag.get_execution_order()  # List of task_ids
+            durations = self.stats_store.estimate_dag(dag) if self.stats_store else None
+            execution_order = self.scheduler.schedule(dag, durations)
             files = {Path(f.func.__code__.co_filename) for f in dag.tasks.values()}
             if not Defcon.scan_code(files):
                 self.logger.error("DEFCON1 scan failed")
@@ -591,193 +1569,63 @@ class DAGRunner:
 
         # Execute tasks using a ThreadPoolExecutor.
         # The 'with' statement ensures the pool is properly shut down.
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+        # Linear chains marked by DAG.fuse_linear_chains() run as one job.
+        chains_by_head = {chain[0]: chain for chain in dag.fused_chains}
+        fused_members = {tid for chain in dag.fused_chains for tid in chain[1:]}
+
+        with self._dynamic_cond:
+            self._dynamic_outstanding = set()
+        self._streams = {}
+        self._stream_threads = []
+        for future in list(dag.tasks.values()):
+            if future.dynamic:
+                self._track_dynamic(future)
+
+        pool = (
+            nullcontext(executor)
+            if executor is not None
+            else ThreadPoolExecutor(max_workers=self.max_workers)
+        )
+        with pool as executor:
             self.executor = executor
             self._pool_size = self.max_workers
             for task_id in execution_order:
                 if self._tamper_check and not self._tamper_check():
                     self.logger.critical("DEFCON3 tamper detected; aborting run")
                     return
-                current_parslet_future = dag.get_task_future(task_id)
-                if self.checkpoint and task_id in self.checkpoint.completed:
-                    self.logger.info(
-                        f"Skipping task '{task_id}' as it was already "
-                        "completed in a previous run."
-                    )
-                    self.task_statuses[task_id] = "SKIPPED"
-                    current_parslet_future.set_result(None)
+                if task_id in fused_members:
+                    # Executed inside the job of its chain's first task.
                     continue
-                self.logger.debug(
-                    f"Preparing task '{task_id}' "
-                    f"({current_parslet_future.func.__name__})..."
-                )
-
-                # Resolve arguments by getting results from dependency
-                # ParsletFutures. This implicitly waits for dependencies to
-                # complete before proceeding.
-                (
-                    resolved_args,
-                    resolved_kwargs,
-                    dependency_exception,
-                ) = self._resolve_task_arguments(dag, current_parslet_future)
-
-                if dependency_exception is not None:
-                    # An upstream dependency failed. Mark this task as SKIPPED
-                    # and set its exception.
-                    original_failing_task_id: str | None = None
-                    true_original_exception = dependency_exception
-                    if isinstance(dependency_exception, UpstreamTaskFailedError):
-                        # If the dependency itself was skipped, trace back to
-                        # the root cause.
-                        true_original_exception = (
-                            dependency_exception.original_exception
-                        )
-                        original_failing_task_id = (
-                            dependency_exception.original_failure_task_id
-                        )
-
-                    err_msg_for_log = (
-                        f"Task '{task_id}' "
-                        f"({current_parslet_future.func.__name__}) skipped "
-                        "due to upstream failure in task "
-                        f"'{original_failing_task_id or 'unknown'}'. "
-                        f"Root error: {type(true_original_exception).__name__}"
-                        f": {true_original_exception}"
-                    )
-                    self.logger.error(err_msg_for_log)
-                    self.task_statuses[task_id] = "SKIPPED"
-
-                    current_parslet_future.set_exception(
-                        UpstreamTaskFailedError(
-                            skipped_task_id=task_id,
-                            skipped_task_name=(current_parslet_future.func.__name__),
-                            original_failure_task_id=original_failing_task_id,
-                            original_exception=true_original_exception,
-                        )
-                    )
-                    continue  # Move to the next task in the execution order.
-
-                cache_enabled = (
-                    getattr(current_parslet_future.func, "_parslet_cache", False)
-                    and not self.disable_cache
-                )
-                if cache_enabled:
-                    version = getattr(
-                        current_parslet_future.func, "_parslet_cache_version", "1"
-                    )
-                    task_name = getattr(
-                        current_parslet_future.func,
-                        "_parslet_task_name",
-                        current_parslet_future.func.__name__,
-                    )
-                    cache_key = compute_cache_key(
-                        task_name, tuple(resolved_args), resolved_kwargs, version
-                    )
-                    try:
-                        cached = load_from_cache(cache_key)
-                    except FileNotFoundError:
-                        current_parslet_future._cache_key = cache_key  # type: ignore[attr-defined]
-                    else:
-                        self.logger.info(
-                            f"Cache hit for task '{task_id}' ({task_name})."
-                        )
-                        current_parslet_future.set_result(cached)
-                        self.task_statuses[task_id] = "SUCCESS"
-                        self.task_execution_times[task_id] = 0.0
-                        if self.checkpoint:
-                            self.checkpoint.mark_complete(task_id, "SUCCESS")
-                        continue
-
-                # Check battery level for battery-sensitive tasks.
-                batt_level = get_battery_level()
-                if (
-                    getattr(
-                        current_parslet_future.func,
-                        "_parslet_battery_sensitive",
-                        False,
-                    )
-                    and not self.ignore_battery
-                    and batt_level is not None
-                    and batt_level < 20
-                ):
-                    self.logger.warning(
-                        f"Skipping battery-sensitive task '{task_id}' due to "
-                        f"low battery ({batt_level}%)."
-                        " Use --ignore-battery to override."
-                    )
-                    self.task_statuses[task_id] = "SKIPPED"
-                    current_parslet_future.set_exception(
-                        BatteryLevelLowError(
-                            task_id,
-                            current_parslet_future.func.__name__,
-                            batt_level,
-                        )
-                    )
-                    if self.checkpoint:
-                        self.checkpoint.mark_complete(task_id, "SKIPPED")
-                    continue
-
-                # All dependencies resolved successfully, submit the task to
-                # the executor.
-                try:
-                    self.logger.info(
-                        f"Submitting task '{task_id}' "
-                        f"({current_parslet_future.func.__name__}) to "
-                        "executor."
-                    )
-                    self.task_start_times[task_id] = time.monotonic()
-                    self.task_statuses[task_id] = "RUNNING"
-
-                    # store resolved args for potential failsafe re-run
-                    current_parslet_future._resolved_args = resolved_args  # type: ignore[attr-defined]
-                    current_parslet_future._resolved_kwargs = resolved_kwargs  # type: ignore[attr-defined]
-
-                    exec_future = executor.submit(
-                        self._wrapped_task_execution,
-                        current_parslet_future,
-                        resolved_args,
-                        resolved_kwargs,
-                    )
-
-                    # Add a callback to handle task completion/failure and
-                    # update ParsletFuture.
-                    def _cb(
-                        executor_fut: ExecutorFuture[Any],
-                        parslet_fut: ParsletFuture = current_parslet_future,
-                    ) -> None:
-                        self._task_done_callback(parslet_fut, executor_fut)
-
-                    exec_future.add_done_callback(_cb)
-                except (MemoryError, OSError) as e:
-                    if self.failsafe_mode:
-                        self.logger.warning(
-                            f"Executor rejected task '{task_id}' due to "
-                            f"resource limits: {e}. Running serially."
-                        )
-                        self._run_task_serially(
-                            current_parslet_future,
-                            resolved_args,
-                            resolved_kwargs,
-                        )
-                    else:
-                        err_msg = (
-                            "Failed to submit task " f"'{task_id}' to executor: {e}"
-                        )
-                        self.logger.critical(err_msg, exc_info=True)
-                        current_parslet_future.set_exception(RuntimeError(err_msg))
-                        self.task_statuses[task_id] = "FAILED"
-                        if task_id in self.task_start_times:
-                            end_time = time.monotonic()
-                            duration = end_time - self.task_start_times[task_id]
-                            self.task_execution_times[task_id] = duration
-                except Exception as e:
-                    err_msg = f"Failed to submit task '{task_id}' to executor: {e}"
-                    self.logger.critical(err_msg, exc_info=True)
-                    current_parslet_future.set_exception(RuntimeError(err_msg))
-                    self.task_statuses[task_id] = "FAILED"
-                    if task_id in self.task_start_times:
-                        end_time = time.monotonic()
-                        duration = end_time - self.task_start_times[task_id]
-                        self.task_execution_times[task_id] = duration
-
-        self.logger.info("DAGRunner finished processing all tasks.")
+                self._dispatch_task(executor, dag, task_id, chains_by_head.get(task_id))
+
+            # Dynamic tasks may still be running or waiting for the tasks
+            # they spawned; keep the executor open until all have settled.
+            self._wait_for_dynamic_tasks()
+            for thread in list(self._stream_threads):
+                thread.join()
+            self._wait_for_jobs()
+
+        self.events.emit(EventType.RUN_FINISHED, detail={"tasks": len(dag.tasks)})
+        if self.energy is not None:
+            # The meter needs every completion and the closing sample.
+            self.events.flush()
+            self.energy.stop()
+        if self.stats_store is not None:
+            self._record_stats(dag, self.stats_store)
+
+    def _record_stats(self, dag: DAG, store: TaskStatsStore) -> None:
+        """Save durations of tasks that actually executed to ``store``."""
+        observed: dict[str, list[float]] = {}
+        for task_id, duration in self.task_execution_times.items():
+            if (
+                self.task_statuses.get(task_id) != "SUCCESS"
+                or task_id in self.cache_hits
+                or task_id not in dag.tasks
+            ):
+                continue
+            observed.setdefault(_task_name(dag.tasks[task_id]), []).append(duration)
+        store.record_many(observed)
+        if self.energy is not None:
+            for name, joules in self.energy.joules_per_call().items():
+                store.record_energy(name, joules)
+        store.save()
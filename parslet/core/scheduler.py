@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
+
 from ..utils.resource_utils import (
     ResourceSnapshot,
     get_available_ram_mb,
@@ -36,7 +38,16 @@ class AdaptiveScheduler:
         )
         return self.policy.decide_pool_size(snapshot)
 
-    def schedule(self, dag: DAG) -> None:
-        """Placeholder for future advanced scheduling logic."""
-        del dag
-        return
+    def schedule(
+        self, dag: DAG, durations: Mapping[str, float] | None = None
+    ) -> list[str]:
+        """Return the order in which the runner should consider tasks.
+
+        With ``durations`` (expected seconds per task ID, e.g. from
+        :class:`parslet.core.stats.TaskStatsStore`) ready tasks are ordered
+        longest-path-first so the critical path starts as early as possible.
+        Without it the plain topological order is used.
+        """
+        if not durations:
+            return dag.get_execution_order()
+        return dag.get_execution_order(priorities=dag.bottom_levels(durations))
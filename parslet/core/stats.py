@@ -0,0 +1,134 @@
+"""Persistent per-task runtime statistics.
+
+Execution times are aggregated by task name across runs so that later runs
+can estimate how long a workflow will take and which chain of tasks bounds
+its makespan.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from collections.abc import Mapping
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover - imported for type hints only
+    from .dag import DAG
+
+__all__ = ["TaskStatsStore", "get_stats_path"]
+
+logger = logging.getLogger(__name__)
+
+
+def get_stats_path() -> Path:
+    """Return the file used for storing task runtime statistics.
+
+    ``PARSLET_STATS_FILE`` names it directly. Otherwise it is kept next to
+    the run history if ``PARSLET_HISTORY_DB`` moves that elsewhere, and in
+    ``~/.parslet`` by default.
+    """
+    path = os.environ.get("PARSLET_STATS_FILE")
+    if path:
+        return Path(path)
+    history = os.environ.get("PARSLET_HISTORY_DB")
+    if history:
+        return Path(history).parent / "task_stats.json"
+    return Path(os.path.expanduser("~/.parslet/task_stats.json"))
+
+
+class TaskStatsStore:
+    """Small JSON-backed store of historical task durations.
+
+    Each task name maps to the number of recorded runs, the mean duration
+    and the longest duration seen, all in seconds, and - once measured with
+    :class:`~parslet.core.energy.EnergyMeter` - the mean energy per call in
+    joules. The file is read once on construction and rewritten atomically
+    by :meth:`save`.
+    """
+
+    def __init__(self, path: str | Path | None = None) -> None:
+        self.path = Path(path) if path is not None else get_stats_path()
+        self.entries: dict[str, dict[str, float]] = {}
+        if self.path.exists():
+            try:
+                data = json.loads(self.path.read_text(encoding="utf-8"))
+                if isinstance(data, dict):
+                    self.entries = data
+            except Exception as e:  # pragma: no cover - malformed file
+                logger.warning(f"Could not read task stats file {self.path}: {e}")
+
+    def record(self, task_name: str, duration_s: float) -> None:
+        """Fold one observed duration for ``task_name`` into the store."""
+        entry = self.entries.setdefault(
+            task_name, {"count": 0, "mean_s": 0.0, "max_s": 0.0}
+        )
+        count = int(entry["count"]) + 1
+        entry["mean_s"] += (duration_s - entry["mean_s"]) / count
+        entry["max_s"] = max(entry["max_s"], duration_s)
+        entry["count"] = count
+
+    def record_many(self, durations: Mapping[str, list[float]]) -> None:
+        """Record several durations per task name."""
+        for task_name, values in durations.items():
+            for value in values:
+                self.record(task_name, value)
+
+    def record_energy(self, task_name: str, joules: float) -> None:
+        """Fold the measured energy of one call of ``task_name`` into the store."""
+        entry = self.entries.setdefault(
+            task_name, {"count": 0, "mean_s": 0.0, "max_s": 0.0}
+        )
+        count = int(entry.get("energy_count", 0)) + 1
+        mean = entry.get("energy_j", 0.0)
+        entry["energy_j"] = mean + (joules - mean) / count
+        entry["energy_count"] = count
+
+    def energy_costs(self) -> dict[str, float]:
+        """Return the mean measured energy per call in joules, by task name."""
+        return {
+            name: float(entry["energy_j"])
+            for name, entry in self.entries.items()
+            if entry.get("energy_count")
+        }
+
+    def estimate(self, task_name: str) -> float | None:
+        """Return the expected duration of ``task_name`` or ``None``."""
+        entry = self.entries.get(task_name)
+        if entry is None or not entry.get("count"):
+            return None
+        return float(entry["mean_s"])
+
+    def estimate_dag(self, dag: DAG, default: float | None = None) -> dict[str, float]:
+        """Return an expected duration for every task ID in ``dag``.
+
+        Tasks without history receive ``default``; if that is ``None`` the
+        mean estimate of the DAG's known tasks is used (or ``0.0`` when no
+        task has history yet).
+        """
+        known: dict[str, float] = {}
+        unknown: list[str] = []
+        for task_id, future in dag.tasks.items():
+            name = getattr(future.func, "_parslet_task_name", future.func.__name__)
+            value = self.estimate(name)
+            if value is None:
+                unknown.append(task_id)
+            else:
+                known[task_id] = value
+        if unknown:
+            if default is None:
+                default = sum(known.values()) / len(known) if known else 0.0
+            for task_id in unknown:
+                known[task_id] = default
+        return known
+
+    def save(self) -> None:
+        """Write the store to disk, replacing the previous file atomically."""
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+            tmp.write_text(json.dumps(self.entries, indent=2), encoding="utf-8")
+            os.replace(tmp, self.path)
+        except Exception as e:  # pragma: no cover - disk write error
+            logger.warning(f"Failed to update task stats file {self.path}: {e}")
@@ -0,0 +1,147 @@
+"""Bounded item streams between tasks.
+
+A task declared with ``@parslet_task(stream=True)`` is iterated by the
+:class:`~parslet.core.runner.DAGRunner` while it runs. Every item it yields
+is pushed into one :class:`StreamChannel` per consuming task, and each
+consumer reads its channel through a :class:`TaskStream`. Channels are
+bounded, so a producer that gets ahead of its slowest consumer pauses
+instead of buffering the whole output in memory. A consumer still waiting
+for its other dependencies cannot read yet, so its channel only becomes
+bounded once the consumer has been dispatched; until then it buffers
+everything rather than stall the producer and with it the other consumers.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterator
+from threading import Condition
+
+__all__ = ["StreamChannel", "TaskStream"]
+
+
+class StreamChannel:
+    """
+    Bounded, thread-safe queue from one producer task to one consumer task.
+
+    The producer calls :meth:`put` for each item and :meth:`finish` once it
+    is done (passing an exception if it failed). The consumer reads items
+    with :meth:`get`. If the consumer completes before draining the channel,
+    :meth:`close` discards the buffered items and makes further ``put``
+    calls return immediately, so the producer is never left waiting.
+    """
+
+    def __init__(self, maxsize: int, bounded: bool = True) -> None:
+        """
+        Args:
+            maxsize (int): Maximum number of items held at once.
+            bounded (bool): Whether ``maxsize`` applies from the start. An
+                unbounded channel buffers every item until :meth:`bound`
+                is called.
+        """
+        self.maxsize = maxsize
+        self._bounded = bounded
+        self._items: deque[object] = deque()
+        self._cond = Condition()
+        self._finished = False
+        self._closed = False
+        self._error: Exception | None = None
+
+    @property
+    def closed(self) -> bool:
+        """True once the consumer has stopped reading."""
+        return self._closed
+
+    def bound(self) -> None:
+        """Apply ``maxsize`` from now on; items already buffered are kept."""
+        with self._cond:
+            self._bounded = True
+
+    def put(self, item: object) -> bool:
+        """
+        Append ``item``, waiting while a bounded channel is full.
+
+        Returns:
+            bool: False if the consumer has closed the channel and the item
+            was dropped, True otherwise.
+        """
+        with self._cond:
+            while (
+                self._bounded and len(self._items) >= self.maxsize and not self._closed
+            ):
+                self._cond.wait()
+            if self._closed:
+                return False
+            self._items.append(item)
+            self._cond.notify_all()
+            return True
+
+    def finish(self, error: Exception | None = None) -> None:
+        """
+        Mark the end of the stream.
+
+        Args:
+            error (Optional[Exception]): Raised to the consumer after the
+                buffered items if the producer failed. Later calls are
+                ignored.
+        """
+        with self._cond:
+            if self._finished:
+                return
+            self._finished = True
+            self._error = error
+            self._cond.notify_all()
+
+    def close(self) -> None:
+        """Stop accepting items and drop anything still buffered."""
+        with self._cond:
+            self._closed = True
+            self._items.clear()
+            self._cond.notify_all()
+
+    def get(self) -> object:
+        """
+        Remove and return the next item, waiting for the producer if needed.
+
+        Raises:
+            StopIteration: When the stream finished and is drained.
+            Exception: The producer's failure, once the buffered items
+                have been consumed.
+        """
+        with self._cond:
+            while not self._items and not self._finished and not self._closed:
+                self._cond.wait()
+            if self._items:
+                item = self._items.popleft()
+                self._cond.notify_all()
+                return item
+            if self._error is not None:
+                raise self._error
+            raise StopIteration
+
+
+class TaskStream(Iterator[object]):
+    """
+    Single-use iterator over the items of a streaming task.
+
+    Consumers receive a ``TaskStream`` wherever they referenced the
+    streaming task's future. Iterating it yields items as the producer
+    emits them and raises the producer's failure, typically an
+    ``UpstreamTaskFailedError``, if it stops with an error.
+
+    Attributes:
+        producer_task_id (str): ID of the task producing the items.
+    """
+
+    def __init__(self, channel: StreamChannel, producer_task_id: str) -> None:
+        self._channel = channel
+        self.producer_task_id = producer_task_id
+
+    def __iter__(self) -> TaskStream:
+        return self
+
+    def __next__(self) -> object:
+        return self._channel.get()
+
+    def __repr__(self) -> str:
+        return f"<TaskStream from={self.producer_task_id}>"
@@ -0,0 +1,362 @@
+"""Run one workflow over many parameter sets.
+
+A sweep evaluates a workflow's ``main(**params)`` for every parameter set.
+Instead of building, validating and running a separate DAG each time,
+:class:`WorkflowTemplate` calls ``main`` once with :class:`SweepParameter`
+placeholders, validates the resulting graph and records which tasks depend
+on a parameter. Every parameter set then copies those tasks. Pure or cached
+tasks that depend on no parameter are shared by all instances and run once;
+other tasks are copied even without parameters, as running them once per
+instance may be the point (e.g. creating an output directory).
+:func:`run_sweep` places all instances in a single DAG so that one
+:class:`~parslet.core.runner.DAGRunner` executes them concurrently on one
+worker pool.
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+import logging
+import time
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, NoReturn
+
+from .dag import DAG
+from .task import ArgumentTemplate, ParsletFuture
+
+if TYPE_CHECKING:  # pragma: no cover - imported for type hints only
+    from .runner import DAGRunner
+
+__all__ = [
+    "SweepParameter",
+    "SweepResult",
+    "SweepTemplateError",
+    "WorkflowTemplate",
+    "load_parameter_sets",
+    "run_sweep",
+]
+
+logger = logging.getLogger(__name__)
+
+
+class SweepTemplateError(TypeError):
+    """A workflow needed a parameter's value while its template was built."""
+
+
+class SweepParameter:
+    """
+    Placeholder for a parameter value while a workflow template is built.
+
+    Placeholders may be passed to tasks directly or inside lists, tuples,
+    sets and dicts. Anything that needs the actual value, such as string
+    formatting, comparisons, truth tests or attribute access, raises
+    :class:`SweepTemplateError`; :func:`run_sweep` then falls back to
+    calling ``main`` once per parameter set.
+
+    Attributes:
+        name (str): Keyword argument of ``main`` this placeholder stands for.
+    """
+
+    __slots__ = ("name",)
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __repr__(self) -> str:
+        return f"<SweepParameter {self.name}>"
+
+    def _needs_value(self, *_args: object) -> NoReturn:
+        raise SweepTemplateError(
+            f"Sweep parameter '{self.name}' has no value while the workflow "
+            "template is built; pass it to tasks unchanged."
+        )
+
+    def __getattr__(self, attr: str) -> NoReturn:
+        if attr.startswith("__"):
+            raise AttributeError(attr)
+        self._needs_value()
+
+    __str__ = __format__ = __bool__ = __len__ = __iter__ = _needs_value
+    __contains__ = __getitem__ = __fspath__ = __index__ = _needs_value
+    __int__ = __float__ = __add__ = __radd__ = __mul__ = __rmul__ = _needs_value
+    __eq__ = __ne__ = __lt__ = __le__ = __gt__ = __ge__ = _needs_value
+    __hash__ = object.__hash__
+
+
+def _as_future_list(value: object) -> list[ParsletFuture]:
+    """Normalise what a workflow's ``main`` returned to a list of futures."""
+    if isinstance(value, ParsletFuture):
+        return [value]
+    return list(value)  # type: ignore[call-overload]
+
+
+class WorkflowTemplate:
+    """
+    A workflow's task graph, built once and instantiated per parameter set.
+
+    Attributes:
+        parameters (Tuple[str, ...]): Keyword arguments passed to ``main``.
+        dag (DAG): The validated graph of template tasks.
+        shared (Set[str]): IDs of pure or cached template tasks that depend
+            on no parameter. Every instance reuses these futures, so they run
+            only once.
+    """
+
+    def __init__(self, main: Callable[..., Any], parameters: Iterable[str]) -> None:
+        """
+        Args:
+            main (Callable[..., Any]): The workflow's ``main`` function.
+            parameters (Iterable[str]): Keyword arguments to sweep over.
+
+        Raises:
+            SweepTemplateError: If ``main`` needs a parameter's value to
+                build its tasks.
+            DAGCycleError: If the template graph contains a cycle.
+        """
+        self.parameters = tuple(parameters)
+        placeholders = {name: SweepParameter(name) for name in self.parameters}
+        self._entries = _as_future_list(main(**placeholders))
+        self.dag = DAG()
+        self.dag.build_dag(self._entries)
+        self.dag.validate_dag()
+
+        # Tasks copied per instance, in topological order, with their
+        # arguments compiled so instances only rebuild what differs.
+        self._varying: dict[str, tuple[ParsletFuture, ArgumentTemplate]] = {}
+        for task_id in self.dag.get_execution_order():
+            future = self.dag.tasks[task_id]
+            template = ArgumentTemplate(future.args, future.kwargs, SweepParameter)
+            shareable = (
+                (future.pure or getattr(future.func, "_parslet_cache", False))
+                and not template.placeholders
+                # Dependencies come first in topological order.
+                and not any(d.task_id in self._varying for d in template.dependencies)
+            )
+            if not shareable:
+                self._varying[task_id] = (future, template)
+        self.shared = set(self.dag.tasks) - set(self._varying)
+
+    def instantiate(self, params: Mapping[str, Any], tag: str) -> list[ParsletFuture]:
+        """
+        Create the futures of one workflow instance.
+
+        Args:
+            params (Mapping[str, Any]): A value for every name in
+                ``parameters``.
+            tag (str): Appended to the IDs of copied tasks, as
+                ``<template id>@<tag>``, to keep instances apart.
+
+        Returns:
+            List[ParsletFuture]: The instance's counterparts of the futures
+            returned by ``main``. Shared futures are returned unchanged.
+
+        Raises:
+            ValueError: If a parameter is missing from ``params``.
+        """
+        missing = [name for name in self.parameters if name not in params]
+        if missing:
+            raise ValueError(f"Missing sweep parameter(s): {', '.join(missing)}")
+        clones: dict[str, ParsletFuture] = {}
+
+        def fill(obj: ParsletFuture | SweepParameter) -> object:
+            if isinstance(obj, SweepParameter):
+                return params[obj.name]
+            return clones.get(obj.task_id, obj)
+
+        for task_id, (future, template) in self._varying.items():
+            args, kwargs = template.resolve(fill)
+            clones[task_id] = ParsletFuture(
+                task_id=f"{task_id}@{tag}",
+                func=future.func,
+                args=tuple(args),
+                kwargs=kwargs,
+            )
+        return [clones.get(f.task_id, f) for f in self._entries]
+
+
+@dataclass
+class SweepResult:
+    """
+    Outcome of :func:`run_sweep`.
+
+    Attributes:
+        params (List[Dict[str, Any]]): Parameter sets in submission order.
+        futures (List[List[ParsletFuture]]): Entry futures of each instance,
+            aligned with ``params``.
+        shared_tasks (int): Tasks computed once for all instances.
+        task_names (Dict[str, str]): Task name of every task ID in the sweep.
+        task_statuses (Dict[str, str]): Final status of every task ID.
+        task_execution_times (Dict[str, float]): Seconds per executed task.
+        cache_hits (int): Tasks whose result came from the cache.
+        elapsed_s (float): Wall-clock duration of the whole sweep.
+    """
+
+    params: list[dict[str, Any]]
+    futures: list[list[ParsletFuture]]
+    shared_tasks: int = 0
+    task_names: dict[str, str] = field(default_factory=dict)
+    task_statuses: dict[str, str] = field(default_factory=dict)
+    task_execution_times: dict[str, float] = field(default_factory=dict)
+    cache_hits: int = 0
+    elapsed_s: float = 0.0
+
+    def error(self, index: int) -> Exception | None:
+        """Return why instance ``index`` failed, or None if it succeeded."""
+        for future in self.futures[index]:
+            if not future.done():
+                return RuntimeError(f"Task {future.task_id} did not run.")
+            try:
+                future.result()
+            except Exception as e:
+                return e
+        return None
+
+    def results(self, index: int) -> list[Any]:
+        """
+        Return the results of instance ``index``'s entry futures.
+
+        Raises:
+            Exception: The failure of the instance, as in
+                :meth:`ParsletFuture.result`.
+        """
+        error = self.error(index)
+        if error is not None:
+            raise error
+        return [future.result() for future in self.futures[index]]
+
+    def summary(self) -> dict[str, Any]:
+        """
+        Aggregate the sweep into a JSON-friendly report.
+
+        Returns:
+            dict: Instance counts, task counts, throughput and, per task
+            name, how often it ran with its mean and longest duration.
+        """
+        failed = sum(1 for i in range(len(self.futures)) if self.error(i))
+        per_task: dict[str, dict[str, float]] = {}
+        for task_id, seconds in self.task_execution_times.items():
+            name = self.task_names.get(task_id, task_id)
+            entry = per_task.setdefault(name, {"count": 0, "mean_s": 0.0, "max_s": 0.0})
+            entry["count"] += 1
+            entry["mean_s"] += (seconds - entry["mean_s"]) / entry["count"]
+            entry["max_s"] = max(entry["max_s"], seconds)
+        return {
+            "instances": len(self.futures),
+            "succeeded": len(self.futures) - failed,
+            "failed": failed,
+            "tasks": len(self.task_statuses),
+            "shared_tasks": self.shared_tasks,
+            "cache_hits": self.cache_hits,
+            "elapsed_s": self.elapsed_s,
+            "instances_per_s": (
+                len(self.futures) / self.elapsed_s if self.elapsed_s else 0.0
+            ),
+            "per_task": per_task,
+        }
+
+
+def load_parameter_sets(path: str | Path) -> list[dict[str, Any]]:
+    """
+    Read sweep parameter sets from a file.
+
+    ``.csv`` files use their header row as parameter names (values are
+    strings), ``.jsonl`` files hold one JSON object per line and any other
+    file must contain a JSON list of objects.
+
+    Raises:
+        ValueError: If the file does not describe a list of objects.
+    """
+    path = Path(path)
+    with open(path, encoding="utf-8", newline="") as fh:
+        if path.suffix == ".csv":
+            sets: list[Any] = list(csv.DictReader(fh))
+        elif path.suffix == ".jsonl":
+            sets = [json.loads(line) for line in fh if line.strip()]
+        else:
+            sets = json.load(fh)
+    if not isinstance(sets, list) or not all(isinstance(p, dict) for p in sets):
+        raise ValueError(f"{path} must contain a list of parameter objects.")
+    return sets
+
+
+def run_sweep(
+    main: Callable[..., Any],
+    param_sets: Sequence[Mapping[str, Any]],
+    runner: DAGRunner | None = None,
+    eliminate_duplicates: bool = False,
+    fuse_chains: bool = False,
+) -> SweepResult:
+    """
+    Run ``main(**params)`` for every parameter set as one combined DAG.
+
+    The workflow's DAG is built and validated once as a
+    :class:`WorkflowTemplate`. If ``main`` needs parameter values to decide
+    which tasks to create, it is called once per parameter set instead; the
+    instances still share one DAG, one security scan and one worker pool.
+
+    Args:
+        main (Callable[..., Any]): The workflow's ``main`` function.
+        param_sets (Sequence[Mapping[str, Any]]): Keyword arguments for each
+            instance. All sets must name the same parameters.
+        runner (Optional[DAGRunner]): Runner to execute the sweep with; a
+            default ``DAGRunner`` is created if omitted.
+        eliminate_duplicates (bool): Merge identical calls of pure or cached
+            tasks across instances before running.
+        fuse_chains (bool): Run linear task chains as a single job.
+
+    Returns:
+        SweepResult: Per-instance futures and aggregated statistics.
+    """
+    from .runner import DAGRunner
+
+    start = time.perf_counter()
+    params = [dict(p) for p in param_sets]
+    names = list(dict.fromkeys(name for p in params for name in p))
+
+    instances: list[list[ParsletFuture]] = []
+    shared = 0
+    template: WorkflowTemplate | None = None
+    try:
+        if params:
+            template = WorkflowTemplate(main, names)
+    except Exception as e:
+        # Usually a SweepTemplateError, but library code handed a
+        # placeholder may fail in its own way. Real errors resurface below.
+        logger.info(
+            f"Workflow needs parameter values to build its DAG ({e}); "
+            "calling main() once per parameter set."
+        )
+        for p in params:
+            instances.append(_as_future_list(main(**p)))
+    if template is not None:
+        shared = len(template.shared)
+        for index, p in enumerate(params):
+            instances.append(template.instantiate(p, str(index)))
+
+    dag = DAG()
+    for futures in instances:
+        dag.extend(futures)
+    if eliminate_duplicates:
+        dag.eliminate_common_subexpressions()
+    if fuse_chains:
+        dag.fuse_linear_chains()
+
+    runner = runner if runner is not None else DAGRunner()
+    if dag.tasks:
+        runner.run(dag)
+    return SweepResult(
+        params=params,
+        futures=instances,
+        shared_tasks=shared,
+        task_names={
+            task_id: getattr(f.func, "_parslet_task_name", f.func.__name__)
+            for task_id, f in dag.tasks.items()
+        },
+        task_statuses=dict(runner.task_statuses),
+        task_execution_times=dict(runner.task_execution_times),
+        cache_hits=len(runner.cache_hits),
+        elapsed_s=time.perf_counter() - start,
+    )
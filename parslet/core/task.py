@@ -1,16 +1,24 @@
 """Task utilities and decorators for building Parslet DAGs.
 
-Public API: :func:`parslet_task`, :class:`ParsletFuture` and
-``set_allow_redefine``.
+Public API: :func:`parslet_task`, :class:`ParsletFuture`,
+``set_allow_redefine`` and ``set_task_id_mode``.
 """
 
 import functools
+import hashlib
+import itertools
+import json
 import logging
+import os
+import pickle
+import re
 import uuid
 from collections.abc import Callable
-from threading import Event
+from threading import Event, Lock
 from typing import Any
 
+from .cache import _safe_serialize
+
 # Global registry for Parslet tasks.
 # This dictionary maps a task's registered name (str) to the actual callable
 # function. It's used to look up task functions, though direct function
@@ -28,7 +36,36 @@ _RESULT_NOT_SET = object()
 # Module-level logger for task utilities
 logger = logging.getLogger(__name__)
 
-__all__ = ["parslet_task", "ParsletFuture", "set_allow_redefine", "task_variant"]
+# Strategies for generating task IDs:
+# - "uuid": a random suffix per call (historical default).
+# - "counter": a monotonic per-process counter; cheap and collision free.
+# - "deterministic": a digest of the task name and argument structure so the
+#   same workflow produces the same IDs across runs (useful for checkpoints).
+TASK_ID_MODES = ("uuid", "counter", "deterministic")
+_TASK_ID_MODE: str = os.environ.get("PARSLET_TASK_ID_MODE", "uuid")
+if _TASK_ID_MODE not in TASK_ID_MODES:
+    logger.warning(
+        "Unknown PARSLET_TASK_ID_MODE '%s'; falling back to 'uuid'.", _TASK_ID_MODE
+    )
+    _TASK_ID_MODE = "uuid"
+_TASK_ID_COUNTER = itertools.count(1)
+# Number of times each deterministic digest has been issued in this process.
+# Identical invocations receive an occurrence suffix so they remain distinct
+# DAG nodes while still being reproducible from run to run.
+_DETERMINISTIC_ID_SEEN: dict[str, int] = {}
+# Memory addresses in default reprs such as "<Foo object at 0x7f...>".
+_ADDRESS_RE = re.compile(r" at 0x[0-9a-fA-F]+")
+_TASK_ID_LOCK = Lock()
+# Guards registration and dispatch of ParsletFuture completion callbacks.
+_CALLBACK_LOCK = Lock()
+
+__all__ = [
+    "parslet_task",
+    "ParsletFuture",
+    "set_allow_redefine",
+    "set_task_id_mode",
+    "task_variant",
+]
 
 
 class ParsletFuture:
@@ -90,12 +127,28 @@ class ParsletFuture:
         self.qos: str = getattr(func, "_parslet_qos", "standard")
         self.degradable: bool = getattr(func, "_parslet_degradable", True)
         self.variant_key: str | None = getattr(func, "_parslet_variant_key", None)
+        self.pure: bool = getattr(func, "_parslet_pure", False)
+        self.dynamic: bool = getattr(func, "_parslet_dynamic", False)
+        self.stream: bool = getattr(func, "_parslet_stream", False)
+        self.stream_buffer: int = getattr(func, "_parslet_stream_buffer", 16)
+
+        # Precomputed view of where dependency futures live inside ``args``
+        # and ``kwargs``. Built lazily by :meth:`argument_template`.
+        self._arg_template: ArgumentTemplate | None = None
+
+        # Set when the DAG collapses this invocation into an identical one;
+        # results are then read from the canonical future.
+        self._alias_of: ParsletFuture | None = None
 
         # Internal attributes to store the outcome of the task execution.
         self._result: Any = _RESULT_NOT_SET
         self._exception: Exception | None = None
         # Event used to signal completion of this task (success or failure)
         self._done: Event = Event()
+        # Callables registered through add_done_callback, run once on
+        # completion. ``None`` until the first registration to keep idle
+        # futures small.
+        self._callbacks: list[Callable[[ParsletFuture], None]] | None = None
 
     def __repr__(self) -> str:
         """
@@ -109,6 +162,17 @@ class ParsletFuture:
             f"<ParsletFuture task_id='{self.task_id}' " f"func='{self.func.__name__}'>"
         )
 
+    def argument_template(self) -> "ArgumentTemplate":
+        """
+        Return the cached :class:`ArgumentTemplate` for this task's arguments.
+
+        The template is computed on first access, so ``args`` and ``kwargs``
+        should not be reassigned afterwards.
+        """
+        if self._arg_template is None:
+            self._arg_template = ArgumentTemplate(self.args, self.kwargs)
+        return self._arg_template
+
     def set_result(self, value: object) -> None:
         """
         Sets the successful result of the task.
@@ -132,7 +196,7 @@ class ParsletFuture:
                 "exception."
             )
         self._result = value
-        self._done.set()
+        self._mark_done()
 
     def set_exception(self, exception: Exception) -> None:
         """
@@ -149,7 +213,50 @@ class ParsletFuture:
         # (though unlikely) or the initial _RESULT_NOT_SET sentinel is
         # cleared to reflect failure.
         self._result = _RESULT_NOT_SET
-        self._done.set()
+        self._mark_done()
+
+    def done(self) -> bool:
+        """Return True once a result or an exception has been set."""
+        if self._alias_of is not None:
+            return self._alias_of.done()
+        return self._done.is_set()
+
+    def add_done_callback(self, fn: Callable[["ParsletFuture"], None]) -> None:
+        """
+        Call ``fn(self)`` once this future has a result or an exception.
+
+        If the future is already complete, ``fn`` is called immediately in
+        the calling thread; otherwise it runs in the thread that completes
+        the future. Exceptions raised by ``fn`` are logged and ignored.
+
+        Args:
+            fn (Callable[[ParsletFuture], None]): The callback to register.
+        """
+        if self._alias_of is not None:
+            self._alias_of.add_done_callback(lambda _canonical: fn(self))
+            return
+        with _CALLBACK_LOCK:
+            if not self._done.is_set():
+                if self._callbacks is None:
+                    self._callbacks = []
+                self._callbacks.append(fn)
+                return
+        self._run_callback(fn)
+
+    def _mark_done(self) -> None:
+        with _CALLBACK_LOCK:
+            self._done.set()
+            callbacks, self._callbacks = self._callbacks, None
+        for fn in callbacks or ():
+            self._run_callback(fn)
+
+    def _run_callback(self, fn: Callable[["ParsletFuture"], None]) -> None:
+        try:
+            fn(self)
+        except Exception:
+            logger.exception(
+                "Done callback for task %s raised an exception.", self.task_id
+            )
 
     def result(self, timeout: float | None = None) -> object:
         """
@@ -181,6 +288,10 @@ class ParsletFuture:
                           hasn't been set by the runner, often meaning the
                           task hasn't completed or was not run).
         """
+        if self._alias_of is not None:
+            # This invocation was merged into an identical task by the DAG.
+            return self._alias_of.result(timeout)
+
         if self._exception is not None:
             # If an exception was recorded, re-raise it to the caller.
             raise self._exception
@@ -201,6 +312,113 @@ class ParsletFuture:
         return self._result
 
 
+# Node kinds used by ArgumentTemplate.
+_LITERAL = 0
+_FUTURE = 1
+_NESTED = 2
+
+
+class ArgumentTemplate:
+    """
+    Precomputed structure of a task's arguments for dependency resolution.
+
+    ``ParsletFuture`` objects may appear directly as arguments or nested
+    inside lists, tuples, sets and dicts. The template records where they
+    are once, so that resolving arguments on the runner's hot path only
+    rebuilds the containers that actually hold futures; purely literal
+    values, however large, are passed through untouched.
+
+    Attributes:
+        dependencies (List[ParsletFuture]): Unique futures referenced
+            anywhere in the arguments, in discovery order.
+        nested (bool): True if any future sits inside a container rather
+            than being passed directly as an argument. Backends that only
+            resolve top-level futures (e.g. Parsl) must handle these tasks
+            differently.
+        placeholders (List[Any]): Instances of the ``placeholder`` type
+            found in the arguments, in discovery order.
+    """
+
+    def __init__(
+        self, args: tuple, kwargs: dict[str, Any], placeholder: type | None = None
+    ) -> None:
+        """
+        Args:
+            args (tuple): Positional arguments of the task.
+            kwargs (Dict[str, Any]): Keyword arguments of the task.
+            placeholder (Optional[type]): Values of this type are handed to
+                the ``lookup`` of :meth:`resolve` like futures, but are not
+                dependencies; e.g. sweep parameters filled in per instance.
+        """
+        self.dependencies: list[ParsletFuture] = []
+        self.placeholders: list[Any] = []
+        self._seen: set[int] = set()
+        self._placeholder = placeholder
+        self._args = [self._compile(a) for a in args]
+        self._kwargs = {k: self._compile(v) for k, v in kwargs.items()}
+        del self._seen, self._placeholder
+        self.nested = any(
+            node[0] == _NESTED for node in (*self._args, *self._kwargs.values())
+        )
+
+    def _compile(self, obj: Any) -> tuple[int, Any]:
+        if isinstance(obj, ParsletFuture):
+            if id(obj) not in self._seen:
+                self._seen.add(id(obj))
+                self.dependencies.append(obj)
+            return (_FUTURE, obj)
+        if self._placeholder is not None and isinstance(obj, self._placeholder):
+            self.placeholders.append(obj)
+            return (_FUTURE, obj)
+        # Only exact built-in containers are traversed so that subclasses
+        # (e.g. namedtuples) are never rebuilt with the wrong constructor.
+        kind = type(obj)
+        if kind is list or kind is tuple or kind is set or kind is frozenset:
+            items = [self._compile(i) for i in obj]
+            if all(k == _LITERAL for k, _ in items):
+                return (_LITERAL, obj)
+            return (_NESTED, (kind, items))
+        if kind is dict:
+            entries = [(k, self._compile(v)) for k, v in obj.items()]
+            if all(node[0] == _LITERAL for _, node in entries):
+                return (_LITERAL, obj)
+            return (_NESTED, (dict, entries))
+        return (_LITERAL, obj)
+
+    @staticmethod
+    def _materialize(node: tuple[int, Any], lookup: Callable[[Any], object]) -> object:
+        kind, payload = node
+        if kind == _LITERAL:
+            return payload
+        if kind == _FUTURE:
+            return lookup(payload)
+        container, items = payload
+        if container is dict:
+            return {k: ArgumentTemplate._materialize(v, lookup) for k, v in items}
+        return container(ArgumentTemplate._materialize(i, lookup) for i in items)
+
+    def resolve(
+        self, lookup: Callable[[Any], object]
+    ) -> tuple[list[object], dict[str, object]]:
+        """
+        Rebuild the arguments, replacing each future with ``lookup(future)``.
+
+        Args:
+            lookup (Callable[[ParsletFuture], Any]): Called for every future
+                (and placeholder) occurrence; typically returns its result or
+                a backend specific handle (e.g. a Dask delayed object).
+
+        Returns:
+            Tuple[List[Any], Dict[str, Any]]: The resolved positional and
+            keyword arguments.
+        """
+        args = [self._materialize(node, lookup) for node in self._args]
+        kwargs = {
+            k: self._materialize(node, lookup) for k, node in self._kwargs.items()
+        }
+        return args, kwargs
+
+
 def parslet_task(
     _func: Callable[..., Any] | None = None,
     *,
@@ -222,6 +440,11 @@ def parslet_task(
     deadline_s: int | None = None,
     qos: str = "standard",
     degradable: bool = True,
+    pure: bool = False,
+    dynamic: bool = False,
+    stream: bool = False,
+    stream_buffer: int = 16,
+    profile: bool | str = False,
 ) -> Callable[..., ParsletFuture]:
     """
     Decorator to define a Python function as a Parslet task.
@@ -264,6 +487,28 @@ def parslet_task(
             :func:`parslet.security.shell_guard`.
         allow_redefine (bool): Permit replacing an existing task with the same
             name without raising an error.
+        pure (bool): Declare that the task has no side effects and its result
+            depends only on its arguments. Identical invocations of pure (or
+            cached) tasks can then be merged by
+            :meth:`DAG.eliminate_common_subexpressions`.
+        dynamic (bool): Allow the task to spawn follow-up tasks at run time.
+            Any ``ParsletFuture`` objects in the value it returns (directly
+            or inside lists, tuples, sets and dicts) are added to the running
+            DAG, and the task completes with that value once they have been
+            replaced by their results.
+        stream (bool): Treat the task as a generator whose items are passed
+            to downstream tasks while it is still running. Each consuming
+            task receives a single-use :class:`~parslet.core.TaskStream`
+            in place of the result, and the task's own result is the number
+            of items it produced.
+        stream_buffer (int): Maximum number of items buffered for each
+            consumer of a streaming task. The producer pauses while any
+            consumer's buffer is full.
+        profile (bool | str): Profile every execution of this task, even
+            when the run was not started with ``--profile``. ``True`` or
+            ``"cpu"`` collects a cProfile profile, ``"mem"`` traces memory
+            allocations with tracemalloc. See
+            :class:`~parslet.core.profiling.TaskProfiler`.
 
     Returns:
         Callable: A wrapped function that, when called, returns a
@@ -276,6 +521,17 @@ def parslet_task(
         # Determine the task's base name: use custom 'name' if provided,
         # else function's own name.
         task_name = name if name is not None else func_to_wrap.__name__
+        if stream and stream_buffer < 1:
+            raise ValueError(
+                f"Task '{task_name}': stream_buffer must be at least 1, "
+                f"got {stream_buffer}."
+            )
+        profile_mode = "cpu" if profile is True else (profile or None)
+        if profile_mode not in (None, "cpu", "mem"):
+            raise ValueError(
+                f"Task '{task_name}': profile must be True, False, 'cpu' or "
+                f"'mem', got {profile!r}."
+            )
 
         # (Optional) Register the original function in a global registry.
         # This could be used for looking up tasks by name, though Parslet
@@ -306,6 +562,11 @@ def parslet_task(
         func_to_wrap._parslet_deadline_s = deadline_s
         func_to_wrap._parslet_qos = qos
         func_to_wrap._parslet_degradable = degradable
+        func_to_wrap._parslet_pure = pure
+        func_to_wrap._parslet_dynamic = dynamic
+        func_to_wrap._parslet_stream = stream
+        func_to_wrap._parslet_stream_buffer = stream_buffer
+        func_to_wrap._parslet_profile = profile_mode
 
         @functools.wraps(func_to_wrap)
         def wrapper(*args: object, **kwargs: object) -> ParsletFuture:
@@ -318,7 +579,7 @@ def parslet_task(
             # This ensures that even if the same function is called multiple
             # times with different arguments, each call results in a unique
             # task node in the DAG.
-            unique_task_id = f"{task_name}_{uuid.uuid4().hex[:8]}"
+            unique_task_id = _make_task_id(task_name, args, kwargs)
 
             # Create the ParsletFuture object, capturing the original
             # function, its arguments, and this unique task ID.
@@ -348,6 +609,11 @@ def parslet_task(
         wrapper._parslet_deadline_s = deadline_s
         wrapper._parslet_qos = qos
         wrapper._parslet_degradable = degradable
+        wrapper._parslet_pure = pure
+        wrapper._parslet_dynamic = dynamic
+        wrapper._parslet_stream = stream
+        wrapper._parslet_stream_buffer = stream_buffer
+        wrapper._parslet_profile = profile_mode
 
         return wrapper
 
@@ -388,6 +654,89 @@ def set_allow_redefine(flag: bool) -> None:
     _ALLOW_REDEFINE = flag
 
 
+def set_task_id_mode(mode: str) -> None:
+    """Select how task IDs are generated for subsequent task invocations.
+
+    ``mode`` must be one of ``"uuid"``, ``"counter"`` or ``"deterministic"``.
+    Switching modes restarts the counter and the deterministic occurrence
+    bookkeeping so that a fresh workflow build yields reproducible IDs. The
+    initial mode can also be chosen with the ``PARSLET_TASK_ID_MODE``
+    environment variable.
+
+    Raises:
+        ValueError: If ``mode`` is not a known ID mode.
+    """
+    global _TASK_ID_MODE, _TASK_ID_COUNTER
+    if mode not in TASK_ID_MODES:
+        raise ValueError(
+            f"Unknown task ID mode '{mode}'. Expected one of: "
+            f"{', '.join(TASK_ID_MODES)}."
+        )
+    with _TASK_ID_LOCK:
+        _TASK_ID_MODE = mode
+        _TASK_ID_COUNTER = itertools.count(1)
+        _DETERMINISTIC_ID_SEEN.clear()
+
+
+def _argument_fingerprint(obj: object) -> object:
+    """Return a JSON-friendly structure describing ``obj`` for ID hashing.
+
+    ``ParsletFuture`` instances are represented by their task IDs, so a
+    deterministic upstream ID yields a deterministic downstream ID. Objects
+    whose ``repr`` contains a memory address are represented by a digest of
+    their pickled state instead.
+
+    Raises:
+        TypeError: If such an object cannot be pickled either.
+    """
+    if isinstance(obj, ParsletFuture):
+        return {"__future__": obj.task_id}
+    if isinstance(obj, list | tuple):
+        return [_argument_fingerprint(i) for i in obj]
+    if isinstance(obj, dict):
+        return [
+            [_argument_fingerprint(k), _argument_fingerprint(v)]
+            for k, v in sorted(obj.items(), key=lambda kv: repr(kv[0]))
+        ]
+    if isinstance(obj, set | frozenset):
+        return sorted(repr(_argument_fingerprint(i)) for i in obj)
+    value = _safe_serialize(obj)
+    if not isinstance(value, str) or not _ADDRESS_RE.search(value):
+        return value
+    # The default repr changes from run to run and would change the ID.
+    try:
+        data = pickle.dumps(obj, protocol=4)
+    except Exception as e:
+        raise TypeError(
+            f"Cannot derive a deterministic task ID from an argument of type "
+            f"'{type(obj).__qualname__}': its repr includes a memory address "
+            f"and it cannot be pickled ({e}). Give it a __repr__ that "
+            "identifies it, or use the 'uuid' or 'counter' task ID mode."
+        ) from e
+    return {"__pickle__": hashlib.sha256(data).hexdigest()}
+
+
+def _make_task_id(task_name: str, args: tuple, kwargs: dict[str, Any]) -> str:
+    """Generate a task ID for one invocation according to the active mode."""
+    if _TASK_ID_MODE == "counter":
+        return f"{task_name}_{next(_TASK_ID_COUNTER)}"
+    if _TASK_ID_MODE == "deterministic":
+        payload = json.dumps(
+            [task_name, _argument_fingerprint(args), _argument_fingerprint(kwargs)],
+            sort_keys=True,
+            separators=(",", ":"),
+            default=repr,
+        )
+        digest = hashlib.sha256(payload.encode()).hexdigest()[:12]
+        with _TASK_ID_LOCK:
+            occurrence = _DETERMINISTIC_ID_SEEN.get(digest, 0)
+            _DETERMINISTIC_ID_SEEN[digest] = occurrence + 1
+        if occurrence:
+            return f"{task_name}_{digest}_{occurrence}"
+        return f"{task_name}_{digest}"
+    return f"{task_name}_{uuid.uuid4().hex[:8]}"
+
+
 def get_all_registered_tasks() -> dict[str, Callable[..., Any]]:
     """
     Returns a copy of the global task registry.
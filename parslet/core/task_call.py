@@ -0,0 +1,76 @@
+"""Picklable task calls shared by the Dask and Parsl bridges.
+
+Public API: :class:`TaskCall` and :class:`ResultRef`.
+
+A :class:`TaskCall` holds a Parslet task's function with its arguments, in
+which every :class:`~parslet.core.task.ParsletFuture` has been replaced by a
+:class:`ResultRef`. The backend passes the dependency results positionally
+when it runs the call, and they are put back where the futures appeared.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+__all__ = ["ResultRef", "TaskCall"]
+
+
+class ResultRef:
+    """Placeholder for the result of another task inside a call's arguments."""
+
+    __slots__ = ("key",)
+
+    def __init__(self, key: str) -> None:
+        self.key = key
+
+    def __reduce__(self) -> tuple[Any, tuple[str]]:
+        return (ResultRef, (self.key,))
+
+
+def _substitute(obj: Any, values: dict[str, Any]) -> Any:
+    if type(obj) is ResultRef:
+        return values[obj.key]
+    if type(obj) is list:
+        return [_substitute(v, values) for v in obj]
+    if type(obj) is tuple:
+        return tuple(_substitute(v, values) for v in obj)
+    if type(obj) is dict:
+        return {k: _substitute(v, values) for k, v in obj.items()}
+    if type(obj) in (set, frozenset):
+        return type(obj)(_substitute(v, values) for v in obj)
+    return obj
+
+
+class TaskCall:
+    """Callable running one Parslet task on an external backend.
+
+    The results of the dependencies listed in ``dep_keys`` are passed in that
+    order. Keeping the arguments inside this object stops the backend from
+    walking (and possibly misinterpreting) literal argument values.
+    """
+
+    __slots__ = ("func", "args", "kwargs", "dep_keys")
+
+    def __init__(
+        self,
+        func: Callable[..., Any],
+        args: list[Any],
+        kwargs: dict[str, Any],
+        dep_keys: tuple[str, ...],
+    ) -> None:
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.dep_keys = dep_keys
+
+    def __call__(self, *dep_values: Any) -> Any:
+        if not self.dep_keys:
+            return self.func(*self.args, **self.kwargs)
+        values = dict(zip(self.dep_keys, dep_values, strict=True))
+        args = _substitute(self.args, values)
+        kwargs = _substitute(self.kwargs, values)
+        return self.func(*args, **kwargs)
+
+    def __reduce__(self) -> tuple[Any, tuple[Any, ...]]:
+        return (TaskCall, (self.func, self.args, self.kwargs, self.dep_keys))
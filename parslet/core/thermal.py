@@ -0,0 +1,170 @@
+"""Thermal throttling guard for :class:`~parslet.core.runner.DAGRunner`.
+
+Shrinking a :class:`~concurrent.futures.ThreadPoolExecutor` does not stop
+threads it has already started, so the runner cannot lower its concurrency
+by resizing the pool. :class:`ThermalGuard` instead makes every task take a
+slot before it executes: while the SoC is hot, fewer slots are available.
+Tasks declared with ``energy_cost="high"`` are held back before they reach
+the pool until the SoC cools down, so they do not occupy worker threads that
+lighter tasks could use. Both decisions come from a
+:class:`~parslet.core.policy.ThermalPolicy`.
+
+Streaming producers are not admitted through the guard: they run in their
+own threads alongside their consumers, and holding one back could stall
+consumers that already hold slots.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import contextmanager
+
+from ..utils.power import PowerState, shared_watcher
+from .policy import ThermalPolicy
+from .task import ParsletFuture
+
+__all__ = ["ThermalGuard"]
+
+logger = logging.getLogger(__name__)
+
+# Deadline, futures and release callback of work held back by hold().
+_Held = tuple[float, Sequence[ParsletFuture], Callable[[], None]]
+
+
+class ThermalGuard:
+    """
+    Admit tasks to execution according to the SoC temperature.
+
+    Attributes:
+        policy (ThermalPolicy): Decides the worker limit and deferrals.
+        interval_s (float): Maximum age of the cached power reading.
+    """
+
+    def __init__(
+        self,
+        policy: ThermalPolicy | None = None,
+        interval_s: float = 2.0,
+        sample: Callable[[], PowerState] | None = None,
+    ) -> None:
+        self.policy = policy or ThermalPolicy()
+        self.interval_s = interval_s
+        self._sample = sample or self._shared_sample
+        self._state: PowerState | None = None
+        self._state_at = 0.0
+        self._state_lock = threading.Lock()
+        self._cond = threading.Condition()
+        self._running = 0
+        self._held: list[_Held] = []
+        self._releaser: threading.Thread | None = None
+        #: Tasks that had to wait for a slot or for the SoC to cool.
+        self.deferred = 0
+
+    def _shared_sample(self) -> PowerState:
+        return shared_watcher().latest(max_age_s=self.interval_s)
+
+    def state(self) -> PowerState:
+        """Return the power state, read at most every ``interval_s``."""
+        with self._state_lock:
+            now = time.monotonic()
+            if self._state is None or now - self._state_at >= self.interval_s:
+                self._state = self._sample()
+                self._state_at = now
+            return self._state
+
+    def limit(self, max_workers: int) -> int:
+        """Return how many of ``max_workers`` tasks may run at once now."""
+        return self.policy.decide_max_workers(self.state(), max_workers)
+
+    @contextmanager
+    def slot(self, future: ParsletFuture, max_workers: int) -> Iterator[bool]:
+        """
+        Hold an execution slot for ``future`` while the block runs.
+
+        Blocks while the running tasks already use up the temperature
+        dependent limit. After ``policy.max_defer_s`` the task runs
+        regardless, so a device that never cools still finishes. Yields
+        True if the task had to wait.
+        """
+        deadline = time.monotonic() + self.policy.max_defer_s
+        waited = False
+        while True:
+            state = self.state()
+            with self._cond:
+                limit = self.policy.decide_max_workers(state, max_workers)
+                remaining = deadline - time.monotonic()
+                if self._running < limit or remaining <= 0:
+                    self._running += 1
+                    break
+                if not waited:
+                    waited = True
+                    self.deferred += 1
+                    logger.info(
+                        f"Holding back task '{future.task_id}': SoC at "
+                        f"{state.temperature_c}°C, {self._running} of {limit} "
+                        "slot(s) in use."
+                    )
+                self._cond.wait(min(self.interval_s, remaining))
+        try:
+            yield waited
+        finally:
+            with self._cond:
+                self._running -= 1
+                self._cond.notify_all()
+
+    def hold(
+        self, futures: Sequence[ParsletFuture], release: Callable[[], None]
+    ) -> bool:
+        """
+        Hold back work while any of ``futures`` should wait for the SoC.
+
+        Returns False without calling ``release`` if nothing has to wait, in
+        which case the caller submits the work itself. Otherwise ``release``
+        is called later from the guard's own thread, once the SoC has cooled
+        down or ``policy.max_defer_s`` has passed.
+        """
+        state = self.state()
+        waiting = [f for f in futures if self.policy.should_defer(f, state)]
+        if not waiting:
+            return False
+        with self._cond:
+            self.deferred += 1
+            self._held.append(
+                (time.monotonic() + self.policy.max_defer_s, futures, release)
+            )
+            if self._releaser is None:
+                self._releaser = threading.Thread(
+                    target=self._release_held, name="parslet-thermal", daemon=True
+                )
+                self._releaser.start()
+        logger.info(
+            f"Holding back task '{waiting[0].task_id}' until the SoC cools "
+            f"down: {state.temperature_c}°C."
+        )
+        return True
+
+    def _release_held(self) -> None:
+        """Release held work as the SoC cools or its deadline passes."""
+        while True:
+            with self._cond:
+                if not self._held:
+                    self._releaser = None
+                    return
+                self._cond.wait(self.interval_s)
+            state = self.state()
+            now = time.monotonic()
+            held: list[_Held] = []
+            ready: list[_Held] = []
+            with self._cond:
+                for entry in self._held:
+                    deadline, futures, _ = entry
+                    cool = not any(self.policy.should_defer(f, state) for f in futures)
+                    (ready if cool or now >= deadline else held).append(entry)
+                self._held = held
+            for _, _, release in ready:
+                try:
+                    release()
+                except Exception:  # pragma: no cover - release handles errors
+                    logger.exception("Releasing a held task failed")
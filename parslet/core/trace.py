@@ -0,0 +1,144 @@
+"""Chrome trace recording for :class:`~parslet.core.runner.DAGRunner` runs.
+
+:class:`TraceRecorder` collects timed spans while a workflow executes -
+argument resolution, cache lookups, the time a task waits in the executor
+queue and the task's execution on its worker thread - and writes them in the
+Chrome Trace Event format. The resulting JSON file opens in Perfetto
+(https://ui.perfetto.dev) or ``chrome://tracing``, where each worker thread
+gets its own track so idle workers, stragglers and dispatch gaps are easy to
+spot.
+
+Like :class:`~parslet.core.metrics.RunnerMetrics`, recording only appends a
+tuple to a :class:`collections.deque`; events are formatted when the trace
+is exported.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any
+
+__all__ = ["TraceRecorder"]
+
+# (phase, name, category, timestamp µs, duration µs, thread ID, args, ID)
+_Event = tuple[str, str, str, float, float, int, "dict[str, Any] | None", "str | None"]
+
+
+class TraceRecorder:
+    """
+    Buffer of trace events for one or more runs.
+
+    All recording methods may be called from any thread without taking a
+    lock. Timestamps are microseconds since the recorder was created, as
+    returned by :meth:`now`.
+    """
+
+    def __init__(self) -> None:
+        self._origin_ns = time.perf_counter_ns()
+        self._pid = os.getpid()
+        self._events: deque[_Event] = deque()
+        # Thread ID -> thread name, for the track labels.
+        self._threads: dict[int, str] = {}
+
+    def now(self) -> float:
+        """Return the current trace timestamp in microseconds."""
+        return (time.perf_counter_ns() - self._origin_ns) / 1000
+
+    def _tid(self) -> int:
+        tid = threading.get_ident()
+        if tid not in self._threads:
+            self._threads[tid] = threading.current_thread().name
+        return tid
+
+    def complete(
+        self,
+        name: str,
+        category: str,
+        start: float,
+        end: float | None = None,
+        args: dict[str, Any] | None = None,
+    ) -> None:
+        """
+        Record a span that ran on the calling thread.
+
+        Args:
+            name (str): Label shown on the span.
+            category (str): Event category, e.g. ``"task"`` or ``"cache"``.
+            start (float): Start timestamp from :meth:`now`.
+            end (Optional[float]): End timestamp; defaults to now.
+            args (Optional[dict]): Extra details shown when the span is
+                selected.
+        """
+        if end is None:
+            end = self.now()
+        self._events.append(
+            ("X", name, category, start, end - start, self._tid(), args, None)
+        )
+
+    def async_span(
+        self,
+        name: str,
+        category: str,
+        span_id: str,
+        start: float,
+        end: float,
+        args: dict[str, Any] | None = None,
+    ) -> None:
+        """
+        Record a span that is not tied to a thread, such as queue waiting.
+
+        Spans with the same ``name`` are drawn on a shared track and may
+        overlap; ``span_id`` tells them apart.
+        """
+        tid = self._tid()
+        self._events.append(("b", name, category, start, 0.0, tid, args, span_id))
+        self._events.append(("e", name, category, end, 0.0, tid, None, span_id))
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the recorded events as a Chrome trace JSON object."""
+        events: list[dict[str, Any]] = [
+            {
+                "ph": "M",
+                "name": "process_name",
+                "pid": self._pid,
+                "tid": 0,
+                "args": {"name": "parslet"},
+            }
+        ]
+        for tid, thread_name in list(self._threads.items()):
+            events.append(
+                {
+                    "ph": "M",
+                    "name": "thread_name",
+                    "pid": self._pid,
+                    "tid": tid,
+                    "args": {"name": thread_name},
+                }
+            )
+        for phase, name, category, ts, dur, tid, args, span_id in list(self._events):
+            event: dict[str, Any] = {
+                "ph": phase,
+                "name": name,
+                "cat": category,
+                "ts": ts,
+                "pid": self._pid,
+                "tid": tid,
+            }
+            if phase == "X":
+                event["dur"] = dur
+            else:
+                event["id"] = span_id
+            if args:
+                event["args"] = args
+            events.append(event)
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def save(self, path: str | Path) -> None:
+        """Write the trace to ``path`` as JSON."""
+        with open(path, "w", encoding="utf-8") as fh:
+            json.dump(self.to_dict(), fh, default=repr)
@@ -0,0 +1,331 @@
+"""Warm workflow daemon behind ``parslet serve`` and ``parslet submit``.
+
+Every ``parslet run`` starts a fresh interpreter, imports Parslet and the
+workflow, scans it and builds a worker pool before the first task runs.
+For workflows that are triggered every few minutes that start-up dominates
+the run. :class:`WorkflowDaemon` pays it once: it listens on a local Unix
+socket, keeps loaded workflow modules, the task statistics store and a
+single thread pool resident, and executes one run per request.
+:func:`submit_workflow` is the matching client.
+
+Requests and responses are single JSON objects terminated by a newline.
+Runs are executed one at a time so that process-wide settings such as the
+task ID mode and ``--offline`` never leak between requests.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import socket
+import socketserver
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+__all__ = ["WorkflowDaemon", "get_socket_path", "send_request", "submit_workflow"]
+
+logger = logging.getLogger(__name__)
+
+#: Run options a client may send along with a workflow.
+RUN_OPTIONS = ("no_cache", "failsafe_mode", "dedupe", "fuse_chains", "offline")
+
+
+def get_socket_path() -> Path:
+    """Return the Unix socket used by ``parslet serve``.
+
+    Defaults to ``~/.parslet/parslet.sock`` and can be overridden with the
+    ``PARSLET_SOCKET`` environment variable.
+    """
+    base = os.environ.get(
+        "PARSLET_SOCKET", os.path.expanduser("~/.parslet/parslet.sock")
+    )
+    return Path(base)
+
+
+class WorkflowDaemon:
+    """Serve workflow runs over a Unix socket from a warm process.
+
+    Workflow modules are cached by path and only re-imported when the file
+    changes on disk, and all runs share one thread pool. Each request gets
+    its own :class:`~parslet.core.runner.DAGRunner`, so per-run state such
+    as task statuses never mixes between requests.
+
+    Supported requests:
+
+    * ``{"cmd": "run", "workflow": PATH, "options": {...}}`` runs a workflow
+      and answers with its results and statistics.
+    * ``{"cmd": "ping"}`` answers ``{"ok": true}`` with the daemon's PID.
+    * ``{"cmd": "shutdown"}`` stops the daemon after answering.
+    """
+
+    def __init__(
+        self,
+        socket_path: str | Path | None = None,
+        max_workers: int | None = None,
+        task_id_mode: str | None = None,
+    ) -> None:
+        """
+        Args:
+            socket_path (Optional[str | Path]): Where to listen. Defaults to
+                :func:`get_socket_path`.
+            max_workers (Optional[int]): Size of the shared worker pool. If
+                None, it is chosen by the :class:`AdaptiveScheduler`.
+            task_id_mode (Optional[str]): Task ID mode used for every run,
+                see :func:`~parslet.core.task.set_task_id_mode`. If None, the
+                current mode (``PARSLET_TASK_ID_MODE`` by default) is kept.
+        """
+        from .core.scheduler import AdaptiveScheduler
+        from .core.stats import TaskStatsStore
+        from .core.task import set_task_id_mode
+
+        self.socket_path = Path(socket_path) if socket_path else get_socket_path()
+        if task_id_mode is not None:
+            set_task_id_mode(task_id_mode)
+        self.max_workers = AdaptiveScheduler().calculate_worker_count(max_workers)
+        self.executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="parslet-serve"
+        )
+        self.stats_store = None if os.getenv("PARSLET_NO_STATS") else TaskStatsStore()
+        # Resolved workflow path -> ((mtime_ns, size), loaded module).
+        self._modules: dict[str, tuple[tuple[int, int], ModuleType]] = {}
+        self._run_lock = threading.Lock()
+        self.runs_served = 0
+        self._server: socketserver.ThreadingUnixStreamServer | None = None
+
+    def serve_forever(self) -> None:
+        """Listen on the socket and handle requests until shut down."""
+        from .utils.network_utils import is_network_available
+
+        if self.socket_path.exists():
+            if _daemon_alive(self.socket_path):
+                raise RuntimeError(
+                    f"A Parslet daemon already listens on {self.socket_path}"
+                )
+            self.socket_path.unlink()
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+
+        daemon = self
+
+        class _Handler(socketserver.StreamRequestHandler):
+            def handle(self) -> None:
+                request: Any = None
+                try:
+                    request = json.loads(self.rfile.readline())
+                    response = daemon.handle_request(request)
+                except Exception as e:
+                    response = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+                payload = json.dumps(response, default=repr) + "\n"
+                self.wfile.write(payload.encode("utf-8"))
+                if isinstance(request, dict) and request.get("cmd") == "shutdown":
+                    # ``shutdown`` waits for the serve loop, which runs in
+                    # another thread than this handler.
+                    daemon.shutdown()
+
+        server = socketserver.ThreadingUnixStreamServer(str(self.socket_path), _Handler)
+        server.daemon_threads = True
+        # Anyone who can connect can run code as this user.
+        os.chmod(self.socket_path, 0o600)
+        self._server = server
+        if not is_network_available():
+            logger.warning(
+                "No internet connection detected. Tasks that require the "
+                "network may fail."
+            )
+        logger.info(f"Parslet daemon listening on {self.socket_path}")
+        try:
+            server.serve_forever()
+        finally:
+            server.server_close()
+            self.socket_path.unlink(missing_ok=True)
+            self.executor.shutdown(wait=True)
+            logger.info("Parslet daemon stopped.")
+
+    def shutdown(self) -> None:
+        """Stop :meth:`serve_forever`; safe to call from any other thread."""
+        if self._server is not None:
+            self._server.shutdown()
+
+    def handle_request(self, request: dict[str, Any]) -> dict[str, Any]:
+        """Answer one decoded request; see the class docstring."""
+        cmd = request.get("cmd")
+        if cmd == "ping":
+            return {"ok": True, "pid": os.getpid(), "runs_served": self.runs_served}
+        if cmd == "shutdown":
+            return {"ok": True}
+        if cmd == "run":
+            options = request.get("options") or {}
+            unknown = set(options) - set(RUN_OPTIONS)
+            if unknown:
+                raise ValueError(f"Unknown run option(s): {', '.join(sorted(unknown))}")
+            return self.run_workflow(str(request["workflow"]), **options)
+        raise ValueError(f"Unknown command: {cmd!r}")
+
+    def run_workflow(
+        self,
+        workflow: str,
+        no_cache: bool = False,
+        failsafe_mode: bool = False,
+        dedupe: bool = False,
+        fuse_chains: bool = False,
+        offline: bool = False,
+    ) -> dict[str, Any]:
+        """Run ``workflow`` on the shared pool and summarise the outcome.
+
+        Args:
+            workflow (str): Workflow file path or ``module:func`` reference.
+            no_cache (bool): Disable task caching for this run.
+            failsafe_mode (bool): Retry resource failures serially.
+            dedupe (bool): Merge identical calls of pure or cached tasks.
+            fuse_chains (bool): Run linear chains as a single job.
+            offline (bool): Block network access while the run executes.
+
+        Returns:
+            dict: ``ok`` (True when every task succeeded), ``results`` (one
+            entry per future returned by ``main()``, ``None`` where it
+            failed), ``task_statuses``, ``task_execution_times``,
+            ``cache_hits`` and ``elapsed_s``.
+        """
+        from .core import DAG, DAGRunner
+        from .security import offline_guard
+        from .security.defcon import Defcon
+
+        with self._run_lock:
+            start = time.perf_counter()
+            mod = self._load_module(workflow)
+            wf = Path(mod.__file__ or "")
+            if mod.__file__ and not Defcon.scan_code([wf]):
+                return {"ok": False, "error": "DEFCON1 rejection: unsafe code"}
+            futures = mod.main()
+            if not isinstance(futures, (list, tuple)):
+                futures = [futures]
+            dag = DAG()
+            dag.build_dag(futures, eliminate_duplicates=dedupe)
+            if fuse_chains:
+                dag.fuse_linear_chains()
+            runner = DAGRunner(
+                max_workers=self.max_workers,
+                failsafe_mode=failsafe_mode,
+                watch_files=[str(wf)] if mod.__file__ else None,
+                disable_cache=no_cache,
+                stats_store=self.stats_store,
+                check_network=False,
+            )
+            with offline_guard(offline):
+                runner.run(dag, executor=self.executor)
+            self.runs_served += 1
+            statuses = dict(runner.task_statuses)
+            results = [
+                f.result() if statuses.get(f.task_id) == "SUCCESS" else None
+                for f in futures
+            ]
+            return {
+                "ok": bool(statuses) and all(s == "SUCCESS" for s in statuses.values()),
+                "results": results,
+                "task_statuses": statuses,
+                "task_execution_times": dict(runner.task_execution_times),
+                "cache_hits": len(runner.cache_hits),
+                "elapsed_s": time.perf_counter() - start,
+            }
+
+    def _load_module(self, workflow: str) -> ModuleType:
+        """Return the workflow module, re-importing it only if it changed."""
+        from .cli import load_workflow_module
+        from .core import task as task_mod
+
+        path = Path(workflow)
+        if not path.exists():
+            # ``module:func`` references are cached by the import system.
+            return load_workflow_module(workflow)
+        key = str(path.resolve())
+        stat = path.stat()
+        version = (stat.st_mtime_ns, stat.st_size)
+        cached = self._modules.get(key)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        # Each workflow runs as if in its own process, so re-imports and
+        # workflows sharing task names must not trip the redefinition check.
+        previous = task_mod._ALLOW_REDEFINE
+        task_mod.set_allow_redefine(True)
+        try:
+            module = load_workflow_module(key)
+        finally:
+            task_mod.set_allow_redefine(previous)
+        self._modules[key] = (version, module)
+        return module
+
+
+def send_request(
+    request: dict[str, Any],
+    socket_path: str | Path | None = None,
+    timeout: float | None = None,
+) -> dict[str, Any]:
+    """Send one request to a ``parslet serve`` daemon and return its answer.
+
+    Args:
+        request (dict): Request object, see :class:`WorkflowDaemon`.
+        socket_path (Optional[str | Path]): Daemon socket. Defaults to
+            :func:`get_socket_path`.
+        timeout (Optional[float]): Seconds to wait for the answer; None
+            waits indefinitely.
+
+    Raises:
+        ConnectionError: If no daemon is listening on the socket.
+    """
+    path = Path(socket_path) if socket_path else get_socket_path()
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(str(path))
+            sock.sendall(json.dumps(request).encode("utf-8") + b"\n")
+            with sock.makefile("rb") as fh:
+                line = fh.readline()
+    except (FileNotFoundError, ConnectionRefusedError) as e:
+        raise ConnectionError(
+            f"No Parslet daemon is listening on {path}. "
+            "Start one with 'parslet serve'."
+        ) from e
+    if not line:
+        raise ConnectionError(f"Parslet daemon at {path} closed the connection")
+    return json.loads(line)
+
+
+def _daemon_alive(socket_path: Path) -> bool:
+    try:
+        return bool(send_request({"cmd": "ping"}, socket_path, timeout=1.0).get("ok"))
+    except (OSError, ValueError):
+        return False
+
+
+def submit_workflow(
+    workflow: str,
+    socket_path: str | Path | None = None,
+    timeout: float | None = None,
+    **options: bool,
+) -> dict[str, Any]:
+    """Run ``workflow`` on a running ``parslet serve`` daemon.
+
+    Args:
+        workflow (str): Workflow file path or ``module:func`` reference.
+            Relative paths are resolved against the caller's directory.
+        socket_path (Optional[str | Path]): Daemon socket. Defaults to
+            :func:`get_socket_path`.
+        timeout (Optional[float]): Seconds to wait for the run; None waits
+            indefinitely.
+        **options (bool): Any of ``no_cache``, ``failsafe_mode``, ``dedupe``,
+            ``fuse_chains`` and ``offline``.
+
+    Returns:
+        dict: The daemon's response, see :meth:`WorkflowDaemon.run_workflow`.
+
+    Raises:
+        ConnectionError: If no daemon is listening on the socket.
+    """
+    if Path(workflow).exists():
+        workflow = str(Path(workflow).resolve())
+    request = {"cmd": "run", "workflow": workflow, "options": options}
+    return send_request(request, socket_path, timeout)
@@ -1,33 +1,82 @@
 """Hybrid execution engine for Parslet.
 
 This module provides a minimal helper to execute a Parslet workflow
-partly on Parsl and partly on the local DAGRunner.  It is intended as a
+partly on Parsl and partly on a local thread pool.  It is intended as a
 starting point for more advanced federated orchestration.
 """
 
 from __future__ import annotations
 
-from typing import Any, Dict, List
+import concurrent.futures
+from typing import Any, Callable, Dict, List, Set
 
-from ..core import DAG, ParsletFuture
+from ..core import DAG, AdaptiveScheduler, ParsletFuture
 from ..core.parsl_bridge import convert_task_to_parsl
+from ..core.task import ArgumentTemplate
+
+
+def _wait_all(handles: Dict[str, Any]) -> Callable[[ParsletFuture], Any]:
+    """Argument lookup that blocks until each dependency has a value."""
+
+    return lambda dep: handles[dep.task_id].result()
+
+
+def _run_local(
+    func: Callable[..., Any],
+    template: ArgumentTemplate,
+    handles: Dict[str, Any],
+) -> Any:
+    # Boundary: local work needs concrete values, including remote ones.
+    args, kwargs = template.resolve(_wait_all(handles))
+    return func(*args, **kwargs)
+
+
+def _run_remote_after_local(
+    app: Callable[..., Any],
+    template: ArgumentTemplate,
+    handles: Dict[str, Any],
+    remote_ids: Set[str],
+) -> Any:
+    # Boundary: wait for local inputs only; remote inputs stay AppFutures so
+    # Parsl keeps tracking those dependencies itself. Parsl does not look
+    # inside containers, so nested inputs are always waited for here.
+    def lookup(dep: ParsletFuture) -> Any:
+        handle = handles[dep.task_id]
+        if dep.task_id in remote_ids and not template.nested:
+            return handle
+        return handle.result()
+
+    args, kwargs = template.resolve(lookup)
+    return app(*args, **kwargs).result()
 
 
 def execute_hybrid(
     entry_futures: List[ParsletFuture],
     parsl_config: Any | None = None,
+    max_workers: int | None = None,
 ) -> List[Any]:
     """Execute a workflow mixing local and Parsl-backed tasks.
 
     Tasks are automatically routed to the remote Parsl backend when they
     are defined with ``@parslet_task(remote=True)``.
 
+    Nothing blocks while tasks are being launched.  Remote tasks whose
+    inputs are all remote (or literal) and passed directly as arguments are
+    submitted straight away with the upstream Parsl ``AppFuture`` objects as
+    arguments, so Parsl chains them on its own.  Local tasks run concurrently
+    on a local thread pool.  The engine only waits at a boundary: a local
+    task waits for the remote results it consumes, and a remote task fed by
+    local tasks is submitted once those local results exist.
+
     Parameters
     ----------
     entry_futures:
         List of terminal futures defining the workflow.
     parsl_config:
         Optional Parsl ``Config`` object for remote execution.
+    max_workers:
+        Size of the local thread pool.  Defaults to the worker count the
+        ``DAGRunner`` would choose for this device.
 
     Returns
     -------
@@ -53,26 +102,44 @@ def execute_hybrid(
     dag.validate_dag()
 
     order = dag.get_execution_order()
-    results: Dict[str, Any] = {}
-
-    for task_id in order:
-        pf = dag.get_task_future(task_id)
-        resolved_args = [
-            results[a.task_id] if isinstance(a, ParsletFuture) else a
-            for a in pf.args
-        ]
-        resolved_kwargs = {
-            k: results[v.task_id] if isinstance(v, ParsletFuture) else v
-            for k, v in pf.kwargs.items()
-        }
-
-        if getattr(pf.func, "_parslet_remote", False):
-            parsl_app = convert_task_to_parsl(pf.func)
-            results[task_id] = parsl_app(
-                *resolved_args, **resolved_kwargs
-            ).result()
-        else:
-            results[task_id] = pf.func(*resolved_args, **resolved_kwargs)
-
-    parsl.dfk().cleanup()
-    return [results[f.task_id] for f in entry_futures]
+    # Per task: a Parsl AppFuture for remote tasks submitted directly (IDs in
+    # ``remote_ids``), otherwise a local concurrent Future.
+    handles: Dict[str, Any] = {}
+    remote_ids: Set[str] = set()
+    workers = AdaptiveScheduler().calculate_worker_count(max_workers)
+
+    try:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as pool:
+            for task_id in order:
+                pf = dag.get_task_future(task_id)
+                template = pf.argument_template()
+
+                if getattr(pf.func, "_parslet_remote", False):
+                    app = convert_task_to_parsl(pf.func)
+                    if not template.nested and all(
+                        d.task_id in remote_ids for d in template.dependencies
+                    ):
+                        args, kwargs = template.resolve(
+                            lambda dep: handles[dep.task_id]
+                        )
+                        handles[task_id] = app(*args, **kwargs)
+                        remote_ids.add(task_id)
+                    else:
+                        handles[task_id] = pool.submit(
+                            _run_remote_after_local, app, template, handles, remote_ids
+                        )
+                else:
+                    handles[task_id] = pool.submit(
+                        _run_local, pf.func, template, handles
+                    )
+
+            results = [handles[f.task_id].result() for f in entry_futures]
+            # Let remote tasks outside the entry set settle before cleanup.
+            for task_id in remote_ids:
+                try:
+                    handles[task_id].result()
+                except Exception:
+                    pass
+    finally:
+        parsl.dfk().cleanup()
+    return results
@@ -7,13 +7,115 @@ It is intended to be simple to keep the barrier to entry low for new users.
 
 import argparse
 import json
+import os
 import sys
+from typing import TYPE_CHECKING
 
 from parslet.security import offline_guard
 
-from .plugins.loader import load_plugins
 from .utils import get_parslet_logger
 
+if TYPE_CHECKING:  # pragma: no cover - imported for type hints only
+    from .core import DAG
+    from .core.history import RunHistory
+    from .core.stats import TaskStatsStore
+
+
+def _print_runtime_estimate(dag: "DAG", store: "TaskStatsStore", workers: int) -> None:
+    """Print the critical path and expected makespan from task history."""
+    unknown = sum(
+        1
+        for f in dag.tasks.values()
+        if store.estimate(getattr(f.func, "_parslet_task_name", f.func.__name__))
+        is None
+    )
+    print("--- Runtime Estimate ---")
+    if unknown == len(dag.tasks):
+        print(
+            f"No runtime estimate available: none of these tasks has recorded "
+            f"history in {store.path} yet. Run the workflow once to record it."
+        )
+        return
+    durations = store.estimate_dag(dag)
+    path, path_s = dag.critical_path(durations)
+    total_s = sum(durations.values())
+    # Neither the critical path nor the total work spread over all workers
+    # can be beaten, so the larger of the two is the makespan estimate.
+    makespan = max(path_s, total_s / max(1, workers))
+    print(f"Critical path ({len(path)} tasks, {path_s:.2f}s):")
+    print("  " + " -> ".join(path))
+    print(
+        f"Expected makespan: ~{makespan:.2f}s "
+        f"(total work {total_s:.2f}s over {workers} worker(s))"
+    )
+    if unknown:
+        print(
+            f"{unknown} of {len(dag.tasks)} task(s) have no recorded history; "
+            "their durations are guessed."
+        )
+
+
+def _print_history_stats(history: "RunHistory", args: argparse.Namespace) -> None:
+    """Print the ``parslet stats`` report for the selected runs."""
+    workflow = args.workflow
+    if workflow is not None and os.path.exists(workflow):
+        workflow = os.path.realpath(workflow)
+    runs = history.runs(workflow, limit=args.runs)
+    percentiles = history.percentiles(workflow, last_runs=args.runs)
+    trends = history.trends(
+        workflow, recent=args.recent, threshold=args.threshold, last_runs=args.runs
+    )
+    slowest = history.slowest(workflow, limit=args.top, last_runs=args.runs)
+    regressions = [row for row in trends if row["regression"]]
+    if args.json:
+        print(
+            json.dumps(
+                {
+                    "runs": runs,
+                    "percentiles": percentiles,
+                    "trends": trends,
+                    "slowest": slowest,
+                },
+                indent=2,
+                default=repr,
+            )
+        )
+    elif not runs:
+        print(f"No runs recorded in {history.path}.")
+    else:
+        elapsed = sorted(r["elapsed_s"] for r in runs if r["elapsed_s"] is not None)
+        versions = {r["workflow_hash"] for r in runs if r["workflow_hash"]}
+        print(
+            f"--- {len(runs)} run(s), {len(versions)} workflow version(s), "
+            f"median {elapsed[len(elapsed) // 2] if elapsed else 0:.2f}s ---"
+        )
+        print(
+            f"{'Task':<30} {'Runs':>6} {'p50':>10} {'p90':>10} {'p99':>10} "
+            f"{'Max':>10}"
+        )
+        for name, row in sorted(percentiles.items(), key=lambda kv: -kv[1]["p90_s"]):
+            print(
+                f"{name:<30} {row['count']:>6} {row['p50_s']:>9.3f}s "
+                f"{row['p90_s']:>9.3f}s {row['p99_s']:>9.3f}s {row['max_s']:>9.3f}s"
+            )
+        if trends:
+            print(f"--- Trend: last {args.recent} run(s) vs. earlier ---")
+            for row in trends:
+                flag = "  REGRESSION" if row["regression"] else ""
+                print(
+                    f"{row['task']:<30} {row['baseline_s']:>9.3f}s -> "
+                    f"{row['recent_s']:>9.3f}s ({row['ratio']:.2f}x){flag}"
+                )
+        if slowest:
+            print("--- Slowest task executions ---")
+            for row in slowest:
+                print(
+                    f"{row['task_name']:<30} {row['duration_s']:>9.3f}s  "
+                    f"run {row['run_id']}  {row['task_id']}"
+                )
+    if regressions and args.fail_on_regression:
+        sys.exit(1)
+
 
 def cli() -> None:
     """Parse command line arguments and dispatch the chosen command."""
@@ -41,6 +143,48 @@ def cli() -> None:
         action="store_true",
         help="Show live task progress during execution",
     )
+    run_p.add_argument(
+        "--metrics",
+        action="store_true",
+        help="Serve Prometheus metrics over HTTP while the workflow runs",
+    )
+    run_p.add_argument(
+        "--metrics-port",
+        type=int,
+        default=6300,
+        help="Port for --metrics; if it is taken, the system picks a free "
+        "port, which is logged",
+    )
+    run_p.add_argument(
+        "--trace",
+        type=str,
+        metavar="PATH",
+        help="Write a Chrome trace of the run to PATH for Perfetto or "
+        "chrome://tracing",
+    )
+    run_p.add_argument(
+        "--profile",
+        choices=["cpu", "mem"],
+        help="Profile every task with cProfile (cpu) or tracemalloc (mem)",
+    )
+    run_p.add_argument(
+        "--profile-dir",
+        type=str,
+        metavar="DIR",
+        default="parslet_profile",
+        help="Directory for the merged pstats file and per-task reports",
+    )
+    run_p.add_argument(
+        "--energy",
+        action="store_true",
+        help="Measure battery drain per task and report it after the run",
+    )
+    run_p.add_argument(
+        "--thermal-guard",
+        action="store_true",
+        help="Run fewer tasks and hold back energy_cost='high' tasks when the "
+        "CPU nears its throttling temperature",
+    )
     run_p.add_argument(
         "--battery-mode",
         action="store_true",
@@ -51,6 +195,12 @@ def cli() -> None:
         action="store_true",
         help="Emit logs in JSON format",
     )
+    run_p.add_argument(
+        "--event-log",
+        type=str,
+        metavar="PATH",
+        help="Write every task event to PATH as JSON lines",
+    )
     run_p.add_argument(
         "--failsafe-mode",
         action="store_true",
@@ -71,6 +221,30 @@ def cli() -> None:
         action="store_true",
         help="Disable task caching",
     )
+    run_p.add_argument(
+        "--no-stats",
+        action="store_true",
+        help="Neither use nor record task runtime statistics and run history "
+        "(same as PARSLET_NO_STATS=1)",
+    )
+    run_p.add_argument(
+        "--task-ids",
+        choices=["uuid", "counter", "deterministic"],
+        default=None,
+        help="How task IDs are generated; 'deterministic' keeps IDs stable "
+        "across runs so checkpoints can be resumed (default: "
+        "$PARSLET_TASK_ID_MODE or 'uuid')",
+    )
+    run_p.add_argument(
+        "--dedupe",
+        action="store_true",
+        help="Merge identical calls of pure or cached tasks before running",
+    )
+    run_p.add_argument(
+        "--fuse-chains",
+        action="store_true",
+        help="Run linear task chains as a single job to cut scheduling overhead",
+    )
     run_p.add_argument(
         "--max-workers",
         type=int,
@@ -89,6 +263,161 @@ def cli() -> None:
         help="Write task execution stats to the given JSON file",
     )
 
+    stats_p = sub.add_parser(
+        "stats",
+        help="Analyse task durations across recorded runs",
+        description="Report duration percentiles, trends and the slowest "
+        "tasks from the run history that 'parslet run' records.",
+    )
+    stats_p.add_argument(
+        "workflow",
+        nargs="?",
+        help="Only include runs of this workflow file",
+    )
+    stats_p.add_argument(
+        "--db",
+        metavar="PATH",
+        help="Run-history database (default: $PARSLET_HISTORY_DB or "
+        "~/.parslet/history.db)",
+    )
+    stats_p.add_argument(
+        "--keep",
+        type=int,
+        metavar="N",
+        help="Delete all but the N newest runs from the history first "
+        "(0 keeps every run)",
+    )
+    stats_p.add_argument(
+        "--runs",
+        type=int,
+        default=50,
+        help="Number of most recent runs to analyse",
+    )
+    stats_p.add_argument(
+        "--recent",
+        type=int,
+        default=3,
+        help="Newest runs compared against the older ones for trends",
+    )
+    stats_p.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="Relative slowdown reported as a regression (0.2 = 20%%)",
+    )
+    stats_p.add_argument(
+        "--top",
+        type=int,
+        default=10,
+        help="Number of slowest task executions to list",
+    )
+    stats_p.add_argument(
+        "--json",
+        action="store_true",
+        help="Print the report as JSON",
+    )
+    stats_p.add_argument(
+        "--fail-on-regression",
+        action="store_true",
+        help="Exit with status 1 if any task regressed",
+    )
+
+    sweep_p = sub.add_parser(
+        "sweep",
+        help="Run a workflow once per parameter set",
+        description="Build the workflow's DAG once and run main(**params) "
+        "for every parameter set concurrently on one worker pool.",
+    )
+    sweep_p.add_argument(
+        "workflow",
+        help="Workflow file path or module:func reference",
+    )
+    sweep_p.add_argument(
+        "--params",
+        required=True,
+        metavar="PATH",
+        help="Parameter sets as a JSON list, JSON Lines or CSV file",
+    )
+    sweep_p.add_argument(
+        "--max-workers",
+        type=int,
+        help="Maximum number of worker threads",
+    )
+    sweep_p.add_argument(
+        "--dedupe",
+        action="store_true",
+        help="Merge identical pure or cached task calls across instances",
+    )
+    sweep_p.add_argument("--fuse-chains", action="store_true")
+    sweep_p.add_argument("--no-cache", action="store_true")
+    sweep_p.add_argument(
+        "--no-stats",
+        action="store_true",
+        help="Neither use nor record task runtime statistics",
+    )
+    sweep_p.add_argument("--failsafe-mode", action="store_true")
+    sweep_p.add_argument(
+        "--out",
+        metavar="PATH",
+        help="Write one JSON line with params and results per instance",
+    )
+    sweep_p.add_argument(
+        "--export-stats",
+        metavar="PATH",
+        help="Write the aggregated sweep stats to the given JSON file",
+    )
+
+    serve_p = sub.add_parser(
+        "serve",
+        help="Keep a warm daemon running for fast repeated runs",
+        description="Serve workflow runs over a local Unix socket, keeping "
+        "modules, caches and the worker pool loaded between runs.",
+    )
+    serve_p.add_argument(
+        "--socket",
+        metavar="PATH",
+        help="Unix socket to listen on (default: $PARSLET_SOCKET or "
+        "~/.parslet/parslet.sock)",
+    )
+    serve_p.add_argument(
+        "--max-workers",
+        type=int,
+        help="Size of the shared worker pool",
+    )
+    serve_p.add_argument(
+        "--task-ids",
+        choices=["uuid", "counter", "deterministic"],
+        default=None,
+        help="How task IDs are generated for every run (default: "
+        "$PARSLET_TASK_ID_MODE or 'uuid')",
+    )
+
+    submit_p = sub.add_parser(
+        "submit",
+        help="Run a workflow on a running 'parslet serve' daemon",
+    )
+    submit_p.add_argument(
+        "workflow",
+        nargs="?",
+        help="Workflow file path or module:func reference",
+    )
+    submit_p.add_argument("--socket", metavar="PATH", help="Daemon socket")
+    submit_p.add_argument("--no-cache", action="store_true")
+    submit_p.add_argument("--failsafe-mode", action="store_true")
+    submit_p.add_argument("--dedupe", action="store_true")
+    submit_p.add_argument("--fuse-chains", action="store_true")
+    submit_p.add_argument("--offline", action="store_true")
+    submit_p.add_argument(
+        "--json",
+        action="store_true",
+        help="Print the daemon's full JSON response",
+    )
+    submit_p.add_argument(
+        "--shutdown",
+        action="store_true",
+        help="Stop the daemon instead of running a workflow",
+    )
+
     rad_p = sub.add_parser("rad", help="Run RAD by Parslet example")
     rad_p.add_argument("image", nargs="?")
     rad_p.add_argument("--out-dir", default="rad_results")
@@ -109,8 +438,13 @@ def cli() -> None:
 
     args = parser.parse_args()
     logger = get_parslet_logger("parslet-cli")
-    load_plugins()
-    logger.info("Plugins loaded")
+    if args.cmd in ("run", "rad", "serve", "sweep"):
+        # Plugins only affect workflow execution; skipping them keeps the
+        # other commands fast to start.
+        from .plugins.loader import load_plugins
+
+        load_plugins()
+        logger.info("Plugins loaded")
 
     try:
         if args.cmd == "run":
@@ -118,23 +452,26 @@ def cli() -> None:
             import time
             from pathlib import Path
 
-            from rich.live import Live
-            from rich.table import Table
-
             from parslet.cli import load_workflow_module
             from parslet.core import DAG, DAGRunner
-            from parslet.core.policy import AdaptivePolicy
+            from parslet.core.policy import AdaptivePolicy, ThermalPolicy
+            from parslet.core.stats import TaskStatsStore
+            from parslet.core.task import set_task_id_mode
             from parslet.security.defcon import Defcon
 
+            if args.task_ids is not None:
+                set_task_id_mode(args.task_ids)
             wf_input = args.workflow
             mod = load_workflow_module(wf_input)
-            wf = Path(mod.__file__ or "")
-            if wf and not Defcon.scan_code([wf]):
+            wf = Path(mod.__file__) if mod.__file__ else None
+            if wf is not None and not Defcon.scan_code([wf]):
                 logger.error("DEFCON1 rejection: unsafe code")
                 return
             futures = mod.main()
             dag = DAG()
-            dag.build_dag(futures)
+            dag.build_dag(futures, eliminate_duplicates=args.dedupe)
+            if args.fuse_chains:
+                dag.fuse_linear_chains()
 
             if getattr(mod, "__converted_from_parsl__", False):
                 from parslet.compat.parsl_adapter import export_parsl_dag
@@ -163,14 +500,29 @@ def cli() -> None:
             policy = None
             if args.battery_mode:
                 policy = AdaptivePolicy(max_workers=2, battery_threshold=40)
+            no_stats = args.no_stats or bool(os.getenv("PARSLET_NO_STATS"))
+            stats_store = None if no_stats else TaskStatsStore()
             runner = DAGRunner(
                 policy=policy,
                 failsafe_mode=args.failsafe_mode,
-                watch_files=[str(wf)] if wf else None,
+                watch_files=[str(wf)] if wf is not None else None,
                 disable_cache=args.no_cache,
                 json_logs=args.json_logs,
                 max_workers=args.max_workers,
+                stats_store=stats_store,
+                monitor_port=args.metrics_port,
+                serve_metrics=args.metrics,
+                record_trace=bool(args.trace),
+                profile=args.profile,
+                energy=args.energy,
+                thermal_policy=ThermalPolicy() if args.thermal_guard else None,
             )
+            event_log = None
+            if args.event_log and not args.simulate:
+                from parslet.core.events import JsonLinesSink
+
+                event_log = JsonLinesSink(args.event_log)
+                runner.events.subscribe(event_log)
 
             if args.simulate:
                 print("--- DAG Simulation ---")
@@ -183,32 +535,42 @@ def cli() -> None:
                     print(f"Available RAM: {ram:.1f} MB")
                 if batt is not None:
                     print(f"Battery level: {batt}%")
+                if stats_store is not None and dag.tasks:
+                    _print_runtime_estimate(dag, stats_store, runner.max_workers)
                 return
 
+            history = None
+            if not no_stats:
+                from parslet.core.history import RunHistory, resource_snapshot
+
+                try:
+                    history = RunHistory()
+                except Exception as e:  # pragma: no cover - unwritable home
+                    logger.warning(f"Run history disabled: {e}")
+            resources_before = resource_snapshot() if history is not None else None
+            started_at = time.time()
+            run_start = time.perf_counter()
+
             if args.monitor:
+                from rich.live import Live
+
+                from parslet.core.monitor import RunMonitor
 
                 def _run() -> None:
                     with offline_guard(args.offline):
                         runner.run(dag)
 
+                monitor = RunMonitor(total=lambda: len(dag.tasks))
+                runner.events.subscribe(monitor)
                 t = threading.Thread(target=_run)
                 t.start()
-                with Live(refresh_per_second=4) as live:
+                with Live(monitor.render(), refresh_per_second=2) as live:
                     while t.is_alive():
-                        table = Table()
-                        table.add_column("Task")
-                        table.add_column("Status")
-                        for tid, status in runner.task_statuses.items():
-                            table.add_row(tid, status)
-                        live.update(table)
-                        time.sleep(0.5)
-                    t.join()
-                    table = Table()
-                    table.add_column("Task")
-                    table.add_column("Status")
-                    for tid, status in runner.task_statuses.items():
-                        table.add_row(tid, status)
-                    live.update(table)
+                        t.join(0.5)
+                        live.update(monitor.render())
+                    runner.events.flush()
+                    live.update(monitor.render())
+                runner.events.unsubscribe(monitor)
             else:
                 with offline_guard(args.offline):
                     runner.run(dag)
@@ -231,6 +593,146 @@ def cli() -> None:
                     except Exception as e:  # pragma: no cover - defensive
                         err = f"Failed to export stats: {e}"
                         logger.error(err, exc_info=False)
+            if history is not None:
+                try:
+                    run_id = history.record_run(
+                        runner,
+                        dag,
+                        workflow=str(wf.resolve()) if wf is not None else wf_input,
+                        started_at=started_at,
+                        elapsed_s=time.perf_counter() - run_start,
+                        source=mod.__file__,
+                        resources_before=resources_before,
+                    )
+                    logger.info(f"Run {run_id} recorded in {history.path}")
+                except Exception as e:  # pragma: no cover - disk or db error
+                    logger.warning(f"Failed to record run history: {e}")
+            if event_log is not None:
+                runner.events.unsubscribe(event_log)
+                logger.info(f"Event log written to {args.event_log}")
+            if runner.trace is not None:
+                try:
+                    runner.trace.save(args.trace)
+                    logger.info(f"Trace written to {args.trace}")
+                except OSError as e:
+                    logger.error(f"Failed to write trace: {e}", exc_info=False)
+            if runner.energy is not None:
+                print("--- Energy per task ---")
+                print(runner.energy.format_report())
+            if runner.profiler.has_results:
+                try:
+                    written = runner.profiler.save(args.profile_dir)
+                    logger.info(
+                        "Task profiles written to " + ", ".join(str(p) for p in written)
+                    )
+                except OSError as e:
+                    logger.error(f"Failed to write profiles: {e}", exc_info=False)
+        elif args.cmd == "stats":
+            from parslet.core.history import RunHistory
+
+            history = RunHistory(args.db)
+            if args.keep is not None:
+                removed = history.prune(args.keep)
+                logger.info(f"Removed {removed} run(s) from {history.path}")
+            _print_history_stats(history, args)
+        elif args.cmd == "sweep":
+            from pathlib import Path
+
+            from parslet.cli import load_workflow_module
+            from parslet.core import DAGRunner
+            from parslet.core.stats import TaskStatsStore
+            from parslet.core.sweep import load_parameter_sets, run_sweep
+            from parslet.security.defcon import Defcon
+
+            param_sets = load_parameter_sets(args.params)
+            mod = load_workflow_module(args.workflow)
+            wf = Path(mod.__file__) if mod.__file__ else None
+            if wf is not None and not Defcon.scan_code([wf]):
+                logger.error("DEFCON1 rejection: unsafe code")
+                return
+            no_stats = args.no_stats or bool(os.getenv("PARSLET_NO_STATS"))
+            stats_store = None if no_stats else TaskStatsStore()
+            runner = DAGRunner(
+                failsafe_mode=args.failsafe_mode,
+                watch_files=[str(wf)] if wf is not None else None,
+                disable_cache=args.no_cache,
+                max_workers=args.max_workers,
+                stats_store=stats_store,
+            )
+            result = run_sweep(
+                mod.main,
+                param_sets,
+                runner=runner,
+                eliminate_duplicates=args.dedupe,
+                fuse_chains=args.fuse_chains,
+            )
+            summary = result.summary()
+            print(
+                f"{summary['succeeded']}/{summary['instances']} instance(s) "
+                f"succeeded in {summary['elapsed_s']:.2f}s "
+                f"({summary['tasks']} task(s), {summary['shared_tasks']} shared, "
+                f"{summary['cache_hits']} from cache)"
+            )
+            if args.out:
+                with open(args.out, "w", encoding="utf-8") as fh:
+                    for index, params in enumerate(result.params):
+                        error = result.error(index)
+                        record = {"index": index, "params": params}
+                        if error is None:
+                            record["results"] = result.results(index)
+                        else:
+                            record["error"] = f"{type(error).__name__}: {error}"
+                        fh.write(json.dumps(record, default=repr) + "\n")
+                logger.info(f"Sweep results written to {args.out}")
+            if args.export_stats:
+                with open(args.export_stats, "w", encoding="utf-8") as fh:
+                    json.dump(summary, fh, indent=2)
+                logger.info(f"Sweep stats written to {args.export_stats}")
+        elif args.cmd == "serve":
+            from parslet.daemon import WorkflowDaemon
+
+            daemon = WorkflowDaemon(
+                socket_path=args.socket,
+                max_workers=args.max_workers,
+                task_id_mode=args.task_ids,
+            )
+            try:
+                daemon.serve_forever()
+            except KeyboardInterrupt:
+                pass
+        elif args.cmd == "submit":
+            from parslet.daemon import send_request, submit_workflow
+
+            if args.shutdown:
+                send_request({"cmd": "shutdown"}, args.socket)
+                print("Daemon stopped.")
+                return
+            if not args.workflow:
+                print("Specify a workflow to submit or --shutdown", flush=True)
+                return
+            response = submit_workflow(
+                args.workflow,
+                socket_path=args.socket,
+                no_cache=args.no_cache,
+                failsafe_mode=args.failsafe_mode,
+                dedupe=args.dedupe,
+                fuse_chains=args.fuse_chains,
+                offline=args.offline,
+            )
+            if args.json:
+                print(json.dumps(response, indent=2, default=repr))
+            elif "error" in response:
+                logger.error(response["error"])
+            else:
+                for value in response["results"]:
+                    print(value)
+                statuses = response["task_statuses"]
+                failed = sum(1 for s in statuses.values() if s != "SUCCESS")
+                print(
+                    f"{len(statuses)} task(s), {failed} not successful, "
+                    f"{response['cache_hits']} from cache, "
+                    f"{response['elapsed_s'] * 1000:.1f} ms"
+                )
         elif args.cmd == "rad":
             from examples.rad_parslet.rad_dag import main as rad_main
             from parslet.core import DAG, DAGRunner
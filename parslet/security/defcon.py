@@ -20,12 +20,23 @@ class Defcon:
     #: Calls that are considered unsafe for :meth:`scan_code`.
     BAD_CALLS = frozenset({"eval", "exec"})
 
+    #: SHA-256 digests of sources that already passed :meth:`scan_code`.
+    _clean_sources: set[str] = set()
+
     @staticmethod
     def scan_code(paths: Iterable[Path]) -> bool:
-        """DEFCON1: scan for dangerous calls."""
+        """DEFCON1: scan for dangerous calls.
+
+        Sources that passed before are recognised by their hash and not
+        parsed again, which keeps repeated runs in one process cheap.
+        """
         for path in paths:
             try:
-                tree = ast.parse(path.read_text())
+                source = path.read_text()
+                digest = hashlib.sha256(source.encode()).hexdigest()
+                if digest in Defcon._clean_sources:
+                    continue
+                tree = ast.parse(source)
             except Exception as exc:
                 logger.error("parse error %s: %s", path, exc)
                 return False
@@ -38,6 +49,7 @@ class Defcon:
                             "Forbidden call %s in %s", node.func.id, path
                         )
                         return False
+            Defcon._clean_sources.add(digest)
         return True
 
     @staticmethod
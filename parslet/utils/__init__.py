@@ -10,13 +10,22 @@ from .resource_utils import (
     probe_resources,
 )
 
-RichHandler: type | None
-try:
-    from rich.logging import RichHandler as _RichHandler
 
-    RichHandler = _RichHandler
-except Exception:  # pragma: no cover - rich is optional
-    RichHandler = None
+def _rich_handler() -> type | None:
+    """Return ``rich``'s ``RichHandler`` class, importing it on first use."""
+    try:
+        from rich.logging import RichHandler
+    except Exception:  # pragma: no cover - rich is optional
+        return None
+    return RichHandler
+
+
+def __getattr__(name: str) -> object:
+    # ``RichHandler`` used to be imported eagerly; resolve it lazily so that
+    # importing Parslet does not pay for loading ``rich``.
+    if name == "RichHandler":
+        return _rich_handler()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def get_parslet_logger(
@@ -33,6 +42,7 @@ def get_parslet_logger(
     logger = logging.getLogger(name)
 
     if not logger.handlers:
+        RichHandler = _rich_handler()
         if RichHandler is not None:
             handler = RichHandler(rich_tracebacks=True)
             formatter = logging.Formatter("%(message)s", datefmt="[%X]")
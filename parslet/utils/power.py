@@ -6,14 +6,21 @@ information from the running system.  The implementation intentionally keeps
 its dependencies light so it can operate in constrained environments such as
 Android/Termux or Raspberry Pi.  When no information is available the function
 falls back to conservative defaults instead of raising errors.
+
+Components that follow the power state over time - the runner, the live
+monitor, the metrics endpoint - share one :class:`PowerWatcher` (see
+:func:`shared_watcher`) instead of each polling the providers themselves.
 """
 
 from __future__ import annotations
 
+import logging
 import subprocess
+import threading
 import time
-from collections.abc import Callable, Iterator
-from dataclasses import dataclass
+from collections.abc import AsyncIterator, Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, replace
 from pathlib import Path
 from typing import Literal
 
@@ -22,6 +29,8 @@ try:  # psutil is part of the base requirements
 except Exception:  # pragma: no cover - psutil always available in tests
     psutil = None  # type: ignore
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class PowerState:
@@ -36,6 +45,48 @@ class PowerState:
     cpu_freq_hint: int | None = None  # kHz
     thermal_throttle: bool = False
     ts: float = 0.0
+    power_w: float | None = None  # discharge (or charge) rate
+    energy_wh: float | None = None  # energy left in the battery
+    throttle_temp_c: float | None = None  # first passive trip point
+
+
+def _sysfs_battery_energy(bat: Path) -> tuple[float | None, float | None]:
+    """Return the power draw in W and remaining energy in Wh of ``bat``.
+
+    Kernels expose either ``power_now``/``energy_now`` (µW, µWh) or
+    ``current_now``/``charge_now`` (µA, µAh), which are combined with
+    ``voltage_now`` (µV).
+    """
+
+    def _read(name: str) -> float | None:
+        try:
+            return float((bat / name).read_text().strip())
+        except (OSError, ValueError):
+            return None
+
+    power = _read("power_now")
+    energy = _read("energy_now")
+    if power is None or energy is None:
+        voltage = _read("voltage_now")
+        if voltage is not None:
+            current = _read("current_now")
+            charge = _read("charge_now")
+            if power is None and current is not None:
+                power = abs(current) * voltage / 1e6
+            if energy is None and charge is not None:
+                energy = charge * voltage / 1e6
+    return (
+        power / 1e6 if power is not None else None,
+        energy / 1e6 if energy is not None else None,
+    )
+
+
+def _sysfs_battery() -> Path | None:
+    base = Path("/sys/class/power_supply")
+    try:
+        return next(iter(sorted(base.glob("BAT*"))), None)
+    except OSError:
+        return None
 
 
 def _psutil_provider() -> PowerState | None:
@@ -55,6 +106,9 @@ def _psutil_provider() -> PowerState | None:
     if secs not in (psutil.POWER_TIME_UNLIMITED, psutil.POWER_TIME_UNKNOWN):
         mins = int(secs // 60)
 
+    # psutil does not report the charge rate; Linux exposes it in sysfs.
+    bat = _sysfs_battery()
+    power_w, energy_wh = _sysfs_battery_energy(bat) if bat else (None, None)
     return PowerState(
         source="ac" if batt.power_plugged else "battery",
         percent=int(batt.percent) if batt.percent is not None else None,
@@ -62,28 +116,30 @@ def _psutil_provider() -> PowerState | None:
         est_time_to_empty_min=mins if not batt.power_plugged else None,
         est_time_to_full_min=mins if batt.power_plugged else None,
         ts=time.time(),
+        power_w=power_w,
+        energy_wh=energy_wh,
     )
 
 
 def _sysfs_provider() -> PowerState | None:
     """Attempt to gather battery info from ``/sys`` paths."""
 
-    base = Path("/sys/class/power_supply")
-    if not base.exists():
-        return None
-    bat_paths = list(base.glob("BAT*"))
-    if not bat_paths:
+    bat = _sysfs_battery()
+    if bat is None:
         return None
     try:
-        status = (bat_paths[0] / "status").read_text().strip().lower()
-        percent = int((bat_paths[0] / "capacity").read_text().strip())
+        status = (bat / "status").read_text().strip().lower()
+        percent = int((bat / "capacity").read_text().strip())
     except Exception:
         return None
+    power_w, energy_wh = _sysfs_battery_energy(bat)
     return PowerState(
         source="battery",
         percent=percent,
         is_charging=status == "charging",
         ts=time.time(),
+        power_w=power_w,
+        energy_wh=energy_wh,
     )
 
 
@@ -111,22 +167,400 @@ def _termux_provider() -> PowerState | None:
 
 _PROVIDERS = [_termux_provider, _psutil_provider, _sysfs_provider]
 
+_THERMAL_BASE = Path("/sys/class/thermal")
+_CPUFREQ_BASE = Path("/sys/devices/system/cpu/cpufreq")
+
+# Thermal zone types that measure the CPU/SoC rather than the battery,
+# skin or charger, on x86 laptops, Raspberry Pi and common phone SoCs.
+_SOC_ZONE_HINTS = ("cpu", "soc", "x86_pkg", "core", "tsens", "cluster", "apc")
+_OTHER_ZONE_HINTS = ("battery", "bms", "charger", "skin", "usb", "pa_therm")
+
+
+def _read_number(path: Path) -> float | None:
+    try:
+        return float(path.read_text().strip())
+    except (OSError, ValueError):
+        return None
+
+
+def _millidegrees(value: float | None) -> float | None:
+    """Convert a sysfs temperature, usually in m°C, to °C."""
+    if value is None:
+        return None
+    # A few Android kernels report whole degrees.
+    celsius = value / 1000 if abs(value) >= 1000 else value
+    return celsius if 0 < celsius < 150 else None
+
+
+def _thermal_zone_provider() -> tuple[float | None, float | None]:
+    """Return the hottest SoC temperature and its passive trip point in °C.
+
+    Reads ``/sys/class/thermal/thermal_zone*``. Zones whose type names the
+    CPU or SoC are preferred; otherwise every zone except battery, skin and
+    charger sensors is considered.
+    """
+
+    zones: list[tuple[bool, float, float | None]] = []
+    try:
+        paths = sorted(_THERMAL_BASE.glob("thermal_zone*"))
+    except OSError:
+        return None, None
+    for zone in paths:
+        try:
+            kind = (zone / "type").read_text().strip().lower()
+        except OSError:
+            continue
+        if any(hint in kind for hint in _OTHER_ZONE_HINTS):
+            continue
+        temp = _millidegrees(_read_number(zone / "temp"))
+        if temp is None:
+            continue
+        trip: float | None = None
+        for trip_type in zone.glob("trip_point_*_type"):
+            try:
+                if trip_type.read_text().strip() not in ("passive", "hot"):
+                    continue
+            except OSError:
+                continue
+            value = _millidegrees(
+                _read_number(trip_type.with_name(trip_type.name[:-4] + "temp"))
+            )
+            if value is not None and (trip is None or value < trip):
+                trip = value
+        zones.append((any(hint in kind for hint in _SOC_ZONE_HINTS), temp, trip))
+    if not zones:
+        return None, None
+    soc = [z for z in zones if z[0]] or zones
+    _, temp, trip = max(soc, key=lambda z: z[1])
+    return temp, trip
+
+
+def _cpufreq_provider() -> int | None:
+    """Return the highest current CPU frequency in kHz across cpufreq policies."""
+
+    try:
+        policies = sorted(_CPUFREQ_BASE.glob("policy*"))
+    except OSError:
+        return None
+    freqs = [_read_number(p / "scaling_cur_freq") for p in policies]
+    known = [int(f) for f in freqs if f is not None]
+    return max(known) if known else None
+
+
+def _add_thermal(state: PowerState) -> PowerState:
+    """Fill in the SoC temperature, throttle state and CPU frequency."""
+
+    temp, trip = _thermal_zone_provider()
+    if temp is not None:
+        # The SoC sensor matters more for throttling than the battery's.
+        state.temperature_c = temp
+        state.throttle_temp_c = trip
+        state.thermal_throttle = trip is not None and temp >= trip
+    state.cpu_freq_hint = _cpufreq_provider()
+    return state
+
 
 def get_power_state() -> PowerState:
     """Return the best effort :class:`PowerState` for the system.
 
     Providers are tried in order and the first non-``None`` result is used.
     If every provider fails, a ``PowerState`` with ``source='unknown'`` is
-    returned.  All provider errors are swallowed so callers can use this
-    function without defensive ``try`` blocks.
+    returned.  The thermal zone and cpufreq readings from ``/sys`` are
+    added where the platform exposes them.  All provider errors are
+    swallowed so callers can use this function without defensive ``try``
+    blocks.
     """
 
     for provider in _PROVIDERS:
         state = provider()
         if state is not None:
-            return state
+            return _add_thermal(state)
     # fall back to conservative defaults
-    return PowerState(ts=time.time())
+    return _add_thermal(PowerState(ts=time.time()))
+
+
+class _ProviderSelector:
+    """Remember which provider works and keep using it.
+
+    The providers are tried in order on the first call only. The provider
+    that answered is then used alone until it fails ``max_failures`` times
+    in a row; until then, its last good reading stands in for the failed
+    ones, with fresh thermal readings. If no provider answers, discovery is
+    retried after ``retry_s`` seconds rather than on every call, so hosts
+    without ``termux-battery-status`` do not start a subprocess per sample.
+    """
+
+    def __init__(self, retry_s: float = 300.0, max_failures: int = 3) -> None:
+        self.retry_s = retry_s
+        self.max_failures = max_failures
+        self.provider: Callable[[], PowerState | None] | None = None
+        self._last: PowerState | None = None
+        self._failures = 0
+        self._retry_at = 0.0
+
+    def sample(self) -> PowerState:
+        provider = self.provider
+        if provider is not None:
+            state = provider()
+            if state is not None:
+                self._failures = 0
+                self._last = state
+                return _add_thermal(state)
+            self._failures += 1
+            if self._failures < self.max_failures and self._last is not None:
+                return _add_thermal(replace(self._last, ts=time.time()))
+            self.provider = None
+            self._last = None
+        now = time.monotonic()
+        if now >= self._retry_at:
+            for candidate in _PROVIDERS:
+                state = candidate()
+                if state is not None:
+                    self.provider = candidate
+                    self._failures = 0
+                    self._last = state
+                    return _add_thermal(state)
+            self._retry_at = now + self.retry_s
+        return _add_thermal(PowerState(ts=time.time()))
+
+
+class PowerWatcher:
+    """Shared, change-driven view of the power state.
+
+    One background thread samples the power state for all consumers.
+    :meth:`latest` returns the last reading without touching the system
+    unless it is older than the caller accepts; callbacks registered with
+    :meth:`subscribe` and :meth:`changes` iterators only see readings that
+    differ meaningfully from the last one reported: a change of power
+    source, charging or throttle state, or a move of at least
+    ``percent_delta`` percent, ``temperature_delta_c`` degrees or
+    ``power_delta_w`` watts.
+
+    The sampling thread runs while at least one consumer has called
+    :meth:`start` (or uses :meth:`running` or :meth:`changes`); each may ask
+    for its own interval and the shortest one applies.
+    """
+
+    def __init__(
+        self,
+        interval_s: float = 20.0,
+        percent_delta: int = 1,
+        temperature_delta_c: float = 1.0,
+        power_delta_w: float = 0.5,
+        sample: Callable[[], PowerState] | None = None,
+    ) -> None:
+        self.interval_s = interval_s
+        self.percent_delta = percent_delta
+        self.temperature_delta_c = temperature_delta_c
+        self.power_delta_w = power_delta_w
+        self._sample = sample or _ProviderSelector().sample
+        self._lock = threading.Lock()
+        self._wake = threading.Condition(self._lock)
+        # Serialises sampling so concurrent callers share one reading.
+        self._sample_lock = threading.Lock()
+        self._state: PowerState | None = None
+        self._state_at = 0.0
+        self._reported: PowerState | None = None
+        self._subscribers: list[Callable[[PowerState], None]] = []
+        self._intervals: list[float] = []
+        self._thread: threading.Thread | None = None
+
+    @property
+    def interval(self) -> float:
+        """Seconds between samples of the background thread."""
+        with self._lock:
+            return min(self._intervals, default=self.interval_s)
+
+    def changed(self, old: PowerState, new: PowerState) -> bool:
+        """Return True if ``new`` differs meaningfully from ``old``."""
+        if (
+            old.source != new.source
+            or old.is_charging != new.is_charging
+            or old.thermal_throttle != new.thermal_throttle
+        ):
+            return True
+
+        def moved(a: float | None, b: float | None, delta: float) -> bool:
+            if a is None or b is None:
+                return (a is None) != (b is None)
+            return abs(a - b) >= delta
+
+        return (
+            moved(old.percent, new.percent, self.percent_delta)
+            or moved(old.temperature_c, new.temperature_c, self.temperature_delta_c)
+            or moved(old.power_w, new.power_w, self.power_delta_w)
+        )
+
+    def latest(self, max_age_s: float | None = None) -> PowerState:
+        """Return the last reading, sampling anew if there is none yet or it
+        is older than ``max_age_s`` seconds."""
+        with self._lock:
+            state, at = self._state, self._state_at
+        if state is not None and (
+            max_age_s is None or time.monotonic() - at <= max_age_s
+        ):
+            return state
+        with self._sample_lock:
+            # Another thread may have sampled while this one waited.
+            with self._lock:
+                state, at = self._state, self._state_at
+            if state is not None and (
+                max_age_s is None or time.monotonic() - at <= max_age_s
+            ):
+                return state
+            state, subscribers = self._poll_locked()
+        self._notify(state, subscribers)
+        return state
+
+    def poll(self) -> PowerState:
+        """Sample the power state now and notify subscribers of a change."""
+        with self._sample_lock:
+            state, subscribers = self._poll_locked()
+        self._notify(state, subscribers)
+        return state
+
+    def _poll_locked(
+        self,
+    ) -> tuple[PowerState, list[Callable[[PowerState], None]]]:
+        """Take a sample; return it and the subscribers to notify of it."""
+        state = self._sample()
+        with self._lock:
+            self._state = state
+            self._state_at = time.monotonic()
+            if self._reported is not None and not self.changed(self._reported, state):
+                return state, []
+            self._reported = state
+            return state, list(self._subscribers)
+
+    @staticmethod
+    def _notify(
+        state: PowerState, subscribers: list[Callable[[PowerState], None]]
+    ) -> None:
+        # Called without holding any lock, so callbacks may use the watcher.
+        for callback in subscribers:
+            try:
+                callback(state)
+            except Exception as e:  # pragma: no cover - consumer bug
+                logger.warning(f"Power watcher subscriber failed: {e}")
+
+    def subscribe(self, on_change: Callable[[PowerState], None]) -> Callable[[], None]:
+        """Call ``on_change`` with every meaningful change; return a function
+        that removes the subscription.
+
+        The callback runs on the thread that took the sample, usually the
+        sampling thread, with no lock of the watcher held. It should return
+        quickly.
+        """
+        with self._lock:
+            self._subscribers.append(on_change)
+
+        def unsubscribe() -> None:
+            with self._lock:
+                if on_change in self._subscribers:
+                    self._subscribers.remove(on_change)
+
+        return unsubscribe
+
+    def start(self, interval_s: float | None = None) -> None:
+        """Register a consumer of periodic samples, starting the thread.
+
+        Every call must be paired with a :meth:`stop` with the same
+        ``interval_s``.
+        """
+        with self._lock:
+            self._intervals.append(interval_s or self.interval_s)
+            self._wake.notify_all()
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._loop, name="parslet-power", daemon=True
+                )
+                self._thread.start()
+
+    def stop(self, interval_s: float | None = None) -> None:
+        """Unregister a consumer; the thread ends when none are left."""
+        with self._lock:
+            interval = interval_s or self.interval_s
+            if interval in self._intervals:
+                self._intervals.remove(interval)
+            thread = self._thread if not self._intervals else None
+            if thread is not None:
+                self._thread = None
+            self._wake.notify_all()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+    @contextmanager
+    def running(self, interval_s: float | None = None) -> Iterator[PowerWatcher]:
+        """Keep the watcher sampling while the ``with`` block runs."""
+        self.start(interval_s)
+        try:
+            yield self
+        finally:
+            self.stop(interval_s)
+
+    def _loop(self) -> None:
+        current = threading.current_thread()
+        while True:
+            with self._lock:
+                if self._thread is not current:
+                    return
+            try:
+                self.poll()
+            except Exception as e:  # pragma: no cover - provider bug
+                logger.warning(f"Power sampling failed: {e}")
+            with self._lock:
+                if self._thread is not current:
+                    return
+                self._wake.wait(min(self._intervals, default=self.interval_s))
+
+    async def changes(
+        self, interval_s: float | None = None
+    ) -> AsyncIterator[PowerState]:
+        """Yield the last reported state, if any, then every meaningful
+        change.
+
+        For use in ``async for``; sampling happens on the watcher's thread,
+        never on the event loop.
+        """
+        import asyncio  # Only needed by async consumers; slow to import.
+
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue[PowerState] = asyncio.Queue()
+
+        def deliver(state: PowerState) -> None:
+            loop.call_soon_threadsafe(queue.put_nowait, state)
+
+        # Subscribe before reading the last report, so that a change made in
+        # between is delivered rather than lost; it may then arrive twice.
+        unsubscribe = self.subscribe(deliver)
+        with self._lock:
+            reported = self._reported
+        if reported is not None:
+            queue.put_nowait(reported)
+        self.start(interval_s)
+        last: PowerState | None = None
+        try:
+            while True:
+                state = await queue.get()
+                if state is not last:
+                    last = state
+                    yield state
+        finally:
+            unsubscribe()
+            await asyncio.to_thread(self.stop, interval_s)
+
+
+_shared: PowerWatcher | None = None
+_shared_lock = threading.Lock()
+
+
+def shared_watcher() -> PowerWatcher:
+    """Return the process-wide :class:`PowerWatcher`."""
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = PowerWatcher()
+        return _shared
 
 
 def watch(
@@ -135,12 +569,15 @@ def watch(
     """Yield :class:`PowerState` snapshots at a fixed interval.
 
     The generator yields the latest :class:`PowerState` and optionally calls
-    ``on_change`` with the new value.  This is a simple building block used by
-    higher level scheduling components.
+    ``on_change`` with the new value.  Readings come from
+    :func:`shared_watcher`, which remembers the working provider; prefer
+    :meth:`PowerWatcher.subscribe` or :meth:`PowerWatcher.changes` to be
+    told about changes only.
     """
 
+    watcher = shared_watcher()
     while True:
-        state = get_power_state()
+        state = watcher.poll()
         if on_change is not None:
             on_change(state)
         yield state
@@ -14,8 +14,11 @@ ensuring `psutil` is a soft dependency.
 
 import logging  # For logging errors in resource queries
 import os
+import sys
 from typing import NamedTuple
 
+from .power import shared_watcher
+
 # Initialize a logger for this module.
 # This allows for more controlled logging than print statements, especially if
 # used as a library.
@@ -31,13 +34,6 @@ except ImportError:
     PSUTIL_AVAILABLE = False
     psutil = None  # Assign to None so type hints and checks work cleanly.
 
-BATTERY_AVAILABLE = False
-try:
-    if PSUTIL_AVAILABLE and hasattr(psutil, "sensors_battery"):
-        BATTERY_AVAILABLE = True
-except Exception:
-    BATTERY_AVAILABLE = False
-
 
 class ResourceSnapshot(NamedTuple):
     """Lightweight container for system resource metrics."""
@@ -119,59 +115,37 @@ def get_available_ram_mb() -> float | None:
         return None
 
 
-def get_battery_level() -> int | None:
-    """Return the current battery percentage if available."""
-    # 1) Try psutil if it is available
-    if BATTERY_AVAILABLE and psutil is not None:
-        try:
-            batt = psutil.sensors_battery()
-            if batt is not None and batt.percent is not None:
-                return int(batt.percent)
-        except Exception as e:  # pragma: no cover - psutil may fail in CI
-            logger.debug(
-                "Battery level via psutil not available: %s", e, exc_info=False
-            )
+def get_peak_rss_bytes() -> int | None:
+    """Return the peak resident set size of this process so far, in bytes.
 
-    # 2) Try Termux command on Android devices
+    Returns None where the ``resource`` module is unavailable (Windows).
+    """
     try:
-        import json
-        import shutil
-        import subprocess
-
-        termux_cmd = shutil.which("termux-battery-status")
-        if termux_cmd:
-            output = subprocess.check_output([termux_cmd], text=True)
-            data = json.loads(output)
-            percent = data.get("percentage")
-            if percent is not None:
-                return int(percent)
-    except Exception as e:  # pragma: no cover - Termux not usually in CI
-        logger.debug(
-            "Battery level via termux-battery-status not available: %s",
-            e,
-            exc_info=False,
-        )
+        import resource
+    except ImportError:  # pragma: no cover - not available on Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes.
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+# Battery readings younger than this many seconds are reused.
+BATTERY_MAX_AGE_S = 5.0
 
-    # 3) Fallback to reading from /sys/class/power_supply (common on Linux)
-    try:
-        import glob
-
-        for path in glob.glob("/sys/class/power_supply/BAT*/capacity"):
-            try:
-                with open(path, encoding="utf-8") as f:
-                    val = f.read().strip()
-                    return int(val)
-            except Exception:
-                continue
-    except Exception as e:  # pragma: no cover - path may not exist
-        logger.debug(
-            "Battery level via /sys/class/power_supply not available: %s",
-            e,
-            exc_info=False,
-        )
 
-    logger.debug("Battery level could not be determined with available methods.")
-    return None
+def get_battery_level() -> int | None:
+    """Return the current battery percentage if available.
+
+    The value comes from the shared :class:`~parslet.utils.power.PowerWatcher`,
+    so frequent callers such as the runner's pool resizing reuse a reading
+    that is at most :data:`BATTERY_MAX_AGE_S` seconds old instead of querying
+    psutil, ``termux-battery-status`` and ``/sys`` on every call.
+    """
+    percent = shared_watcher().latest(max_age_s=BATTERY_MAX_AGE_S).percent
+    if percent is None:
+        logger.debug("Battery level could not be determined with available methods.")
+        return None
+    return int(percent)
 
 
 def probe_resources() -> ResourceSnapshot:
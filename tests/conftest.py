@@ -1,8 +1,16 @@
 from __future__ import annotations
 
+import os
+import tempfile
+
 from parslet.core.task import set_allow_redefine
 
 
 def pytest_sessionstart(session):
     """Allow task redefinition across tests by default."""
     set_allow_redefine(True)
+    # Keep CLI runs from writing to the user's ~/.parslet.
+    state = tempfile.mkdtemp(prefix="parslet-tests-")
+    os.environ.setdefault("PARSLET_HISTORY_DB", os.path.join(state, "history.db"))
+    os.environ.setdefault("PARSLET_STATS_FILE", os.path.join(state, "stats.json"))
+    os.environ.setdefault("PARSLET_COMPILE_CACHE_DIR", os.path.join(state, "compiled"))
@@ -10,7 +10,9 @@ def test_top_level_public_api() -> None:
         "task_variant",
         "EnergyAwarePolicy",
         "PowerState",
+        "PowerWatcher",
         "get_power_state",
+        "shared_watcher",
         "watch",
     }
     assert set(parslet.__all__) == expected
@@ -0,0 +1,54 @@
+import json
+
+from benchmarks.__main__ import main
+from benchmarks.harness import BENCHMARKS, compare
+
+
+def test_suite_registers_all_areas():
+    names = set(BENCHMARKS)
+    assert {
+        "dispatch.overhead",
+        "dag.build",
+        "dag.validate",
+        "dag.toposort",
+        "cache.key",
+        "cache.io",
+        "checkpoint.write",
+        "e2e.throughput",
+    } <= names
+
+
+def test_quick_run_writes_json_report(tmp_path, capsys):
+    out = tmp_path / "bench.json"
+    argv = ["--quick", "--repeat", "1", "--max-size", "1000"]
+    assert main(argv + ["cache", "checkpoint", "dag.build", "--out", str(out)]) == 0
+    report = json.loads(out.read_text())
+    assert report["meta"]["quick"] is True
+    assert "python" in report["meta"]
+    names = {r["name"] for r in report["results"]}
+    assert names == {"cache.key", "cache.io", "checkpoint.write", "dag.build"}
+    for result in report["results"]:
+        assert result["seconds"] > 0
+        assert result["per_item_us"] > 0
+    assert "cache.key" in capsys.readouterr().out
+
+
+def test_compare_flags_regressions(tmp_path):
+    def report(seconds):
+        return {
+            "results": [
+                {"name": "dag.build", "params": {"nodes": 10}, "seconds": seconds},
+                {"name": "cache.key", "params": {"calls": 5}, "seconds": 1.0},
+            ]
+        }
+
+    rows = compare(report(1.5), report(1.0), threshold=0.1)
+    by_name = {r["name"]: r for r in rows}
+    assert by_name["dag.build"]["regression"]
+    assert by_name["dag.build"]["ratio"] == 1.5
+    assert not by_name["cache.key"]["regression"]
+
+    base = tmp_path / "base.json"
+    base.write_text(json.dumps({"results": []}))
+    argv = ["--quick", "--repeat", "1", "cache.key", "--compare", str(base)]
+    assert main(argv) == 0
@@ -0,0 +1,96 @@
+import threading
+from importlib import import_module
+
+import pytest
+
+from parslet.daemon import WorkflowDaemon, send_request, submit_workflow
+
+WORKFLOW = """
+from parslet import parslet_task
+
+@parslet_task
+def base():
+    return {value}
+
+@parslet_task
+def double(x):
+    return x * 2
+
+def main():
+    return [double(base())]
+"""
+
+
+@pytest.fixture
+def daemon(tmp_path, monkeypatch):
+    monkeypatch.setenv("PARSLET_NO_STATS", "1")
+    monkeypatch.chdir(tmp_path)
+    d = WorkflowDaemon(socket_path=tmp_path / "d.sock", max_workers=2)
+    thread = threading.Thread(target=d.serve_forever, daemon=True)
+    thread.start()
+    for _ in range(200):
+        try:
+            if send_request({"cmd": "ping"}, d.socket_path, timeout=1.0)["ok"]:
+                break
+        except ConnectionError:
+            threading.Event().wait(0.01)
+    yield d
+    send_request({"cmd": "shutdown"}, d.socket_path, timeout=5.0)
+    thread.join(timeout=5.0)
+    assert not thread.is_alive()
+    assert not d.socket_path.exists()
+
+
+def test_daemon_reuses_module_and_pool(daemon, tmp_path):
+    wf = tmp_path / "wf_daemon.py"
+    wf.write_text(WORKFLOW.format(value=3))
+
+    first = submit_workflow(str(wf), socket_path=daemon.socket_path, no_cache=True)
+    assert first["ok"]
+    assert first["results"] == [6]
+    assert set(first["task_statuses"].values()) == {"SUCCESS"}
+    module = daemon._modules[str(wf.resolve())][1]
+
+    second = submit_workflow(str(wf), socket_path=daemon.socket_path, no_cache=True)
+    assert second["results"] == [6]
+    assert daemon._modules[str(wf.resolve())][1] is module
+    assert not daemon.executor._shutdown
+    assert daemon.runs_served == 2
+
+
+def test_daemon_reloads_changed_workflow(daemon, tmp_path):
+    wf = tmp_path / "wf_daemon_reload.py"
+    wf.write_text(WORKFLOW.format(value=1))
+    assert submit_workflow(str(wf), socket_path=daemon.socket_path)["results"] == [2]
+    wf.write_text(WORKFLOW.format(value=10) + "\n# changed\n")
+    assert submit_workflow(str(wf), socket_path=daemon.socket_path)["results"] == [20]
+
+
+def test_daemon_reports_errors(daemon, tmp_path):
+    missing = send_request(
+        {"cmd": "run", "workflow": str(tmp_path / "missing.py")}, daemon.socket_path
+    )
+    assert not missing["ok"]
+    assert "Cannot find workflow" in missing["error"]
+    bad = send_request({"cmd": "bogus"}, daemon.socket_path)
+    assert not bad["ok"]
+
+
+def test_submit_without_daemon(tmp_path):
+    with pytest.raises(ConnectionError, match="parslet serve"):
+        submit_workflow("wf.py", socket_path=tmp_path / "none.sock")
+
+
+def test_cli_submit_prints_results(daemon, tmp_path, monkeypatch, capsys):
+    wf = tmp_path / "wf_daemon_cli.py"
+    wf.write_text(WORKFLOW.format(value=4))
+    module = import_module("parslet.main_cli")
+    monkeypatch.setattr(
+        module.sys,
+        "argv",
+        ["parslet", "submit", str(wf), "--socket", str(daemon.socket_path)],
+    )
+    module.main()
+    out = capsys.readouterr().out
+    assert "8" in out.splitlines()
+    assert "2 task(s), 0 not successful" in out
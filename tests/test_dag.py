@@ -19,3 +19,63 @@ def test_dag_build_and_topological_order():
     dag.validate_dag()
     order = dag.get_execution_order()
     assert order == [a.task_id, b.task_id]
+
+
+@parslet_task
+def total(values, extra=None):
+    return sum(values) + sum(extra.values())
+
+
+def test_nested_futures_become_dependencies():
+    parts = [t1() for _ in range(3)]
+    bonus = t2(parts[0])
+    fut = total(parts, extra={"bonus": bonus, "const": 10})
+    dag = DAG()
+    dag.build_dag([fut])
+    dag.validate_dag()
+    deps = set(dag.get_dependencies(fut.task_id))
+    assert deps == {p.task_id for p in parts} | {bonus.task_id}
+    assert dag.all_tasks_and_dependencies_known([fut])
+
+
+@parslet_task(pure=True)
+def pure_inc(x):
+    return x + 1
+
+
+def test_eliminate_duplicate_pure_tasks():
+    from parslet.core import DAGRunner
+
+    first = pure_inc(1)
+    second = pure_inc(1)
+    other = pure_inc(2)
+    # Downstream duplicates collapse once their inputs have been merged.
+    chained_a = pure_inc(first)
+    chained_b = pure_inc(second)
+    impure_a = t1()
+    impure_b = t1()
+    dag = DAG()
+    dag.build_dag(
+        [chained_a, chained_b, other, impure_a, impure_b],
+        eliminate_duplicates=True,
+    )
+    assert dag.aliases == {
+        second.task_id: first.task_id,
+        chained_b.task_id: chained_a.task_id,
+    }
+    assert len(dag.tasks) == 5
+    DAGRunner(max_workers=1).run(dag)
+    assert second.result() == first.result() == 2
+    assert chained_b.result() == 3
+    assert impure_a.result() == impure_b.result() == 1
+
+
+def test_fuse_linear_chains_stops_at_fan_in_and_fan_out():
+    a = t1()
+    b = t2(a)
+    c = t2(b)
+    d = t2(c)
+    e = t2(c)
+    dag = DAG()
+    dag.build_dag([d, e])
+    assert dag.fuse_linear_chains() == [[a.task_id, b.task_id, c.task_id]]
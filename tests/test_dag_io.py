@@ -1,3 +1,5 @@
+import pytest
+
 from parslet.core import DAG, DAGRunner, parslet_task, dag_io
 
 
@@ -26,3 +28,75 @@ def test_export_import_dag(tmp_path):
     runner = DAGRunner(max_workers=1)
     runner.run(loaded)
     assert loaded.tasks[b.task_id].result() == 2
+
+
+@parslet_task
+def combine(values: list) -> int:
+    return sum(values)
+
+
+def test_export_import_nested_futures(tmp_path):
+    a = t1()
+    b = t2(a)
+    c = combine([a, b, 5])
+    dag = DAG()
+    dag.build_dag([c])
+    out = tmp_path / "nested.dag"
+    dag_io.export_dag_to_json(dag, str(out))
+
+    loaded = dag_io.import_dag_from_json(str(out))
+    runner = DAGRunner(max_workers=1)
+    runner.run(loaded)
+    assert loaded.tasks[c.task_id].result() == 8
+
+
+def test_binary_round_trip(tmp_path):
+    a = t1()
+    chain = [t2(a)]
+    for _ in range(200):
+        chain.append(t2(chain[-1]))
+    c = combine([a, chain[-1], 5])
+    dag = DAG()
+    dag.build_dag([c])
+    out = tmp_path / "graph.pdag"
+    dag_io.export_dag_to_binary(dag, str(out))
+
+    loaded = dag_io.import_dag_from_binary(str(out))
+    assert set(loaded.tasks) == set(dag.tasks)
+    assert set(loaded.graph.edges) == set(dag.graph.edges)
+    # Functions are interned: one definition each, shared by all tasks.
+    assert len({id(f.func) for f in loaded.tasks.values()}) == 3
+    DAGRunner(max_workers=1).run(loaded)
+    assert loaded.tasks[c.task_id].result() == 1 + 202 + 5
+
+
+@parslet_task
+def shapes(pair: tuple, nested: list, opts: dict) -> tuple:
+    return type(pair), type(nested[1]), type(opts["span"])
+
+
+@pytest.mark.parametrize("fmt", ["json", "binary"])
+def test_round_trip_keeps_tuples(tmp_path, fmt):
+    a = t1()
+    s = shapes((a, 2), [1, (a, (3, 4))], opts={"span": (0, a)})
+    dag = DAG()
+    dag.build_dag([s])
+    out = tmp_path / "graph.dag"
+    getattr(dag_io, f"export_dag_to_{fmt}")(dag, str(out))
+
+    loaded = getattr(dag_io, f"import_dag_from_{fmt}")(str(out))
+    task = loaded.tasks[s.task_id]
+    assert task.args[0] == (loaded.tasks[a.task_id], 2)
+    assert task.args[1] == [1, (loaded.tasks[a.task_id], (3, 4))]
+    assert task.kwargs == {"opts": {"span": (0, loaded.tasks[a.task_id])}}
+    DAGRunner(max_workers=1).run(loaded)
+    assert task.result() == (tuple, tuple, tuple)
+
+
+def test_binary_import_rejects_other_files(tmp_path):
+    out = tmp_path / "graph.json"
+    dag = DAG()
+    dag.build_dag([t1()])
+    dag_io.export_dag_to_json(dag, str(out))
+    with pytest.raises(ValueError):
+        dag_io.import_dag_from_binary(str(out))
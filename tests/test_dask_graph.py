@@ -0,0 +1,44 @@
+import pickle
+
+from parslet.core import DAG, parslet_task
+from parslet.core.dask_bridge import _build_dask_graph
+
+
+@parslet_task
+def dg_inc(x):
+    return x + 1
+
+
+@parslet_task
+def dg_join(values, label="sum"):
+    return {label: sum(values)}
+
+
+def _simple_get(graph, keys):
+    """Evaluate a legacy Dask graph of ``(callable, *dep_keys)`` tuples."""
+    cache = {}
+
+    def run(key):
+        if key not in cache:
+            func, *deps = graph[key]
+            cache[key] = func(*(run(d) for d in deps))
+        return cache[key]
+
+    return [run(k) for k in keys]
+
+
+def test_dask_graph_is_a_raw_task_dict():
+    a = dg_inc(1)
+    b = dg_inc(a)
+    # Literal strings and tuples are left alone, futures nested in lists work.
+    c = dg_join([a, b, 10], label="total")
+    dag = DAG()
+    dag.build_dag([c])
+
+    graph = _build_dask_graph(dag)
+    assert set(graph) == set(dag.tasks)
+    assert graph[c.task_id][1:] == (a.task_id, b.task_id)
+    assert _simple_get(graph, [c.task_id]) == [{"total": 2 + 3 + 10}]
+    # Nodes must survive pickling for process-based schedulers.
+    call = pickle.loads(pickle.dumps(graph[c.task_id][0].args))
+    assert call[0][2] == 10
@@ -35,3 +35,15 @@ def test_verify_chain(tmp_path):
 
     sig.unlink()
     assert Defcon.verify_chain(dag_hash, sig)
+
+
+def test_scan_code_skips_unchanged_sources(tmp_path, monkeypatch):
+    p = tmp_path / "clean.py"
+    p.write_text("b = 2")
+    assert Defcon.scan_code([p])
+
+    def fail_parse(*_args, **_kwargs):
+        raise AssertionError("clean source parsed twice")
+
+    monkeypatch.setattr("parslet.security.defcon.ast.parse", fail_parse)
+    assert Defcon.scan_code([p])
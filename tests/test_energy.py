@@ -0,0 +1,161 @@
+import itertools
+import time
+
+import pytest
+
+from parslet.core import DAG, DAGRunner, EnergyAwarePolicy, parslet_task
+from parslet.core.energy import EnergyMeter
+from parslet.core.events import Event, EventType
+from parslet.core.stats import TaskStatsStore
+from parslet.utils.power import PowerState, _sysfs_battery_energy
+
+
+@parslet_task
+def en_light(x):
+    return x
+
+
+@parslet_task(energy_cost="low")
+def en_heavy(x):
+    return x
+
+
+def _battery(ts, energy_wh=None, percent=None, power_w=None, charging=False):
+    # Offset so that no sample has the dataclass's "unset" timestamp 0.
+    return PowerState(
+        source="battery",
+        percent=percent,
+        is_charging=charging,
+        ts=T0 + ts,
+        energy_wh=energy_wh,
+        power_w=power_w,
+    )
+
+
+T0 = 1_000.0
+
+
+def _meter(states):
+    it = iter(states)
+    meter = EnergyMeter(sample=lambda: next(it))
+    for _ in states:
+        meter.sample_now()
+    return meter
+
+
+def _finished(meter, name, start, end):
+    meter.handle(
+        Event(EventType.TASK_SUCCEEDED, T0 + end, f"{name}_1", name, end - start)
+    )
+
+
+def test_drain_split_by_overlapping_runtime():
+    meter = _meter(
+        [_battery(0, 10.0, 80), _battery(10, 9.99, 80), _battery(20, 9.98, 79)]
+    )
+    _finished(meter, "a", 0, 10)
+    _finished(meter, "b", 5, 20)
+    report = meter.report()
+    a, b = report["tasks"]["a"], report["tasks"]["b"]
+    assert a["joules"] == pytest.approx(24.0)
+    assert b["joules"] == pytest.approx(48.0)
+    assert b["battery_pct"] == pytest.approx(1.0)
+    assert a["joules_per_call"] == pytest.approx(24.0)
+    assert report["idle_joules"] is None
+    assert meter.joules_per_call() == pytest.approx({"a": 24.0, "b": 48.0})
+
+
+def test_power_rate_fallback_and_idle_windows():
+    meter = _meter(
+        [_battery(0, power_w=2.0), _battery(10, power_w=4.0), _battery(20, power_w=2.0)]
+    )
+    _finished(meter, "a", 12, 18)
+    report = meter.report()
+    assert report["tasks"]["a"]["joules"] == pytest.approx(30.0)
+    assert report["idle_joules"] == pytest.approx(30.0)
+    assert "Idle drain: 30.00 J" in meter.format_report()
+
+
+def test_no_drain_while_charging_or_on_ac():
+    meter = _meter(
+        [
+            _battery(0, 10.0, 80),
+            _battery(10, 9.0, 70, charging=True),
+            PowerState(source="ac", ts=T0 + 20),
+        ]
+    )
+    _finished(meter, "a", 0, 20)
+    entry = meter.report()["tasks"]["a"]
+    assert entry["joules"] is None
+    assert entry["battery_pct"] is None
+    assert meter.joules_per_call() == {}
+
+
+def test_runner_measures_energy_and_records_it(tmp_path):
+    ticks = itertools.count()
+    store = TaskStatsStore(tmp_path / "stats.json")
+    runner = DAGRunner(max_workers=1, energy=True, stats_store=store)
+    runner.energy._sample = lambda: PowerState(
+        source="battery", percent=50, energy_wh=10.0 - next(ticks) * 0.001
+    )
+    dag = DAG()
+    dag.build_dag([en_light(1), en_heavy(2)])
+    runner.run(dag)
+    report = runner.energy.report()
+    assert report["samples"] >= 2
+    assert {name: e["calls"] for name, e in report["tasks"].items()} == {
+        "en_light": 1,
+        "en_heavy": 1,
+    }
+    saved = TaskStatsStore(tmp_path / "stats.json").entries["en_light"]
+    assert saved["count"] == 1
+    assert saved["energy_j"] > 0
+
+
+def test_policy_prefers_measured_costs(tmp_path):
+    store = TaskStatsStore(tmp_path / "stats.json")
+    store.record_energy("en_light", 1.0)
+    store.record_energy("en_heavy", 50.0)
+    store.record_energy("en_heavy", 30.0)
+    assert store.energy_costs() == {"en_light": 1.0, "en_heavy": 40.0}
+
+    low_battery = PowerState(source="battery", percent=10)
+    light, heavy = en_light(1), en_heavy(2)
+    # The labels alone put the "low" task first.
+    assert EnergyAwarePolicy().order([light, heavy], low_battery) == [heavy, light]
+    policy = EnergyAwarePolicy.from_stats(store)
+    assert policy.order([heavy, light], low_battery) == [light, heavy]
+
+
+def test_sysfs_energy_units(tmp_path):
+    (tmp_path / "power_now").write_text("5000000\n")
+    (tmp_path / "energy_now").write_text("40000000\n")
+    assert _sysfs_battery_energy(tmp_path) == (5.0, 40.0)
+    other = tmp_path / "charge"
+    other.mkdir()
+    (other / "voltage_now").write_text("4000000")
+    (other / "current_now").write_text("-500000")
+    (other / "charge_now").write_text("2000000")
+    assert _sysfs_battery_energy(other) == (2.0, 8.0)
+
+
+def test_meter_reuses_the_shared_watchers_samples(monkeypatch):
+    from parslet.utils import power
+
+    calls = itertools.count()
+
+    def sample():
+        next(calls)
+        return PowerState(source="battery", percent=50, ts=time.time())
+
+    watcher = power.PowerWatcher(sample=sample)
+    monkeypatch.setattr(power, "_shared", watcher)
+    meter = EnergyMeter(interval_s=0.05)
+    # As in DAGRunner.run, which keeps the watcher sampling during a run.
+    with watcher.running(0.05):
+        meter.start()
+        time.sleep(1.0)
+        meter.stop()
+    # One sampler polls about 20 times a second; the meter must not add its own.
+    assert next(calls) <= 26
+    assert watcher._thread is None
@@ -0,0 +1,164 @@
+import io
+import json
+import logging
+import threading
+from importlib import import_module
+
+from parslet.core import DAG, DAGRunner, parslet_task
+from parslet.core.events import (
+    EventBus,
+    EventSink,
+    EventType,
+    JsonLinesSink,
+    LogSink,
+)
+
+
+@parslet_task
+def ev_inc(x):
+    return x + 1
+
+
+@parslet_task
+def ev_fail(x):
+    raise RuntimeError("nope")
+
+
+class Collect(EventSink):
+    def __init__(self):
+        self.events = []
+        self.threads = set()
+        self.closed = False
+
+    def handle(self, event):
+        self.events.append(event)
+        self.threads.add(threading.current_thread().name)
+
+    def close(self):
+        self.closed = True
+
+
+def test_bus_ring_buffer_and_delivery():
+    bus = EventBus(capacity=3)
+    sink = Collect()
+    bus.subscribe(sink)
+    bus.start()
+    for i in range(5):
+        bus.emit(EventType.TASK_SUBMITTED, f"t{i}", "inc")
+    bus.flush()
+    assert [e.task_id for e in sink.events] == ["t0", "t1", "t2", "t3", "t4"]
+    assert sink.threads == {"parslet-events"}
+    assert [e.task_id for e in bus.recent()] == ["t2", "t3", "t4"]
+    assert [e.task_id for e in bus.recent(1)] == ["t4"]
+    bus.close()
+    assert sink.closed
+
+
+def test_events_without_dispatcher_delivered_on_stop():
+    bus = EventBus()
+    sink = Collect()
+    bus.subscribe(sink)
+    bus.emit(EventType.CACHE_HIT, "t", "inc")
+    assert sink.events == []
+    bus.stop()
+    assert [e.type for e in sink.events] == [EventType.CACHE_HIT]
+
+
+def test_runner_emits_task_lifecycle():
+    sink = Collect()
+    ok = ev_inc(ev_inc(1))
+    bad = ev_fail(1)
+    skipped = ev_inc(bad)
+    dag = DAG()
+    dag.build_dag([ok, skipped])
+    runner = DAGRunner(max_workers=2, event_sinks=[sink])
+    runner.run(dag)
+    kinds = [e.type for e in sink.events]
+    assert kinds[0] == EventType.RUN_STARTED
+    assert kinds[-1] == EventType.RUN_FINISHED
+    assert kinds.count(EventType.TASK_SUBMITTED) == 3
+    assert kinds.count(EventType.TASK_SUCCEEDED) == 2
+    failed = next(e for e in sink.events if e.type == EventType.TASK_FAILED)
+    assert failed.task_id == bad.task_id
+    assert failed.task_name == "ev_fail"
+    assert "RuntimeError: nope" in failed.detail["error"]
+    assert failed.duration_s is not None
+    skip = next(e for e in sink.events if e.type == EventType.TASK_SKIPPED)
+    assert skip.task_id == skipped.task_id
+    assert skip.detail == {
+        "reason": "upstream_failure",
+        "failed_task_id": bad.task_id,
+    }
+
+
+def test_log_sink_formats_only_on_dispatcher():
+    stream = io.StringIO()
+    log = logging.getLogger("parslet.test.events")
+    handler = logging.StreamHandler(stream)
+    handler.setFormatter(logging.Formatter("%(threadName)s|%(message)s"))
+    log.handlers[:] = [handler]
+    log.setLevel(logging.INFO)
+    log.propagate = False
+    fut = ev_inc(1)
+    dag = DAG()
+    dag.build_dag([fut])
+    DAGRunner(max_workers=1, runner_logger=log).run(dag)
+    lines = stream.getvalue().splitlines()
+    submitted = f"Submitting task '{fut.task_id}' (ev_inc) to executor."
+    completed = f"Task '{fut.task_id}' (ev_inc) completed successfully in"
+    for text in (submitted, completed):
+        (line,) = [line for line in lines if text in line]
+        assert line.startswith("parslet-events|")
+
+    stream.truncate(0)
+    log.setLevel(logging.WARNING)
+    runner = DAGRunner(max_workers=1, runner_logger=log)
+    assert runner.events.sinks == []
+
+
+def test_json_log_sink():
+    stream = io.StringIO()
+    log = logging.getLogger("parslet.test.events.json")
+    log.handlers[:] = [logging.StreamHandler(stream)]
+    log.setLevel(logging.INFO)
+    log.propagate = False
+    sink = LogSink(log, json_format=True)
+    bus = EventBus()
+    bus.subscribe(sink)
+    bus.emit(EventType.POOL_RESIZED, detail={"old": 4, "new": 2})
+    bus.stop()
+    record = json.loads(stream.getvalue())
+    assert record["event"] == "pool_resized"
+    assert (record["old"], record["new"]) == (4, 2)
+
+
+def test_cli_event_log(tmp_path, monkeypatch):
+    monkeypatch.setenv("PARSLET_NO_STATS", "1")
+    wf = tmp_path / "wf_events.py"
+    wf.write_text(
+        "from parslet import parslet_task\n"
+        "@parslet_task\n"
+        "def one():\n    return 1\n"
+        "def main():\n    return [one()]\n"
+    )
+    out = tmp_path / "events.jsonl"
+    module = import_module("parslet.main_cli")
+    argv = ["parslet", "run", str(wf), "--event-log", str(out)]
+    monkeypatch.setattr(module.sys, "argv", argv)
+    module.main()
+    records = [json.loads(line) for line in out.read_text().splitlines()]
+    kinds = [r["event"] for r in records]
+    assert kinds[0] == "run_started" and kinds[-1] == "run_finished"
+    done = next(r for r in records if r["event"] == "task_succeeded")
+    assert done["task"] == "one"
+    assert done["duration_s"] >= 0
+
+
+def test_json_lines_sink_stream_left_open():
+    stream = io.StringIO()
+    sink = JsonLinesSink(stream)
+    bus = EventBus()
+    bus.subscribe(sink)
+    bus.emit(EventType.CACHE_MISS, "t1", "inc")
+    bus.close()
+    assert json.loads(stream.getvalue())["task_id"] == "t1"
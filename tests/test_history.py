@@ -0,0 +1,158 @@
+import json
+import os
+import time
+from importlib import import_module
+
+import pytest
+
+from parslet.core import DAG, DAGRunner, parslet_task
+from parslet.core.history import RunHistory
+
+
+@parslet_task
+def hist_inc(x):
+    return x + 1
+
+
+@parslet_task
+def hist_fail(x):
+    raise RuntimeError("nope")
+
+
+def _run(history, futures, workflow="wf.py"):
+    dag = DAG()
+    dag.build_dag(futures)
+    runner = DAGRunner(max_workers=2, check_network=False)
+    runner.run(dag)
+    return history.record_run(runner, dag, workflow, time.time(), 0.1)
+
+
+def _insert(history, run_id, name, duration):
+    with history._connect() as conn:
+        conn.execute(
+            "INSERT INTO runs (id, started_at, workflow) VALUES (?, ?, ?)",
+            (run_id, time.time(), "wf.py"),
+        )
+        conn.execute(
+            "INSERT INTO task_runs (run_id, task_id, task_name, status, "
+            "duration_s) VALUES (?, ?, ?, 'SUCCESS', ?)",
+            (run_id, f"{name}_{run_id}", name, duration),
+        )
+
+
+def test_record_run_stores_tasks_by_name(tmp_path):
+    history = RunHistory(tmp_path / "h.db")
+    run_id = _run(history, [hist_inc(1), hist_inc(2), hist_fail(0)])
+    [run] = history.runs()
+    assert run["id"] == run_id
+    assert run["tasks"] == 3
+    assert run["succeeded"] == 2
+    assert run["failed"] == 1
+    assert run["host"]
+    stats = history.percentiles()
+    assert list(stats) == ["hist_inc"]
+    assert stats["hist_inc"]["count"] == 2
+
+
+def test_percentiles_and_slowest(tmp_path):
+    history = RunHistory(tmp_path / "h.db")
+    for run_id, duration in enumerate([1.0, 2.0, 3.0, 4.0, 5.0], start=1):
+        _insert(history, run_id, "step", duration)
+    stats = history.percentiles()["step"]
+    assert stats["p50_s"] == 3.0
+    assert stats["p90_s"] == pytest.approx(4.6)
+    assert stats["max_s"] == 5.0
+    assert history.percentiles(last_runs=2)["step"]["count"] == 2
+    assert [r["duration_s"] for r in history.slowest(limit=2)] == [5.0, 4.0]
+
+
+def test_trends_flag_regressions(tmp_path):
+    history = RunHistory(tmp_path / "h.db")
+    durations = [1.0, 1.1, 0.9, 1.0, 2.0, 2.1, 1.9]
+    for run_id, duration in enumerate(durations, start=1):
+        _insert(history, run_id, "step", duration)
+    [row] = history.trends(recent=3, threshold=0.2)
+    assert row["baseline_s"] == pytest.approx(1.0)
+    assert row["recent_s"] == pytest.approx(2.0)
+    assert row["regression"]
+    assert history.trends(recent=7) == []
+
+
+def test_prune_keeps_newest_runs(tmp_path):
+    history = RunHistory(tmp_path / "h.db")
+    for run_id in range(1, 5):
+        _insert(history, run_id, "step", 1.0)
+    assert history.prune(keep=2) == 2
+    assert [r["id"] for r in history.runs()] == [4, 3]
+    assert history.percentiles()["step"]["count"] == 2
+    assert history.prune(keep=0) == 0
+    assert len(history.runs()) == 2
+
+
+def test_workflow_filter_matches_file_names_literally(tmp_path):
+    history = RunHistory(tmp_path / "h.db")
+    for run_id, workflow in enumerate(
+        [os.path.join("data", "my_wf.py"), os.path.join("data", "myxwf.py")], 1
+    ):
+        with history._connect() as conn:
+            conn.execute(
+                "INSERT INTO runs (id, started_at, workflow) VALUES (?, ?, ?)",
+                (run_id, time.time(), workflow),
+            )
+    assert [r["id"] for r in history.runs("my_wf.py")] == [1]
+    assert [r["id"] for r in history.runs("%wf.py")] == []
+
+
+def test_record_run_applies_retention(tmp_path, monkeypatch):
+    monkeypatch.setenv("PARSLET_HISTORY_KEEP", "2")
+    history = RunHistory(tmp_path / "h.db")
+    ids = [_run(history, [hist_inc(i)]) for i in range(4)]
+    assert [r["id"] for r in history.runs()] == ids[:1:-1]
+    with history._connect() as conn:
+        (count,) = conn.execute("SELECT COUNT(*) FROM task_runs").fetchone()
+    assert count == 2
+    assert RunHistory(tmp_path / "h.db", keep=0).keep == 0
+
+
+def test_cli_records_run_and_reports_stats(tmp_path, monkeypatch, capsys):
+    wf = tmp_path / "wf.py"
+    wf.write_text(
+        "from parslet.core import parslet_task\n"
+        "@parslet_task\n"
+        "def one():\n"
+        "    return 1\n"
+        "def main():\n"
+        "    return [one()]\n"
+    )
+    db = tmp_path / "history.db"
+    monkeypatch.delenv("PARSLET_NO_STATS", raising=False)
+    monkeypatch.setenv("PARSLET_STATS_FILE", str(tmp_path / "stats.json"))
+    monkeypatch.setenv("PARSLET_HISTORY_DB", str(db))
+    module = import_module("parslet.main_cli")
+    for _ in range(2):
+        monkeypatch.setattr(module.sys, "argv", ["parslet", "run", str(wf)])
+        module.main()
+    capsys.readouterr()
+
+    monkeypatch.setattr(
+        module.sys, "argv", ["parslet", "stats", str(wf), "--recent", "1", "--json"]
+    )
+    module.main()
+    report = json.loads(capsys.readouterr().out)
+    assert len(report["runs"]) == 2
+    assert report["percentiles"]["one"]["count"] == 2
+    assert [row["task"] for row in report["trends"]] == ["one"]
+
+    monkeypatch.setattr(module.sys, "argv", ["parslet", "stats"])
+    module.main()
+    out = capsys.readouterr().out
+    assert "2 run(s), 1 workflow version(s)" in out
+    assert "Slowest task executions" in out
+
+    monkeypatch.setattr(module.sys, "argv", ["parslet", "stats", "--keep", "0"])
+    module.main()
+    assert "2 run(s), 1 workflow version(s)" in capsys.readouterr().out
+
+    monkeypatch.setattr(module.sys, "argv", ["parslet", "stats", "--keep", "1"])
+    module.main()
+    assert "1 run(s), 1 workflow version(s)" in capsys.readouterr().out
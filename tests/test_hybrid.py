@@ -20,6 +20,7 @@ def make_stub_parsl():
 
     def python_app(func):
         def wrapper(*args, **kwargs):
+            parsl_mod.received.append([type(a).__name__ for a in args])
             resolved_args = [
                 a.result() if hasattr(a, "result") else a for a in args
             ]
@@ -61,6 +62,7 @@ def make_stub_parsl():
     threads_mod.ThreadPoolExecutor = ThreadPoolExecutor
     executors_mod.threads = threads_mod
 
+    parsl_mod.received = []
     parsl_mod.python_app = python_app
     parsl_mod.config = config_mod
     parsl_mod.executors = executors_mod
@@ -97,3 +99,45 @@ def test_execute_hybrid_mixes_local_and_remote(stub_parsl):
     results = execute_hybrid([add_one(one())])
     parsl.dfk().cleanup()
     assert results == [2]
+
+
+def test_execute_hybrid_overlaps_local_and_chains_remote(stub_parsl):
+    import threading
+
+    barrier = threading.Barrier(2, timeout=5)
+
+    @parslet_task
+    def wait_for_peer(x):
+        # Only returns if both local tasks run at the same time.
+        barrier.wait()
+        return x
+
+    @parslet_task(remote=True)
+    def double(x):
+        return x * 2
+
+    @parslet_task
+    def total(a, b):
+        return a + b
+
+    remote = double(double(3))
+    result = total(wait_for_peer(1), wait_for_peer(remote))
+    results = execute_hybrid([result], max_workers=2)
+    assert results == [13]
+    # The second remote call received the first one's AppFuture untouched.
+    assert stub_parsl.received == [["int"], ["DummyFuture"]]
+
+
+def test_execute_hybrid_waits_for_remote_futures_inside_containers(stub_parsl):
+    @parslet_task(remote=True)
+    def square(x):
+        return x * x
+
+    @parslet_task(remote=True)
+    def total(values):
+        return sum(values)
+
+    results = execute_hybrid([total([square(1), square(2), square(3)])])
+    assert results == [14]
+    # Parsl was handed the list of values, not a list of AppFutures.
+    assert stub_parsl.received[-1] == ["list"]
@@ -0,0 +1,67 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+# Modules that are expensive to import and only needed once a workflow runs.
+HEAVY_MODULES = [
+    "networkx",
+    "rich",
+    "pydot",
+    "parslet.core.dag",
+    "parslet.core.dag_io",
+    "parslet.core.exporter",
+    "parslet.core.parsl_bridge",
+    "parslet.core.runner",
+]
+
+# Generous default so slow CI machines pass; tighten locally via the env var.
+IMPORT_BUDGET_S = float(os.environ.get("PARSLET_IMPORT_BUDGET_S", "1.0"))
+
+
+def _fresh_import(statement: str) -> dict:
+    code = (
+        "import json, sys, time\n"
+        "start = time.perf_counter()\n"
+        f"{statement}\n"
+        "elapsed = time.perf_counter() - start\n"
+        "print(json.dumps({'elapsed': elapsed, 'modules': sorted(sys.modules)}))\n"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "import parslet",
+        "import parslet.main_cli",
+        "from parslet import parslet_task",
+    ],
+)
+def test_import_skips_heavy_modules(statement):
+    loaded = set(_fresh_import(statement)["modules"])
+    assert not loaded & set(HEAVY_MODULES)
+
+
+def test_import_within_budget():
+    elapsed = min(_fresh_import("import parslet.main_cli")["elapsed"] for _ in range(3))
+    assert elapsed < IMPORT_BUDGET_S
+
+
+def test_lazy_exports_resolve():
+    import parslet
+    import parslet.core
+
+    from parslet.core.dag import DAG
+
+    assert parslet.DAG is DAG
+    assert parslet.core.DAG is DAG
+    assert set(parslet.core.__all__) <= set(dir(parslet.core))
+    assert isinstance(parslet.__version__, str)
+    with pytest.raises(AttributeError):
+        _ = parslet.core.does_not_exist
@@ -1,7 +1,10 @@
+from parslet.core import DAG, DAGRunner, parslet_task
 from parslet.core.ir import (
     IRTask,
     IRGraph,
+    dag_from_ir,
     infer_edges_from_params,
+    ir_from_dag,
     toposort,
     normalize_names,
 )
@@ -34,3 +37,41 @@ def test_toposort_cycle_detection():
     edges = infer_edges_from_params(tasks)
     with pytest.raises(ValueError):
         toposort(tasks, edges)
+
+
+def test_toposort_large_chain_and_unknown_edge():
+    n = 50_000
+    tasks = {f"t{i}": IRTask(name=f"t{i}", params=[f"t{i - 1}"]) for i in range(n)}
+    edges = infer_edges_from_params(tasks)
+    assert len(edges) == n - 1
+    order = toposort(tasks, reversed(edges))
+    assert order[0] == "t0" and order[-1] == f"t{n - 1}"
+    with pytest.raises(ValueError):
+        toposort({"a": IRTask(name="a", params=[])}, [("missing", "a")])
+
+
+@parslet_task
+def ir_source(x):
+    return x * 2
+
+
+@parslet_task
+def ir_sink(values, offset=0):
+    return sum(values) + offset
+
+
+def test_dag_ir_round_trip():
+    a = ir_source(1)
+    b = ir_source(a)
+    c = ir_sink([a, b], offset=3)
+    dag = DAG()
+    dag.build_dag([c])
+
+    graph = ir_from_dag(dag)
+    assert set(graph.edges) == set(dag.graph.edges)
+    assert toposort(graph.tasks, graph.edges)[-1] == c.task_id
+
+    rebuilt = dag_from_ir(graph)
+    assert set(rebuilt.graph.edges) == set(dag.graph.edges)
+    DAGRunner(max_workers=1).run(rebuilt)
+    assert rebuilt.tasks[c.task_id].result() == 2 + 4 + 3
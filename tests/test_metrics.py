@@ -0,0 +1,78 @@
+import urllib.request
+
+from parslet.core import DAG, DAGRunner, parslet_task
+from parslet.core.metrics import MetricsServer, RunnerMetrics
+from parslet.utils.diagnostics import find_free_port
+
+
+@parslet_task
+def inc(x):
+    return x + 1
+
+
+@parslet_task
+def scrape(port, *_deps):
+    url = f"http://127.0.0.1:{port}/metrics"
+    with urllib.request.urlopen(url, timeout=5) as resp:
+        return resp.headers["Content-Type"], resp.read().decode()
+
+
+def test_render_histogram_and_cache_ratio():
+    metrics = RunnerMetrics()
+    metrics.task_finished("load", "SUCCESS", 0.02)
+    metrics.task_finished("load", "SUCCESS", 7.0)
+    metrics.task_finished("load", "FAILED", 400.0)
+    metrics.cache_lookup(hit=True)
+    metrics.cache_lookup(hit=False)
+    metrics.cache_lookup(hit=False)
+    text = metrics.render()
+    assert 'parslet_task_duration_seconds_bucket{task="load",le="0.025"} 1' in text
+    assert 'parslet_task_duration_seconds_bucket{task="load",le="10.0"} 2' in text
+    assert 'parslet_task_duration_seconds_bucket{task="load",le="300.0"} 2' in text
+    assert 'parslet_task_duration_seconds_bucket{task="load",le="+Inf"} 3' in text
+    assert 'parslet_task_duration_seconds_count{task="load"} 3' in text
+    assert 'parslet_tasks_finished_total{status="FAILED"} 1' in text
+    assert "parslet_cache_hits_total 1" in text
+    assert "parslet_cache_hit_ratio 0.333" in text
+    assert "# TYPE parslet_task_duration_seconds histogram" in text
+
+
+def test_metrics_server_404_and_stop():
+    server = MetricsServer(lambda: "up 1\n", port=0)
+    server.start()
+    try:
+        with urllib.request.urlopen(f"http://127.0.0.1:{server.port}/") as resp:
+            assert resp.read() == b"up 1\n"
+        try:
+            urllib.request.urlopen(f"http://127.0.0.1:{server.port}/other")
+        except urllib.error.HTTPError as e:
+            assert e.code == 404
+        else:  # pragma: no cover - must not happen
+            raise AssertionError("expected 404")
+    finally:
+        server.stop()
+
+
+def test_runner_serves_metrics_during_run():
+    port = find_free_port(18300)
+    runner = DAGRunner(max_workers=2, serve_metrics=True, monitor_port=port)
+    assert runner.monitor_port == port
+    first = inc(inc(1))
+    fut = scrape(runner.monitor_port, first)
+    dag = DAG()
+    dag.build_dag([fut])
+    runner.run(dag)
+    content_type, text = fut.result()
+    assert content_type.startswith("text/plain; version=0.0.4")
+    assert 'parslet_task_duration_seconds_count{task="inc"} 2' in text
+    assert 'parslet_tasks{status="SUCCESS"} 2' in text
+    assert 'parslet_tasks{status="RUNNING"} 1' in text
+    assert "parslet_active_workers 1" in text
+    assert "parslet_pool_size" in text
+    # The server only lives as long as the run.
+    try:
+        urllib.request.urlopen(f"http://127.0.0.1:{runner.monitor_port}/", timeout=1)
+    except OSError:
+        pass
+    else:  # pragma: no cover - must not happen
+        raise AssertionError("metrics server still running")
@@ -0,0 +1,120 @@
+import time
+from importlib import import_module
+
+from rich.console import Console
+
+from parslet.core import DAG, DAGRunner, parslet_task
+from parslet.core.events import Event, EventType
+from parslet.core.monitor import RunMonitor
+
+
+@parslet_task
+def mon_inc(x):
+    return x + 1
+
+
+@parslet_task
+def mon_fail(x):
+    raise RuntimeError("nope")
+
+
+def _event(kind, task_id=None, name=None, duration=None):
+    return Event(kind, time.time(), task_id, name, duration)
+
+
+def test_counts_and_running_tasks():
+    monitor = RunMonitor(total=lambda: 5, top=2)
+    monitor.handle(_event(EventType.TASK_SUBMITTED, "a_1", "a"))
+    monitor.handle(_event(EventType.TASK_SUBMITTED, "a_2", "a"))
+    monitor.handle(_event(EventType.TASK_SUBMITTED, "b_1", "b"))
+    monitor.handle(_event(EventType.TASK_SUCCEEDED, "a_1", "a", 0.5))
+    monitor.handle(_event(EventType.TASK_FAILED, "a_2", "a", 1.5))
+    monitor.handle(_event(EventType.CACHE_HIT, "c_1", "c"))
+
+    snap = monitor.snapshot()
+    assert snap["total"] == 5
+    assert snap["succeeded"] == 1
+    assert snap["failed"] == 1
+    assert snap["cached"] == 1
+    assert snap["running"] == 1
+    assert snap["pending"] == 1
+    assert [tid for tid, _, _ in snap["slowest"]] == ["b_1"]
+    assert list(snap["by_name"]) == ["a", "b"]
+    assert snap["by_name"]["a"]["mean_s"] == 1.0
+    assert snap["throughput"] > 0
+    assert snap["eta_s"] is not None
+
+
+def test_slowest_lists_longest_running_first():
+    monitor = RunMonitor(top=2)
+    for i in range(4):
+        monitor.handle(_event(EventType.TASK_SUBMITTED, f"t{i}", "t"))
+    assert [tid for tid, _, _ in monitor.snapshot()["slowest"]] == ["t0", "t1"]
+
+
+def test_render_is_bounded_by_top():
+    monitor = RunMonitor(total=lambda: 10_000, top=3)
+    for i in range(10_000):
+        monitor.handle(_event(EventType.TASK_SUBMITTED, f"t{i}", f"name{i % 50}"))
+    console = Console(width=120, record=True)
+    console.print(monitor.render())
+    text = console.export_text()
+    assert "47 more task name(s)" in text
+    assert "t0" in text and "t2" in text
+    assert "t9999" not in text
+
+
+def test_monitor_follows_runner_events():
+    futures = [mon_inc(i) for i in range(4)] + [mon_fail(0)]
+    dag = DAG()
+    dag.build_dag(futures)
+    runner = DAGRunner(max_workers=2)
+    monitor = RunMonitor(total=lambda: len(dag.tasks))
+    runner.events.subscribe(monitor)
+    runner.run(dag)
+    snap = monitor.snapshot()
+    assert snap["succeeded"] == 4
+    assert snap["failed"] == 1
+    assert snap["running"] == 0
+    assert snap["pending"] == 0
+
+
+def test_cli_monitor(tmp_path, monkeypatch, capsys):
+    wf = tmp_path / "wf.py"
+    wf.write_text(
+        "from parslet.core import parslet_task\n"
+        "@parslet_task\n"
+        "def one():\n"
+        "    return 1\n"
+        "def main():\n"
+        "    return [one(), one()]\n"
+    )
+    monkeypatch.setenv("PARSLET_NO_STATS", "1")
+    module = import_module("parslet.main_cli")
+    monkeypatch.setattr(module.sys, "argv", ["parslet", "run", str(wf), "--monitor"])
+    module.main()
+    out = capsys.readouterr().out
+    assert "2/2 done" in out
+    assert "Tasks by name" in out
+
+
+def test_later_fused_chain_stages_show_as_running():
+    last = mon_inc(mon_inc(mon_inc(0)))
+    dag = DAG()
+    dag.build_dag([last])
+    assert len(dag.fuse_linear_chains()) == 1
+    runner = DAGRunner(max_workers=1)
+    runner.run(dag)
+    events = runner.events.recent()
+    cut = next(
+        i
+        for i, e in enumerate(events)
+        if e.type is EventType.TASK_SUCCEEDED and e.task_id == last.task_id
+    )
+    monitor = RunMonitor(total=lambda: len(dag.tasks))
+    for event in events[:cut]:
+        monitor.handle(event)
+    snap = monitor.snapshot()
+    assert snap["succeeded"] == 2
+    assert snap["running"] == 1
+    assert [tid for tid, _, _ in snap["slowest"]] == [last.task_id]
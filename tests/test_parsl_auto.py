@@ -34,3 +34,43 @@ def test_cli_run_exports_parsl(tmp_path: Path, monkeypatch) -> None:
     exported = tmp_path / "wf_parsl_parslet_export.py"
     assert exported.exists()
     assert "@python_app" in exported.read_text()
+
+
+def test_translation_is_cached_by_source_hash(tmp_path: Path, monkeypatch) -> None:
+    from parslet.compat import parsl_adapter
+
+    cache_dir = tmp_path / "compiled"
+    monkeypatch.setenv("PARSLET_COMPILE_CACHE_DIR", str(cache_dir))
+    calls = []
+    original = parsl_adapter.import_parsl_script
+
+    def counting(src: str, dest: str) -> None:
+        calls.append(src)
+        original(src, dest)
+
+    monkeypatch.setattr(parsl_adapter, "import_parsl_script", counting)
+    wf = tmp_path / "wf_cached.py"
+    wf.write_text(
+        "from parsl import python_app\n"
+        "@python_app\n"
+        "def a():\n    return 1\n"
+        "x = a()\n"
+    )
+
+    first = load_workflow_module(str(wf))
+    second = load_workflow_module(str(wf))
+    assert len(calls) == 1
+    assert first.__file__ == second.__file__
+    assert list(cache_dir.glob("*_parslet.py")) == [Path(first.__file__)]
+
+    wf.write_text(
+        "from parsl import python_app\n"
+        "@python_app\n"
+        "def a():\n    return 2\n"
+        "x = a()\n"
+    )
+    third = load_workflow_module(str(wf))
+    assert len(calls) == 2
+    # The stale translation is replaced, not accumulated.
+    assert list(cache_dir.glob("*_parslet.py")) == [Path(third.__file__)]
+    assert not list(cache_dir.glob("*.tmp"))
@@ -24,6 +24,9 @@ def make_stub_parsl():
     parsl_mod = types.ModuleType("parsl")
 
     def python_app(func=None, *, executor=None):
+        parsl_mod.apps_created += 1
+        parsl_mod.app_funcs.append(func)
+
         def wrapper(*args, **kwargs):
             resolved_args = [
                 a.result() if isinstance(a, DummyFuture) else a for a in args
@@ -66,6 +69,8 @@ def make_stub_parsl():
     threads_mod.ThreadPoolExecutor = ThreadPoolExecutor
     executors_mod.threads = threads_mod
 
+    parsl_mod.apps_created = 0
+    parsl_mod.app_funcs = []
     parsl_mod.python_app = python_app
     parsl_mod.config = config_mod
     parsl_mod.executors = executors_mod
@@ -132,6 +137,57 @@ def test_execute_with_parsl_creates_run_dir(stub_parsl):
         shutil.rmtree(config.run_dir)
 
 
+def test_execute_with_parsl_resolves_nested_futures(stub_parsl):
+    @parslet_task
+    def num(x):
+        return x
+
+    @parslet_task
+    def combine(values, extra):
+        return sum(values) + extra["bonus"]
+
+    fut = combine([num(1), num(2), num(3)], {"bonus": num(10)})
+    assert execute_with_parsl([fut]) == [16]
+
+
+def test_conversion_is_memoized_per_function(stub_parsl):
+    @parslet_task
+    def bump(x):
+        return x + 1
+
+    fut = bump(0)
+    for _ in range(50):
+        fut = bump(fut)
+    assert execute_with_parsl([fut]) == [51]
+    assert stub_parsl.apps_created == 1
+    assert convert_task_to_parsl(bump._parslet_original_func) is convert_task_to_parsl(
+        bump._parslet_original_func
+    )
+
+
+def test_app_cache_does_not_keep_functions_alive(stub_parsl):
+    import gc
+    import weakref
+
+    def square(x):
+        return x * x
+
+    app = convert_task_to_parsl(square)
+    assert app(3).result() == 9
+    assert convert_task_to_parsl(square) is app
+    # Process-based executors pickle the app, which weak references break.
+    (body,) = stub_parsl.app_funcs
+    cells = [cell.cell_contents for cell in body.__closure__]
+    assert square in cells
+    assert not any(isinstance(c, weakref.ReferenceType) for c in cells)
+
+    ref = weakref.ref(square)
+    stub_parsl.app_funcs.clear()
+    del app, body, cells, square
+    gc.collect()
+    assert ref() is None
+
+
 def test_parsl_python_runs_under_parsl(stub_parsl):
     @parsl_python
     def add(x, y):
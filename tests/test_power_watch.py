@@ -0,0 +1,158 @@
+import asyncio
+import threading
+
+from parslet.utils import power
+from parslet.utils.power import PowerState, PowerWatcher
+
+
+class FakeSource:
+    def __init__(self, *states: PowerState) -> None:
+        self.states = list(states)
+        self.calls = 0
+
+    def __call__(self) -> PowerState:
+        self.calls += 1
+        if len(self.states) > 1:
+            return self.states.pop(0)
+        return self.states[0]
+
+
+def battery(percent: int, temp: float | None = None) -> PowerState:
+    return PowerState(source="battery", percent=percent, temperature_c=temp, ts=1.0)
+
+
+def test_selector_remembers_working_provider(monkeypatch):
+    calls = {"termux": 0, "psutil": 0}
+
+    def termux():
+        calls["termux"] += 1
+        return None
+
+    def psutil_provider():
+        calls["psutil"] += 1
+        return battery(50)
+
+    monkeypatch.setattr(power, "_PROVIDERS", [termux, psutil_provider])
+    monkeypatch.setattr(power, "_add_thermal", lambda s: s)
+    selector = power._ProviderSelector()
+    for _ in range(5):
+        assert selector.sample().percent == 50
+    assert calls == {"termux": 1, "psutil": 5}
+
+
+def test_selector_keeps_last_reading_through_transient_failures(monkeypatch):
+    answers = [battery(50), None, None, None, None]
+
+    def flaky():
+        return answers.pop(0) if answers else None
+
+    monkeypatch.setattr(power, "_PROVIDERS", [flaky])
+    monkeypatch.setattr(power, "_add_thermal", lambda s: s)
+    selector = power._ProviderSelector(retry_s=300, max_failures=3)
+    first = selector.sample()
+    assert [selector.sample().percent for _ in range(2)] == [50, 50]
+    assert selector.sample().source == "unknown"
+    assert selector.provider is None
+    assert first.ts == 1.0
+
+
+def test_selector_backs_off_when_nothing_works(monkeypatch):
+    calls = []
+    monkeypatch.setattr(power, "_PROVIDERS", [lambda: calls.append(1)])
+    monkeypatch.setattr(power, "_add_thermal", lambda s: s)
+    selector = power._ProviderSelector(retry_s=300)
+    for _ in range(3):
+        assert selector.sample().source == "unknown"
+    assert len(calls) == 1
+
+
+def test_latest_reuses_fresh_reading():
+    source = FakeSource(battery(80))
+    watcher = PowerWatcher(sample=source)
+    assert watcher.latest(max_age_s=60).percent == 80
+    watcher.latest(max_age_s=60)
+    assert source.calls == 1
+    watcher.latest(max_age_s=0)
+    assert source.calls == 2
+
+
+def test_subscribers_only_see_meaningful_changes():
+    source = FakeSource(
+        battery(80, 40.0),
+        battery(80, 40.4),
+        battery(79, 40.4),
+        battery(79, 42.0),
+        PowerState(source="ac", percent=79, temperature_c=42.0, ts=1.0),
+    )
+    watcher = PowerWatcher(sample=source)
+    first, second = [], []
+    watcher.subscribe(first.append)
+    unsubscribe = watcher.subscribe(second.append)
+    for _ in range(5):
+        watcher.poll()
+    assert [(s.percent, s.temperature_c, s.source) for s in first] == [
+        (80, 40.0, "battery"),
+        (79, 40.4, "battery"),
+        (79, 42.0, "battery"),
+        (79, 42.0, "ac"),
+    ]
+    assert second == first
+    unsubscribe()
+    watcher.poll()
+    assert len(second) == 4
+
+
+def test_thread_runs_while_any_consumer_is_registered():
+    polled = threading.Event()
+
+    def sample() -> PowerState:
+        polled.set()
+        return battery(60)
+
+    watcher = PowerWatcher(interval_s=60, sample=sample)
+    watcher.start(0.01)
+    with watcher.running(30):
+        assert polled.wait(2)
+        assert watcher.interval == 0.01
+        watcher.stop(0.01)
+        assert watcher.interval == 30
+        assert watcher._thread is not None
+    assert watcher._thread is None
+
+
+def test_async_changes():
+    source = FakeSource(battery(90), battery(90), battery(85))
+    watcher = PowerWatcher(sample=source)
+
+    async def collect() -> list[int | None]:
+        seen = []
+        async for state in watcher.changes(interval_s=0.01):
+            seen.append(state.percent)
+            if len(seen) == 2:
+                break
+        return seen
+
+    assert asyncio.run(collect()) == [90, 85]
+    assert watcher._thread is None
+
+
+def test_subscribers_may_use_the_watcher():
+    source = FakeSource(battery(80), battery(70))
+    watcher = PowerWatcher(sample=source)
+    seen = []
+
+    def on_change(state: PowerState) -> None:
+        seen.append(state.percent)
+        if len(seen) == 1:
+            watcher.latest(max_age_s=0)
+
+    watcher.subscribe(on_change)
+    done = threading.Event()
+
+    def poll() -> None:
+        watcher.poll()
+        done.set()
+
+    threading.Thread(target=poll, daemon=True).start()
+    assert done.wait(2), "subscriber sampling the watcher deadlocked"
+    assert seen == [80, 70]
@@ -0,0 +1,143 @@
+import linecache
+import pstats
+import threading
+import time
+from importlib import import_module
+
+import pytest
+
+from parslet.core import DAG, DAGRunner, parslet_task
+from parslet.core.profiling import TaskProfiler
+
+
+def _busy(n):
+    return sum(i * i for i in range(n))
+
+
+@parslet_task
+def prof_square(n):
+    return _busy(n)
+
+
+@parslet_task
+def prof_alloc(n):
+    return [bytes(1024) for _ in range(n)]
+
+
+@parslet_task(profile=True)
+def prof_flagged(n):
+    return _busy(n)
+
+
+@parslet_task(profile="mem")
+def prof_flagged_mem(n):
+    return [bytes(2048) for _ in range(n)]
+
+
+def _run(futures, **kwargs):
+    dag = DAG()
+    dag.build_dag(futures)
+    runner = DAGRunner(max_workers=1, **kwargs)
+    runner.run(dag)
+    return runner
+
+
+def test_cpu_profiles_are_merged_per_task(tmp_path):
+    runner = _run([prof_square(1000), prof_square(2000)], profile="cpu")
+    stats = runner.profiler.cpu_stats("prof_square")
+    assert stats is not None
+    assert any(func[2] == "_busy" for func in stats.stats)
+    calls = next(v[1] for k, v in stats.stats.items() if k[2] == "_busy")
+    assert calls == 2
+
+    written = runner.profiler.save(tmp_path)
+    names = {p.name for p in written}
+    assert {"cpu.pstats", "cpu-prof_square.pstats", "cpu.txt"} <= names
+    merged = pstats.Stats(str(tmp_path / "cpu.pstats"))
+    assert any(func[2] == "_busy" for func in merged.stats)
+    assert "=== prof_square ===" in (tmp_path / "cpu.txt").read_text()
+
+
+def test_concurrent_cpu_profiles_run_one_at_a_time(monkeypatch):
+    from parslet.core import profiling
+
+    # Behave as on Python 3.12+, where cProfile is process-wide.
+    monkeypatch.setattr(profiling, "_PROCESS_WIDE_CPU_PROFILER", True)
+    profiler = TaskProfiler("cpu")
+    active = []
+    peak = []
+
+    def task(n):
+        active.append(n)
+        peak.append(len(active))
+        time.sleep(0.02)
+        result = _busy(n)
+        active.remove(n)
+        return result
+
+    threads = [
+        threading.Thread(target=profiler.execute, args=(task, [1000 + i], {}))
+        for i in range(4)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert max(peak) == 1
+    stats = profiler.cpu_stats("task")
+    assert next(v[1] for k, v in stats.stats.items() if k[2] == "_busy") == 4
+
+
+def test_memory_profile_reports_top_allocations(tmp_path):
+    runner = _run([prof_alloc(500)], profile="mem")
+    summary = runner.profiler.memory_summary()["prof_alloc"]
+    assert summary["calls"] == 1
+    assert summary["peak_bytes"] >= 500 * 1024
+    location, size = summary["top_allocations"][0]
+    filename, line = location.rsplit(":", 1)
+    assert "bytes(1024)" in linecache.getline(filename, int(line))
+    assert size >= 500 * 1024
+    runner.profiler.save(tmp_path)
+    assert "=== prof_alloc ===" in (tmp_path / "memory.txt").read_text()
+
+
+def test_only_flagged_tasks_without_run_mode():
+    runner = _run(
+        [prof_square(100), prof_flagged(100), prof_flagged_mem(10)],
+    )
+    assert runner.profiler.cpu_stats("prof_square") is None
+    assert runner.profiler.cpu_stats("prof_flagged") is not None
+    assert set(runner.profiler.memory_summary()) == {"prof_flagged_mem"}
+
+
+def test_no_profiling_by_default():
+    runner = _run([prof_square(10)])
+    assert not runner.profiler.has_results
+
+
+def test_invalid_modes_rejected():
+    with pytest.raises(ValueError):
+        TaskProfiler("gpu")
+    with pytest.raises(ValueError):
+
+        @parslet_task(profile="disk")
+        def prof_bad():
+            return None
+
+
+def test_cli_profile_writes_reports(tmp_path, monkeypatch):
+    monkeypatch.setenv("PARSLET_NO_STATS", "1")
+    wf = tmp_path / "wf_profile.py"
+    wf.write_text(
+        "from parslet import parslet_task\n"
+        "@parslet_task\n"
+        "def count(n):\n    return sum(range(n))\n"
+        "def main():\n    return [count(10000)]\n"
+    )
+    out = tmp_path / "prof"
+    module = import_module("parslet.main_cli")
+    argv = ["parslet", "run", str(wf), "--profile", "cpu", "--profile-dir", str(out)]
+    monkeypatch.setattr(module.sys, "argv", argv)
+    module.main()
+    assert (out / "cpu.pstats").exists()
+    assert "=== count ===" in (out / "cpu.txt").read_text()
@@ -1,4 +1,6 @@
-from parslet.core import DAG, DAGRunner, parslet_task
+import pytest
+
+from parslet.core import DAG, DAGRunner, UpstreamTaskFailedError, parslet_task
 
 
 @parslet_task
@@ -14,3 +16,120 @@ def test_runner_executes_tasks():
     runner = DAGRunner(max_workers=1)
     runner.run(dag)
     assert a.result() == 3
+
+
+@parslet_task
+def gather(items, lookup):
+    return [items, lookup]
+
+
+def test_runner_resolves_nested_futures():
+    a = add(1, 2)
+    b = add(a, 1)
+    literal = list(range(5))
+    fut = gather((a, [b, 7]), {"b": b, "raw": literal})
+    dag = DAG()
+    dag.build_dag([fut])
+    runner = DAGRunner(max_workers=2)
+    runner.run(dag)
+    items, lookup = fut.result()
+    assert items == (3, [4, 7])
+    assert lookup["b"] == 4
+    # Containers without futures are passed through untouched.
+    assert lookup["raw"] is literal
+
+
+@parslet_task
+def stage(x):
+    import threading
+
+    return x + [threading.get_ident()]
+
+
+@parslet_task
+def explode(x):
+    raise ValueError("boom")
+
+
+def test_fused_chain_runs_in_one_worker_and_keeps_per_task_stats():
+    first = stage([])
+    second = stage(first)
+    third = stage(second)
+    broken = explode(stage([]))
+    after = stage(broken)
+    dag = DAG()
+    dag.build_dag([third, after])
+    chains = dag.fuse_linear_chains()
+    assert [first.task_id, second.task_id, third.task_id] in chains
+    runner = DAGRunner(max_workers=2)
+    runner.run(dag)
+
+    assert len(set(third.result())) == 1
+    bench = runner.get_task_benchmarks()
+    for fut in (first, second, third):
+        assert bench[fut.task_id]["status"] == "SUCCESS"
+        assert bench[fut.task_id]["execution_time_s"] is not None
+    assert bench[broken.task_id]["status"] == "FAILED"
+    assert bench[after.task_id]["status"] == "SKIPPED"
+    with pytest.raises(UpstreamTaskFailedError) as excinfo:
+        after.result()
+    assert excinfo.value.original_failure_task_id == broken.task_id
+    assert isinstance(excinfo.value.original_exception, ValueError)
+
+
+@parslet_task(dynamic=True)
+def split(n):
+    # The number of follow-up tasks is only known at run time.
+    return [add(i, i) for i in range(n)]
+
+
+@parslet_task(dynamic=True)
+def split_nested(n):
+    return {"parts": split(n), "bad": explode(n) if n < 0 else None}
+
+
+@parslet_task
+def total(values):
+    return sum(values)
+
+
+def test_dynamic_task_spawns_tasks_at_run_time():
+    parts = split(4)
+    result = total(parts)
+    nested = split_nested(2)
+    dag = DAG()
+    dag.build_dag([result, nested])
+    assert len(dag.tasks) == 3
+    runner = DAGRunner(max_workers=1)
+    runner.run(dag)
+
+    assert parts.result() == [0, 2, 4, 6]
+    assert result.result() == 12
+    assert nested.result() == {"parts": [0, 2], "bad": None}
+    assert len(dag.tasks) == 3 + 4 + 1 + 2
+    bench = runner.get_task_benchmarks()
+    assert all(b["status"] == "SUCCESS" for b in bench.values())
+
+
+def test_dynamic_task_fails_when_spawned_task_fails():
+    parent = split_nested(-1)
+    dag = DAG()
+    dag.build_dag([parent])
+    DAGRunner(max_workers=2).run(dag)
+    with pytest.raises(UpstreamTaskFailedError) as excinfo:
+        parent.result()
+    assert isinstance(excinfo.value.original_exception, ValueError)
+
+
+def test_runner_reuses_supplied_executor():
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        for value in (1, 2):
+            fut = add(value, 1)
+            dag = DAG()
+            dag.build_dag([fut])
+            DAGRunner(max_workers=2, check_network=False).run(dag, executor=pool)
+            assert fut.result() == value + 1
+        # The runner must leave a supplied pool running.
+        assert pool.submit(lambda: "alive").result() == "alive"
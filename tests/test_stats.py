@@ -0,0 +1,104 @@
+from importlib import import_module
+from pathlib import Path
+
+import pytest
+
+from parslet.core import DAG, AdaptiveScheduler, DAGRunner, TaskStatsStore, parslet_task
+from parslet.core.stats import get_stats_path
+
+
+@parslet_task
+def quick(x):
+    return x
+
+
+@parslet_task
+def join(*xs):
+    return sum(xs)
+
+
+def test_stats_store_round_trip(tmp_path: Path) -> None:
+    path = tmp_path / "stats.json"
+    store = TaskStatsStore(path)
+    store.record("quick", 1.0)
+    store.record("quick", 3.0)
+    store.save()
+
+    reloaded = TaskStatsStore(path)
+    assert reloaded.estimate("quick") == pytest.approx(2.0)
+    assert reloaded.entries["quick"]["count"] == 2
+    assert reloaded.estimate("missing") is None
+
+
+def test_critical_path_and_longest_path_first_order() -> None:
+    short = quick(1)
+    long_a = quick(2)
+    long_b = quick(long_a)
+    end = join(short, long_b)
+    dag = DAG()
+    dag.build_dag([end])
+    durations = {short.task_id: 1.0, long_a.task_id: 5.0, long_b.task_id: 5.0}
+
+    path, total = dag.critical_path(durations)
+    assert path == [long_a.task_id, long_b.task_id, end.task_id]
+    assert total == pytest.approx(11.0)
+
+    order = AdaptiveScheduler().schedule(dag, durations)
+    assert order[0] == long_a.task_id
+    assert order[-1] == end.task_id
+
+
+def test_runner_records_durations(tmp_path: Path) -> None:
+    store = TaskStatsStore(tmp_path / "stats.json")
+    fut = join(quick(1), quick(2))
+    dag = DAG()
+    dag.build_dag([fut])
+    DAGRunner(max_workers=1, stats_store=store).run(dag)
+    assert fut.result() == 3
+    reloaded = TaskStatsStore(tmp_path / "stats.json")
+    assert reloaded.entries["quick"]["count"] == 2
+    assert reloaded.entries["join"]["count"] == 1
+
+
+def test_cli_simulate_prints_estimate(tmp_path: Path, monkeypatch, capsys) -> None:
+    monkeypatch.setenv("PARSLET_STATS_FILE", str(tmp_path / "stats.json"))
+    wf = tmp_path / "wf_estimate.py"
+    wf.write_text(
+        "from parslet import parslet_task\n"
+        "@parslet_task\n"
+        "def one():\n    return 1\n"
+        "def main():\n    return [one()]\n"
+    )
+    module = import_module("parslet.main_cli")
+    monkeypatch.setattr(module.sys, "argv", ["parslet", "run", str(wf), "--simulate"])
+    module.main()
+    out = capsys.readouterr().out
+    assert "No runtime estimate available" in out
+    assert "Expected makespan" not in out
+
+    store = TaskStatsStore(tmp_path / "stats.json")
+    store.record("one", 0.5)
+    store.save()
+    module.main()
+    out = capsys.readouterr().out
+    assert "Critical path (1 tasks, 0.50s)" in out
+    assert "Expected makespan" in out
+
+
+def test_stats_location_and_opt_out(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.delenv("PARSLET_STATS_FILE", raising=False)
+    monkeypatch.delenv("PARSLET_NO_STATS", raising=False)
+    monkeypatch.setenv("PARSLET_HISTORY_DB", str(tmp_path / "hist" / "h.db"))
+    assert get_stats_path() == tmp_path / "hist" / "task_stats.json"
+
+    wf = tmp_path / "wf_no_stats.py"
+    wf.write_text(
+        "from parslet import parslet_task\n"
+        "@parslet_task\n"
+        "def one():\n    return 1\n"
+        "def main():\n    return [one()]\n"
+    )
+    module = import_module("parslet.main_cli")
+    monkeypatch.setattr(module.sys, "argv", ["parslet", "run", str(wf), "--no-stats"])
+    module.main()
+    assert not (tmp_path / "hist").exists()
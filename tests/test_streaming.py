@@ -0,0 +1,151 @@
+import json
+import threading
+
+import pytest
+
+from parslet.core import (
+    DAG,
+    DAGRunner,
+    TaskStream,
+    UpstreamTaskFailedError,
+    parslet_task,
+)
+
+progress = {"produced": 0, "consumed": 0, "max_ahead": 0}
+lock = threading.Lock()
+
+
+@parslet_task(stream=True, stream_buffer=2)
+def numbers(n):
+    for i in range(n):
+        with lock:
+            progress["produced"] += 1
+            ahead = progress["produced"] - progress["consumed"]
+            progress["max_ahead"] = max(progress["max_ahead"], ahead)
+        yield i
+
+
+@parslet_task
+def consume(items):
+    assert isinstance(items, TaskStream)
+    total = 0
+    for value in items:
+        with lock:
+            progress["consumed"] += 1
+        total += value
+    return total
+
+
+@parslet_task(stream=True)
+def broken_numbers(n):
+    yield 1
+    raise ValueError("decoder crashed")
+
+
+@parslet_task
+def take_first(items):
+    return next(iter(items))
+
+
+def test_stream_items_flow_with_bounded_buffer():
+    producer = numbers(50)
+    total = consume(producer)
+    dag = DAG()
+    dag.build_dag([total])
+    assert dag.fuse_linear_chains() == []
+    runner = DAGRunner(max_workers=1)
+    runner.run(dag)
+
+    assert total.result() == sum(range(50))
+    assert producer.result() == 50
+    # Buffer of two, plus the item in hand on each side.
+    assert progress["max_ahead"] <= 4
+    assert runner.get_task_benchmarks()[producer.task_id]["status"] == "SUCCESS"
+
+
+@parslet_task
+def combine(items, total):
+    return sum(items) + total
+
+
+def test_consumer_waiting_on_a_sibling_does_not_stall_the_producer():
+    producer = numbers(50)
+    first = consume(producer)
+    second = combine(producer, first)
+    dag = DAG()
+    dag.build_dag([second])
+    done = threading.Event()
+
+    def run():
+        DAGRunner(max_workers=2).run(dag)
+        done.set()
+
+    threading.Thread(target=run, daemon=True).start()
+    assert done.wait(10), "diamond over a streaming task deadlocked"
+    assert second.result() == 2 * sum(range(50))
+
+
+def test_stream_failure_reaches_consumer():
+    producer = broken_numbers(3)
+    total = consume(producer)
+    dag = DAG()
+    dag.build_dag([total])
+    runner = DAGRunner(max_workers=2)
+    runner.run(dag)
+
+    with pytest.raises(ValueError):
+        producer.result()
+    with pytest.raises(UpstreamTaskFailedError) as excinfo:
+        total.result()
+    assert excinfo.value.original_failure_task_id == producer.task_id
+
+
+def test_producer_stops_when_consumers_stop_reading():
+    producer = numbers(10_000)
+    first = take_first(producer)
+    dag = DAG()
+    dag.build_dag([first])
+    DAGRunner(max_workers=1).run(dag)
+
+    assert first.result() == 0
+    assert producer.result() < 10_000
+
+
+def test_stream_buffer_must_be_positive():
+    with pytest.raises(ValueError):
+
+        @parslet_task(stream=True, stream_buffer=0, name="bad_stream_buffer")
+        def bad():
+            yield 1
+
+
+@parslet_task(cache=True)
+def cached_sum(items):
+    return sum(items)
+
+
+def test_stream_consumers_bypass_the_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("PARSLET_CACHE_DIR", str(tmp_path))
+    total = cached_sum(numbers(5))
+    dag = DAG()
+    dag.build_dag([total])
+    runner = DAGRunner(max_workers=2)
+    runner.run(dag)
+
+    assert total.result() == 10
+    assert not runner.cache_hits
+    assert not list(tmp_path.iterdir())
+
+
+def test_checkpointed_producer_reruns_for_pending_consumers(tmp_path):
+    producer = numbers(4)
+    total = consume(producer)
+    checkpoint = tmp_path / "ckpt.json"
+    checkpoint.write_text(json.dumps({producer.task_id: "SUCCESS"}))
+    dag = DAG()
+    dag.build_dag([total])
+    runner = DAGRunner(max_workers=2, checkpoint_file=str(checkpoint))
+    runner.run(dag)
+
+    assert producer.result() == 4
+    assert total.result() == 6
@@ -0,0 +1,165 @@
+import json
+from importlib import import_module
+from pathlib import Path
+
+import pytest
+
+from parslet.core import DAGRunner, WorkflowTemplate, parslet_task, run_sweep
+from parslet.core.runner import UpstreamTaskFailedError
+from parslet.core.sweep import SweepTemplateError, load_parameter_sets
+
+CALLS = {"model": 0, "setup": 0}
+
+
+@parslet_task(pure=True)
+def load_model():
+    CALLS["model"] += 1
+    return 10
+
+
+@parslet_task
+def setup():
+    CALLS["setup"] += 1
+
+
+@parslet_task
+def score(model, image):
+    if image == "bad":
+        raise ValueError("unreadable image")
+    return model + len(image)
+
+
+@parslet_task
+def report(scores):
+    return sum(scores)
+
+
+def workflow(image):
+    model = load_model()
+    first = score(model, image)
+    return [report([first, score(model, [image, "x"])])]
+
+
+def test_template_shares_parameter_free_tasks():
+    template = WorkflowTemplate(workflow, ["image"])
+    assert len(template.dag.tasks) == 4
+    assert len(template.shared) == 1
+    (a,) = template.instantiate({"image": "ab"}, "0")
+    (b,) = template.instantiate({"image": "abc"}, "1")
+    assert a.task_id.endswith("@0") and b.task_id.endswith("@1")
+    assert a.kwargs == {} and a.args[0][0].args[1] == "ab"
+    # The parameter-free load_model future is the same object in both.
+    assert a.args[0][0].args[0] is b.args[0][0].args[0]
+    with pytest.raises(ValueError, match="image"):
+        template.instantiate({}, "2")
+
+
+def test_run_sweep_runs_all_instances_on_one_runner():
+    CALLS["model"] = 0
+    params = [{"image": "a"}, {"image": "bad"}, {"image": "abcd"}]
+    result = run_sweep(workflow, params, runner=DAGRunner(max_workers=2))
+    assert CALLS["model"] == 1
+    assert result.results(0) == [11 + 12]
+    assert result.results(2) == [14 + 12]
+    assert isinstance(result.error(1), Exception)
+    with pytest.raises(UpstreamTaskFailedError, match="unreadable"):
+        result.results(1)
+    summary = result.summary()
+    assert summary["instances"] == 3
+    assert summary["succeeded"] == 2
+    assert summary["shared_tasks"] == 1
+    assert summary["per_task"]["load_model"]["count"] == 1
+    assert summary["per_task"]["score"]["count"] == 6
+
+
+def setup_workflow(image):
+    return [setup(), score(load_model(), image)]
+
+
+def test_impure_parameter_free_tasks_run_per_instance():
+    CALLS["model"] = CALLS["setup"] = 0
+    template = WorkflowTemplate(setup_workflow, ["image"])
+    assert {template.dag.tasks[t].func.__name__ for t in template.shared} == {
+        "load_model"
+    }
+    result = run_sweep(setup_workflow, [{"image": "a"}, {"image": "bc"}])
+    assert CALLS == {"model": 1, "setup": 2}
+    assert result.results(1) == [None, 12]
+
+
+def branching_workflow(mode):
+    if mode == "fast":
+        return [load_model()]
+    return [score(load_model(), mode)]
+
+
+def test_run_sweep_falls_back_when_main_inspects_parameters():
+    with pytest.raises(SweepTemplateError):
+        WorkflowTemplate(branching_workflow, ["mode"])
+    result = run_sweep(branching_workflow, [{"mode": "fast"}, {"mode": "slow"}])
+    assert result.results(0) == [10]
+    assert result.results(1) == [14]
+
+
+def test_load_parameter_sets(tmp_path: Path):
+    (tmp_path / "p.csv").write_text("image,label\na.png,1\nb.png,2\n")
+    (tmp_path / "p.jsonl").write_text('{"image": "a.png"}\n\n{"image": "b.png"}\n')
+    (tmp_path / "p.json").write_text('[{"image": "a.png"}]')
+    (tmp_path / "bad.json").write_text('{"image": "a.png"}')
+    assert load_parameter_sets(tmp_path / "p.csv")[1] == {
+        "image": "b.png",
+        "label": "2",
+    }
+    assert len(load_parameter_sets(tmp_path / "p.jsonl")) == 2
+    assert load_parameter_sets(tmp_path / "p.json") == [{"image": "a.png"}]
+    with pytest.raises(ValueError):
+        load_parameter_sets(tmp_path / "bad.json")
+
+
+def test_cli_sweep_writes_results(tmp_path: Path, monkeypatch, capsys):
+    monkeypatch.setenv("PARSLET_NO_STATS", "1")
+    wf = tmp_path / "wf_sweep.py"
+    wf.write_text(
+        "from parslet import parslet_task\n"
+        "@parslet_task\n"
+        "def square(x):\n    return x * x\n"
+        "def main(x):\n    return [square(x)]\n"
+    )
+    params = tmp_path / "params.jsonl"
+    params.write_text('{"x": 2}\n{"x": 3}\n')
+    out = tmp_path / "out.jsonl"
+    stats = tmp_path / "stats.json"
+    module = import_module("parslet.main_cli")
+    argv = ["parslet", "sweep", str(wf), "--params", str(params)]
+    argv += ["--out", str(out), "--export-stats", str(stats)]
+    monkeypatch.setattr(module.sys, "argv", argv)
+    module.main()
+    assert "2/2 instance(s) succeeded" in capsys.readouterr().out
+    records = [json.loads(line) for line in out.read_text().splitlines()]
+    assert [r["results"] for r in records] == [[4], [9]]
+    assert json.loads(stats.read_text())["per_task"]["square"]["count"] == 2
+
+
+def test_cli_sweep_module_without_file(tmp_path: Path, monkeypatch, capsys):
+    import types
+
+    import parslet.cli
+    from parslet.security.defcon import Defcon
+
+    monkeypatch.setenv("PARSLET_NO_STATS", "1")
+    mod = types.ModuleType("wf_no_file")
+    mod.__file__ = None
+    mod.main = workflow
+    monkeypatch.setattr(parslet.cli, "load_workflow_module", lambda path: mod)
+    scanned = []
+    monkeypatch.setattr(
+        Defcon, "scan_code", staticmethod(lambda paths: scanned.append(paths) or True)
+    )
+    params = tmp_path / "params.jsonl"
+    params.write_text('{"image": "ab"}\n')
+    module = import_module("parslet.main_cli")
+    argv = ["parslet", "sweep", "wf_no_file", "--params", str(params)]
+    monkeypatch.setattr(module.sys, "argv", argv)
+    module.main()
+    assert "1/1 instance(s) succeeded" in capsys.readouterr().out
+    assert [Path(".")] not in scanned
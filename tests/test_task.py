@@ -1,7 +1,7 @@
 import pytest
 
 from parslet.core import ParsletFuture, parslet_task
-from parslet.core.task import _TASK_REGISTRY, set_allow_redefine
+from parslet.core.task import _TASK_REGISTRY, set_allow_redefine, set_task_id_mode
 
 
 @parslet_task
@@ -61,3 +61,83 @@ def test_force_redefine_allows_protected_task() -> None:
         set_allow_redefine(True)
     assert "prot_force" in _TASK_REGISTRY
     _TASK_REGISTRY.pop("prot_force", None)
+
+
+def test_counter_task_ids_are_sequential() -> None:
+    set_task_id_mode("counter")
+    try:
+        first = add(1, 2)
+        second = add(1, 2)
+    finally:
+        set_task_id_mode("uuid")
+    assert first.task_id == "add_1"
+    assert second.task_id == "add_2"
+
+
+def test_deterministic_task_ids_are_stable() -> None:
+    def build() -> list[str]:
+        set_task_id_mode("deterministic")
+        a = add(1, 2)
+        b = add(a, [3, {"k": 4}])
+        dup = add(1, 2)
+        return [a.task_id, b.task_id, dup.task_id]
+
+    try:
+        first_run = build()
+        second_run = build()
+    finally:
+        set_task_id_mode("uuid")
+    assert first_run == second_run
+    assert len(set(first_run)) == 3
+    assert first_run[2] == f"{first_run[0]}_1"
+
+
+class _Point:
+    def __init__(self, x: int) -> None:
+        self.x = x
+
+
+class _Handle:
+    def __init__(self) -> None:
+        self.callback = lambda: None
+
+
+def test_deterministic_ids_ignore_memory_addresses() -> None:
+    set_task_id_mode("deterministic")
+    try:
+        first = add(_Point(1), 2).task_id
+        set_task_id_mode("deterministic")
+        second = add(_Point(1), 2).task_id
+        other = add(_Point(2), 2).task_id
+        with pytest.raises(TypeError, match="_Handle"):
+            add(_Handle(), 2)
+    finally:
+        set_task_id_mode("uuid")
+    assert first == second
+    assert other != first
+
+
+def test_unknown_task_id_mode_rejected() -> None:
+    with pytest.raises(ValueError):
+        set_task_id_mode("random")
+
+
+def test_cli_run_keeps_task_id_mode_from_environment(tmp_path, monkeypatch):
+    from importlib import import_module
+
+    from parslet.core import task as task_module
+
+    wf = tmp_path / "wf_ids.py"
+    wf.write_text(
+        "from parslet import parslet_task\n"
+        "@parslet_task\n"
+        "def one():\n    return 1\n"
+        "def main():\n    return [one()]\n"
+    )
+    # What PARSLET_TASK_ID_MODE=counter selects when parslet is imported.
+    monkeypatch.setattr(task_module, "_TASK_ID_MODE", "counter")
+    monkeypatch.setenv("PARSLET_NO_STATS", "1")
+    module = import_module("parslet.main_cli")
+    monkeypatch.setattr(module.sys, "argv", ["parslet", "run", str(wf)])
+    module.main()
+    assert task_module._TASK_ID_MODE == "counter"
@@ -0,0 +1,174 @@
+import threading
+import time
+
+from parslet.core import DAG, DAGRunner, ThermalPolicy, parslet_task
+from parslet.core.thermal import ThermalGuard
+from parslet.utils import power
+from parslet.utils.power import PowerState
+
+
+@parslet_task(energy_cost="high")
+def th_heavy(x):
+    return x * 2
+
+
+@parslet_task
+def th_light(x):
+    return x + 1
+
+
+def _zone(base, index, kind, temp, trips=()):
+    zone = base / f"thermal_zone{index}"
+    zone.mkdir()
+    (zone / "type").write_text(kind + "\n")
+    (zone / "temp").write_text(f"{temp}\n")
+    for i, (trip_type, trip_temp) in enumerate(trips):
+        (zone / f"trip_point_{i}_type").write_text(trip_type + "\n")
+        (zone / f"trip_point_{i}_temp").write_text(f"{trip_temp}\n")
+
+
+def test_sysfs_thermal_and_cpufreq(tmp_path, monkeypatch):
+    thermal = tmp_path / "thermal"
+    thermal.mkdir()
+    _zone(thermal, 0, "battery", 95000)
+    _zone(thermal, 1, "cpu-0-0", 71000, [("critical", 110000), ("passive", 75000)])
+    _zone(thermal, 2, "cpu-1-0", 76000, [("passive", 80000), ("hot", 85000)])
+    cpufreq = tmp_path / "cpufreq"
+    for name, freq in (("policy0", 1800000), ("policy4", 2400000)):
+        (cpufreq / name).mkdir(parents=True)
+        (cpufreq / name / "scaling_cur_freq").write_text(f"{freq}\n")
+    monkeypatch.setattr(power, "_THERMAL_BASE", thermal)
+    monkeypatch.setattr(power, "_CPUFREQ_BASE", cpufreq)
+
+    assert power._thermal_zone_provider() == (76.0, 80.0)
+    state = power._add_thermal(PowerState(temperature_c=30.0))
+    assert state.temperature_c == 76.0
+    assert state.throttle_temp_c == 80.0
+    assert not state.thermal_throttle
+    assert state.cpu_freq_hint == 2400000
+
+    (thermal / "thermal_zone2" / "temp").write_text("81000\n")
+    assert power._add_thermal(PowerState()).thermal_throttle
+
+
+def test_missing_sysfs_leaves_state_alone(tmp_path, monkeypatch):
+    monkeypatch.setattr(power, "_THERMAL_BASE", tmp_path / "none")
+    monkeypatch.setattr(power, "_CPUFREQ_BASE", tmp_path / "none")
+    state = power._add_thermal(PowerState(temperature_c=31.0))
+    assert state.temperature_c == 31.0
+    assert state.cpu_freq_hint is None
+    assert not state.thermal_throttle
+
+
+def test_thermal_policy_scales_with_heat():
+    policy = ThermalPolicy(margin_c=10.0)
+    cool = PowerState(temperature_c=60.0, throttle_temp_c=85.0)
+    warm = PowerState(temperature_c=80.0, throttle_temp_c=85.0)
+    throttled = PowerState(temperature_c=70.0, thermal_throttle=True)
+    assert policy.heat(PowerState()) is None
+    assert policy.heat(cool) == 0.0
+    assert policy.heat(warm) == 0.5
+    assert policy.decide_max_workers(cool, 4) == 4
+    assert policy.decide_max_workers(warm, 4) == 2
+    assert policy.decide_max_workers(throttled, 4) == 1
+    # Without a trip point the policy's default throttle temperature counts.
+    assert policy.heat(PowerState(temperature_c=75.0)) == 0.5
+    assert policy.should_defer(th_heavy(1), warm)
+    assert not policy.should_defer(th_light(1), warm)
+    assert not policy.should_defer(th_heavy(1), cool)
+
+
+def test_guard_limits_concurrency_when_warm():
+    warm = PowerState(temperature_c=80.0, throttle_temp_c=85.0)
+    guard = ThermalGuard(ThermalPolicy(margin_c=10.0), sample=lambda: warm)
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def work():
+        nonlocal active, peak
+        with guard.slot(th_light(1), 4):
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.05)
+            with lock:
+                active -= 1
+
+    threads = [threading.Thread(target=work) for _ in range(6)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert peak == 2
+    assert guard.deferred > 0
+
+
+def test_guard_holds_heavy_tasks_until_deadline():
+    warm = PowerState(temperature_c=80.0, throttle_temp_c=85.0)
+    guard = ThermalGuard(
+        ThermalPolicy(margin_c=10.0, max_defer_s=0.2),
+        interval_s=0.05,
+        sample=lambda: warm,
+    )
+    released = threading.Event()
+    start = time.monotonic()
+    assert not guard.hold([th_light(1)], released.set)
+    assert guard.hold([th_light(1), th_heavy(1)], released.set)
+    assert released.wait(2)
+    assert time.monotonic() - start >= 0.2
+    assert guard.deferred == 1
+    with guard.slot(th_heavy(1), 4) as waited:
+        assert not waited
+
+
+@parslet_task(energy_cost="high")
+def th_heavy_logged(x):
+    th_order.append("heavy")
+    return x
+
+
+@parslet_task
+def th_light_logged(x):
+    th_order.append("light")
+    return x
+
+
+th_order = []
+
+
+def test_held_tasks_do_not_occupy_workers():
+    state = {"temp": 80.0}
+    runner = DAGRunner(
+        max_workers=1, thermal_policy=ThermalPolicy(margin_c=10.0, max_defer_s=5)
+    )
+    runner.thermal.interval_s = 0.02
+    runner.thermal._sample = lambda: PowerState(
+        temperature_c=state["temp"], throttle_temp_c=85.0
+    )
+    heavy = th_heavy_logged(1)
+    light = th_light_logged(2)
+    dag = DAG()
+    dag.build_dag([heavy, light])
+    th_order.clear()
+
+    def cool_down():
+        light.result()
+        state["temp"] = 40.0
+
+    threading.Thread(target=cool_down, daemon=True).start()
+    runner.run(dag)
+    assert th_order == ["light", "heavy"]
+    assert heavy.result() == 1
+    assert runner.thermal.deferred == 1
+
+
+def test_runner_with_thermal_guard():
+    runner = DAGRunner(max_workers=2, thermal_policy=ThermalPolicy())
+    runner.thermal._sample = lambda: PowerState(temperature_c=40.0)
+    futures = [th_heavy(i) for i in range(3)] + [th_light(1)]
+    dag = DAG()
+    dag.build_dag(futures)
+    runner.run(dag)
+    assert [f.result() for f in futures] == [0, 2, 4, 2]
+    assert runner.thermal.deferred == 0
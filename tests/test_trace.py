@@ -0,0 +1,141 @@
+import json
+from importlib import import_module
+
+import pytest
+
+from parslet.core import DAG, DAGRunner, parslet_task
+from parslet.core.trace import TraceRecorder
+
+
+@parslet_task
+def trace_inc(x):
+    return x + 1
+
+
+@parslet_task
+def trace_boom(x):
+    raise ValueError(x)
+
+
+@parslet_task(cache=True)
+def trace_cached(x):
+    return x * 2
+
+
+def _run(futures, **kwargs):
+    dag = DAG()
+    dag.build_dag(futures)
+    runner = DAGRunner(max_workers=2, record_trace=True, **kwargs)
+    runner.run(dag)
+    return runner, runner.trace.to_dict()["traceEvents"]
+
+
+def test_recorder_formats_chrome_events():
+    trace = TraceRecorder()
+    start = trace.now()
+    trace.complete("work", "task", start, args={"task_id": "t1"})
+    trace.async_span("queued", "queue", "t1", start, start + 5)
+    events = trace.to_dict()["traceEvents"]
+    names = {e["args"]["name"] for e in events if e["ph"] == "M"}
+    assert "parslet" in names
+    work = next(e for e in events if e["ph"] == "X")
+    assert work["name"] == "work" and work["dur"] >= 0
+    assert work["args"] == {"task_id": "t1"}
+    begin, end = (e for e in events if e.get("cat") == "queue")
+    assert (begin["ph"], end["ph"]) == ("b", "e")
+    assert begin["id"] == end["id"] == "t1"
+    assert end["ts"] - begin["ts"] == pytest.approx(5)
+
+
+def test_runner_records_task_spans(tmp_path):
+    first = trace_inc(1)
+    second = trace_inc(first)
+    failed = trace_boom(3)
+    runner, events = _run([second, failed])
+    tasks = {e["args"]["task_id"]: e for e in events if e.get("cat") == "task"}
+    assert tasks[first.task_id]["args"]["status"] == "SUCCESS"
+    assert tasks[failed.task_id]["args"]["status"] == "FAILED"
+    assert tasks[first.task_id]["name"] == "trace_inc"
+    assert "queue_wait_ms" in tasks[second.task_id]["args"]
+    # Dependent task starts after its upstream ended.
+    up = tasks[first.task_id]
+    assert tasks[second.task_id]["ts"] >= up["ts"] + up["dur"]
+    resolved = [e for e in events if e.get("name") == "resolve_args"]
+    assert len(resolved) == 3
+    queued = [e for e in events if e.get("cat") == "queue"]
+    assert len(queued) == 6
+    threads = {e["tid"]: e["args"]["name"] for e in events if e["ph"] == "M"}
+    assert all(e["tid"] in threads for e in events if e["ph"] == "X")
+    assert any(e["name"] == "run" for e in events)
+
+    out = tmp_path / "trace.json"
+    runner.trace.save(out)
+    assert json.loads(out.read_text())["displayTimeUnit"] == "ms"
+
+
+def test_runner_records_cache_lookups(tmp_path, monkeypatch):
+    monkeypatch.setenv("PARSLET_CACHE_DIR", str(tmp_path))
+    _run([trace_cached(21)])
+    _, events = _run([trace_cached(21)])
+    lookups = [e for e in events if e.get("cat") == "cache"]
+    assert [e["args"]["hit"] for e in lookups] == [True]
+    assert not [e for e in events if e.get("cat") == "task"]
+
+
+def test_fused_chain_stages_are_traced():
+    a = trace_inc(1)
+    b = trace_inc(a)
+    c = trace_inc(b)
+    dag = DAG()
+    dag.build_dag([c])
+    dag.fuse_linear_chains()
+    runner = DAGRunner(max_workers=2, record_trace=True)
+    runner.run(dag)
+    events = runner.trace.to_dict()["traceEvents"]
+    tasks = [e for e in events if e.get("cat") == "task"]
+    assert len(tasks) == 3
+    assert len({e["tid"] for e in tasks}) == 1
+    assert sum("queue_wait_ms" in e["args"] for e in tasks) == 1
+
+
+ATTEMPTS = {"fragile": 0}
+
+
+@parslet_task
+def trace_fragile():
+    ATTEMPTS["fragile"] += 1
+    if ATTEMPTS["fragile"] == 1:
+        raise MemoryError("boom")
+    return 42
+
+
+def test_failsafe_runs_are_traced():
+    fut = trace_fragile()
+    runner, events = _run([fut], failsafe_mode=True)
+    assert fut.result() == 42
+    spans = [e for e in events if e.get("cat") == "task"]
+    failsafe = [e for e in spans if e["args"].get("failsafe")]
+    assert [e["args"]["status"] for e in failsafe] == ["SUCCESS"]
+    assert failsafe[0]["name"] == "trace_fragile"
+
+
+def test_no_trace_by_default():
+    assert DAGRunner(max_workers=1).trace is None
+
+
+def test_cli_writes_trace(tmp_path, monkeypatch):
+    monkeypatch.setenv("PARSLET_NO_STATS", "1")
+    wf = tmp_path / "wf_trace.py"
+    wf.write_text(
+        "from parslet import parslet_task\n"
+        "@parslet_task\n"
+        "def double(x):\n    return x * 2\n"
+        "def main():\n    return [double(double(2))]\n"
+    )
+    out = tmp_path / "out.json"
+    module = import_module("parslet.main_cli")
+    argv = ["parslet", "run", str(wf), "--trace", str(out)]
+    monkeypatch.setattr(module.sys, "argv", argv)
+    module.main()
+    events = json.loads(out.read_text())["traceEvents"]
+    assert len([e for e in events if e.get("cat") == "task"]) == 2